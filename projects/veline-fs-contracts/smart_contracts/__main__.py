@@ -1,12 +1,21 @@
+import argparse
 import logging
-import sys
+from functools import partial
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from smart_contracts._helpers.build import build
-from smart_contracts._helpers.config import contracts
-from smart_contracts._helpers.deploy import deploy
+from smart_contracts._helpers import timing
+from smart_contracts._helpers.build import (
+    BACKENDS,
+    DEFAULT_PROFILE,
+    PROFILES,
+    build,
+    built_profile,
+    terminate_builds,
+)
+from smart_contracts._helpers.config import SmartContract, discover_contracts
+from smart_contracts._helpers.parallel import install_log_prefix, run_parallel
 
 # Uncomment the following lines to enable auto generation of AVM Debugger compliant sourcemap and simulation trace file.
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
@@ -14,8 +23,12 @@ from smart_contracts._helpers.deploy import deploy
 # from algokit_utils.config import config
 # config.configure(debug=True, trace_all=True)
 logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
+    level=logging.DEBUG,
+    format="%(asctime)s %(levelname)-10s: %(contract_prefix)s%(message)s",
 )
+# records logged while building a contract are prefixed with its name
+for handler in logging.getLogger().handlers:
+    install_log_prefix(handler)
 logger = logging.getLogger(__name__)
 logger.info("Loading .env")
 # For manual script execution (bypassing `algokit project deploy`) with a custom .env,
@@ -24,49 +37,233 @@ load_dotenv()
 root_path = Path(__file__).parent
 
 
-def main(action: str, contract_name: str | None = None) -> None:
-    artifact_path = root_path / "artifacts"
-
-    # Filter contracts if a specific contract name is provided
-    filtered_contracts = [
-        c for c in contracts if contract_name is None or c.name == contract_name
-    ]
-
-    match action:
-        case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-        case "deploy":
-            for contract in filtered_contracts:
-                output_dir = artifact_path / contract.name
-                app_spec_file_name = next(
-                    (
-                        file.name
-                        for file in output_dir.iterdir()
-                        if file.is_file() and file.suffixes == [".arc32", ".json"]
-                    ),
-                    None,
+def build_all(
+    artifact_path: Path,
+    to_build: list[SmartContract],
+    jobs: int | None = None,
+    backend: str = "auto",
+    profile: str = DEFAULT_PROFILE,
+) -> dict[str, Path]:
+    """Builds the contracts concurrently, stopping at the first that fails, and
+    returns the path of each app spec by contract name."""
+
+    def build_contract(contract: SmartContract) -> Path:
+        logger.info(f"Building app at {contract.path}")
+        return build(
+            artifact_path / contract.name,
+            contract.path,
+            backend=backend,
+            profile=profile,
+        )
+
+    return run_parallel(
+        {contract.name: partial(build_contract, contract) for contract in to_build},
+        jobs,
+        on_failure=terminate_builds,
+    )
+
+
+def check_costs(
+    artifact_path: Path,
+    to_check: list[SmartContract],
+    threshold: float | None = None,
+    update: bool = False,
+) -> None:
+    """Checks that no method of the contracts costs more than `threshold` more than
+    in the committed cost report, or updates the report with their costs.
+
+    The report holds the costs of builds with the default profile, so contracts
+    last built with another profile are skipped."""
+    from smart_contracts._helpers import teal_cost
+
+    to_measure = []
+    for contract in to_check:
+        profile = built_profile(artifact_path / contract.name)
+        if profile == DEFAULT_PROFILE:
+            to_measure.append(contract)
+        else:
+            logger.info(
+                f"Skipping the costs of {contract.name}, it was built with the "
+                f"{profile} profile and the cost report is of {DEFAULT_PROFILE} builds"
+            )
+    report = teal_cost.analyse_artifacts(
+        path
+        for contract in to_measure
+        for path in (artifact_path / contract.name).glob("*.approval.teal")
+    )
+    report_path = artifact_path / teal_cost.REPORT_FILE
+    if update:
+        teal_cost.update_report(report_path, report)
+        logger.info(f"Wrote the cost of each method to {report_path}")
+    else:
+        teal_cost.check_report(
+            report_path,
+            report,
+            teal_cost.DEFAULT_THRESHOLD if threshold is None else threshold,
+        )
+
+
+def main(
+    action: str,
+    contract_names: list[str] | None = None,
+    jobs: int | None = None,
+    backend: str = "auto",
+    check: bool = False,
+    threshold: float | None = None,
+    profile: str = DEFAULT_PROFILE,
+    run_tests: bool = False,
+    timings_path: Path | None = None,
+    trace_path: Path | None = None,
+) -> None:
+    # the time spent in each stage is reported even if one fails
+    with timing.reported(timings_path, trace_path):
+        artifact_path = root_path / "artifacts"
+
+        # Only look at the named contracts if any are given
+        with timing.stage("discovery"):
+            filtered_contracts = discover_contracts(contract_names)
+        if action in ("deploy", "all"):
+            # imports algokit_utils, which a build does not need
+            from smart_contracts._helpers.deploy import deploy_all
+
+        match action:
+            case "build":
+                build_all(artifact_path, filtered_contracts, jobs, backend, profile)
+            case "watch":
+                from smart_contracts._helpers.watch import watch
+
+                try:
+                    watch(
+                        filtered_contracts,
+                        lambda contract: build_all(
+                            artifact_path, [contract], backend=backend, profile=profile
+                        ),
+                        tests=run_tests,
+                    )
+                except KeyboardInterrupt:
+                    logger.info("Stopped watching")
+            case "cost":
+                check_costs(
+                    artifact_path, filtered_contracts, threshold, update=not check
+                )
+            case "deploy":
+                deployments = {}
+                for contract in filtered_contracts:
+                    output_dir = artifact_path / contract.name
+                    app_spec_file_name = next(
+                        (
+                            file.name
+                            for file in output_dir.iterdir()
+                            if file.is_file() and file.suffixes == [".arc32", ".json"]
+                        ),
+                        None,
+                    )
+                    if app_spec_file_name is None:
+                        raise Exception(
+                            "Could not deploy app, .arc32.json file not found"
+                        )
+                    app_spec_path = output_dir / app_spec_file_name
+                    if contract.deploy:
+                        logger.info(f"Deploying app {contract.name}")
+                        deployments[contract.name] = (app_spec_path, contract.deploy)
+                check_costs(artifact_path, filtered_contracts, threshold)
+                deploy_all(deployments, jobs)
+            case "all":
+                app_spec_paths = build_all(
+                    artifact_path, filtered_contracts, jobs, backend, profile
+                )
+                check_costs(artifact_path, filtered_contracts, threshold)
+                deploy_all(
+                    {
+                        contract.name: (app_spec_paths[contract.name], contract.deploy)
+                        for contract in filtered_contracts
+                        if contract.deploy
+                    },
+                    jobs,
                 )
-                if app_spec_file_name is None:
-                    raise Exception("Could not deploy app, .arc32.json file not found")
-                app_spec_path = output_dir / app_spec_file_name
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    deploy(app_spec_path, contract.deploy)
-        case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                app_spec_path = build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.path.name}")
-                    deploy(app_spec_path, contract.deploy)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    parser = argparse.ArgumentParser(prog="python -m smart_contracts")
+    parser.add_argument(
+        "action",
+        nargs="?",
+        default="all",
+        choices=["build", "deploy", "all", "cost", "watch"],
+    )
+    parser.add_argument("contract_name", nargs="?")
+    parser.add_argument(
+        "--contract",
+        action="append",
+        dest="contracts",
+        metavar="NAME",
+        help="only build or deploy this contract, can be given more than once",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="number of contracts to build or deploy at once, the number of CPUs by "
+        "default",
+    )
+    parser.add_argument(
+        "--backend",
+        default="auto",
+        choices=BACKENDS,
+        help="compile with puyapy in this process or with the AlgoKit CLI; "
+        "auto uses puyapy if it is installed",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="with cost, fail if a method costs more than in the cost report "
+        "instead of updating it",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help="how much more a method may cost than in the cost report before "
+        "deploying fails, 0.1 (10%%) by default",
+    )
+    parser.add_argument(
+        "--profile",
+        default=DEFAULT_PROFILE,
+        choices=PROFILES,
+        help="optimisation and debug flags to build with: dev is unoptimised "
+        "with debug information, size optimises the most; the program size and "
+        "method costs of each profile built are kept in the build manifest",
+    )
+    parser.add_argument(
+        "--test",
+        action="store_true",
+        help="with watch, run the tests that import a contract after rebuilding it",
+    )
+    parser.add_argument(
+        "--timings",
+        type=Path,
+        metavar="PATH",
+        help="write the duration and number of requests of each stage to PATH, "
+        "as JSON lines",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="PATH",
+        help="write the stages to PATH as a Chrome trace, to open in "
+        "chrome://tracing or https://ui.perfetto.dev",
+    )
+    args = parser.parse_args()
+    contract_names = args.contracts or []
+    if args.contract_name:
+        contract_names.append(args.contract_name)
+    main(
+        args.action,
+        contract_names or None,
+        args.jobs,
+        args.backend,
+        args.check,
+        args.threshold,
+        args.profile,
+        args.test,
+        args.timings,
+        args.trace,
+    )
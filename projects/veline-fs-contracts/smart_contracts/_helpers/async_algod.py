@@ -0,0 +1,254 @@
+import base64
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import httpx
+from algokit_utils import AlgoClientConfig, get_algod_client
+from algosdk import encoding, error, transaction
+from algosdk.v2client import models
+
+from smart_contracts._helpers.cache import RoundCache
+from smart_contracts._helpers.transport import RequestMetrics
+
+logger = logging.getLogger(__name__)
+
+API_VERSION_PREFIX = "/v2"
+AUTH_HEADER = "X-Algo-API-Token"
+# Connections kept open to algod. Requests beyond this wait for a free connection
+# rather than opening a new socket, which keeps thousands of coroutines on one pool.
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_TIMEOUT = 30.0
+# algod holds wait-for-block-after requests open for up to a minute
+STATUS_AFTER_BLOCK_TIMEOUT = 70.0
+
+
+class AsyncAlgodClient:
+    """Coroutine counterpart of `algosdk.v2client.algod.AlgodClient`.
+
+    Covers the endpoints the app clients need. Every request goes through one
+    `httpx.AsyncClient`, so connections are pooled and kept alive across calls, and
+    responses and errors have the same shape as the synchronous client's. With a
+    `cache`, suggested params, app info and boxes are served from it. `metrics`
+    records the latency of the requests to each endpoint.
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: RoundCache | None = None,
+    ):
+        self.cache = cache
+        self.metrics = RequestMetrics()
+        self.algod_address = algod_address.rstrip("/")
+        self.http = httpx.AsyncClient(
+            base_url=self.algod_address + API_VERSION_PREFIX,
+            headers={AUTH_HEADER: algod_token, **(headers or {})},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    @classmethod
+    def from_config(cls, config: AlgoClientConfig, **kwargs: Any) -> "AsyncAlgodClient":
+        return cls(config.token, config.server, **kwargs)
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncAlgodClient":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def algod_request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str = "json",
+        timeout: float | None = None,
+    ) -> Any:
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = await self.http.request(
+                method,
+                path,
+                params=params,
+                content=data,
+                headers=headers,
+                timeout=timeout or self.http.timeout,
+            )
+            failed = response.is_error
+        finally:
+            self.metrics.record(
+                method,
+                API_VERSION_PREFIX + path,
+                time.perf_counter() - start,
+                failed,
+            )
+        if response.is_error:
+            try:
+                body = response.json()
+                message = body["message"]
+            except Exception:
+                body, message = {}, response.text
+            raise error.AlgodHTTPError(message, response.status_code, body.get("data"))
+        if response_format != "json":
+            return response.content
+        body = response.json()
+        if self.cache:
+            self.cache.observe_response(body)
+        return body
+
+    async def status(self) -> dict[str, Any]:
+        return await self.algod_request("GET", "/status")
+
+    async def status_after_block(self, round_num: int) -> dict[str, Any]:
+        return await self.algod_request(
+            "GET",
+            f"/status/wait-for-block-after/{round_num}",
+            timeout=STATUS_AFTER_BLOCK_TIMEOUT,
+        )
+
+    async def _cached(
+        self, key: tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.get_or_fetch_async(key, fetch)
+
+    async def block_txids(self, round_num: int) -> list[str]:
+        """Returns the ids of the transactions confirmed in block `round_num`."""
+        response = await self.algod_request("GET", f"/blocks/{round_num}/txids")
+        return response["blockTxids"]
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        response = await self._cached(
+            ("suggested_params",),
+            lambda: self.algod_request("GET", "/transactions/params"),
+        )
+        return transaction.SuggestedParams(
+            response["fee"],
+            response["last-round"],
+            response["last-round"] + 1000,
+            response["genesis-hash"],
+            response["genesis-id"],
+            False,
+            response["consensus-version"],
+            response["min-fee"],
+        )
+
+    async def send_raw_transaction(self, txn: bytes) -> str:
+        """Sends msgpack encoded signed transactions, concatenated for a group."""
+        response = await self.algod_request(
+            "POST",
+            "/transactions",
+            data=txn,
+            headers={"Content-Type": "application/x-binary"},
+        )
+        return response["txId"]
+
+    async def send_transactions(
+        self, txns: Iterable[transaction.GenericSignedTransaction]
+    ) -> str:
+        return await self.send_raw_transaction(
+            b"".join(base64.b64decode(encoding.msgpack_encode(txn)) for txn in txns)
+        )
+
+    async def pending_transaction_info(self, transaction_id: str) -> dict[str, Any]:
+        return await self.algod_request(
+            "GET", f"/transactions/pending/{transaction_id}", params={"format": "json"}
+        )
+
+    async def simulate_transactions(
+        self, request: models.SimulateRequest
+    ) -> dict[str, Any]:
+        return await self.algod_request(
+            "POST",
+            "/transactions/simulate",
+            data=base64.b64decode(encoding.msgpack_encode(request)),
+            headers={"Content-Type": "application/msgpack"},
+        )
+
+    async def account_info(self, address: str) -> dict[str, Any]:
+        return await self.algod_request("GET", f"/accounts/{address}")
+
+    async def application_info(self, application_id: int) -> dict[str, Any]:
+        return await self._cached(
+            ("application_info", application_id),
+            lambda: self.algod_request("GET", f"/applications/{application_id}"),
+        )
+
+    async def application_box_by_name(
+        self, application_id: int, box_name: bytes
+    ) -> dict[str, Any]:
+        return await self._cached(
+            ("box", application_id, box_name),
+            lambda: self.algod_request(
+                "GET",
+                f"/applications/{application_id}/box",
+                params={"name": "b64:" + base64.b64encode(box_name).decode()},
+            ),
+        )
+
+    async def application_boxes(
+        self, application_id: int, limit: int = 0
+    ) -> dict[str, Any]:
+        return await self.algod_request(
+            "GET",
+            f"/applications/{application_id}/boxes",
+            params={"max": limit} if limit else None,
+        )
+
+    async def wait_for_confirmation(
+        self, transaction_id: str, wait_rounds: int = 1000
+    ) -> dict[str, Any]:
+        """Waits for a transaction to be confirmed, as `transaction.wait_for_confirmation`."""
+        current_round = (await self.status())["last-round"] + 1
+        last_round = current_round + wait_rounds
+        while current_round <= last_round:
+            try:
+                tx_info = await self.pending_transaction_info(transaction_id)
+            except error.AlgodHTTPError:
+                # A load balanced node that did not receive the transaction answers 404
+                tx_info = {}
+            if tx_info.get("pool-error"):
+                raise error.TransactionRejectedError(
+                    f"Transaction rejected: {tx_info['pool-error']}"
+                )
+            if tx_info.get("confirmed-round"):
+                return tx_info
+            await self.status_after_block(current_round)
+            current_round += 1
+        raise error.ConfirmationTimeoutError(
+            f"Wait for transaction id {transaction_id} timed out"
+        )
+
+
+def get_async_algod_client(
+    config: AlgoClientConfig | None = None, **kwargs: Any
+) -> AsyncAlgodClient:
+    """Returns an `AsyncAlgodClient` from `config`, or from the same environment
+    variables `algokit_utils.get_algod_client` reads."""
+    algod_client = get_algod_client(config)
+    return AsyncAlgodClient(
+        algod_client.algod_token,
+        algod_client.algod_address,
+        algod_client.headers,
+        **kwargs,
+    )
@@ -0,0 +1,322 @@
+import asyncio
+import base64
+import dataclasses
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import algokit_utils
+from algokit_utils import ApplicationSpecification, TransactionParameters
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import (
+    ABIResult,
+    AtomicTransactionComposer,
+    AtomicTransactionComposerStatus,
+    AtomicTransactionResponse,
+    SimulateABIResult,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+)
+from algosdk.logic import get_application_address
+from algosdk.v2client import models
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.readonly import ReadonlyBatcher
+
+DEFAULT_WAIT_ROUNDS = 4
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(kw_only=True)
+class SimulateOptions:
+    allow_more_logs: bool = False
+    allow_empty_signatures: bool = False
+    extra_opcode_budget: int = 0
+    exec_trace_config: models.SimulateTraceConfig | None = None
+
+
+def method_args(args: Any) -> dict[str, Any]:
+    """Maps a generated client's `*Args` dataclass to ABI arguments by name.
+
+    Fields are read as they are, unlike `dataclasses.asdict`, so transaction arguments
+    keep their signer.
+    """
+    return {field.name: getattr(args, field.name) for field in dataclasses.fields(args)}
+
+
+async def _resolved(value: Any) -> Any:
+    return value
+
+
+def _parse_results(
+    atc: AtomicTransactionComposer, tx_infos: list[dict[str, Any]]
+) -> list[ABIResult]:
+    return [
+        atc.parse_result(method, atc.tx_ids[index], tx_infos[index])
+        for index, method in atc.method_dict.items()
+    ]
+
+
+class AsyncComposer:
+    """Builds an atomic group of app calls and executes or simulates it as a coroutine.
+
+    Transactions are built and signed in process by algosdk; only the network round
+    trips are awaited.
+    """
+
+    def __init__(
+        self,
+        app_client: "AsyncApplicationClient",
+        suggested_params: transaction.SuggestedParams,
+        atc: AtomicTransactionComposer | None = None,
+    ):
+        self.app_client = app_client
+        self.suggested_params = suggested_params
+        self.atc = atc or AtomicTransactionComposer()
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.atc
+
+    def add_method_call(
+        self,
+        method: abi.Method | str,
+        args: dict[str, Any] | None = None,
+        transaction_parameters: TransactionParameters | None = None,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+    ) -> "AsyncComposer":
+        """Adds an ABI method call, with `args` keyed by the method's argument names."""
+        app_client = self.app_client
+        parameters = transaction_parameters or TransactionParameters()
+        method = app_client.get_method(method)
+        args = args or {}
+        missing = [arg.name for arg in method.args if arg.name not in args]
+        if missing:
+            raise Exception(f"Missing arguments for {method.name}: {missing}")
+        signer = parameters.signer or app_client.signer
+        sender = parameters.sender or app_client.sender
+        if signer is None or sender is None:
+            raise Exception(f"A signer and sender are required to call {method.name}")
+        self.atc.add_method_call(
+            app_id=app_client.app_id,
+            method=method,
+            sender=sender,
+            sp=parameters.suggested_params or self.suggested_params,
+            signer=signer,
+            method_args=[args[arg.name] for arg in method.args],
+            on_complete=on_complete,
+            note=parameters.note,
+            lease=parameters.lease,
+            accounts=parameters.accounts,
+            foreign_apps=parameters.foreign_apps,
+            foreign_assets=parameters.foreign_assets,
+            boxes=parameters.boxes,
+            rekey_to=parameters.rekey_to,
+        )
+        return self
+
+    async def execute(
+        self, wait_rounds: int = DEFAULT_WAIT_ROUNDS
+    ) -> AtomicTransactionResponse:
+        """Submits the group and waits for it to be confirmed."""
+        algod = self.app_client.algod_client
+        atc = self.atc
+        signed_txns = atc.gather_signatures()
+        await algod.send_transactions(signed_txns)
+        atc.status = AtomicTransactionComposerStatus.SUBMITTED
+        confirmed = await algod.wait_for_confirmation(atc.tx_ids[0], wait_rounds)
+        atc.status = AtomicTransactionComposerStatus.COMMITTED
+        # The group confirms in one round, the other transactions only need their logs
+        tx_infos = await asyncio.gather(
+            *(
+                algod.pending_transaction_info(tx_id) if index else _resolved(confirmed)
+                for index, tx_id in enumerate(atc.tx_ids)
+            )
+        )
+        return AtomicTransactionResponse(
+            confirmed_round=confirmed["confirmed-round"],
+            tx_ids=atc.tx_ids,
+            results=_parse_results(atc, tx_infos),
+        )
+
+    async def simulate(
+        self, options: SimulateOptions | None = None
+    ) -> SimulateAtomicTransactionResponse:
+        """Runs the group through algod's simulate endpoint without submitting it."""
+        options = options or SimulateOptions()
+        atc = self.atc
+        request = models.SimulateRequest(
+            txn_groups=[
+                models.SimulateRequestTransactionGroup(txns=atc.gather_signatures())
+            ],
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+        )
+        response = await self.app_client.algod_client.simulate_transactions(request)
+        txn_group = response["txn-groups"][0]
+        tx_infos = [result["txn-result"] for result in txn_group["txn-results"]]
+        return SimulateAtomicTransactionResponse(
+            version=response.get("version", 0),
+            failure_message=txn_group.get("failure-message", ""),
+            failed_at=txn_group.get("failed-at"),
+            simulate_response=response,
+            tx_ids=atc.tx_ids,
+            results=[
+                SimulateABIResult(
+                    tx_id=result.tx_id,
+                    raw_value=result.raw_value,
+                    return_value=result.return_value,
+                    decode_error=result.decode_error,
+                    tx_info=result.tx_info,
+                    method=result.method,
+                )
+                for result in _parse_results(atc, tx_infos)
+            ],
+        )
+
+
+class AsyncApplicationClient:
+    """Asyncio counterpart of `algokit_utils.ApplicationClient` for a deployed app.
+
+    Calls, composes and simulates ABI methods described by an ARC-32 app spec over an
+    `AsyncAlgodClient`, so one event loop can keep thousands of calls in flight.
+    Deployment stays with the synchronous clients.
+    """
+
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        app_spec: ApplicationSpecification,
+        *,
+        app_id: int,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: transaction.SuggestedParams | None = None,
+    ):
+        self.algod_client = algod_client
+        self.app_spec = app_spec
+        self.app_id = app_id
+        if isinstance(signer, algokit_utils.Account):
+            sender = sender or signer.address
+            signer = signer.signer
+        self.signer = signer
+        self.sender = sender
+        self.suggested_params = suggested_params
+        self._readonly: ReadonlyBatcher | None = None
+        self._methods = {
+            method.get_signature(): method for method in app_spec.contract.methods
+        }
+
+    @property
+    def app_address(self) -> str:
+        return get_application_address(self.app_id)
+
+    def get_method(self, method: abi.Method | str) -> abi.Method:
+        """Resolves a method by signature or, when unambiguous, by name."""
+        if isinstance(method, abi.Method):
+            return method
+        if method in self._methods:
+            return self._methods[method]
+        return self.app_spec.contract.get_method_by_name(method)
+
+    async def get_suggested_params(self) -> transaction.SuggestedParams:
+        return self.suggested_params or await self.algod_client.suggested_params()
+
+    async def compose(
+        self, atc: AtomicTransactionComposer | None = None
+    ) -> AsyncComposer:
+        return AsyncComposer(self, await self.get_suggested_params(), atc)
+
+    async def call(
+        self,
+        method: abi.Method | str,
+        args: dict[str, Any] | None = None,
+        transaction_parameters: TransactionParameters | None = None,
+        wait_rounds: int = DEFAULT_WAIT_ROUNDS,
+    ) -> algokit_utils.ABITransactionResponse:
+        composer = await self.compose()
+        composer.add_method_call(method, args, transaction_parameters)
+        return algokit_utils.TransactionResponse.from_atr(
+            await composer.execute(wait_rounds)
+        )
+
+    async def simulate(
+        self,
+        method: abi.Method | str,
+        args: dict[str, Any] | None = None,
+        transaction_parameters: TransactionParameters | None = None,
+        options: SimulateOptions | None = None,
+    ) -> algokit_utils.ABITransactionResponse:
+        composer = await self.compose()
+        composer.add_method_call(method, args, transaction_parameters)
+        response = await composer.simulate(options)
+        if response.failure_message:
+            raise Exception(f"Simulation failed: {response.failure_message}")
+        return algokit_utils.TransactionResponse.from_atr(response)
+
+    @property
+    def readonly(self) -> ReadonlyBatcher:
+        if self._readonly is None:
+            self._readonly = ReadonlyBatcher(
+                self.algod_client, self.app_id, sender=self.sender
+            )
+        return self._readonly
+
+    async def read(
+        self,
+        method: abi.Method | str,
+        args: dict[str, Any] | None = None,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse:
+        """Runs a read-only method through simulate, unsigned and without a fee.
+
+        Reads are batched and memoized per round by `readonly`. Given transaction
+        parameters, the call is simulated on its own instead, as by `simulate`.
+        """
+        if transaction_parameters is not None:
+            return await self.simulate(method, args, transaction_parameters)
+        method = self.get_method(method)
+        args = args or {}
+        missing = [arg.name for arg in method.args if arg.name not in args]
+        if missing:
+            raise Exception(f"Missing arguments for {method.name}: {missing}")
+        return await self.readonly.read(method, [args[arg.name] for arg in method.args])
+
+    async def get_global_state(self) -> dict[bytes, bytes | int]:
+        cache = self.algod_client.cache
+        if cache is None:
+            return await self._get_global_state()
+        state = await cache.get_or_fetch_async(
+            ("global_state", self.app_id), self._get_global_state
+        )
+        return dict(state)
+
+    async def _get_global_state(self) -> dict[bytes, bytes | int]:
+        app_info = await self.algod_client.application_info(self.app_id)
+        state: dict[bytes, bytes | int] = {}
+        for entry in app_info["params"].get("global-state", []):
+            value = entry["value"]
+            state[base64.b64decode(entry["key"])] = (
+                base64.b64decode(value["bytes"])
+                if value["type"] == 1
+                else value["uint"]
+            )
+        return state
+
+    async def get_box_value(self, name: bytes) -> bytes:
+        box = await self.algod_client.application_box_by_name(self.app_id, name)
+        return base64.b64decode(box["value"])
+
+    async def get_box(self, name: bytes, decode: Callable[[bytes], T]) -> T:
+        """Returns the value of box `name` decoded by `decode`, cached as decoded."""
+        cache = self.algod_client.cache
+        if cache is None:
+            return decode(await self.get_box_value(name))
+
+        async def fetch() -> T:
+            return decode(await self.get_box_value(name))
+
+        return await cache.get_or_fetch_async(
+            ("decoded_box", self.app_id, name, decode), fetch
+        )
@@ -0,0 +1,269 @@
+import dataclasses
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from algokit_utils import Account, ApplicationSpecification, TransactionParameters
+from algosdk import abi, encoding, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    TransactionSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+# Protocol limits for a transaction group and for the references of one app call.
+# Since AVM 9 every reference of an app call is available to all app calls in the
+# group, so box references can be placed on whichever call has room for them.
+MAX_GROUP_SIZE = 16
+MAX_TXN_REFERENCES = 8
+MAX_TXN_ACCOUNTS = 4
+DEFAULT_WAIT_ROUNDS = 4
+
+# Maps the ABI arguments of a call (by name) and its sender to a box name it touches
+BoxName = Callable[[dict[str, Any], str], bytes]
+
+
+def box_name(prefix: bytes, key: bytes | int | str) -> bytes:
+    """Returns the box name of a `BoxMap` entry: its key prefix followed by the key.
+
+    Integer keys are encoded as uint64 and strings as Algorand addresses, the way
+    `UInt64` and `Address` keys are stored.
+    """
+    if isinstance(key, int):
+        return prefix + key.to_bytes(8, "big")
+    if isinstance(key, str):
+        return prefix + encoding.decode_address(key)
+    return prefix + key
+
+
+def sender_box(prefix: bytes) -> BoxName:
+    """Box of a `BoxMap` keyed by the caller's address."""
+    return lambda args, sender: box_name(prefix, sender)
+
+
+def arg_box(prefix: bytes, arg_name: str) -> BoxName:
+    """Box of a `BoxMap` keyed by one of the call's arguments."""
+    return lambda args, sender: box_name(prefix, args[arg_name])
+
+
+@dataclasses.dataclass
+class _Call:
+    method: abi.Method
+    args: list[Any]
+    parameters: TransactionParameters
+    sender: str
+    signer: TransactionSigner
+    boxes: list[bytes]
+    references: int
+    accounts: int
+
+    @property
+    def txn_count(self) -> int:
+        return self.method.get_txn_calls()
+
+
+@dataclasses.dataclass
+class _Group:
+    calls: list[_Call] = dataclasses.field(default_factory=list)
+    boxes: dict[bytes, None] = dataclasses.field(default_factory=dict)
+
+    @property
+    def txn_count(self) -> int:
+        return sum(call.txn_count for call in self.calls)
+
+    @property
+    def box_capacity(self) -> int:
+        return sum(MAX_TXN_REFERENCES - call.references for call in self.calls)
+
+
+class BatchComposer:
+    """Splits any number of ABI calls into atomic groups that fit the protocol limits.
+
+    Box references are derived for each call from `box_references`, the rules for the
+    boxes each method touches keyed by method name, and merged with any given in
+    `TransactionParameters.boxes`. Each group's box references are pooled and spread
+    over its app calls, so one call may carry the boxes of another and a call may
+    touch more boxes than fit in its own arrays.
+    """
+
+    def __init__(
+        self,
+        app_spec: ApplicationSpecification,
+        app_id: int,
+        box_references: dict[str, list[BoxName]] | None = None,
+        *,
+        signer: TransactionSigner | Account | None = None,
+        sender: str | None = None,
+        max_group_size: int = MAX_GROUP_SIZE,
+    ):
+        self.app_spec = app_spec
+        self.app_id = app_id
+        self.box_references = box_references or {}
+        if isinstance(signer, Account):
+            sender = sender or signer.address
+            signer = signer.signer
+        self.signer = signer
+        self.sender = sender
+        self.max_group_size = max_group_size
+        self._methods = {
+            method.get_signature(): method for method in app_spec.contract.methods
+        }
+        self._groups: list[_Group] = [_Group()]
+
+    def __len__(self) -> int:
+        return sum(len(group.calls) for group in self._groups)
+
+    def get_method(self, method: abi.Method | str) -> abi.Method:
+        if isinstance(method, abi.Method):
+            return method
+        if method in self._methods:
+            return self._methods[method]
+        return self.app_spec.contract.get_method_by_name(method)
+
+    def infer_boxes(
+        self, method: abi.Method | str, args: dict[str, Any], sender: str
+    ) -> list[bytes]:
+        """Returns the names of the boxes a call to `method` with `args` touches."""
+        rules = self.box_references.get(self.get_method(method).name, [])
+        return [rule(args, sender) for rule in rules]
+
+    def add_method_call(
+        self,
+        method: abi.Method | str,
+        args: dict[str, Any] | None = None,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "BatchComposer":
+        """Adds a call, with `args` keyed by the method's argument names."""
+        method = self.get_method(method)
+        args = args or {}
+        parameters = transaction_parameters or TransactionParameters()
+        signer = parameters.signer or self.signer
+        sender = parameters.sender or self.sender
+        if signer is None or sender is None:
+            raise Exception(f"A signer and sender are required to call {method.name}")
+        missing = [arg.name for arg in method.args if arg.name not in args]
+        if missing:
+            raise Exception(f"Missing arguments for {method.name}: {missing}")
+
+        boxes = dict.fromkeys(self.infer_boxes(method, args, sender))
+        for _, name in parameters.boxes or []:
+            boxes[encoding.encode_as_bytes(name)] = None
+        call = _Call(
+            method=method,
+            args=[args[arg.name] for arg in method.args],
+            parameters=dataclasses.replace(parameters, boxes=None),
+            sender=sender,
+            signer=signer,
+            boxes=list(boxes),
+            **self._count_references(method, args, parameters, sender),
+        )
+        if call.references > MAX_TXN_REFERENCES:
+            raise Exception(
+                f"{method.name} needs {call.references} references, "
+                f"more than the {MAX_TXN_REFERENCES} one app call can carry"
+            )
+        if call.accounts > MAX_TXN_ACCOUNTS:
+            raise Exception(
+                f"{method.name} references {call.accounts} accounts, "
+                f"more than the {MAX_TXN_ACCOUNTS} one app call can carry"
+            )
+
+        # A call joins the current group while the group stays within the size limit
+        # and its box references still fit, or fit better than without the call
+        group = self._groups[-1]
+        group_boxes = group.boxes | dict.fromkeys(call.boxes)
+        missing_before = len(group.boxes) - group.box_capacity
+        missing_after = len(group_boxes) - (
+            group.box_capacity + MAX_TXN_REFERENCES - call.references
+        )
+        if group.calls and (
+            group.txn_count + call.txn_count > self.max_group_size
+            or (missing_after > 0 and missing_after >= missing_before)
+        ):
+            group = _Group()
+            self._groups.append(group)
+            group_boxes = dict.fromkeys(call.boxes)
+        group.calls.append(call)
+        group.boxes = group_boxes
+        return self
+
+    def _count_references(
+        self,
+        method: abi.Method,
+        args: dict[str, Any],
+        parameters: TransactionParameters,
+        sender: str,
+    ) -> dict[str, int]:
+        """Counts the accounts, assets and apps the call itself places in its arrays."""
+        accounts = set(parameters.accounts or [])
+        assets = set(parameters.foreign_assets or [])
+        apps = set(parameters.foreign_apps or [])
+        for arg in method.args:
+            match arg.type:
+                case abi.ABIReferenceType.ACCOUNT:
+                    accounts.add(args[arg.name])
+                case abi.ABIReferenceType.ASSET:
+                    assets.add(args[arg.name])
+                case abi.ABIReferenceType.APPLICATION:
+                    apps.add(args[arg.name])
+        accounts.discard(sender)
+        apps.discard(self.app_id)
+        return {
+            "references": len(accounts) + len(assets) + len(apps),
+            "accounts": len(accounts),
+        }
+
+    def build(
+        self, suggested_params: transaction.SuggestedParams
+    ) -> list[AtomicTransactionComposer]:
+        """Returns one `AtomicTransactionComposer` per group, ready to sign and send."""
+        atcs = []
+        for group in self._groups:
+            if not group.calls:
+                continue
+            if len(group.boxes) > group.box_capacity:
+                raise Exception(
+                    f"A group of {len(group.calls)} calls needs {len(group.boxes)} box "
+                    f"references but has room for {group.box_capacity}; add calls "
+                    "with free references to carry them"
+                )
+            pending_boxes = list(group.boxes)
+            atc = AtomicTransactionComposer()
+            for call in group.calls:
+                room = MAX_TXN_REFERENCES - call.references
+                boxes, pending_boxes = pending_boxes[:room], pending_boxes[room:]
+                parameters = call.parameters
+                atc.add_method_call(
+                    app_id=self.app_id,
+                    method=call.method,
+                    sender=call.sender,
+                    sp=parameters.suggested_params or suggested_params,
+                    signer=call.signer,
+                    method_args=call.args,
+                    note=parameters.note,
+                    lease=parameters.lease,
+                    accounts=parameters.accounts,
+                    foreign_apps=parameters.foreign_apps,
+                    foreign_assets=parameters.foreign_assets,
+                    boxes=[(self.app_id, name) for name in boxes],
+                    rekey_to=parameters.rekey_to,
+                )
+            atcs.append(atc)
+        return atcs
+
+    def execute(
+        self, algod_client: AlgodClient, wait_rounds: int = DEFAULT_WAIT_ROUNDS
+    ) -> list[AtomicTransactionResponse]:
+        """Sends the groups one after another, waiting for each to be confirmed."""
+        atcs = self.build(algod_client.suggested_params())
+        responses = []
+        for index, atc in enumerate(atcs):
+            responses.append(atc.execute(algod_client, wait_rounds))
+            logger.info(
+                f"Confirmed group {index + 1}/{len(atcs)} of {atc.get_tx_count()} "
+                f"transactions in round {responses[-1].confirmed_round}"
+            )
+        return responses
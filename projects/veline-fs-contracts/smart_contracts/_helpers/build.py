@@ -1,10 +1,69 @@
 import logging
 import subprocess
+import threading
 from pathlib import Path
 from shutil import rmtree
+from typing import Any
+
+from smart_contracts._helpers import inprocess, timing
+from smart_contracts._helpers.build_cache import (
+    build_hash,
+    is_up_to_date,
+    read_manifest,
+    write_manifest,
+)
 
 logger = logging.getLogger(__name__)
 deployment_extension = "py"
+# optimisation and debug flags of each build profile, the committed artifacts are
+# built with the default
+PROFILES = {
+    "dev": ["--optimization-level=0", "--debug-level=1"],
+    "release": ["--optimization-level=1", "--debug-level=0"],
+    "size": ["--optimization-level=2", "--debug-level=0"],
+}
+DEFAULT_PROFILE = "release"
+# "auto" compiles in process when puyapy is importable and with the AlgoKit CLI if not
+BACKENDS = ("auto", "in-process", "cli")
+
+# compiler and generator processes of the builds in progress
+_running: set[subprocess.Popen[str]] = set()
+_running_lock = threading.Lock()
+
+
+def _run(args: list[Any]) -> subprocess.CompletedProcess[str]:
+    """Runs a command, logging its output line by line as it is produced."""
+    output = []
+    with subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    ) as process:
+        with _running_lock:
+            _running.add(process)
+        try:
+            for line in process.stdout:  # type: ignore[union-attr]
+                output.append(line)
+                logger.debug(line.rstrip())
+            returncode = process.wait()
+        finally:
+            with _running_lock:
+                _running.discard(process)
+    return subprocess.CompletedProcess(args, returncode, "".join(output))
+
+
+def terminate_builds() -> None:
+    """Stops the compiler and generator processes of the builds in progress."""
+    with _running_lock:
+        for process in _running:
+            process.terminate()
+
+
+def profile_flags(profile: str) -> list[str]:
+    if profile not in PROFILES:
+        raise Exception(f"Unknown build profile {profile}, use one of {list(PROFILES)}")
+    return ["--output-arc32", *PROFILES[profile]]
+
+
+compile_flags = profile_flags(DEFAULT_PROFILE)
 
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
@@ -15,14 +74,15 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
-    output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
+def _find_app_spec(output_dir: Path) -> Path:
+    app_spec_path = next(output_dir.glob("*.arc32.json"), None)
+    if app_spec_path is None:
+        raise Exception(f"Could not find an .arc32.json file in {output_dir}")
+    return app_spec_path
 
-    build_result = subprocess.run(
+
+def _compile_with_cli(contract_path: Path, output_dir: Path, flags: list[str]) -> None:
+    build_result = _run(
         [
             "algokit",
             "--no-color",
@@ -30,16 +90,125 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "python",
             contract_path.absolute(),
             f"--out-dir={output_dir}",
-            "--output-arc32",
-            "--debug-level=0",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+            *flags,
+        ]
     )
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
 
+
+def _generate_client_with_cli(output_dir: Path) -> None:
+    generate_result = _run(
+        [
+            "algokit",
+            "generate",
+            "client",
+            output_dir,
+            "--output",
+            _get_output_path(output_dir, deployment_extension),
+        ]
+    )
+    if generate_result.returncode:
+        if "No such command" in generate_result.stdout:
+            raise Exception(
+                "Could not generate typed client, requires AlgoKit 2.0.0 or "
+                "later. Please update AlgoKit"
+            )
+        else:
+            raise Exception(
+                f"Could not generate typed client:\n{generate_result.stdout}"
+            )
+
+
+def _in_process(backend: str) -> bool:
+    if backend not in BACKENDS:
+        raise Exception(f"Unknown build backend {backend}, use one of {BACKENDS}")
+    if backend == "in-process" and not inprocess.available():
+        raise Exception("Could not build in process, puyapy is not installed")
+    return backend != "cli" and inprocess.available()
+
+
+# Errors of an in-process step that mean the installed puyapy or client generator
+# has another API than the one used, rather than that the contract is wrong
+_API_ERRORS = (inprocess.UnsupportedFlag, TypeError, AttributeError)
+
+
+def _measure(output_dir: Path) -> dict[str, Any]:
+    """The program size and the cost of each method of the programs built."""
+    from smart_contracts._helpers.teal_cost import analyse_artifacts
+
+    return {
+        name: {
+            "program_size": report["program_size"],
+            "method_costs": {
+                signature: method["cost"]
+                for signature, method in report["methods"].items()
+            },
+        }
+        for name, report in analyse_artifacts(
+            output_dir.glob("*.approval.teal")
+        ).items()
+    }
+
+
+def built_profile(output_dir: Path) -> str:
+    """The profile the artifacts in `output_dir` were last built with; artifacts
+    without a manifest are taken to be the committed ones."""
+    manifest = read_manifest(output_dir) or {}
+    return manifest.get("profile", DEFAULT_PROFILE)  # type: ignore[no-any-return]
+
+
+def _log_profiles(contract_path: Path, profiles: dict[str, Any]) -> None:
+    for profile, programs in sorted(profiles.items()):
+        for name, program in programs.items():
+            logger.info(
+                f"{contract_path} built for {profile}: {name} is "
+                f"{program['program_size']} bytes, its methods cost "
+                f"{sum(program['method_costs'].values())} in total"
+            )
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    force: bool = False,
+    backend: str = "auto",
+    profile: str = DEFAULT_PROFILE,
+) -> Path:
+    output_dir = output_dir.resolve()
+    flags = profile_flags(profile)
+    sources_hash = build_hash(contract_path, [deployment_extension])
+    inputs_hash = build_hash(contract_path, [*flags, deployment_extension])
+    if not force and is_up_to_date(output_dir, inputs_hash):
+        logger.info(f"{contract_path} is unchanged since its last build, skipping")
+        return _find_app_spec(output_dir)
+
+    # the measurements of the other profiles are kept while the sources are the
+    # same, so they can be compared
+    manifest = read_manifest(output_dir) or {}
+    profiles = (
+        manifest.get("profiles", {})
+        if manifest.get("sources_hash") == sources_hash
+        else {}
+    )
+    if output_dir.exists():
+        rmtree(output_dir)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    logger.info(f"Exporting {contract_path} to {output_dir}")
+
+    in_process = _in_process(backend)
+    with timing.stage("compile"):
+        if in_process:
+            try:
+                inprocess.compile_contract(contract_path, output_dir, flags)
+            except _API_ERRORS as ex:
+                if backend == "in-process":
+                    raise
+                logger.warning(f"Could not compile in process ({ex}), using the CLI")
+                in_process = False
+        if not in_process:
+            _compile_with_cli(contract_path, output_dir, flags)
+
     app_spec_file_names = [file.name for file in output_dir.glob("*.arc32.json")]
 
     for app_spec_file_name in app_spec_file_names:
@@ -47,29 +216,33 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             raise Exception(
                 "Could not generate typed client, .arc32.json file not found"
             )
-        print(app_spec_file_name)
-        generate_result = subprocess.run(
-            [
-                "algokit",
-                "generate",
-                "client",
-                output_dir,
-                "--output",
-                _get_output_path(output_dir, deployment_extension),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        if generate_result.returncode:
-            if "No such command" in generate_result.stdout:
-                raise Exception(
-                    "Could not generate typed client, requires AlgoKit 2.0.0 or "
-                    "later. Please update AlgoKit"
-                )
-            else:
-                raise Exception(
-                    f"Could not generate typed client:\n{generate_result.stdout}"
-                )
+        logger.info(f"Generating typed client for {app_spec_file_name}")
+        with timing.stage("client generation"):
+            if in_process:
+                try:
+                    inprocess.generate_client(
+                        output_dir / app_spec_file_name,
+                        _get_output_path(output_dir, deployment_extension),
+                    )
+                except _API_ERRORS as ex:
+                    if backend == "in-process":
+                        raise
+                    logger.warning(
+                        f"Could not generate in process ({ex}), using the CLI"
+                    )
+                    in_process = False
+            if not in_process:
+                _generate_client_with_cli(output_dir)
 
+    profiles[profile] = _measure(output_dir)
+    if len(profiles) > 1:
+        _log_profiles(contract_path, profiles)
+    write_manifest(
+        output_dir,
+        inputs_hash,
+        flags=flags,
+        profile=profile,
+        sources_hash=sources_hash,
+        profiles=profiles,
+    )
     return output_dir / app_spec_file_name
@@ -0,0 +1,136 @@
+"""Skips rebuilding contracts whose inputs have not changed since the last build.
+
+A build is identified by a hash of everything its artifacts depend on: the
+contract's source and the project modules it imports, directly or not, the
+versions of the compiler and client generator, and the compiler flags. The hash and a digest of each artifact
+are recorded in a manifest next to the artifacts, and a build whose hash matches
+a manifest with intact artifacts has nothing to do.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "build_manifest.json"
+# Packages whose version changes the artifacts built from the same source
+BUILD_TOOLS = ("puyapy", "algorand-python", "algokit-client-generator")
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def _module_paths(root: Path, module: str) -> list[Path]:
+    base = root.joinpath(*module.split("."))
+    return [base.with_suffix(".py"), base / "__init__.py"]
+
+
+def _imported_paths(path: Path, root: Path) -> Iterable[Path]:
+    """Yields the files of the project modules `path` may import."""
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    package = path.parent.relative_to(root).parts
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield from _module_paths(root, alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package[: len(package) - node.level + 1]
+                module = ".".join([*parts, *([node.module] if node.module else [])])
+            else:
+                module = node.module or ""
+            yield from _module_paths(root, module)
+            # `from package import module` imports a module too
+            for alias in node.names:
+                yield from _module_paths(root, f"{module}.{alias.name}")
+
+
+def source_files(contract_path: Path, root: Path = PROJECT_ROOT) -> list[Path]:
+    """Returns the contract and the project files it imports, transitively."""
+    root = root.resolve()
+    pending = [contract_path.resolve()]
+    found: set[Path] = set()
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.add(path)
+        pending.extend(
+            imported
+            for imported in _imported_paths(path, root)
+            if imported.is_file() and imported not in found
+        )
+    return sorted(found)
+
+
+def tool_versions() -> dict[str, str]:
+    versions = {}
+    for tool in BUILD_TOOLS:
+        try:
+            versions[tool] = metadata.version(tool)
+        except metadata.PackageNotFoundError:
+            versions[tool] = "not installed"
+    return versions
+
+
+def build_hash(
+    contract_path: Path,
+    flags: Iterable[str],
+    root: Path = PROJECT_ROOT,
+) -> str:
+    """Hashes the inputs of a contract's build: its source files, the build tool
+    versions and `flags`."""
+    digest = hashlib.sha256()
+    root = root.resolve()
+    for path in source_files(contract_path, root):
+        path = path.resolve()
+        name = path.relative_to(root) if path.is_relative_to(root) else path
+        digest.update(f"{name.as_posix()}\0".encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    digest.update(json.dumps([tool_versions(), list(flags)]).encode())
+    return digest.hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def read_manifest(output_dir: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads((output_dir / MANIFEST_FILE).read_text())  # type: ignore[no-any-return]
+    except (OSError, ValueError):
+        return None
+
+
+def is_up_to_date(output_dir: Path, inputs_hash: str) -> bool:
+    """Whether the artifacts in `output_dir` were built from `inputs_hash` and have
+    not been changed since."""
+    manifest = read_manifest(output_dir)
+    if manifest is None or manifest.get("build_hash") != inputs_hash:
+        return False
+    return all(
+        (output_dir / name).is_file() and _file_digest(output_dir / name) == digest
+        for name, digest in manifest["outputs"].items()
+    )
+
+
+def write_manifest(
+    output_dir: Path, inputs_hash: str, **details: Any
+) -> dict[str, Any]:
+    """Records the artifacts in `output_dir` as built from `inputs_hash`."""
+    manifest = {
+        "build_hash": inputs_hash,
+        "tools": tool_versions(),
+        **details,
+        "outputs": {
+            path.name: _file_digest(path)
+            for path in sorted(output_dir.iterdir())
+            if path.is_file() and path.name != MANIFEST_FILE
+        },
+    }
+    (output_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
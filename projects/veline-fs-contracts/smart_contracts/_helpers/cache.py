@@ -0,0 +1,240 @@
+import asyncio
+import copy
+import dataclasses
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.transport import PooledAlgodClient, PooledSession
+
+T = TypeVar("T")
+
+# A block is produced every few seconds, so anything older than that is likely stale
+DEFAULT_TTL = 3.0
+# Fields of algod responses that tell which round the node has reached
+ROUND_FIELDS = ("last-round", "round", "confirmed-round")
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclasses.dataclass
+class _Entry:
+    value: Any
+    round: int
+    expires_at: float
+
+
+@dataclasses.dataclass
+class _Fetch:
+    task: "asyncio.Task[Any]"
+    waiters: int = 0
+
+
+class RoundCache:
+    """Caches algod reads until they expire or a newer round is observed.
+
+    Entries are keyed by a tuple whose first item is their kind, such as
+    `"suggested_params"` or `"global_state"`; hits and misses are counted per kind in
+    `stats`. Every response that carries a round is passed to `observe_round`, so a
+    read made after a transaction confirms never sees state from before it.
+
+    One cache may be shared by clients on several threads, such as the concurrent
+    deploys of `deploy_all`; its state is only changed under a lock, which is not
+    held while fetching.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.clock = clock
+        self.round = 0
+        self.stats: dict[str, CacheStats] = {}
+        self._entries: dict[tuple[Hashable, ...], _Entry] = {}
+        self._fetches: dict[tuple[Hashable, ...], _Fetch] = {}
+        # Reentrant, as storing a value may observe a new round
+        self._lock = threading.RLock()
+
+    @property
+    def hits(self) -> int:
+        return sum(stats.hits for stats in self.stats.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(stats.misses for stats in self.stats.values())
+
+    def observe_round(self, round_num: int) -> None:
+        with self._lock:
+            if round_num > self.round:
+                self.round = round_num
+                self._entries.clear()
+
+    def observe_response(self, response: Any) -> None:
+        self.observe_round(_response_round(response))
+
+    def invalidate(self, *key: Hashable) -> None:
+        """Drops the entry for `key`, or every entry if no key is given."""
+        with self._lock:
+            if key:
+                self._entries.pop(key, None)
+            else:
+                self._entries.clear()
+
+    def _lookup(
+        self, key: tuple[Hashable, ...], pending: bool = False
+    ) -> _Entry | None:
+        with self._lock:
+            stats = self.stats.setdefault(str(key[0]), CacheStats())
+            entry = self._entries.get(key)
+            if entry and entry.round == self.round and entry.expires_at > self.clock():
+                stats.hits += 1
+                return entry
+            # Joining a fetch already in flight saves a request just as a hit does
+            if pending:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+            return None
+
+    def _store(self, key: tuple[Hashable, ...], value: Any, round_num: int) -> None:
+        # A round observed while fetching means the value may already be stale,
+        # unless the value says it is from that round
+        round_num = max(round_num, _response_round(value))
+        with self._lock:
+            self.observe_round(round_num)
+            if self.ttl > 0 and round_num == self.round:
+                self._entries[key] = _Entry(value, round_num, self.clock() + self.ttl)
+
+    def get_or_fetch(self, key: tuple[Hashable, ...], fetch: Callable[[], T]) -> T:
+        entry = self._lookup(key)
+        if entry:
+            return entry.value  # type: ignore[no-any-return]
+        round_num = self.round
+        value = fetch()
+        self._store(key, value, round_num)
+        return value
+
+    async def get_or_fetch_async(
+        self, key: tuple[Hashable, ...], fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Like `get_or_fetch`, but concurrent misses on one key share a single fetch.
+
+        The fetch runs in its own task, so a cancelled caller only stops waiting for
+        it; the fetch is cancelled once no caller is waiting any more.
+        """
+        entry = self._lookup(key, pending=key in self._fetches)
+        if entry:
+            return entry.value  # type: ignore[no-any-return]
+        shared = self._fetches.get(key)
+        if shared is None:
+            shared = _Fetch(asyncio.ensure_future(self._fetch(key, fetch)))
+            self._fetches[key] = shared
+        shared.waiters += 1
+        try:
+            return await asyncio.shield(shared.task)  # type: ignore[no-any-return]
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                shared.task.cancel()
+                # Later callers start a new fetch instead of joining a cancelled one
+                if self._fetches.get(key) is shared:
+                    del self._fetches[key]
+
+    async def _fetch(
+        self, key: tuple[Hashable, ...], fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        round_num = self.round
+        try:
+            value = await fetch()
+        finally:
+            shared = self._fetches.get(key)
+            if shared and shared.task is asyncio.current_task():
+                del self._fetches[key]
+        self._store(key, value, round_num)
+        return value
+
+
+def _response_round(response: Any) -> int:
+    if isinstance(response, transaction.SuggestedParams):
+        return response.first
+    if isinstance(response, dict):
+        return max(
+            (response[field] for field in ROUND_FIELDS if field in response),
+            default=0,
+        )
+    return 0
+
+
+class CachingAlgodClient(PooledAlgodClient):
+    """`AlgodClient` that serves suggested params, app info and boxes from a cache.
+
+    Drop-in for the generated clients and `algokit_utils.ApplicationClient`, which
+    fetch suggested params for every call and global state for every read.
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        cache: RoundCache | None = None,
+        *,
+        session: PooledSession | None = None,
+    ):
+        super().__init__(algod_token, algod_address, headers, session=session)
+        self.cache = cache or RoundCache()
+
+    @classmethod
+    def wrap(
+        cls, algod_client: AlgodClient, cache: RoundCache | None = None
+    ) -> "CachingAlgodClient":
+        """Returns a caching client for the same node, sharing the connections of
+        `algod_client` if it is pooled."""
+        return cls(
+            algod_client.algod_token,
+            algod_client.algod_address,
+            algod_client.headers,
+            cache,
+            session=getattr(algod_client, "session", None),
+        )
+
+    def algod_request(self, *args: Any, **kwargs: Any) -> Any:
+        response = super().algod_request(*args, **kwargs)
+        self.cache.observe_response(response)
+        return response
+
+    def suggested_params(self, **kwargs: Any) -> transaction.SuggestedParams:
+        if kwargs:
+            return super().suggested_params(**kwargs)
+        # Callers may adjust the fee of the params they are given
+        return copy.copy(
+            self.cache.get_or_fetch(("suggested_params",), super().suggested_params)
+        )
+
+    def application_info(self, application_id: int, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().application_info(application_id, **kwargs)
+        return self.cache.get_or_fetch(
+            ("application_info", application_id),
+            lambda: super(CachingAlgodClient, self).application_info(application_id),
+        )
+
+    def application_box_by_name(
+        self, application_id: int, box_name: bytes, **kwargs: Any
+    ) -> Any:
+        if kwargs:
+            return super().application_box_by_name(application_id, box_name, **kwargs)
+        return self.cache.get_or_fetch(
+            ("box", application_id, box_name),
+            lambda: super(CachingAlgodClient, self).application_box_by_name(
+                application_id, box_name
+            ),
+        )
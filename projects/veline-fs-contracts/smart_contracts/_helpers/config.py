@@ -1,21 +1,31 @@
 import dataclasses
+import functools
 import importlib
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from algokit_utils import Account, ApplicationSpecification
-from algosdk.v2client.algod import AlgodClient
-from algosdk.v2client.indexer import IndexerClient
+if TYPE_CHECKING:
+    # only for annotations, importing them takes longer than a build starts
+    from algokit_utils import Account, ApplicationSpecification, DeployResponse
+    from algosdk.v2client.algod import AlgodClient
+    from algosdk.v2client.indexer import IndexerClient
+
+    DeployCallback = Callable[
+        [AlgodClient, IndexerClient, ApplicationSpecification, Account],
+        DeployResponse | None,
+    ]
 
 
 @dataclasses.dataclass
 class SmartContract:
     path: Path
     name: str
-    deploy: (
-        Callable[[AlgodClient, IndexerClient, ApplicationSpecification, Account], None]
-        | None
-    ) = None
+
+    @functools.cached_property
+    def deploy(self) -> "DeployCallback | None":
+        """The contract's deploy function, imported on first use."""
+        return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -29,10 +39,7 @@ def import_contract(folder: Path) -> Path:
 
 def import_deploy_if_exists(
     folder: Path,
-) -> (
-    Callable[[AlgodClient, IndexerClient, ApplicationSpecification, Account], None]
-    | None
-):
+) -> "DeployCallback | None":
     """Imports the deploy function from a folder if it exists."""
     try:
         deploy_module = importlib.import_module(
@@ -50,12 +57,32 @@ def has_contract_file(directory: Path) -> bool:
 
 # define contracts to build and/or deploy
 base_dir = Path("smart_contracts")
-contracts = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in base_dir.iterdir()
-    if folder.is_dir() and has_contract_file(folder)
-]
+
+
+def discover_contracts(
+    names: Collection[str] | None = None, base_dir: Path = base_dir
+) -> list[SmartContract]:
+    """Lists the contracts in `base_dir`, or only the named ones.
+
+    Only the folders are looked at; nothing is imported until a contract's
+    `deploy` is used, and naming contracts skips listing the other folders.
+    """
+    if names is None:
+        folders = sorted(
+            folder
+            for folder in base_dir.iterdir()
+            if folder.is_dir() and has_contract_file(folder)
+        )
+    else:
+        folders = [base_dir / name for name in names]
+    return [
+        SmartContract(path=import_contract(folder), name=folder.name)
+        for folder in folders
+    ]
+
+
+def __getattr__(name: str) -> Any:
+    # `contracts` is kept for existing imports, and discovered when first used
+    if name == "contracts":
+        return discover_contracts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 # mypy: disable-error-code="no-untyped-call, misc"
 
 
+import functools
 import logging
 from collections.abc import Callable
 from pathlib import Path
@@ -8,46 +9,115 @@ from pathlib import Path
 from algokit_utils import (
     Account,
     ApplicationSpecification,
+    DeployResponse,
     EnsureBalanceParameters,
     ensure_funded,
     get_account,
-    get_algod_client,
-    get_indexer_client,
 )
 from algosdk.util import algos_to_microalgos
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
+from smart_contracts._helpers import timing
+from smart_contracts._helpers.cache import CachingAlgodClient
+from smart_contracts._helpers.parallel import run_parallel
+from smart_contracts._helpers.registry import is_unchanged, record_deployment
+from smart_contracts._helpers.transport import (
+    PooledSession,
+    get_pooled_algod_client,
+    get_pooled_indexer_client,
+)
+
 logger = logging.getLogger(__name__)
 
+DeployCallback = Callable[
+    [AlgodClient, IndexerClient, ApplicationSpecification, Account],
+    DeployResponse | None,
+]
 
-def deploy(
-    app_spec_path: Path,
-    deploy_callback: Callable[
-        [AlgodClient, IndexerClient, ApplicationSpecification, Account], None
-    ],
+
+def deploy_all(
+    deployments: dict[str, tuple[Path, DeployCallback]],
+    jobs: int | None = None,
     deployer_initial_funds: int = 2,
 ) -> None:
+    """Deploys contracts concurrently, by name, from their app spec and callback.
+
+    All share one pool of connections and one deployer, funded once for all the
+    contracts that changed. Contracts whose recorded app already runs their
+    programs are skipped.
+    """
     # get clients
     # by default client configuration is loaded from environment variables
-    algod_client = get_algod_client()
-    indexer_client = get_indexer_client()
-
-    # get app spec
-    app_spec = ApplicationSpecification.from_json(app_spec_path.read_text())
-
-    # get deployer account by name
-    deployer = get_account(algod_client, "DEPLOYER", fund_with_algos=0)
-
-    minimum_funds_micro_algos = algos_to_microalgos(deployer_initial_funds)
-    ensure_funded(
-        algod_client,
-        EnsureBalanceParameters(
-            account_to_fund=deployer,
-            min_spending_balance_micro_algos=minimum_funds_micro_algos,
-            min_funding_increment_micro_algos=minimum_funds_micro_algos,
-        ),
-    )
+    # both share one pool of keep-alive connections, and suggested params and app
+    # state are cached until the next round
+    session = PooledSession()
+    algod_client = CachingAlgodClient.wrap(get_pooled_algod_client(session=session))
+    indexer_client = get_pooled_indexer_client(session=session)
+
+    try:
+        # get app specs
+        app_specs = {
+            name: ApplicationSpecification.from_json(app_spec_path.read_text())
+            for name, (app_spec_path, _) in deployments.items()
+        }
+        # the app recorded by the last deploy to this network may already have
+        # these programs, then there is nothing to fund or send
+        unchanged = run_parallel(
+            {
+                name: functools.partial(is_unchanged, algod_client, app_spec)
+                for name, app_spec in app_specs.items()
+            },
+            jobs,
+        )
+        for name in deployments:
+            if unchanged[name]:
+                logger.info(f"{name} is unchanged, skipping deploy")
+        to_deploy = [name for name in deployments if not unchanged[name]]
+        if not to_deploy:
+            return
+
+        with timing.stage("funding"):
+            # get deployer account by name
+            deployer = get_account(algod_client, "DEPLOYER", fund_with_algos=0)
 
-    # use provided callback to deploy the app
-    deploy_callback(algod_client, indexer_client, app_spec, deployer)
+            minimum_funds_micro_algos = algos_to_microalgos(deployer_initial_funds)
+            ensure_funded(
+                algod_client,
+                EnsureBalanceParameters(
+                    account_to_fund=deployer,
+                    min_spending_balance_micro_algos=minimum_funds_micro_algos
+                    * len(to_deploy),
+                    min_funding_increment_micro_algos=minimum_funds_micro_algos,
+                ),
+            )
+
+        def deploy_contract(name: str) -> DeployResponse | None:
+            _, deploy_callback = deployments[name]
+            # use provided callback to deploy the app
+            with timing.stage("create/update"):
+                return deploy_callback(
+                    algod_client, indexer_client, app_specs[name], deployer
+                )
+
+        responses = run_parallel(
+            {name: functools.partial(deploy_contract, name) for name in to_deploy},
+            jobs,
+        )
+        for name, response in responses.items():
+            if response is not None:
+                record_deployment(algod_client, app_specs[name], response.app)
+    finally:
+        logger.debug(f"Requests by endpoint: {session.metrics.summary()}")
+        session.close()
+
+
+def deploy(
+    app_spec_path: Path,
+    deploy_callback: DeployCallback,
+    deployer_initial_funds: int = 2,
+) -> None:
+    deploy_all(
+        {app_spec_path.parent.name: (app_spec_path, deploy_callback)},
+        deployer_initial_funds=deployer_initial_funds,
+    )
@@ -0,0 +1,111 @@
+"""Compiles contracts and generates their clients without leaving the process.
+
+`algokit compile python` and `algokit generate client` each start the AlgoKit CLI,
+which starts another interpreter for puyapy, so every contract pays for several
+interpreter startups and imports of the compiler. This backend imports puyapy and
+the client generator once and calls them directly for every contract.
+
+Both are used through APIs that are not part of their command line interface, so
+`available` reports whether the installed versions expose what is needed, and
+callers fall back to the CLI when they do not, or when a flag has no known
+equivalent option.
+"""
+
+import functools
+import json
+import logging
+import re
+import threading
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# puyapy keeps its logging context in globals, so one contract compiles at a time
+_compile_lock = threading.Lock()
+_INT_FLAG = re.compile(r"^--([a-z-]+)=(\d+)$")
+_BOOL_FLAGS = {"--output-arc32": "output_arc32", "--output-teal": "output_teal"}
+_INT_OPTIONS = {
+    "debug-level": "debug_level",
+    "optimization-level": "optimization_level",
+}
+
+
+class UnsupportedFlag(Exception):
+    pass
+
+
+class _Backend(NamedTuple):
+    compile_to_teal: Callable[[Any], None]
+    options_class: type
+    generate_client: Callable[[Path, Path], None]
+
+
+@functools.cache
+def _load() -> _Backend | None:
+    try:
+        from algokit_client_generator import generate_client  # type: ignore
+        from puyapy.compile import compile_to_teal  # type: ignore
+        from puyapy.options import PuyaPyOptions  # type: ignore
+    except ImportError as ex:
+        logger.debug(f"Compiling with the AlgoKit CLI, {ex}")
+        return None
+    return _Backend(compile_to_teal, PuyaPyOptions, generate_client)
+
+
+def available() -> bool:
+    return _load() is not None
+
+
+def compiler_options(flags: Sequence[str]) -> dict[str, Any]:
+    """Translates `algokit compile python` flags to `PuyaPyOptions` fields."""
+    options: dict[str, Any] = {}
+    for flag in flags:
+        if flag in _BOOL_FLAGS:
+            options[_BOOL_FLAGS[flag]] = True
+        elif (match := _INT_FLAG.match(flag)) and match.group(1) in _INT_OPTIONS:
+            options[_INT_OPTIONS[match.group(1)]] = int(match.group(2))
+        else:
+            raise UnsupportedFlag(f"No in-process equivalent for {flag}")
+    return options
+
+
+def compile_contract(
+    contract_path: Path, output_dir: Path, flags: Sequence[str]
+) -> None:
+    backend = _load()
+    if backend is None:
+        raise Exception("puyapy is not installed")
+    options = backend.options_class(
+        paths=[contract_path.absolute()],
+        out_dir=output_dir,
+        **compiler_options(flags),
+    )
+    with _compile_lock:
+        try:
+            backend.compile_to_teal(options)
+        except SystemExit as ex:
+            # puyapy logs the errors of the contract, then exits
+            raise Exception(
+                f"Could not build contract, see the errors above (exit code {ex.code})"
+            ) from None
+
+
+def snake_case(name: str) -> str:
+    """The `{contract_name}` AlgoKit puts in client file names, from the app spec's."""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+
+
+def generate_client(app_spec_path: Path, output_pattern: Path) -> Path:
+    """Generates the client of one app spec at `output_pattern`, with its
+    `{contract_name}` filled in as the AlgoKit CLI does."""
+    backend = _load()
+    if backend is None:
+        raise Exception("algokit-client-generator is not installed")
+    contract_name = json.loads(app_spec_path.read_text())["contract"]["name"]
+    output_path = Path(
+        str(output_pattern).format(contract_name=snake_case(contract_name))
+    )
+    backend.generate_client(app_spec_path, output_path)
+    return output_path
@@ -0,0 +1,25 @@
+"""Lazy access to the generated typed clients.
+
+`algokit generate client` emits a module that imports algokit_utils and algosdk
+and parses the embedded ARC-32 spec at import time, which costs a few hundred
+milliseconds before any client exists. The generated modules are left exactly as
+the generator writes them; each contract package has a thin `client` module
+instead, whose names are read from the generated module, imported on first use.
+"""
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_getattr(module_name: str) -> Callable[[str], Any]:
+    """A module `__getattr__` that reads names from `module_name`, importing it
+    the first time one is read."""
+
+    def __getattr__(name: str) -> Any:
+        if name.startswith("__"):
+            # such as __path__ or __file__, looked up by the import system
+            raise AttributeError(name)
+        return getattr(importlib.import_module(module_name), name)
+
+    return __getattr__
@@ -0,0 +1,196 @@
+"""Groups of app calls signed ahead of time, stored on disk and submitted later.
+
+`presign` builds app calls from an ARC-32 spec and explicit suggested params, so
+no algod is needed, groups them with `BatchComposer` and writes each signed group
+to a file as it goes. `replay` reads that file back and submits the groups through
+a `SubmissionPipeline`, as fast as algod takes them.
+
+The file is a stream of msgpack arrays, one per group, of:
+
+- the signed transactions of the group, encoded and concatenated as algod's
+  `POST /v2/transactions` accepts them;
+- the id of the group's first transaction, to confirm it by;
+- the group's last valid round.
+"""
+
+import asyncio
+import dataclasses
+import logging
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+import msgpack  # type: ignore[import-untyped]
+from algokit_utils import Account, ApplicationSpecification
+from algosdk import constants, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+)
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.batch import BatchComposer, BoxName
+from smart_contracts._helpers.pipeline import (
+    DEFAULT_MAX_IN_FLIGHT,
+    SubmissionPipeline,
+    encode_signed_group,
+)
+
+logger = logging.getLogger(__name__)
+
+# Transactions are valid for at most this many rounds after their first valid one
+MAX_VALID_ROUNDS = 1000
+# Calls grouped at once; groups are only formed from calls of the same chunk
+DEFAULT_CHUNK_SIZE = 4096
+
+# A call by method name or signature, with its arguments keyed by name
+Call = tuple[str, dict[str, Any]]
+
+
+class SignedGroup(NamedTuple):
+    signed_group: bytes
+    tx_id: str
+    last_valid: int
+
+
+@dataclasses.dataclass
+class ReplayResult:
+    confirmed: int = 0
+    failed: int = 0
+    # Groups whose last valid round had passed before they could be sent
+    expired: int = 0
+
+
+def offline_params(
+    first_valid: int,
+    last_valid: int,
+    genesis_hash: str,
+    genesis_id: str | None = None,
+    fee: int = constants.MIN_TXN_FEE,
+) -> transaction.SuggestedParams:
+    """Suggested params for transactions built without algod.
+
+    `fee` is the flat fee of each transaction; calls that send inner transactions
+    have to cover theirs too.
+    """
+    if not 0 <= last_valid - first_valid <= MAX_VALID_ROUNDS:
+        raise Exception(
+            f"Rounds {first_valid} to {last_valid} are not a valid window of at most "
+            f"{MAX_VALID_ROUNDS} rounds"
+        )
+    return transaction.SuggestedParams(
+        fee, first_valid, last_valid, genesis_hash, genesis_id, flat_fee=True
+    )
+
+
+class SignedGroupWriter:
+    """Signs groups and appends them to a stream, see the module docstring."""
+
+    def __init__(self, out: BinaryIO):
+        self.out = out
+        self.written = 0
+        self._packer = msgpack.Packer(use_bin_type=True)
+
+    def write(self, atc: AtomicTransactionComposer) -> None:
+        signed_txns = atc.gather_signatures()
+        self.out.write(
+            self._packer.pack(
+                [
+                    encode_signed_group(signed_txns),
+                    atc.tx_ids[0],
+                    max(
+                        signed_txn.transaction.last_valid_round
+                        for signed_txn in signed_txns
+                    ),
+                ]
+            )
+        )
+        self.written += 1
+
+
+def presign(
+    path: Path,
+    app_spec: ApplicationSpecification,
+    app_id: int,
+    calls: Iterable[Call],
+    suggested_params: transaction.SuggestedParams,
+    *,
+    signer: TransactionSigner | Account,
+    sender: str | None = None,
+    box_references: dict[str, list[BoxName]] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Signs `calls` to `app_id` in groups and writes them to `path`.
+
+    `calls` is consumed `chunk_size` at a time, so it may be a generator over
+    millions of calls. Returns the number of groups written.
+    """
+    calls = iter(calls)
+    with path.open("wb") as out:
+        writer = SignedGroupWriter(out)
+        while chunk := list(islice(calls, chunk_size)):
+            composer = BatchComposer(
+                app_spec, app_id, box_references, signer=signer, sender=sender
+            )
+            for method, args in chunk:
+                composer.add_method_call(method, args)
+            for atc in composer.build(suggested_params):
+                writer.write(atc)
+    logger.info(f"Signed {writer.written} groups into {path}")
+    return writer.written
+
+
+def iter_signed_groups(path: Path) -> Iterator[SignedGroup]:
+    with path.open("rb") as signed_groups:
+        for record in msgpack.Unpacker(signed_groups, raw=False):
+            yield SignedGroup(*record)
+
+
+async def replay(
+    algod_client: AsyncAlgodClient,
+    path: Path,
+    *,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    **pipeline_options: Any,
+) -> ReplayResult:
+    """Submits the signed groups in `path` and waits for them to be confirmed.
+
+    The file is read as groups are sent, so only `max_in_flight` of them are held
+    at a time. Groups that fail are logged and counted rather than stopping the
+    others; groups already past their last valid round are not sent.
+    """
+    result = ReplayResult()
+    current_round = (await algod_client.status())["last-round"]
+    in_flight: set[asyncio.Task[int]] = set()
+
+    def collect(done: Iterable[asyncio.Task[int]]) -> None:
+        for task in done:
+            if task.exception() is None:
+                result.confirmed += 1
+            else:
+                result.failed += 1
+                logger.warning(f"Group failed: {task.exception()}")
+
+    async with SubmissionPipeline(
+        algod_client, max_in_flight=max_in_flight, **pipeline_options
+    ) as pipeline:
+        for signed_group in iter_signed_groups(path):
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                collect(done)
+            # Rounds pass while groups are in flight, as seen by the block watcher
+            current_round = max(current_round, pipeline.round)
+            if signed_group.last_valid <= current_round:
+                result.expired += 1
+                continue
+            in_flight.add(asyncio.create_task(pipeline.submit_signed(*signed_group)))
+        if in_flight:
+            collect((await asyncio.wait(in_flight))[0])
+    logger.info(
+        f"Replayed {path}: {result.confirmed} groups confirmed, {result.failed} "
+        f"failed, {result.expired} expired"
+    )
+    return result
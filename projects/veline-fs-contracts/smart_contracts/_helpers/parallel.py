@@ -0,0 +1,100 @@
+"""Runs the build or deploy of several contracts at once.
+
+Each contract's work runs on its own thread; the work itself mostly waits on
+compiler subprocesses or on the network, so threads are enough. Log records
+emitted while working on a contract are prefixed with its name, so the
+interleaved output of concurrent builds can still be told apart.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_current = threading.local()
+
+
+class _NotStarted(Exception):
+    """Raised instead of starting a task once another has failed."""
+
+
+def current_contract() -> str | None:
+    return getattr(_current, "contract", None)
+
+
+class ContractLogFilter(logging.Filter):
+    """Sets `contract_prefix` on records, `[name] ` while working on a contract."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        contract = current_contract()
+        record.contract_prefix = f"[{contract}] " if contract else ""
+        return True
+
+
+def install_log_prefix(handler: logging.Handler) -> None:
+    handler.addFilter(ContractLogFilter())
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def run_parallel(
+    tasks: dict[str, Callable[[], T]],
+    jobs: int | None = None,
+    on_failure: Callable[[], None] | None = None,
+) -> dict[str, T]:
+    """Runs each task, keyed by contract name, on up to `jobs` threads.
+
+    Stops at the first failure: tasks not yet started are cancelled and
+    `on_failure` is called to stop the ones running. Raises an exception that
+    lists every task that failed; otherwise returns the results by name.
+    """
+    failed = threading.Event()
+
+    def run(name: str, task: Callable[[], T]) -> T:
+        # A worker may pick up a task before the rest are cancelled
+        if failed.is_set():
+            raise _NotStarted()
+        _current.contract = name
+        try:
+            return task()
+        except BaseException:
+            failed.set()
+            raise
+        finally:
+            _current.contract = None
+
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as executor:
+        futures: dict[str, Future[T]] = {
+            name: executor.submit(run, name, task) for name, task in tasks.items()
+        }
+        _, not_done = wait(futures.values(), return_when=FIRST_EXCEPTION)
+        if not_done:
+            for future in not_done:
+                future.cancel()
+            if on_failure:
+                on_failure()
+            wait(not_done)
+
+    not_started = [
+        name
+        for name, future in futures.items()
+        if future.cancelled() or isinstance(future.exception(), _NotStarted)
+    ]
+    errors = {
+        name: future.exception()
+        for name, future in futures.items()
+        if name not in not_started and future.exception()
+    }
+    if errors:
+        raise Exception(
+            f"{len(errors)} of {len(tasks)} contracts failed:\n"
+            + "\n".join(f"- {name}: {error}" for name, error in errors.items())
+            + (f"\nNot started: {', '.join(not_started)}" if not_started else "")
+        )
+    return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,229 @@
+import asyncio
+import base64
+import dataclasses
+import logging
+import random
+from collections.abc import Iterable
+
+from algosdk import abi, encoding, error, transaction
+from algosdk.atomic_transaction_composer import (
+    ABIResult,
+    AtomicTransactionComposer,
+    AtomicTransactionComposerStatus,
+    AtomicTransactionResponse,
+)
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 256
+DEFAULT_WAIT_ROUNDS = 10
+DEFAULT_MAX_RETRIES = 8
+DEFAULT_BACKOFF = 0.25
+DEFAULT_MAX_BACKOFF = 8.0
+# algod rejects transactions with these messages while its pool is saturated. A fee
+# "below threshold" is not among them: the same signed bytes would be rejected again
+POOL_FULL_ERRORS = ("transaction pool is full",)
+
+
+def is_pool_full(ex: error.AlgodHTTPError) -> bool:
+    return any(message in str(ex) for message in POOL_FULL_ERRORS)
+
+
+def encode_signed_group(
+    signed_txns: Iterable[transaction.GenericSignedTransaction],
+) -> bytes:
+    """Encodes a group as algod accepts it: its signed transactions concatenated."""
+    return b"".join(
+        base64.b64decode(encoding.msgpack_encode(txn)) for txn in signed_txns
+    )
+
+
+@dataclasses.dataclass
+class _Submitted:
+    confirmed: asyncio.Future[int]
+    last_round: int = 0
+
+
+class SubmissionPipeline:
+    """Signs, submits and confirms many atomic groups concurrently.
+
+    At most `max_in_flight` groups are submitted but not yet confirmed at any time.
+    Instead of polling each transaction, one watcher follows new blocks with
+    `status_after_block` and reads the ids of the transactions each block
+    confirmed, so confirming thousands of groups costs two requests per round.
+    Submissions rejected because the transaction pool is full are retried with
+    exponential backoff.
+
+    Use as an async context manager, or call `aclose` when done.
+    """
+
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        wait_rounds: int = DEFAULT_WAIT_ROUNDS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ):
+        self.algod_client = algod_client
+        self.wait_rounds = wait_rounds
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.submitted = 0
+        self.confirmed = 0
+        self.retries = 0
+        self._window = asyncio.Semaphore(max_in_flight)
+        self._waiting: dict[str, _Submitted] = {}
+        self._round = 0
+        self._watcher: asyncio.Task[None] | None = None
+        self._watcher_ready: asyncio.Future[None] | None = None
+
+    @property
+    def round(self) -> int:
+        """The latest round the block watcher has seen, 0 before it first runs."""
+        return self._round
+
+    async def __aenter__(self) -> "SubmissionPipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._watcher:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+            self._watcher = None
+
+    async def submit(self, atc: AtomicTransactionComposer) -> AtomicTransactionResponse:
+        """Submits one group once there is room in the window and waits for it."""
+        async with self._window:
+            signed_txns = atc.gather_signatures()
+            confirmed_round = await self._submit(
+                encode_signed_group(signed_txns),
+                atc.tx_ids[0],
+                max(
+                    signed_txn.transaction.last_valid_round
+                    for signed_txn in signed_txns
+                ),
+            )
+        atc.status = AtomicTransactionComposerStatus.COMMITTED
+        self.confirmed += 1
+        return AtomicTransactionResponse(
+            confirmed_round=confirmed_round,
+            tx_ids=atc.tx_ids,
+            results=await self._results(atc),
+        )
+
+    async def submit_signed(
+        self, signed_group: bytes, tx_id: str, last_valid: int
+    ) -> int:
+        """Submits a group already signed and encoded, and returns its round.
+
+        `tx_id` is the id of any transaction of the group and `last_valid` the
+        latest round in which the group can be confirmed.
+        """
+        async with self._window:
+            confirmed_round = await self._submit(signed_group, tx_id, last_valid)
+        self.confirmed += 1
+        return confirmed_round
+
+    async def _submit(self, signed_group: bytes, tx_id: str, last_valid: int) -> int:
+        submitted = _Submitted(confirmed=asyncio.get_running_loop().create_future())
+        # Registered before the watcher starts, so it sees there is work to do
+        self._waiting[tx_id] = submitted
+        try:
+            await self._start_watcher()
+            await self._send(signed_group)
+            submitted.last_round = min(self._round + self.wait_rounds, last_valid)
+            self.submitted += 1
+            return await submitted.confirmed
+        finally:
+            self._waiting.pop(tx_id, None)
+
+    async def run(
+        self, atcs: Iterable[AtomicTransactionComposer]
+    ) -> list[AtomicTransactionResponse | BaseException]:
+        """Submits every group and returns their responses, or errors, in order."""
+        return await asyncio.gather(
+            *(self.submit(atc) for atc in atcs), return_exceptions=True
+        )
+
+    async def _send(self, signed_group: bytes) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.algod_client.send_raw_transaction(signed_group)
+                return
+            except error.AlgodHTTPError as ex:
+                if not is_pool_full(ex) or attempt == self.max_retries:
+                    raise
+            self.retries += 1
+            delay = min(self.max_backoff, self.backoff * 2**attempt)
+            # Jitter keeps rejected submissions from all coming back at once
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    async def _results(self, atc: AtomicTransactionComposer) -> list[ABIResult]:
+        """Parses the ABI results, only reading the transactions that return a value."""
+        tx_infos = await asyncio.gather(
+            *(
+                self.algod_client.pending_transaction_info(atc.tx_ids[index])
+                for index, method in atc.method_dict.items()
+                if method.returns.type != abi.Returns.VOID
+            )
+        )
+        results = []
+        infos = iter(tx_infos)
+        for index, method in atc.method_dict.items():
+            tx_info = next(infos) if method.returns.type != abi.Returns.VOID else {}
+            results.append(atc.parse_result(method, atc.tx_ids[index], tx_info))
+        return results
+
+    async def _start_watcher(self) -> None:
+        if self._watcher is None or self._watcher.done():
+            self._watcher_ready = asyncio.get_running_loop().create_future()
+            self._watcher = asyncio.create_task(self._watch(self._watcher_ready))
+        # Groups may only be sent once the watcher knows the round to follow from
+        await asyncio.shield(self._watcher_ready)  # type: ignore[arg-type]
+
+    async def _watch(self, ready: asyncio.Future[None]) -> None:
+        algod = self.algod_client
+        try:
+            self._round = (await algod.status())["last-round"]
+        except Exception as ex:
+            ready.set_exception(ex)
+            return
+        ready.set_result(None)
+        try:
+            while self._waiting:
+                status = await algod.status_after_block(self._round)
+                for round_num in range(self._round + 1, status["last-round"] + 1):
+                    for tx_id in await algod.block_txids(round_num):
+                        submitted = self._waiting.get(tx_id)
+                        if submitted and not submitted.confirmed.done():
+                            submitted.confirmed.set_result(round_num)
+                    self._round = round_num
+                self._expire()
+        except Exception as ex:
+            logger.warning(f"Stopped following blocks: {ex}")
+            for submitted in self._waiting.values():
+                if not submitted.confirmed.done():
+                    submitted.confirmed.set_exception(ex)
+
+    def _expire(self) -> None:
+        for tx_id, submitted in self._waiting.items():
+            # Groups still being sent have no last round yet
+            if (
+                submitted.last_round
+                and submitted.last_round <= self._round
+                and not submitted.confirmed.done()
+            ):
+                submitted.confirmed.set_exception(
+                    error.ConfirmationTimeoutError(
+                        f"Wait for transaction id {tx_id} timed out"
+                    )
+                )
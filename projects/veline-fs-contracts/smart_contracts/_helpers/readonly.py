@@ -0,0 +1,218 @@
+import asyncio
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+import algokit_utils
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+)
+from algosdk.logic import get_application_address
+from algosdk.v2client import models
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.cache import RoundCache
+
+MAX_GROUP_SIZE = 16
+
+ReadCall = tuple[abi.Method, Sequence[Any]]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turns ABI argument values into a hashable key."""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    return value  # type: ignore[no-any-return]
+
+
+def _read_group(
+    app_id: int,
+    sender: str,
+    suggested_params: transaction.SuggestedParams,
+    calls: Sequence[ReadCall],
+) -> AtomicTransactionComposer:
+    atc = AtomicTransactionComposer()
+    for method, args in calls:
+        atc.add_method_call(
+            app_id=app_id,
+            method=method,
+            sender=sender,
+            sp=suggested_params,
+            signer=EmptySigner(),
+            method_args=list(args),
+        )
+    return atc
+
+
+def _read_request(atc: AtomicTransactionComposer) -> models.SimulateRequest:
+    # Reads are not signed and their boxes are not declared, simulate allows both
+    return models.SimulateRequest(
+        txn_groups=[
+            models.SimulateRequestTransactionGroup(txns=atc.gather_signatures())
+        ],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+    )
+
+
+def _read_results(
+    atc: AtomicTransactionComposer, response: dict[str, Any]
+) -> tuple[list[algokit_utils.ABITransactionResponse], int | None, str]:
+    """Parses the results of a simulated group of reads.
+
+    Returns the responses of the calls evaluated before a failing one, the index of
+    that call if any and its failure message.
+    """
+    txn_group = response["txn-groups"][0]
+    failed_at = txn_group.get("failed-at")
+    failed_index = failed_at[0] if failed_at else None
+    results = []
+    for index, result in enumerate(txn_group["txn-results"]):
+        if failed_index is not None and index >= failed_index:
+            break
+        abi_result = atc.parse_result(
+            atc.method_dict[index], atc.tx_ids[index], result["txn-result"]
+        )
+        results.append(
+            algokit_utils.ABITransactionResponse(
+                tx_id=abi_result.tx_id,
+                raw_value=abi_result.raw_value,
+                return_value=abi_result.return_value,
+                decode_error=abi_result.decode_error,
+                tx_info=abi_result.tx_info,
+                method=abi_result.method,
+                confirmed_round=None,
+            )
+        )
+    return results, failed_index, txn_group.get("failure-message", "")
+
+
+def simulate_reads(
+    algod_client: AlgodClient,
+    app_id: int,
+    calls: Sequence[ReadCall],
+    sender: str | None = None,
+) -> list[algokit_utils.ABITransactionResponse]:
+    """Runs read-only ABI calls through simulate, 16 per request, without fees.
+
+    The calls are neither signed nor submitted; `sender`, the app address by
+    default, only has to hold enough to pay their fees.
+    """
+    sender = sender or get_application_address(app_id)
+    suggested_params = algod_client.suggested_params()
+    responses: list[algokit_utils.ABITransactionResponse] = []
+    for start in range(0, len(calls), MAX_GROUP_SIZE):
+        batch = calls[start : start + MAX_GROUP_SIZE]
+        atc = _read_group(app_id, sender, suggested_params, batch)
+        response = algod_client.simulate_transactions(_read_request(atc))
+        results, failed_index, message = _read_results(atc, response)  # type: ignore[arg-type]
+        if failed_index is not None:
+            method = batch[failed_index][0]
+            raise Exception(f"Simulation of {method.name} failed: {message}")
+        responses.extend(results)
+    return responses
+
+
+class ReadonlyBatcher:
+    """Coalesces concurrent read-only ABI calls into simulate requests.
+
+    Calls made in the same event loop iteration share simulate requests of up to 16
+    transactions, sent unsigned by `sender`, the app address by default. Results are
+    memoized by method, arguments and round in the algod client's cache, or in one
+    of the batcher's own, so repeated reads within a round cost nothing.
+    """
+
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        app_id: int,
+        *,
+        sender: str | None = None,
+        max_group_size: int = MAX_GROUP_SIZE,
+    ):
+        self.algod_client = algod_client
+        self.app_id = app_id
+        self.sender = sender or get_application_address(app_id)
+        self.max_group_size = max_group_size
+        self.cache = algod_client.cache or RoundCache()
+        self.requests = 0
+        self._queue: list[tuple[abi.Method, list[Any], asyncio.Future[Any]]] = []
+        self._flush_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def read(
+        self, method: abi.Method, args: Sequence[Any]
+    ) -> algokit_utils.ABITransactionResponse:
+        key = ("readonly", self.app_id, method.get_signature(), _freeze(args))
+        # Cached along with the round the read was evaluated at, which the simulate
+        # response tells and which the cache keeps it for
+        read = await self.cache.get_or_fetch_async(
+            key, lambda: self._enqueue(method, list(args))
+        )
+        return read["response"]  # type: ignore[no-any-return]
+
+    def _enqueue(self, method: abi.Method, args: list[Any]) -> asyncio.Future[Any]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((method, args, future))
+        if len(self._queue) >= self.max_group_size:
+            self._flush()
+        elif not self._flush_scheduled:
+            # Runs once the other coroutines ready in this iteration have queued theirs
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        while self._queue:
+            batch = self._queue[: self.max_group_size]
+            del self._queue[: self.max_group_size]
+            task = asyncio.create_task(self._simulate(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _simulate(
+        self, batch: list[tuple[abi.Method, list[Any], asyncio.Future[Any]]]
+    ) -> None:
+        try:
+            suggested_params = await self.algod_client.suggested_params()
+            while batch:
+                # Reads whose caller was cancelled meanwhile are not simulated
+                batch = [entry for entry in batch if not entry[2].done()]
+                if not batch:
+                    return
+                atc = _read_group(
+                    self.app_id,
+                    self.sender,
+                    suggested_params,
+                    [(method, args) for method, args, _ in batch],
+                )
+                response = await self.algod_client.simulate_transactions(
+                    _read_request(atc)
+                )
+                self.requests += 1
+                results, failed_index, message = _read_results(atc, response)
+                # A caller may be cancelled while its read is simulated
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(
+                            {"last-round": response["last-round"], "response": result}
+                        )
+                if failed_index is None:
+                    return
+                # Only the failing read fails, the ones after it are tried again
+                method, _, future = batch[failed_index]
+                if not future.done():
+                    future.set_exception(
+                        Exception(f"Simulation of {method.name} failed: {message}")
+                    )
+                batch = batch[failed_index + 1 :]
+        except Exception as ex:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(ex)
@@ -0,0 +1,179 @@
+"""Remembers which app each contract was deployed to on each network.
+
+`ApplicationClient.deploy` finds the app to update by searching the indexer for
+every app of the creator, then compiles both programs to compare them with the
+app's, on every run. The registry records, per network, the app id of each
+contract with hashes of the programs deployed, so an unchanged contract is
+confirmed with one `application_info` call and skipped, and a changed one is
+updated without searching the indexer.
+
+The file of a network is named after the algod address rather than the genesis
+hash, which would cost a call. An app that no longer exists or no longer has the
+recorded programs, such as after a LocalNet reset, is deployed as usual.
+"""
+
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from algokit_utils import AppLookup, AppMetaData, ApplicationSpecification
+from algokit_utils.deploy import AppDeployMetaData
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers import timing
+from smart_contracts._helpers.build_cache import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_DIR = PROJECT_ROOT / ".algokit" / "deployments"
+PROGRAM_FIELDS = ("approval_program_hash", "clear_program_hash")
+
+# contracts deployed at once record into the same file
+_lock = threading.Lock()
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def network_name(algod_client: AlgodClient) -> str:
+    address = urlparse(algod_client.algod_address)
+    return re.sub(r"[^\w.-]+", "_", address.netloc or address.path)
+
+
+def registry_path(algod_client: AlgodClient, directory: Path = REGISTRY_DIR) -> Path:
+    return directory / f"{network_name(algod_client)}.json"
+
+
+def read_registry(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return {}
+
+
+def source_hashes(app_spec: ApplicationSpecification) -> dict[str, str]:
+    """Hashes of the TEAL in the app spec, before template values are substituted."""
+    return {
+        "approval_hash": _sha256(app_spec.approval_program.encode()),
+        "clear_hash": _sha256(app_spec.clear_program.encode()),
+    }
+
+
+def _program_hashes(app_info: dict[str, Any]) -> dict[str, str]:
+    params = app_info["params"]
+    return {
+        "approval_program_hash": _sha256(base64.b64decode(params["approval-program"])),
+        "clear_program_hash": _sha256(base64.b64decode(params["clear-state-program"])),
+    }
+
+
+def _deployed_entry(
+    algod_client: AlgodClient, app_spec: ApplicationSpecification, directory: Path
+) -> dict[str, Any] | None:
+    """The recorded deployment of the contract, if its app still has the recorded
+    creator and programs."""
+    name = app_spec.contract.name
+    entry = read_registry(registry_path(algod_client, directory)).get(name)
+    if entry is None:
+        return None
+    try:
+        with timing.stage("app lookup"):
+            app_info = algod_client.application_info(entry["app_id"])
+    except AlgodHTTPError as ex:
+        if ex.code != 404:
+            raise
+        logger.info(f"App {entry['app_id']} of {name} no longer exists")
+        return None
+    program_hashes = _program_hashes(app_info)  # type: ignore[arg-type]
+    if app_info["params"]["creator"] != entry["creator"] or any(  # type: ignore[index]
+        entry[field] != program_hashes[field] for field in PROGRAM_FIELDS
+    ):
+        logger.info(
+            f"App {entry['app_id']} of {name} was changed since it was recorded"
+        )
+        return None
+    return entry  # type: ignore[no-any-return]
+
+
+def is_unchanged(
+    algod_client: AlgodClient,
+    app_spec: ApplicationSpecification,
+    directory: Path = REGISTRY_DIR,
+) -> bool:
+    """Whether the contract's recorded app runs the programs of `app_spec`."""
+    entry = read_registry(registry_path(algod_client, directory)).get(
+        app_spec.contract.name
+    )
+    # only asks algod about the app if the programs built are the ones recorded
+    if entry is None or any(
+        entry[field] != value for field, value in source_hashes(app_spec).items()
+    ):
+        return False
+    return _deployed_entry(algod_client, app_spec, directory) is not None
+
+
+def find_deployment(
+    algod_client: AlgodClient,
+    creator: str,
+    app_spec: ApplicationSpecification,
+    directory: Path = REGISTRY_DIR,
+) -> AppLookup | None:
+    """The recorded app of the contract, as the `existing_deployments` of an app
+    client, or None to have the client search the indexer."""
+    entry = _deployed_entry(algod_client, app_spec, directory)
+    if entry is None or entry["creator"] != creator:
+        return None
+    app_id = entry["app_id"]
+    app = AppMetaData(
+        **entry["metadata"],
+        app_id=app_id,
+        app_address=get_application_address(app_id),
+        created_round=entry["created_round"],
+        updated_round=entry["updated_round"],
+        created_metadata=AppDeployMetaData(**entry["created_metadata"]),
+        deleted=False,
+    )
+    return AppLookup(creator, {app.name: app})
+
+
+def record_deployment(
+    algod_client: AlgodClient,
+    app_spec: ApplicationSpecification,
+    app: AppMetaData,
+    directory: Path = REGISTRY_DIR,
+) -> None:
+    """Records the app the contract was deployed to, with the programs it has now."""
+    app_info: dict[str, Any] = algod_client.application_info(app.app_id)  # type: ignore[assignment]
+    entry = {
+        "app_id": app.app_id,
+        "creator": app_info["params"]["creator"],
+        **source_hashes(app_spec),
+        **_program_hashes(app_info),
+        "metadata": {
+            "name": app.name,
+            "version": app.version,
+            "deletable": app.deletable,
+            "updatable": app.updatable,
+        },
+        "created_metadata": dataclasses.asdict(app.created_metadata),
+        "created_round": app.created_round,
+        "updated_round": app.updated_round,
+    }
+    path = registry_path(algod_client, directory)
+    with _lock:
+        registry = read_registry(path)
+        registry[app_spec.contract.name] = entry
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(registry, indent=2, sort_keys=True))
+        temporary_path.replace(path)
@@ -0,0 +1,292 @@
+"""Snapshots of every box of an app, read straight from algod's box endpoints.
+
+`take_snapshot` lists the app's box names once and fetches the values with a
+bounded pool of workers sharing one `AsyncAlgodClient`, appending each value to a
+file in the snapshot directory as it arrives. An interrupted snapshot is resumed
+by calling it again with the same directory: the listing is reused and only the
+boxes not yet in the file are fetched.
+
+`load_snapshot` groups the boxes by the `BoxMap` whose prefix they start with and
+decodes each map into columns, one sequence per key and struct field, as the
+`BOX_MAPS` of each contract's `boxes` module describe them.
+
+algod has no point-in-time read of boxes, so values come from the rounds in which
+they were fetched; boxes deleted after the listing are left out.
+"""
+
+import asyncio
+import base64
+import dataclasses
+import logging
+import os
+import struct
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from algosdk import error
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 64
+# Box names listed per request; algod lists at most 100,000 boxes at once and
+# pages through the rest with `next`
+BOX_PAGE_SIZE = 1000
+NAMES_FILE = "names.bin"
+VALUES_FILE = "values.bin"
+COMPLETE_FILE = "complete"
+
+Columns = dict[str, Sequence[Any]]
+
+# Each record is the name length, the value length and then both
+_RECORD_HEADER = struct.Struct(">HI")
+# Value length of a box deleted between the listing and its fetch
+_MISSING = 2**32 - 1
+
+
+class BoxMapLayout(NamedTuple):
+    """How the boxes of one `BoxMap` are named and decoded into columns."""
+
+    prefix: bytes
+    # 8 for UInt64 keys, which are decoded to ints, 32 for addresses and hashes
+    key_size: int
+    decode_columns: Callable[[Sequence[bytes]], Columns]
+
+
+@dataclasses.dataclass
+class BoxMapSnapshot:
+    prefix: bytes
+    keys: Sequence[Any]
+    columns: Columns
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def uint64_column(values: Iterable[int]) -> "array[int]":
+    return array("Q", values)
+
+
+def struct_columns(
+    fields: Sequence[str], layout: struct.Struct, values: Sequence[bytes]
+) -> Columns:
+    """Decodes fixed-size struct values into one column per field.
+
+    Integer fields become `array("Q")`s, byte fields lists of `bytes`.
+    """
+    rows = layout.iter_unpack(b"".join(values))
+    columns = list(zip(*rows)) or [()] * len(fields)
+    return {
+        field: (
+            list(column)
+            if column and isinstance(column[0], bytes)
+            else uint64_column(column)
+        )
+        for field, column in zip(fields, columns)
+    }
+
+
+def bool_columns(values: Sequence[bytes]) -> Columns:
+    """Decodes `arc4.Bool` values, whose highest bit is the value."""
+    return {"value": [bool(value[0] & 0x80) for value in values]}
+
+
+def _decode_keys(layout: BoxMapLayout, names: Sequence[bytes]) -> Sequence[Any]:
+    start = len(layout.prefix)
+    if layout.key_size == 8:
+        return uint64_column(int.from_bytes(name[start:], "big") for name in names)
+    return [name[start:] for name in names]
+
+
+def match_layout(name: bytes, layouts: Sequence[BoxMapLayout]) -> BoxMapLayout | None:
+    """Finds the map of a box by its prefix and key size.
+
+    Prefixes may be prefixes of each other, as `campaign` is of `campaign_id`, so
+    the whole name length has to match too.
+    """
+    for layout in layouts:
+        if (
+            name.startswith(layout.prefix)
+            and len(name) == len(layout.prefix) + layout.key_size
+        ):
+            return layout
+    return None
+
+
+def _write_names(path: Path, names: Iterable[bytes]) -> None:
+    # Written aside and renamed, so a listing on disk is always complete
+    partial_path = path.with_suffix(".partial")
+    with partial_path.open("wb") as out:
+        for name in names:
+            out.write(len(name).to_bytes(2, "big") + name)
+    os.replace(partial_path, path)
+
+
+def _read_names(path: Path) -> list[bytes]:
+    data = path.read_bytes()
+    names = []
+    offset = 0
+    while offset < len(data):
+        length = int.from_bytes(data[offset : offset + 2], "big")
+        names.append(data[offset + 2 : offset + 2 + length])
+        offset += 2 + length
+    return names
+
+
+def _iter_records(data: bytes) -> Iterator[tuple[int, bytes, bytes | None]]:
+    """Yields the end offset, name and value of each complete record."""
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        name_length, value_length = _RECORD_HEADER.unpack_from(data, offset)
+        name_start = offset + _RECORD_HEADER.size
+        value_start = name_start + name_length
+        end = value_start + (0 if value_length == _MISSING else value_length)
+        if end > len(data):
+            return
+        name = data[name_start:value_start]
+        yield end, name, None if value_length == _MISSING else data[value_start:end]
+        offset = end
+
+
+def _fetched_names(path: Path) -> set[bytes]:
+    """Returns the names already in the values file.
+
+    A record cut short by an interruption is truncated, so that appending resumes
+    on a record boundary.
+    """
+    if not path.exists():
+        return set()
+    data = path.read_bytes()
+    fetched = set()
+    end = 0
+    for end, name, _ in _iter_records(data):
+        fetched.add(name)
+    if end < len(data):
+        with path.open("r+b") as values_file:
+            values_file.truncate(end)
+    return fetched
+
+
+async def list_box_names(
+    algod_client: AsyncAlgodClient, app_id: int, page_size: int = BOX_PAGE_SIZE
+) -> list[bytes]:
+    """Lists the name of every box of `app_id`, `page_size` names per request."""
+    names = []
+    params: dict[str, Any] = {"max": page_size}
+    while True:
+        response = await algod_client.algod_request(
+            "GET", f"/applications/{app_id}/boxes", params=params
+        )
+        names.extend(base64.b64decode(box["name"]) for box in response["boxes"])
+        next_token = response.get("next-token")
+        if not next_token:
+            return names
+        params = {"max": page_size, "next": next_token}
+
+
+async def _fetch_box(
+    algod_client: AsyncAlgodClient, app_id: int, name: bytes
+) -> bytes | None:
+    # Not through `application_box_by_name`, which would cache every value
+    try:
+        response = await algod_client.algod_request(
+            "GET",
+            f"/applications/{app_id}/box",
+            params={"name": "b64:" + base64.b64encode(name).decode()},
+        )
+    except error.AlgodHTTPError as ex:
+        if ex.code == 404:
+            return None
+        raise
+    return base64.b64decode(response["value"])
+
+
+async def take_snapshot(
+    algod_client: AsyncAlgodClient,
+    app_id: int,
+    directory: Path,
+    *,
+    workers: int = DEFAULT_WORKERS,
+) -> int:
+    """Fetches every box of `app_id` into `directory` and returns how many were listed.
+
+    Resumes the snapshot already in `directory`, if any; a new snapshot needs a new
+    directory.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    names_path = directory / NAMES_FILE
+    values_path = directory / VALUES_FILE
+    if not names_path.exists():
+        _write_names(names_path, await list_box_names(algod_client, app_id))
+    names = _read_names(names_path)
+    if (directory / COMPLETE_FILE).exists():
+        return len(names)
+
+    fetched = _fetched_names(values_path)
+    pending = iter([name for name in names if name not in fetched])
+    logger.info(
+        f"Fetching {len(names) - len(fetched)} of {len(names)} boxes of app {app_id}"
+    )
+
+    with values_path.open("ab") as values_file:
+
+        async def work() -> None:
+            # Workers share one iterator, so each name is fetched by one of them
+            for name in pending:
+                value = await _fetch_box(algod_client, app_id, name)
+                values_file.write(
+                    _RECORD_HEADER.pack(
+                        len(name), _MISSING if value is None else len(value)
+                    )
+                    + name
+                    + (value or b"")
+                )
+
+        tasks = [asyncio.create_task(work()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    (directory / COMPLETE_FILE).touch()
+    return len(names)
+
+
+def load_snapshot(
+    directory: Path, layouts: Sequence[BoxMapLayout]
+) -> dict[bytes, BoxMapSnapshot]:
+    """Decodes a complete snapshot into the columns of each map, by prefix."""
+    if not (directory / COMPLETE_FILE).exists():
+        raise Exception(
+            f"Snapshot in {directory} is incomplete, take it again to resume it"
+        )
+    grouped: dict[bytes, tuple[list[bytes], list[bytes]]] = {
+        layout.prefix: ([], []) for layout in layouts
+    }
+    unknown = 0
+    for _, name, value in _iter_records((directory / VALUES_FILE).read_bytes()):
+        if value is None:
+            continue
+        layout = match_layout(name, layouts)
+        if layout is None:
+            unknown += 1
+            continue
+        names, values = grouped[layout.prefix]
+        names.append(name)
+        values.append(value)
+    if unknown:
+        logger.warning(f"Skipped {unknown} boxes that belong to no known map")
+
+    return {
+        layout.prefix: BoxMapSnapshot(
+            layout.prefix,
+            _decode_keys(layout, grouped[layout.prefix][0]),
+            layout.decode_columns(grouped[layout.prefix][1]),
+        )
+        for layout in layouts
+    }
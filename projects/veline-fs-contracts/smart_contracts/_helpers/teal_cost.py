@@ -0,0 +1,459 @@
+"""Estimates what each ABI method of a compiled contract costs to call.
+
+The approval TEAL is split into basic blocks, and the worst case of each metric
+is the maximum over the paths a call of the method can take: from the program
+start through the ARC-4 router's `match` to the method's route, into every
+subroutine called, until the program returns. Paths that end in `err` fail the
+transaction and are not counted.
+
+Loops are found as back edges and their body is counted once, so the cost of a
+method with loops is per iteration of each loop; `loops` tells how many there
+are. Logged bytes are only known for ARC-4 return values and events, and values
+of dynamic types count as empty. Without the assembled program, its size is
+estimated from the TEAL, an upper bound as the assembler shares constants.
+"""
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from algosdk import abi
+
+REPORT_FILE = "teal_cost.json"
+# how much a method's cost may grow before `find_regressions` reports it
+DEFAULT_THRESHOLD = 0.1
+# the selector puya prefixes ARC-4 return values with
+RETURN_PREFIX = "0x151f7c75"
+BRANCHES = ("b", "bz", "bnz")
+MULTI_BRANCHES = ("match", "switch")
+BLOCK_ENDS = ("callsub", "retsub", "return", "err")
+# transaction fields that are not zero when an ABI method is called
+NONZERO_FIELDS = ("ApplicationID", "NumAppArgs")
+BOX_OPS = (
+    "box_create",
+    "box_del",
+    "box_extract",
+    "box_get",
+    "box_len",
+    "box_put",
+    "box_replace",
+    "box_resize",
+    "box_splice",
+)
+# opcodes that cost more than 1, at their largest where the cost depends on the
+# curve or the size of the input
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 2500,
+    "ecdsa_pk_decompress": 2400,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "bn256_add": 70,
+    "bn256_scalar_mul": 970,
+    "bn256_pairing": 8700,
+    "ec_add": 3000,
+    "ec_scalar_mul": 8000,
+    "ec_subgroup_check": 8000,
+    "ec_map_to": 11000,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "divmodw": 20,
+    "expw": 10,
+    "sqrt": 4,
+    "json_ref": 25,
+}
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|\S+')
+
+
+class Instruction(NamedTuple):
+    op: str
+    args: tuple[str, ...]
+    # line of the instruction in the TEAL file, counting from 1
+    line: int
+
+
+class Program(NamedTuple):
+    instructions: list[Instruction]
+    # the index of the instruction each label is on
+    labels: dict[str, int]
+
+
+class Metrics(NamedTuple):
+    cost: int = 0
+    box_accesses: int = 0
+    log_bytes: int = 0
+
+    def __add__(self, other: object) -> "Metrics":
+        assert isinstance(other, Metrics)
+        return Metrics(*(a + b for a, b in zip(self, other, strict=True)))
+
+
+def _max(*metrics: Metrics | None) -> Metrics | None:
+    """The worst case of each metric, where None is a path that cannot be taken."""
+    valid = [m for m in metrics if m is not None]
+    if not valid:
+        return None
+    return Metrics(*(max(values) for values in zip(*valid, strict=True)))
+
+
+def _add(*metrics: Metrics | None) -> Metrics | None:
+    if any(m is None for m in metrics):
+        return None
+    return sum(metrics, Metrics())  # type: ignore[arg-type]
+
+
+def _tokens(line: str) -> list[str]:
+    tokens = []
+    for token in _TOKEN.findall(line):
+        if token.startswith("//"):
+            break
+        tokens.append(token)
+    return tokens
+
+
+def parse_teal(teal: str) -> Program:
+    instructions: list[Instruction] = []
+    labels: dict[str, int] = {}
+    for line_number, line in enumerate(teal.splitlines(), start=1):
+        tokens = _tokens(line)
+        # directives such as `#pragma version` are not instructions
+        if not tokens or tokens[0].startswith("#"):
+            continue
+        if len(tokens) == 1 and tokens[0].endswith(":"):
+            labels[tokens[0][:-1]] = len(instructions)
+        else:
+            instructions.append(Instruction(tokens[0], tuple(tokens[1:]), line_number))
+    return Program(instructions, labels)
+
+
+def _varuint_size(value: int) -> int:
+    return max(1, (value.bit_length() + 6) // 7)
+
+
+def _bytes_size(value: str) -> int:
+    if value.startswith("0x"):
+        return (len(value) - 2) // 2
+    if value.startswith('"'):
+        return len(json.loads(value).encode())
+    return len(value)
+
+
+def estimate_size(program: Program) -> int:
+    """The size of the assembled program if every constant is pushed in place."""
+    # the version comes first
+    size = 1
+    for instruction in program.instructions:
+        op, args = instruction.op, instruction.args
+        if op in ("int", "pushint"):
+            value = int(args[0], 0) if args[0][0].isdigit() else 0
+            size += 1 + _varuint_size(value)
+        elif op in ("byte", "pushbytes"):
+            length = _bytes_size(args[-1])
+            size += 1 + _varuint_size(length) + length
+        elif op == "method":
+            size += 6
+        elif op == "addr":
+            size += 34
+        elif op in BRANCHES or op == "callsub":
+            size += 3
+        elif op in MULTI_BRANCHES:
+            size += 2 + 2 * len(args)
+        else:
+            size += 1 + len(args)
+    return size
+
+
+def _log_bytes(
+    program: Program, index: int, return_type: abi.ABIType | str | None
+) -> int:
+    """Bytes logged by the `log` at `index`, when it logs an ARC-4 value."""
+    if index < 3:
+        return 0
+    prefix, swap, concat = program.instructions[index - 3 : index]
+    if (swap.op, concat.op) != ("swap", "concat"):
+        return 0
+    if prefix.op == "byte" and prefix.args == (RETURN_PREFIX,):
+        if isinstance(return_type, abi.ABIType):
+            return 4 + min_encoded_size(return_type)
+        return 4
+    if prefix.op == "method":
+        event = abi.Method.from_signature(json.loads(prefix.args[0]) + "void")
+        return 4 + min_encoded_size(
+            abi.TupleType([arg.type for arg in event.args])  # type: ignore[misc]
+        )
+    return 0
+
+
+def min_encoded_size(abi_type: abi.ABIType) -> int:
+    """The ARC-4 encoded size of a value, counting dynamic values as empty."""
+    if not abi_type.is_dynamic():
+        return abi_type.byte_len()
+    if isinstance(abi_type, abi.TupleType):
+        return sum(
+            2 + min_encoded_size(child) if child.is_dynamic() else child.byte_len()
+            for child in abi_type.child_types
+        )
+    # the length of an empty array or string
+    return 2
+
+
+def routes(program: Program) -> dict[str, int]:
+    """The instruction each ABI method is routed to, by method signature."""
+    found = {}
+    for index, instruction in enumerate(program.instructions):
+        if instruction.op != "match":
+            continue
+        selector = program.instructions[index - 1]
+        if (selector.op, selector.args) != ("txna", ("ApplicationArgs", "0")):
+            continue
+        signatures = []
+        for method in reversed(program.instructions[: index - 1]):
+            if method.op != "method":
+                break
+            signatures.insert(0, json.loads(method.args[0]))
+        for signature, label in zip(signatures, instruction.args, strict=False):
+            found[signature] = program.labels[label]
+    return found
+
+
+class _Analysis:
+    """Worst cases of the paths a call of one method can take."""
+
+    def __init__(self, program: Program, signature: str, route: int):
+        self.program = program
+        self.return_type = abi.Method.from_signature(signature).returns.type
+        self.route = route
+        self.loops = 0
+        self._frames: dict[int, tuple[Metrics | None, Metrics | None]] = {}
+        self._calling: set[int] = set()
+        self._starts = set(program.labels.values())
+
+    def _successors(self, index: int) -> list[int]:
+        """Where the branch at `index` can go when calling the method."""
+        instructions = self.program.instructions
+        labels = self.program.labels
+        instruction = instructions[index]
+        previous = instructions[index - 1] if index else None
+        if instruction.op == "b":
+            return [labels[instruction.args[0]]]
+        if instruction.op in ("bz", "bnz"):
+            target = labels[instruction.args[0]]
+            # an ABI method is called on an existing app, with arguments
+            if previous and previous.op == "txn" and previous.args[0] in NONZERO_FIELDS:
+                return [target if instruction.op == "bnz" else index + 1]
+            return [target, index + 1]
+        if instruction.op in MULTI_BRANCHES:
+            if instruction.op == "match" and self.route in [
+                labels[label] for label in instruction.args
+            ]:
+                return [self.route]
+            return [labels[label] for label in instruction.args] + [index + 1]
+        return [index + 1]
+
+    def _block_end(self, start: int) -> int:
+        """The last instruction of the block starting at `start`."""
+        instructions = self.program.instructions
+        index = start
+        while index + 1 < len(instructions) and not (
+            instructions[index].op in (*BRANCHES, *MULTI_BRANCHES, *BLOCK_ENDS)
+            or index + 1 in self._starts
+        ):
+            index += 1
+        return index
+
+    def _blocks(self, entry: int) -> dict[int, list[int]]:
+        """The blocks of the subroutine starting at `entry`, with their
+        successors, dropping the edges that close a loop."""
+        instructions = self.program.instructions
+        blocks: dict[int, list[int]] = {}
+        on_path: set[int] = set()
+        stack: list[tuple[int, Iterator[int]]] = []
+
+        def enter(start: int) -> None:
+            end = self._block_end(start)
+            op = instructions[end].op
+            if op in ("retsub", "return", "err") or end + 1 >= len(instructions):
+                successors = []
+            elif op == "callsub" or op not in (*BRANCHES, *MULTI_BRANCHES):
+                successors = [end + 1]
+            else:
+                successors = self._successors(end)
+            blocks[start] = []
+            on_path.add(start)
+            stack.append((start, iter(successors)))
+
+        enter(entry)
+        while stack:
+            start, successors = stack[-1]
+            successor = next(successors, None)
+            if successor is None:
+                stack.pop()
+                on_path.discard(start)
+            elif successor in on_path:
+                self.loops += 1
+            else:
+                blocks[start].append(successor)
+                if successor not in blocks:
+                    enter(successor)
+        return blocks
+
+    def frame(self, entry: int) -> tuple[Metrics | None, Metrics | None]:
+        """The worst cases from `entry` to its `retsub`, and to the program's
+        `return`."""
+        if entry in self._frames:
+            return self._frames[entry]
+        if entry in self._calling:
+            # a recursive call, counted once
+            self.loops += 1
+            return Metrics(), None
+        self._calling.add(entry)
+        instructions = self.program.instructions
+        blocks = self._blocks(entry)
+        values: dict[int, tuple[Metrics | None, Metrics | None]] = {}
+
+        # successors before the blocks they follow, so every value is known
+        order: list[int] = []
+        visited = {entry}
+        stack = [(entry, iter(blocks[entry]))]
+        while stack:
+            start, successors = stack[-1]
+            successor = next(successors, None)
+            if successor is None:
+                stack.pop()
+                order.append(start)
+            elif successor not in visited:
+                visited.add(successor)
+                stack.append((successor, iter(blocks[successor])))
+
+        for start in order:
+            metrics = Metrics()
+            for index in range(start, self._block_end(start) + 1):
+                instruction = instructions[index]
+                metrics += Metrics(
+                    OPCODE_COSTS.get(instruction.op, 1),
+                    instruction.op in BOX_OPS,
+                    (
+                        _log_bytes(self.program, index, self.return_type)
+                        if instruction.op == "log"
+                        else 0
+                    ),
+                )
+            successors = [values[successor] for successor in blocks[start]]
+            returns = _max(*(returns for returns, _ in successors))
+            ends = _max(*(ends for _, ends in successors))
+            match instruction.op:
+                case "retsub":
+                    returns, ends = Metrics(), None
+                case "return":
+                    returns, ends = None, Metrics()
+                case "err":
+                    returns, ends = None, None
+                case "callsub":
+                    called_returns, called_ends = self.frame(
+                        self.program.labels[instruction.args[0]]
+                    )
+                    returns = _add(called_returns, returns)
+                    ends = _max(called_ends, _add(called_returns, ends))
+            values[start] = (_add(metrics, returns), _add(metrics, ends))
+
+        self._calling.discard(entry)
+        self._frames[entry] = values[entry]
+        return values[entry]
+
+
+def analyse_method(program: Program, signature: str, route: int) -> dict[str, Any]:
+    analysis = _Analysis(program, signature, route)
+    _, worst = analysis.frame(0)
+    if worst is None:
+        raise Exception(f"{signature} always fails")
+    return {**worst._asdict(), "loops": analysis.loops}
+
+
+def analyse_contract(approval_path: Path) -> dict[str, Any]:
+    """The program size and the worst case of each ABI method of a contract."""
+    program = parse_teal(approval_path.read_text())
+    # `--output-bytecode` writes the assembled program next to the TEAL
+    bytecode_path = approval_path.with_suffix(".bin")
+    return {
+        "program_size": (
+            bytecode_path.stat().st_size
+            if bytecode_path.exists()
+            else estimate_size(program)
+        ),
+        "program_size_estimated": not bytecode_path.exists(),
+        "methods": {
+            signature: analyse_method(program, signature, route)
+            for signature, route in sorted(routes(program).items())
+        },
+    }
+
+
+def analyse_artifacts(approval_paths: Iterable[Path]) -> dict[str, Any]:
+    """The report of each contract, by the name of its approval program."""
+    return {
+        path.name.removesuffix(".approval.teal"): analyse_contract(path)
+        for path in sorted(approval_paths)
+    }
+
+
+def find_regressions(
+    baseline: dict[str, Any],
+    report: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """The methods of `report` that cost more than `threshold` more than in
+    `baseline`; methods that are new are not compared."""
+    regressions = []
+    for contract, contract_report in report.items():
+        baseline_methods = baseline.get(contract, {}).get("methods", {})
+        for signature, method in contract_report["methods"].items():
+            if signature not in baseline_methods:
+                continue
+            previous = baseline_methods[signature]["cost"]
+            if method["cost"] > previous * (1 + threshold):
+                regressions.append(
+                    f"{contract}.{signature} costs {method['cost']}, "
+                    f"up from {previous}"
+                )
+    return regressions
+
+
+def read_report(report_path: Path) -> dict[str, Any]:
+    if not report_path.exists():
+        return {}
+    return json.loads(report_path.read_text())  # type: ignore[no-any-return]
+
+
+def update_report(report_path: Path, report: dict[str, Any]) -> None:
+    """Writes the contracts of `report` over theirs in the report file."""
+    merged = {**read_report(report_path), **report}
+    report_path.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n")
+
+
+def check_report(
+    report_path: Path, report: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> None:
+    """Raises if a method of `report` regressed from the report file."""
+    regressions = find_regressions(read_report(report_path), report, threshold)
+    if regressions:
+        raise Exception(
+            f"{len(regressions)} methods cost over {threshold:.0%} more than in "
+            f"{report_path.name}:\n"
+            + "\n".join(f"- {regression}" for regression in regressions)
+        )
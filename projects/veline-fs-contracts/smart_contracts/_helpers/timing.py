@@ -0,0 +1,220 @@
+"""Times the stages of a build or deploy and counts the requests made in each.
+
+A stage is timed as a span on the thread that runs it, for the contract being
+worked on there. Stages nest: a request sent through a `PooledSession` counts
+towards every span open on its thread, and the requests that wait for a
+transaction to be confirmed are `confirmation` spans of their own, so time spent
+waiting for rounds shows apart from time spent creating or updating apps.
+
+The spans of a run can be written as JSON lines, one per span and one summing
+up each stage, or as a Chrome trace, viewed in chrome://tracing or Perfetto with
+a row per thread.
+"""
+
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from smart_contracts._helpers.parallel import current_contract
+
+logger = logging.getLogger(__name__)
+
+STAGES = (
+    "discovery",
+    "compile",
+    "client generation",
+    "funding",
+    "app lookup",
+    "create/update",
+    "confirmation",
+)
+# algod endpoints polled by `wait_for_confirmation`
+CONFIRMATION_PATH = re.compile(
+    r"/v2/(?:transactions/pending|status/wait-for-block-after)/"
+)
+
+
+@dataclasses.dataclass
+class Span:
+    stage: str
+    contract: str | None
+    thread: str
+    start: float
+    seconds: float = 0.0
+    requests: int = 0
+    failed: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "contract": self.contract,
+            "thread": self.thread,
+            "start_ms": round(self.start * 1000, 3),
+            "duration_ms": round(self.seconds * 1000, 3),
+            "requests": self.requests,
+            "failed": self.failed,
+        }
+
+
+class Timeline:
+    """The spans of a run, timed from when it was created."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._open = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list[Span]:
+        if not hasattr(self._open, "spans"):
+            self._open.spans = []
+        return self._open.spans  # type: ignore[no-any-return]
+
+    @contextlib.contextmanager
+    def stage(self, name: str, contract: str | None = None) -> Iterator[Span]:
+        if name not in STAGES:
+            raise Exception(f"Unknown stage {name}, use one of {list(STAGES)}")
+        stack = self._stack()
+        if contract is None:
+            contract = stack[-1].contract if stack else current_contract()
+        span = Span(
+            name,
+            contract,
+            threading.current_thread().name,
+            time.perf_counter() - self._origin,
+        )
+        stack.append(span)
+        try:
+            yield span
+        except BaseException:
+            span.failed = True
+            raise
+        finally:
+            stack.pop()
+            span.seconds = time.perf_counter() - self._origin - span.start
+            with self._lock:
+                self.spans.append(span)
+
+    def count_request(self) -> None:
+        for span in self._stack():
+            span.requests += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """The total duration and requests of each stage that ran."""
+        with self._lock:
+            spans = list(self.spans)
+        totals: dict[str, dict[str, Any]] = {}
+        for stage in STAGES:
+            of_stage = [span for span in spans if span.stage == stage]
+            if of_stage:
+                totals[stage] = {
+                    "spans": len(of_stage),
+                    "duration_ms": round(
+                        sum(span.seconds for span in of_stage) * 1000, 3
+                    ),
+                    "requests": sum(span.requests for span in of_stage),
+                }
+        return totals
+
+    def write_json_lines(self, path: Path) -> None:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        lines = [json.dumps(span.as_dict()) for span in spans]
+        lines.extend(
+            json.dumps({"stage": stage, "total": True, **total})
+            for stage, total in self.summary().items()
+        )
+        path.write_text("".join(f"{line}\n" for line in lines))
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Writes the spans as complete events of the Trace Event Format."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        # numbered in the order they started working
+        threads: dict[str, int] = {}
+        for span in spans:
+            threads.setdefault(span.thread, len(threads))
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for name, tid in threads.items()
+        ]
+        events.extend(
+            {
+                "name": (
+                    f"{span.stage} {span.contract}" if span.contract else span.stage
+                ),
+                "cat": span.stage,
+                "ph": "X",
+                "ts": round(span.start * 1_000_000),
+                "dur": round(span.seconds * 1_000_000),
+                "pid": pid,
+                "tid": threads[span.thread],
+                "args": {"requests": span.requests, "failed": span.failed},
+            }
+            for span in spans
+        )
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+    def log_summary(self) -> None:
+        for stage, total in self.summary().items():
+            logger.info(
+                f"{stage}: {total['duration_ms'] / 1000:.2f}s over "
+                f"{total['spans']} spans, {total['requests']} requests"
+            )
+
+
+# the spans of this run, see `stage`
+timeline = Timeline()
+
+
+def stage(
+    name: str, contract: str | None = None
+) -> contextlib.AbstractContextManager[Span]:
+    """Times a stage of this run, for `contract` or the contract being worked on."""
+    return timeline.stage(name, contract)
+
+
+@contextlib.contextmanager
+def request(path: str) -> Iterator[None]:
+    """Counts a request in the open spans, and times it if it waits for a
+    confirmation."""
+    if CONFIRMATION_PATH.match(path):
+        with stage("confirmation"):
+            timeline.count_request()
+            yield
+    else:
+        timeline.count_request()
+        yield
+
+
+@contextlib.contextmanager
+def reported(
+    json_lines_path: Path | None = None, trace_path: Path | None = None
+) -> Iterator[Timeline]:
+    """Logs the total of each stage of this run once done, and writes its spans
+    as JSON lines and as a Chrome trace to the paths given."""
+    try:
+        yield timeline
+    finally:
+        timeline.log_summary()
+        if json_lines_path:
+            timeline.write_json_lines(json_lines_path)
+            logger.info(f"Wrote the time spent in each stage to {json_lines_path}")
+        if trace_path:
+            timeline.write_chrome_trace(trace_path)
+            logger.info(f"Wrote a trace of the stages to {trace_path}")
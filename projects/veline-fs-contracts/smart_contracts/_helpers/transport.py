@@ -0,0 +1,319 @@
+"""algod and indexer clients that keep their connections open between requests.
+
+algosdk sends every request through `urllib.request.urlopen`, which opens a new
+connection each time, so against a hosted node most of a small read is spent on
+the TCP and TLS handshakes. `PooledAlgodClient` and `PooledIndexerClient` are
+drop-ins that send the same requests through a `PooledSession`, a pool of HTTP/1.1
+`httpx.Client`s whose connections are kept alive and reused, which also records
+how long the requests to each endpoint take.
+"""
+
+import json
+import queue
+import re
+import threading
+import time
+from typing import Any
+from urllib import parse
+
+import httpx
+from algokit_utils import (
+    AlgoClientConfig,
+    get_algod_client,
+    get_indexer_client,
+)
+from algosdk import constants, error
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts._helpers import timing
+
+API_VERSION_PREFIX = "/v2"
+DEFAULT_POOL_SIZE = 16
+DEFAULT_TIMEOUT = 30.0
+USER_AGENT = "py-algorand-sdk"
+
+# Ids, rounds, addresses and transaction ids in paths, so that requests to the
+# same endpoint are counted together
+_PATH_PARAMETER = re.compile(r"/(?:\d+|[A-Z2-7]{52}|[A-Z2-7]{58})(?=/|$)")
+
+
+class EndpointLatency:
+    __slots__ = ("requests", "errors", "total_seconds", "max_seconds")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "mean_ms": round(self.mean_seconds * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+class RequestMetrics:
+    """Request counts and latencies by endpoint, such as `GET /v2/applications/{id}`."""
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointLatency] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def requests(self) -> int:
+        return sum(endpoint.requests for endpoint in self.endpoints.values())
+
+    def record(self, method: str, path: str, seconds: float, failed: bool) -> None:
+        key = f"{method} {_PATH_PARAMETER.sub('/{id}', path)}"
+        with self._lock:
+            endpoint = self.endpoints.get(key)
+            if endpoint is None:
+                endpoint = self.endpoints[key] = EndpointLatency()
+            endpoint.requests += 1
+            endpoint.errors += failed
+            endpoint.total_seconds += seconds
+            endpoint.max_seconds = max(endpoint.max_seconds, seconds)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {key: value.as_dict() for key, value in self.endpoints.items()}
+
+
+class PooledSession:
+    """A pool of keep-alive connections, shared by the clients given it.
+
+    Safe to use from several threads: each request borrows one of up to
+    `pool_size` `httpx.Client`s, most recently used first so that its connection
+    is still open, and requests beyond that wait for one to be returned. A client
+    is never used by two threads at once, which the connection pool of httpcore
+    0.16 does not handle reliably.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.transport = transport
+        self.metrics = RequestMetrics()
+        self._idle: queue.LifoQueue[httpx.Client] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def close(self) -> None:
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+    def _new_client(self) -> httpx.Client:
+        return httpx.Client(timeout=self.timeout, transport=self.transport)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: bytes | None,
+        timeout: float | None,
+    ) -> httpx.Response:
+        with self._slots:
+            try:
+                http = self._idle.get_nowait()
+            except queue.Empty:
+                http = self._new_client()
+            path = parse.urlsplit(url).path
+            start = time.perf_counter()
+            failed = True
+            try:
+                with timing.request(path):
+                    response = http.request(
+                        method,
+                        url,
+                        headers=headers,
+                        content=data,
+                        timeout=timeout or self.timeout,
+                    )
+                failed = response.is_error
+                return response
+            finally:
+                self.metrics.record(method, path, time.perf_counter() - start, failed)
+                self._idle.put(http)
+
+
+def _request_url(address: str, path: str, params: dict[str, Any] | None) -> str:
+    # Built as algosdk builds it, so that query parameters are encoded the same
+    if path not in constants.unversioned_paths:
+        path = API_VERSION_PREFIX + path
+    if params:
+        path = path + "?" + parse.urlencode(params)
+    return address + path
+
+
+def _request_headers(
+    client_headers: dict[str, str] | None,
+    headers: dict[str, str] | None,
+    auth_header: str,
+    token: str | None,
+    path: str,
+) -> dict[str, str]:
+    request_headers = {"User-Agent": USER_AGENT, **(client_headers or {})}
+    request_headers.update(headers or {})
+    if path not in constants.no_auth and token:
+        request_headers[auth_header] = token
+    return request_headers
+
+
+def _error_message(response: httpx.Response) -> tuple[str, dict[str, Any]]:
+    try:
+        body = response.json()
+        return body["message"], body
+    except Exception:
+        return response.text, {}
+
+
+class PooledAlgodClient(AlgodClient):
+    """`AlgodClient` whose requests go through a `PooledSession`."""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        session: PooledSession | None = None,
+    ):
+        super().__init__(algod_token, algod_address, headers)
+        self.session = session or PooledSession()
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        return self.session.metrics
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> Any:
+        response = self.session.request(
+            method,
+            _request_url(self.algod_address, requrl, params),
+            _request_headers(
+                self.headers,
+                headers,
+                constants.algod_auth_header,
+                self.algod_token,
+                requrl,
+            ),
+            data,
+            timeout,
+        )
+        if response.is_error:
+            message, body = _error_message(response)
+            raise error.AlgodHTTPError(message, response.status_code, body.get("data"))
+        if response_format != "json":
+            return response.content
+        if not response.content:
+            # Some algod endpoints answer 200 OK with an empty body
+            return {}
+        try:
+            return response.json()
+        except Exception as ex:
+            raise error.AlgodResponseError(
+                "Failed to parse JSON response from algod"
+            ) from ex
+
+
+def _sort_keys(value: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: _sort_keys(item) if isinstance(item, dict) else item
+        for key, item in sorted(value.items())
+    }
+
+
+class PooledIndexerClient(IndexerClient):
+    """`IndexerClient` whose requests go through a `PooledSession`."""
+
+    def __init__(
+        self,
+        indexer_token: str,
+        indexer_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        session: PooledSession | None = None,
+    ):
+        super().__init__(indexer_token, indexer_address, headers)
+        self.session = session or PooledSession()
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        return self.session.metrics
+
+    def indexer_request(
+        self,
+        method: str,
+        requrl: str,
+        params: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: int | None = 30,
+    ) -> dict[str, Any]:
+        response = self.session.request(
+            method,
+            _request_url(self.indexer_address, requrl, params),
+            _request_headers(
+                self.headers,
+                headers,
+                constants.indexer_auth_header,
+                self.indexer_token,
+                requrl,
+            ),
+            data,
+            timeout,
+        )
+        if response.is_error:
+            message, _ = _error_message(response)
+            raise error.IndexerHTTPError(message)
+        # Sorted like algosdk's responses, for callers that compare them
+        return _sort_keys(json.loads(response.content))
+
+
+def get_pooled_algod_client(
+    config: AlgoClientConfig | None = None, session: PooledSession | None = None
+) -> PooledAlgodClient:
+    """Returns a `PooledAlgodClient` from `config`, or from the same environment
+    variables `algokit_utils.get_algod_client` reads."""
+    algod_client = get_algod_client(config)
+    return PooledAlgodClient(
+        algod_client.algod_token,
+        algod_client.algod_address,
+        algod_client.headers,
+        session=session,
+    )
+
+
+def get_pooled_indexer_client(
+    config: AlgoClientConfig | None = None, session: PooledSession | None = None
+) -> PooledIndexerClient:
+    """Returns a `PooledIndexerClient` from `config`, or from the same environment
+    variables `algokit_utils.get_indexer_client` reads."""
+    indexer_client = get_indexer_client(config)
+    return PooledIndexerClient(
+        indexer_client.indexer_token,
+        indexer_client.indexer_address,
+        indexer_client.headers,
+        session=session,
+    )
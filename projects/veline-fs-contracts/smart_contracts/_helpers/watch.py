@@ -0,0 +1,126 @@
+"""Rebuilds contracts as their sources change.
+
+The sources of a contract are its `contract.py` and the project files it
+imports, as the build cache finds them, and only the contracts with a changed
+source are rebuilt. Files are polled for changes rather than watched with
+inotify, which needs no extra dependency and is cheap for a handful of files.
+
+After a rebuild, the tests that import any source of the contract can be run
+again in a separate process, so their imports see the changed code.
+"""
+
+import logging
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from smart_contracts._helpers.build_cache import PROJECT_ROOT, source_files
+from smart_contracts._helpers.config import SmartContract
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.5
+TESTS_DIR = PROJECT_ROOT / "tests"
+
+
+def _modified_times(paths: list[Path]) -> dict[Path, int]:
+    times = {}
+    for path in paths:
+        try:
+            times[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # deleted, or being replaced by an editor
+            times[path] = 0
+    return times
+
+
+class ContractWatcher:
+    """Tells which contracts had a source change since the last poll."""
+
+    def __init__(self, contracts: list[SmartContract], root: Path = PROJECT_ROOT):
+        self.root = root
+        self._contracts = contracts
+        self._times = {
+            contract.name: _modified_times(source_files(contract.path, root))
+            for contract in contracts
+        }
+
+    def sources(self, contract: SmartContract) -> list[Path]:
+        return list(self._times[contract.name])
+
+    def poll(self) -> list[SmartContract]:
+        changed = []
+        for contract in self._contracts:
+            times = _modified_times(list(self._times[contract.name]))
+            if times != self._times[contract.name]:
+                changed.append(contract)
+                # the change may import other files
+                times = _modified_times(source_files(contract.path, self.root))
+            self._times[contract.name] = times
+        return changed
+
+
+def matching_tests(
+    sources: list[Path], tests_dir: Path = TESTS_DIR, root: Path = PROJECT_ROOT
+) -> list[Path]:
+    """The test files that import any of `sources`."""
+    resolved = {source.resolve() for source in sources}
+    return [
+        test_path
+        for test_path in sorted(tests_dir.glob("*_test.py"))
+        if resolved.intersection(source_files(test_path, root))
+    ]
+
+
+def run_tests(test_paths: list[Path]) -> bool:
+    if not test_paths:
+        logger.info("No tests import the contract")
+        return True
+    logger.info(f"Running {', '.join(path.name for path in test_paths)}")
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", *map(str, test_paths)],
+        cwd=PROJECT_ROOT,
+    )
+    return result.returncode == 0
+
+
+def watch(
+    contracts: list[SmartContract],
+    rebuild: Callable[[SmartContract], object],
+    *,
+    tests: bool = False,
+    interval: float = DEFAULT_INTERVAL,
+    stop: threading.Event | None = None,
+    root: Path = PROJECT_ROOT,
+) -> None:
+    """Rebuilds each contract whose sources change, until `stop` is set.
+
+    A failed build is logged and watching goes on, so the next save can fix it.
+    """
+    stop = stop or threading.Event()
+    watcher = ContractWatcher(contracts, root)
+    logger.info(
+        f"Watching {', '.join(contract.name for contract in contracts)}, "
+        "press Ctrl+C to stop"
+    )
+    while not stop.wait(interval):
+        changed = watcher.poll()
+        if not changed:
+            continue
+        # editors often save in several writes
+        time.sleep(interval)
+        changed += [contract for contract in watcher.poll() if contract not in changed]
+        for contract in changed:
+            logger.info(f"{contract.name} changed, rebuilding")
+            try:
+                rebuild(contract)
+            except Exception as ex:
+                logger.error(f"Could not build {contract.name}: {ex}")
+                continue
+            if tests:
+                run_tests(
+                    matching_tests(watcher.sources(contract), root / "tests", root)
+                )
@@ -38,12 +38,17 @@ _APP_SPEC_JSON = r"""{
                 "no_op": "CALL"
             }
         },
-        "mint_token(byte[],address,uint64,uint64)void": {
+        "rotate_root(uint64,byte[])void": {
             "call_config": {
                 "no_op": "CALL"
             }
         },
-        "check_eligible(address,uint64,uint64)bool": {
+        "mint_token(byte[],address,uint64,uint64,byte[])void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "check_eligible(address,uint64,uint64,byte[])bool": {
             "call_config": {
                 "no_op": "CALL"
             }
@@ -60,7 +65,7 @@ _APP_SPEC_JSON = r"""{
         }
     },
     "source": {
-        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24uYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLl9fcHV5YV9hcmM0X3JvdXRlcl9fKCkgLT4gdWludDY0OgpfX3B1eWFfYXJjNF9yb3V0ZXJfXzoKICAgIHByb3RvIDAgMQogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2JhcmVfcm91dGluZ0AxMQogICAgbWV0aG9kICJvcHRfaW50b19hc3NldChhc3NldCl2b2lkIgogICAgbWV0aG9kICJhbGxvd19vd25lcl9jYW1wYWlnbihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgImFkZF9jYW1wYWlnbihieXRlW10sYnl0ZVtdLHVpbnQ2NCl1aW50NjQiCiAgICBtZXRob2QgIm1pbnRfdG9rZW4oYnl0ZVtdLGFkZHJlc3MsdWludDY0LHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJjaGVja19lbGlnaWJsZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQpYm9vbCIKICAgIG1ldGhvZCAib3duZXJfY2FtcGFpZ24odWludDY0KWFkZHJlc3MiCiAgICBtZXRob2QgImNyZWF0b3IoKWFkZHJlc3MiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19vcHRfaW50b19hc3NldF9yb3V0ZUAyIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FsbG93X293bmVyX2NhbXBhaWduX3JvdXRlQDMgX19wdXlhX2FyYzRfcm91dGVyX19fYWRkX2NhbXBhaWduX3JvdXRlQDQgX19wdXlhX2FyYzRfcm91dGVyX19fbWludF90b2tlbl9yb3V0ZUA1IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2NoZWNrX2VsaWdpYmxlX3JvdXRlQDYgX19wdXlhX2FyYzRfcm91dGVyX19fb3duZXJfY2FtcGFpZ25fcm91dGVANyBfX3B1eWFfYXJjNF9yb3V0ZXJfX19jcmVhdG9yX3JvdXRlQDgKICAgIGludCAwCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9pbnRvX2Fzc2V0X3JvdXRlQDI6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIGNhbGxzdWIgb3B0X2ludG9fYXNzZXQKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FsbG93X293bmVyX2NhbXBhaWduX3JvdXRlQDM6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBjYWxsc3ViIGFsbG93X293bmVyX2NhbXBhaWduCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZGRfY2FtcGFpZ25fcm91dGVANDoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgY2FsbHN1YiBhZGRfY2FtcGFpZ24KICAgIGl0b2IKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX21pbnRfdG9rZW5fcm91dGVANToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBidG9pCiAgICBjYWxsc3ViIG1pbnRfdG9rZW4KICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2NoZWNrX2VsaWdpYmxlX3JvdXRlQDY6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICBjYWxsc3ViIGNoZWNrX2VsaWdpYmxlCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fb3duZXJfY2FtcGFpZ25fcm91dGVANzoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIGNhbGxzdWIgb3duZXJfY2FtcGFpZ24KICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2NyZWF0b3Jfcm91dGVAODoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY3JlYXRvcgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYmFyZV9yb3V0aW5nQDExOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICBpbnQgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLm9wdF9pbnRvX2Fzc2V0KGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6Cm9wdF9pbnRvX2Fzc2V0OgogICAgcHJvdG8gMSAwCiAgICBpbnQgMAogICAgYnl0ZSAiYXNhIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzYSBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICBieXRlICJhc2EiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBpdHhuX2JlZ2luCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5hbGxvd19vd25lcl9jYW1wYWlnbihvd25lcl9jYW1wYWlnbjogYnl0ZXMpIC0+IHZvaWQ6CmFsbG93X293bmVyX2NhbXBhaWduOgogICAgcHJvdG8gMSAwCiAgICBjYWxsc3ViIG9ubHlfY3JlYXRvcgogICAgYnl0ZSAidmFsaWRfb3duZXJfY2FtcGFpZ24iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBPd25lciBjYW1wYWlnbiBpcyBzZXQKICAgIGludCAxCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24ub25seV9jcmVhdG9yKCkgLT4gdm9pZDoKb25seV9jcmVhdG9yOgogICAgcHJvdG8gMCAwCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gTm8gYWNjZXNzaWJsZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLmFkZF9jYW1wYWlnbihwcm9vZjogYnl0ZXMsIHJvb3Q6IGJ5dGVzLCBkdXJhdGlvbjogdWludDY0KSAtPiB1aW50NjQ6CmFkZF9jYW1wYWlnbjoKICAgIHByb3RvIDMgMQogICAgY2FsbHN1YiBvbmx5X3ZhbGlkX293bmVyX2NhbXBhaWduCiAgICB0eG4gU2VuZGVyCiAgICBkdXAKICAgIGludCAwCiAgICBieXRlICJ0b3RhbF9jYW1wYWlnbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jYW1wYWlnbiBleGlzdHMKICAgIGludCAxCiAgICArCiAgICBieXRlICJ0b3RhbF9jYW1wYWlnbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBpbnQgMAogICAgYnl0ZSAidG90YWxfY2FtcGFpZ24iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY2FtcGFpZ24gZXhpc3RzCiAgICBieXRlICJjYW1wYWlnbl9pZCIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBhZGRfY2FtcGFpZ25fZWxzZV9ib2R5QDIKICAgIGZyYW1lX2RpZyAxCiAgICBpdG9iCiAgICBieXRlIDB4MDAwMQogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgYiBhZGRfY2FtcGFpZ25fYWZ0ZXJfaWZfZWxzZUAzCgphZGRfY2FtcGFpZ25fZWxzZV9ib2R5QDI6CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWduX2lkIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBpdG9iCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnQgOAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgYm94X3B1dAoKYWRkX2NhbXBhaWduX2FmdGVyX2lmX2Vsc2VAMzoKICAgIGZyYW1lX2RpZyAtMQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgKwogICAgZHVwCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0b2IKICAgIGJ5dGUgImNhbXBhaWduIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc3dhcAogICAgdW5jb3ZlciA0CiAgICBpdG9iCiAgICBzd2FwCiAgICBkdXAKICAgIGxlbgogICAgaW50IDQ0CiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgYnl0ZSAweDAwMmMKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGRpZyA1CiAgICBib3hfZGVsCiAgICBwb3AKICAgIHVuY292ZXIgNQogICAgc3dhcAogICAgYm94X3B1dAogICAgdW5jb3ZlciA0CiAgICBieXRlIDB4MDAyYwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbWV0aG9kICJBZGRDYW1wYWlnbkV2ZW50KHVpbnQ2NCxieXRlW10sYnl0ZVtdLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLm9ubHlfdmFsaWRfb3duZXJfY2FtcGFpZ24oKSAtPiB2b2lkOgpvbmx5X3ZhbGlkX293bmVyX2NhbXBhaWduOgogICAgcHJvdG8gMCAwCiAgICB0eG4gU2VuZGVyCiAgICBieXRlICJ2YWxpZF9vd25lcl9jYW1wYWlnbiIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogb25seV92YWxpZF9vd25lcl9jYW1wYWlnbl9ib29sX3RydWVAMgogICAgZnJhbWVfZGlnIDAKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGJ6IG9ubHlfdmFsaWRfb3duZXJfY2FtcGFpZ25fYm9vbF9mYWxzZUAzCgpvbmx5X3ZhbGlkX293bmVyX2NhbXBhaWduX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgb25seV92YWxpZF9vd25lcl9jYW1wYWlnbl9ib29sX21lcmdlQDQKCm9ubHlfdmFsaWRfb3duZXJfY2FtcGFpZ25fYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCm9ubHlfdmFsaWRfb3duZXJfY2FtcGFpZ25fYm9vbF9tZXJnZUA0OgogICAgYXNzZXJ0IC8vIE5vIGFjY2Vzc2libGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5taW50X3Rva2VuKGxlYWZfZGF0YTogYnl0ZXMsIGFkZHI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCwgY2FtcGFpZ25faWQ6IHVpbnQ2NCkgLT4gdm9pZDoKbWludF90b2tlbjoKICAgIHByb3RvIDQgMAogICAgaW50IDAKICAgIGJ5dGUgIiIKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBieXRlICJjYW1wYWlnbiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbiBlbnRyeSBleGlzdHMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIGdldF9jbGFpbV9rZXkKICAgIHN3YXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0CiAgICBieXRlICJjbGFpbWVkIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogbWludF90b2tlbl9ib29sX3RydWVAMgogICAgZnJhbWVfZGlnIDYKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNsYWltZWQgZW50cnkgZXhpc3RzCiAgICBibnogbWludF90b2tlbl9ib29sX2ZhbHNlQDMKCm1pbnRfdG9rZW5fYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBtaW50X3Rva2VuX2Jvb2xfbWVyZ2VANAoKbWludF90b2tlbl9ib29sX2ZhbHNlQDM6CiAgICBpbnQgMAoKbWludF90b2tlbl9ib29sX21lcmdlQDQ6CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGV4dHJhY3QgMzYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyA1CiAgICBpdG9iCiAgICBiPj0KICAgIGFzc2VydCAvLyBFeHBpcmVkCiAgICBkdXAKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgc3dhcAogICAgZHVwCiAgICBpbnQgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYnl0ZSAweDAwMDAKICAgICE9CiAgICBieiBtaW50X3Rva2VuX2Jvb2xfZmFsc2VANwogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgbGVuCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgc3Vic3RyaW5nMwogICAgYnl0ZSAweDAwMDAKICAgICE9CiAgICBieiBtaW50X3Rva2VuX2Jvb2xfZmFsc2VANwogICAgaW50IDEKICAgIGIgbWludF90b2tlbl9ib29sX21lcmdlQDgKCm1pbnRfdG9rZW5fYm9vbF9mYWxzZUA3OgogICAgaW50IDAKCm1pbnRfdG9rZW5fYm9vbF9tZXJnZUA4OgogICAgYXNzZXJ0IC8vIENhbXBhaWduIGlzIG5vdCBmb3VuZAogICAgZnJhbWVfZGlnIC00CiAgICBzaGEyNTYKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGxlbgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIHN1YnN0cmluZzMKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgdmVyaWZ5X2Fzc2V0CiAgICBhc3NlcnQgLy8gSW52YWxpZCBkYXRhCiAgICBpbnQgMQogICAgaXRvYgogICAgZnJhbWVfZGlnIDYKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGl0eG5fYmVnaW4KICAgIGludCAwCiAgICBieXRlICJhc2EiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNhIGV4aXN0cwogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMwogICAgY29uY2F0CiAgICBtZXRob2QgIk1pbnRFdmVudChhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5nZXRfY2xhaW1fa2V5KGNhbXBhaWduX2lkOiB1aW50NjQsIGFkZHI6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2NsYWltX2tleToKICAgIHByb3RvIDIgMQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24udmVyaWZ5X2Fzc2V0KHByb29mOiBieXRlcywgcm9vdDogYnl0ZXMsIGxlYWY6IGJ5dGVzKSAtPiB1aW50NjQ6CnZlcmlmeV9hc3NldDoKICAgIHByb3RvIDMgMQogICAgaW50IDAKICAgIGR1cG4gMgogICAgYnl0ZSAiIgogICAgZHVwbiAzCiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgZHVwCiAgICBpbnQgMAogICAgYnl0ZSAiSEFTSF9MRU5HVEgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuSEFTSF9MRU5HVEggZXhpc3RzCiAgICAlCiAgICBibnogdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfZmFsc2VAMgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfbWVyZ2VAMwoKdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfZmFsc2VAMjoKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpbnQgMAogICAgYnl0ZSAiSEFTSF9MRU5HVEgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuSEFTSF9MRU5HVEggZXhpc3RzCiAgICBkaWcgMQogICAgc3dhcAogICAgJQogICAgc3dhcAogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLkhBU0hfTEVOR1RIIGV4aXN0cwogICAgZGlnIDEKICAgIHN3YXAKICAgICUKICAgIC0KICAgIGZyYW1lX2RpZyAtMgogICAgY292ZXIgMgogICAgZXh0cmFjdDMKICAgIGZyYW1lX2J1cnkgMgoKdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfbWVyZ2VAMzoKICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgIGZyYW1lX2RpZyA3CiAgICBzd2FwCiAgICAlCiAgICBibnogdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfZmFsc2VANQogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfbWVyZ2VANgoKdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfZmFsc2VANToKICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgJQogICAgc3dhcAogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLkhBU0hfTEVOR1RIIGV4aXN0cwogICAgZGlnIDEKICAgIHN3YXAKICAgICUKICAgIC0KICAgIGZyYW1lX2RpZyAtMwogICAgY292ZXIgMgogICAgZXh0cmFjdDMKICAgIGZyYW1lX2J1cnkgMQoKdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfbWVyZ2VANjoKICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgNAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuSEFTSF9MRU5HVEggZXhpc3RzCiAgICBmcmFtZV9kaWcgMQogICAgbGVuCiAgICBmcmFtZV9idXJ5IDUKICAgIGFzc2VydCAvLyBTdGVwIGNhbm5vdCBiZSB6ZXJvCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAzCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgMAoKdmVyaWZ5X2Fzc2V0X2Zvcl9oZWFkZXJANzoKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgNQogICAgPAogICAgYnogdmVyaWZ5X2Fzc2V0X2FmdGVyX2ZvckAxMwogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLkhBU0hfTEVOR1RIIGV4aXN0cwogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAzCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGxlbgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDYKICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgICUKICAgIGJueiB2ZXJpZnlfYXNzZXRfdGVybmFyeV9mYWxzZUAxMAogICAgYiB2ZXJpZnlfYXNzZXRfdGVybmFyeV9tZXJnZUAxMQoKdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfZmFsc2VAMTA6CiAgICBpbnQgMAogICAgYnl0ZSAiSEFTSF9MRU5HVEgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuSEFTSF9MRU5HVEggZXhpc3RzCiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgICUKICAgIHN3YXAKICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgIGRpZyAxCiAgICBzd2FwCiAgICAlCiAgICAtCiAgICBleHRyYWN0MwoKdmVyaWZ5X2Fzc2V0X3Rlcm5hcnlfbWVyZ2VAMTE6CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY2FsbHN1YiBoYXNoX3BhaXIKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyA0CiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgdmVyaWZ5X2Fzc2V0X2Zvcl9oZWFkZXJANwoKdmVyaWZ5X2Fzc2V0X2FmdGVyX2ZvckAxMzoKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMgogICAgPT0KICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLmhhc2hfcGFpcihhOiBieXRlcywgYjogYnl0ZXMpIC0+IGJ5dGVzOgpoYXNoX3BhaXI6CiAgICBwcm90byAyIDEKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLmNoZWNrX2VsaWdpYmxlKGFkZHI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCwgY2FtcGFpZ25faWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjaGVja19lbGlnaWJsZToKICAgIHByb3RvIDMgMQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlICJjYW1wYWlnbiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWduIGVudHJ5IGV4aXN0cwogICAgZHVwCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGR1cAogICAgaW50IDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgYnl0ZSAweDAwMDAKICAgID09CiAgICBieiBjaGVja19lbGlnaWJsZV9hZnRlcl9pZl9lbHNlQDMKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGxlbgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIHN1YnN0cmluZzMKICAgIGJ5dGUgMHgwMDAwCiAgICA9PQogICAgYnogY2hlY2tfZWxpZ2libGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNoZWNrX2VsaWdpYmxlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjYWxsc3ViIGhhc2hfcGFpcgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgc3Vic3RyaW5nMwogICAgZnJhbWVfZGlnIDIKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiB2ZXJpZnlfYXNzZXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLm93bmVyX2NhbXBhaWduKGNhbXBhaWduX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpvd25lcl9jYW1wYWlnbjoKICAgIHByb3RvIDEgMQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlICJjYW1wYWlnbiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBvd25lcl9jYW1wYWlnbl9hZnRlcl9pZl9lbHNlQDIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgc3dhcAogICAgcmV0c3ViCgpvd25lcl9jYW1wYWlnbl9hZnRlcl9pZl9lbHNlQDI6CiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2FtcGFpZ24gZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDQgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24uY3JlYXRvcigpIC0+IGJ5dGVzOgpjcmVhdG9yOgogICAgcHJvdG8gMCAxCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgcHJvdG8gMCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGludCAzMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIGJ5dGUgImFzYSIKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYnl0ZSAidG90YWxfY2FtcGFpZ24iCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24uYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLl9fcHV5YV9hcmM0X3JvdXRlcl9fKCkgLT4gdWludDY0OgpfX3B1eWFfYXJjNF9yb3V0ZXJfXzoKICAgIHByb3RvIDAgMQogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2JhcmVfcm91dGluZ0AxMgogICAgbWV0aG9kICJvcHRfaW50b19hc3NldChhc3NldCl2b2lkIgogICAgbWV0aG9kICJhbGxvd19vd25lcl9jYW1wYWlnbihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgImFkZF9jYW1wYWlnbihieXRlW10sYnl0ZVtdLHVpbnQ2NCl1aW50NjQiCiAgICBtZXRob2QgInJvdGF0ZV9yb290KHVpbnQ2NCxieXRlW10pdm9pZCIKICAgIG1ldGhvZCAibWludF90b2tlbihieXRlW10sYWRkcmVzcyx1aW50NjQsdWludDY0LGJ5dGVbXSl2b2lkIgogICAgbWV0aG9kICJjaGVja19lbGlnaWJsZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQsYnl0ZVtdKWJvb2wiCiAgICBtZXRob2QgIm93bmVyX2NhbXBhaWduKHVpbnQ2NClhZGRyZXNzIgogICAgbWV0aG9kICJjcmVhdG9yKClhZGRyZXNzIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggX19wdXlhX2FyYzRfcm91dGVyX19fb3B0X2ludG9fYXNzZXRfcm91dGVAMiBfX3B1eWFfYXJjNF9yb3V0ZXJfX19hbGxvd19vd25lcl9jYW1wYWlnbl9yb3V0ZUAzIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FkZF9jYW1wYWlnbl9yb3V0ZUA0IF9fcHV5YV9hcmM0X3JvdXRlcl9fX3JvdGF0ZV9yb290X3JvdXRlQDUgX19wdXlhX2FyYzRfcm91dGVyX19fbWludF90b2tlbl9yb3V0ZUA2IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2NoZWNrX2VsaWdpYmxlX3JvdXRlQDcgX19wdXlhX2FyYzRfcm91dGVyX19fb3duZXJfY2FtcGFpZ25fcm91dGVAOCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19jcmVhdG9yX3JvdXRlQDkKICAgIGludCAwCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9pbnRvX2Fzc2V0X3JvdXRlQDI6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIGNhbGxzdWIgb3B0X2ludG9fYXNzZXQKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FsbG93X293bmVyX2NhbXBhaWduX3JvdXRlQDM6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBjYWxsc3ViIGFsbG93X293bmVyX2NhbXBhaWduCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZGRfY2FtcGFpZ25fcm91dGVANDoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgY2FsbHN1YiBhZGRfY2FtcGFpZ24KICAgIGl0b2IKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3JvdGF0ZV9yb290X3JvdXRlQDU6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgY2FsbHN1YiByb3RhdGVfcm9vdAogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fbWludF90b2tlbl9yb3V0ZUA2OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGV4dHJhY3QgMiAwCiAgICBjYWxsc3ViIG1pbnRfdG9rZW4KICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2NoZWNrX2VsaWdpYmxlX3JvdXRlQDc6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBleHRyYWN0IDIgMAogICAgY2FsbHN1YiBjaGVja19lbGlnaWJsZQogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX293bmVyX2NhbXBhaWduX3JvdXRlQDg6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICBjYWxsc3ViIG93bmVyX2NhbXBhaWduCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19jcmVhdG9yX3JvdXRlQDk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNyZWF0b3IKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2JhcmVfcm91dGluZ0AxMjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZnRlcl9pZl9lbHNlQDE2CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGlzIGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZnRlcl9pZl9lbHNlQDE2OgogICAgaW50IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5vcHRfaW50b19hc3NldChhc3NldDogdWludDY0KSAtPiB2b2lkOgpvcHRfaW50b19hc3NldDoKICAgIHByb3RvIDEgMAogICAgaW50IDAKICAgIGJ5dGUgImFzYSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc2EgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgYnl0ZSAiYXNhIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgaXR4bl9iZWdpbgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24uYWxsb3dfb3duZXJfY2FtcGFpZ24ob3duZXJfY2FtcGFpZ246IGJ5dGVzKSAtPiB2b2lkOgphbGxvd19vd25lcl9jYW1wYWlnbjoKICAgIHByb3RvIDEgMAogICAgY2FsbHN1YiBvbmx5X2NyZWF0b3IKICAgIGJ5dGUgInZhbGlkX293bmVyX2NhbXBhaWduIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gT3duZXIgY2FtcGFpZ24gaXMgc2V0CiAgICBpbnQgMQogICAgaXRvYgogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLm9ubHlfY3JlYXRvcigpIC0+IHZvaWQ6Cm9ubHlfY3JlYXRvcjoKICAgIHByb3RvIDAgMAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vIGFjY2Vzc2libGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5hZGRfY2FtcGFpZ24ocHJvb2Y6IGJ5dGVzLCByb290OiBieXRlcywgZHVyYXRpb246IHVpbnQ2NCkgLT4gdWludDY0OgphZGRfY2FtcGFpZ246CiAgICBwcm90byAzIDEKICAgIGNhbGxzdWIgb25seV92YWxpZF9vd25lcl9jYW1wYWlnbgogICAgdHhuIFNlbmRlcgogICAgZHVwCiAgICBpbnQgMAogICAgYnl0ZSAidG90YWxfY2FtcGFpZ24iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY2FtcGFpZ24gZXhpc3RzCiAgICBpbnQgMQogICAgKwogICAgYnl0ZSAidG90YWxfY2FtcGFpZ24iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgaW50IDAKICAgIGJ5dGUgInRvdGFsX2NhbXBhaWduIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NhbXBhaWduIGV4aXN0cwogICAgYnl0ZSAiY2FtcGFpZ25faWQiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogYWRkX2NhbXBhaWduX2Vsc2VfYm9keUAyCiAgICBmcmFtZV9kaWcgMQogICAgaXRvYgogICAgYnl0ZSAweDAwMDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGIgYWRkX2NhbXBhaWduX2FmdGVyX2lmX2Vsc2VAMwoKYWRkX2NhbXBhaWduX2Vsc2VfYm9keUAyOgogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbl9pZCBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgaXRvYgogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50IDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKCmFkZF9jYW1wYWlnbl9hZnRlcl9pZl9lbHNlQDM6CiAgICBmcmFtZV9kaWcgLTEKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgICsKICAgIGR1cAogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpdG9iCiAgICBieXRlICJjYW1wYWlnbiIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgc3dhcAogICAgZHVwCiAgICBsZW4KICAgIGludCA0NAogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGJ5dGUgMHgwMDJjCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBkaWcgMgogICAgY29uY2F0CiAgICBkaWcgNAogICAgY29uY2F0CiAgICBkaWcgNQogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDUKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHVuY292ZXIgNAogICAgYnl0ZSAweDAwMmMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIG1ldGhvZCAiQWRkQ2FtcGFpZ25FdmVudCh1aW50NjQsYnl0ZVtdLGJ5dGVbXSxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5vbmx5X3ZhbGlkX293bmVyX2NhbXBhaWduKCkgLT4gdm9pZDoKb25seV92YWxpZF9vd25lcl9jYW1wYWlnbjoKICAgIHByb3RvIDAgMAogICAgdHhuIFNlbmRlcgogICAgYnl0ZSAidmFsaWRfb3duZXJfY2FtcGFpZ24iCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IG9ubHlfdmFsaWRfb3duZXJfY2FtcGFpZ25fYm9vbF90cnVlQDIKICAgIGZyYW1lX2RpZyAwCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBvbmx5X3ZhbGlkX293bmVyX2NhbXBhaWduX2Jvb2xfZmFsc2VAMwoKb25seV92YWxpZF9vd25lcl9jYW1wYWlnbl9ib29sX3RydWVAMjoKICAgIGludCAxCiAgICBiIG9ubHlfdmFsaWRfb3duZXJfY2FtcGFpZ25fYm9vbF9tZXJnZUA0Cgpvbmx5X3ZhbGlkX293bmVyX2NhbXBhaWduX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgpvbmx5X3ZhbGlkX293bmVyX2NhbXBhaWduX2Jvb2xfbWVyZ2VANDoKICAgIGFzc2VydCAvLyBObyBhY2Nlc3NpYmxlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24ucm90YXRlX3Jvb3QoY2FtcGFpZ25faWQ6IHVpbnQ2NCwgcm9vdDogYnl0ZXMpIC0+IHZvaWQ6CnJvdGF0ZV9yb290OgogICAgcHJvdG8gMiAwCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGUgImNhbXBhaWduIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBDYW1wYWlnbiBpcyBub3QgZm91bmQKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBvbmx5X293bmVyX2NhbXBhaWduCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWduIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAzNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgYj49CiAgICBhc3NlcnQgLy8gRXhwaXJlZAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGR1cAogICAgYXNzZXJ0IC8vIFJvb3QgaXMgZW1wdHkKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWduIGVudHJ5IGV4aXN0cwogICAgZHVwCiAgICBpbnQgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludCAwCiAgICBzd2FwCiAgICBleHRyYWN0MwogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGJveF9kZWwKICAgIHBvcAogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBzd2FwCiAgICBieXRlIDB4MDAwYQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIG1ldGhvZCAiUm90YXRlUm9vdEV2ZW50KHVpbnQ2NCxieXRlW10pIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5vbmx5X293bmVyX2NhbXBhaWduKGNhbXBhaWduX2lkOiB1aW50NjQpIC0+IHZvaWQ6Cm9ubHlfb3duZXJfY2FtcGFpZ246CiAgICBwcm90byAxIDAKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZSAiY2FtcGFpZ24iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWduIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA0IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYnogb25seV9vd25lcl9jYW1wYWlnbl9ib29sX2ZhbHNlQDMKICAgIGJ5dGUgInZhbGlkX293bmVyX2NhbXBhaWduIgogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmFsaWRfb3duZXJfY2FtcGFpZ24gZW50cnkgZXhpc3RzCiAgICBieiBvbmx5X293bmVyX2NhbXBhaWduX2Jvb2xfZmFsc2VAMwogICAgaW50IDEKICAgIGIgb25seV9vd25lcl9jYW1wYWlnbl9ib29sX21lcmdlQDQKCm9ubHlfb3duZXJfY2FtcGFpZ25fYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCm9ubHlfb3duZXJfY2FtcGFpZ25fYm9vbF9tZXJnZUA0OgogICAgYXNzZXJ0IC8vIE5vIGFjY2Vzc2libGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5taW50X3Rva2VuKGxlYWZfZGF0YTogYnl0ZXMsIGFkZHI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCwgY2FtcGFpZ25faWQ6IHVpbnQ2NCwgcHJvb2Y6IGJ5dGVzKSAtPiB2b2lkOgptaW50X3Rva2VuOgogICAgcHJvdG8gNSAwCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZSAiY2FtcGFpZ24iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gaXMgbm90IGZvdW5kCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbiBlbnRyeSBleGlzdHMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC00CiAgICBjYWxsc3ViIGdldF9jbGFpbV9rZXkKICAgIGJ5dGUgImNsYWltZWQiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBtaW50X3Rva2VuX2Jvb2xfdHJ1ZUAyCiAgICBmcmFtZV9kaWcgMwogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhaW1lZCBlbnRyeSBleGlzdHMKICAgIGJueiBtaW50X3Rva2VuX2Jvb2xfZmFsc2VAMwoKbWludF90b2tlbl9ib29sX3RydWVAMjoKICAgIGludCAxCiAgICBiIG1pbnRfdG9rZW5fYm9vbF9tZXJnZUA0CgptaW50X3Rva2VuX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgptaW50X3Rva2VuX2Jvb2xfbWVyZ2VANDoKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgZXh0cmFjdCAzNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIDIKICAgIGl0b2IKICAgIGI+PQogICAgYXNzZXJ0IC8vIEV4cGlyZWQKICAgIGR1cAogICAgaW50IDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBkdXAKICAgIGxlbgogICAgc3dhcAogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBieXRlIDB4MDAwMAogICAgIT0KICAgIGFzc2VydCAvLyBDYW1wYWlnbiBpcyBub3QgZm91bmQKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgZnJhbWVfZGlnIC00CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNQogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gSW52YWxpZCBkYXRhCiAgICBmcmFtZV9kaWcgLTUKICAgIHNoYTI1NgogICAgZGlnIDIKICAgIGxlbgogICAgaW50IDIKICAgIGRpZyAxCiAgICA+PQogICAgaW50IDIKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgdW5jb3ZlciA0CiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHZlcmlmeV9hc3NldAogICAgYXNzZXJ0IC8vIEludmFsaWQgZGF0YQogICAgaW50IDEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAzCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBpdHhuX2JlZ2luCiAgICBpbnQgMAogICAgYnl0ZSAiYXNhIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzYSBleGlzdHMKICAgIGZyYW1lX2RpZyAtNAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIG1ldGhvZCAiTWludEV2ZW50KGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLmdldF9jbGFpbV9rZXkoY2FtcGFpZ25faWQ6IHVpbnQ2NCwgYWRkcjogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfY2xhaW1fa2V5OgogICAgcHJvdG8gMiAxCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi52ZXJpZnlfYXNzZXQocHJvb2Y6IGJ5dGVzLCByb290OiBieXRlcywgbGVhZjogYnl0ZXMpIC0+IHVpbnQ2NDoKdmVyaWZ5X2Fzc2V0OgogICAgcHJvdG8gMyAxCiAgICBpbnQgMAogICAgZHVwbiAyCiAgICBieXRlICIiCiAgICBkdXBuIDMKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBkdXAKICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgICUKICAgIGJueiB2ZXJpZnlfYXNzZXRfdGVybmFyeV9mYWxzZUAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2J1cnkgMgogICAgYiB2ZXJpZnlfYXNzZXRfdGVybmFyeV9tZXJnZUAzCgp2ZXJpZnlfYXNzZXRfdGVybmFyeV9mYWxzZUAyOgogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgIGRpZyAxCiAgICBzd2FwCiAgICAlCiAgICBzd2FwCiAgICBpbnQgMAogICAgYnl0ZSAiSEFTSF9MRU5HVEgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuSEFTSF9MRU5HVEggZXhpc3RzCiAgICBkaWcgMQogICAgc3dhcAogICAgJQogICAgLQogICAgZnJhbWVfZGlnIC0yCiAgICBjb3ZlciAyCiAgICBleHRyYWN0MwogICAgZnJhbWVfYnVyeSAyCgp2ZXJpZnlfYXNzZXRfdGVybmFyeV9tZXJnZUAzOgogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLkhBU0hfTEVOR1RIIGV4aXN0cwogICAgZnJhbWVfZGlnIDcKICAgIHN3YXAKICAgICUKICAgIGJueiB2ZXJpZnlfYXNzZXRfdGVybmFyeV9mYWxzZUA1CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2J1cnkgMQogICAgYiB2ZXJpZnlfYXNzZXRfdGVybmFyeV9tZXJnZUA2Cgp2ZXJpZnlfYXNzZXRfdGVybmFyeV9mYWxzZUA1OgogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLkhBU0hfTEVOR1RIIGV4aXN0cwogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAlCiAgICBzd2FwCiAgICBpbnQgMAogICAgYnl0ZSAiSEFTSF9MRU5HVEgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuSEFTSF9MRU5HVEggZXhpc3RzCiAgICBkaWcgMQogICAgc3dhcAogICAgJQogICAgLQogICAgZnJhbWVfZGlnIC0zCiAgICBjb3ZlciAyCiAgICBleHRyYWN0MwogICAgZnJhbWVfYnVyeSAxCgp2ZXJpZnlfYXNzZXRfdGVybmFyeV9tZXJnZUA2OgogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSA0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgIGZyYW1lX2RpZyAxCiAgICBsZW4KICAgIGZyYW1lX2J1cnkgNQogICAgYXNzZXJ0IC8vIFN0ZXAgY2Fubm90IGJlIHplcm8KICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDMKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAwCgp2ZXJpZnlfYXNzZXRfZm9yX2hlYWRlckA3OgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyA1CiAgICA8CiAgICBieiB2ZXJpZnlfYXNzZXRfYWZ0ZXJfZm9yQDEzCiAgICBpbnQgMAogICAgYnl0ZSAiSEFTSF9MRU5HVEgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuSEFTSF9MRU5HVEggZXhpc3RzCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDMKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLkhBU0hfTEVOR1RIIGV4aXN0cwogICAgJQogICAgYm56IHZlcmlmeV9hc3NldF90ZXJuYXJ5X2ZhbHNlQDEwCiAgICBiIHZlcmlmeV9hc3NldF90ZXJuYXJ5X21lcmdlQDExCgp2ZXJpZnlfYXNzZXRfdGVybmFyeV9mYWxzZUAxMDoKICAgIGludCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5IQVNIX0xFTkdUSCBleGlzdHMKICAgIGZyYW1lX2RpZyA2CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgJQogICAgc3dhcAogICAgaW50IDAKICAgIGJ5dGUgIkhBU0hfTEVOR1RIIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLkhBU0hfTEVOR1RIIGV4aXN0cwogICAgZGlnIDEKICAgIHN3YXAKICAgICUKICAgIC0KICAgIGV4dHJhY3QzCgp2ZXJpZnlfYXNzZXRfdGVybmFyeV9tZXJnZUAxMToKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBjYWxsc3ViIGhhc2hfcGFpcgogICAgZnJhbWVfYnVyeSAwCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDQKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiB2ZXJpZnlfYXNzZXRfZm9yX2hlYWRlckA3Cgp2ZXJpZnlfYXNzZXRfYWZ0ZXJfZm9yQDEzOgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAyCiAgICA9PQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24uaGFzaF9wYWlyKGE6IGJ5dGVzLCBiOiBieXRlcykgLT4gYnl0ZXM6Cmhhc2hfcGFpcjoKICAgIHByb3RvIDIgMQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGI+CiAgICBieiBoYXNoX3BhaXJfYWZ0ZXJfaWZfZWxzZUAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIHJldHN1YgoKaGFzaF9wYWlyX2FmdGVyX2lmX2Vsc2VAMjoKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLmNoZWNrX2VsaWdpYmxlKGFkZHI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCwgY2FtcGFpZ25faWQ6IHVpbnQ2NCwgcHJvb2Y6IGJ5dGVzKSAtPiB1aW50NjQ6CmNoZWNrX2VsaWdpYmxlOgogICAgcHJvdG8gNCAxCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGUgImNhbXBhaWduIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbiBlbnRyeSBleGlzdHMKICAgIGR1cAogICAgaW50IDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBkdXAKICAgIGxlbgogICAgc3dhcAogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBieXRlIDB4MDAwMAogICAgPT0KICAgIGJ6IGNoZWNrX2VsaWdpYmxlX2FmdGVyX2lmX2Vsc2VAMgogICAgaW50IDAKICAgIHN3YXAKICAgIHJldHN1YgoKY2hlY2tfZWxpZ2libGVfYWZ0ZXJfaWZfZWxzZUAyOgogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBsZW4KICAgIGludCAyCiAgICBkaWcgMQogICAgPj0KICAgIGludCAyCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN3YXAKICAgIHN1YnN0cmluZzMKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHZlcmlmeV9hc3NldAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXBhaWduLmNvbnRyYWN0LkNhbXBhaWduLm93bmVyX2NhbXBhaWduKGNhbXBhaWduX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpvd25lcl9jYW1wYWlnbjoKICAgIHByb3RvIDEgMQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlICJjYW1wYWlnbiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBvd25lcl9jYW1wYWlnbl9hZnRlcl9pZl9lbHNlQDIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgc3dhcAogICAgcmV0c3ViCgpvd25lcl9jYW1wYWlnbl9hZnRlcl9pZl9lbHNlQDI6CiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2FtcGFpZ24gZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDQgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24uY3JlYXRvcigpIC0+IGJ5dGVzOgpjcmVhdG9yOgogICAgcHJvdG8gMCAxCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wYWlnbi5jb250cmFjdC5DYW1wYWlnbi5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgcHJvdG8gMCAwCiAgICBieXRlICJIQVNIX0xFTkdUSCIKICAgIGludCAzMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIGJ5dGUgImFzYSIKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYnl0ZSAidG90YWxfY2FtcGFpZ24iCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
         "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuY2FtcGFpZ24uY29udHJhY3QuQ2FtcGFpZ24uY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIGludCAxCiAgICByZXR1cm4K"
     },
     "state": {
@@ -141,7 +146,25 @@ _APP_SPEC_JSON = r"""{
                 ],
                 "returns": {
                     "type": "uint64"
-                }
+                },
+                "desc": "Opens a campaign with Merkle root `root` for `duration` seconds.\n`proof` is only stored and emitted, for compatibility with existing callers; each claim passes its own proof to `mint_token`, so it may be empty."
+            },
+            {
+                "name": "rotate_root",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "campaign_id"
+                    },
+                    {
+                        "type": "byte[]",
+                        "name": "root"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                },
+                "desc": "Replaces the Merkle root of a live campaign after leaves were appended.\nProofs are passed with each claim, so only the root is stored. Claim records are keyed by campaign and address, so recipients who already claimed stay claimed under the new root."
             },
             {
                 "name": "mint_token",
@@ -161,11 +184,16 @@ _APP_SPEC_JSON = r"""{
                     {
                         "type": "uint64",
                         "name": "campaign_id"
+                    },
+                    {
+                        "type": "byte[]",
+                        "name": "proof"
                     }
                 ],
                 "returns": {
                     "type": "void"
-                }
+                },
+                "desc": "Sends `amount` to `addr` once per campaign, given the Merkle proof of the\n(addr, amount) leaf."
             },
             {
                 "name": "check_eligible",
@@ -181,6 +209,10 @@ _APP_SPEC_JSON = r"""{
                     {
                         "type": "uint64",
                         "name": "campaign_id"
+                    },
+                    {
+                        "type": "byte[]",
+                        "name": "proof"
                     }
                 ],
                 "returns": {
@@ -306,6 +338,9 @@ class AllowOwnerCampaignArgs(_ArgsBase[None]):
 
 @dataclasses.dataclass(kw_only=True)
 class AddCampaignArgs(_ArgsBase[int]):
+    """Opens a campaign with Merkle root `root` for `duration` seconds.
+    `proof` is only stored and emitted, for compatibility with existing callers; each claim passes its own proof to `mint_token`, so it may be empty."""
+
     proof: bytes | bytearray
     root: bytes | bytearray
     duration: int
@@ -315,16 +350,33 @@ class AddCampaignArgs(_ArgsBase[int]):
         return "add_campaign(byte[],byte[],uint64)uint64"
 
 
+@dataclasses.dataclass(kw_only=True)
+class RotateRootArgs(_ArgsBase[None]):
+    """Replaces the Merkle root of a live campaign after leaves were appended.
+    Proofs are passed with each claim, so only the root is stored. Claim records are keyed by campaign and address, so recipients who already claimed stay claimed under the new root."""
+
+    campaign_id: int
+    root: bytes | bytearray
+
+    @staticmethod
+    def method() -> str:
+        return "rotate_root(uint64,byte[])void"
+
+
 @dataclasses.dataclass(kw_only=True)
 class MintTokenArgs(_ArgsBase[None]):
+    """Sends `amount` to `addr` once per campaign, given the Merkle proof of the
+    (addr, amount) leaf."""
+
     leaf_data: bytes | bytearray
     addr: str
     amount: int
     campaign_id: int
+    proof: bytes | bytearray
 
     @staticmethod
     def method() -> str:
-        return "mint_token(byte[],address,uint64,uint64)void"
+        return "mint_token(byte[],address,uint64,uint64,byte[])void"
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -332,10 +384,11 @@ class CheckEligibleArgs(_ArgsBase[bool]):
     addr: str
     amount: int
     campaign_id: int
+    proof: bytes | bytearray
 
     @staticmethod
     def method() -> str:
-        return "check_eligible(address,uint64,uint64)bool"
+        return "check_eligible(address,uint64,uint64,byte[])bool"
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -446,7 +499,10 @@ class Composer:
         duration: int,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `add_campaign(byte[],byte[],uint64)uint64` ABI method
+        """Opens a campaign with Merkle root `root` for `duration` seconds.
+        `proof` is only stored and emitted, for compatibility with existing callers; each claim passes its own proof to `mint_token`, so it may be empty.
+        
+        Adds a call to `add_campaign(byte[],byte[],uint64)uint64` ABI method
         
         :param bytes | bytearray proof: The `proof` ABI parameter
         :param bytes | bytearray root: The `root` ABI parameter
@@ -467,6 +523,35 @@ class Composer:
         )
         return self
 
+    def rotate_root(
+        self,
+        *,
+        campaign_id: int,
+        root: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Replaces the Merkle root of a live campaign after leaves were appended.
+        Proofs are passed with each claim, so only the root is stored. Claim records are keyed by campaign and address, so recipients who already claimed stay claimed under the new root.
+        
+        Adds a call to `rotate_root(uint64,byte[])void` ABI method
+        
+        :param int campaign_id: The `campaign_id` ABI parameter
+        :param bytes | bytearray root: The `root` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = RotateRootArgs(
+            campaign_id=campaign_id,
+            root=root,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
     def mint_token(
         self,
         *,
@@ -474,14 +559,19 @@ class Composer:
         addr: str,
         amount: int,
         campaign_id: int,
+        proof: bytes | bytearray,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `mint_token(byte[],address,uint64,uint64)void` ABI method
+        """Sends `amount` to `addr` once per campaign, given the Merkle proof of the
+        (addr, amount) leaf.
+        
+        Adds a call to `mint_token(byte[],address,uint64,uint64,byte[])void` ABI method
         
         :param bytes | bytearray leaf_data: The `leaf_data` ABI parameter
         :param str addr: The `addr` ABI parameter
         :param int amount: The `amount` ABI parameter
         :param int campaign_id: The `campaign_id` ABI parameter
+        :param bytes | bytearray proof: The `proof` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns Composer: This Composer instance"""
 
@@ -490,6 +580,7 @@ class Composer:
             addr=addr,
             amount=amount,
             campaign_id=campaign_id,
+            proof=proof,
         )
         self.app_client.compose_call(
             self.atc,
@@ -505,13 +596,15 @@ class Composer:
         addr: str,
         amount: int,
         campaign_id: int,
+        proof: bytes | bytearray,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `check_eligible(address,uint64,uint64)bool` ABI method
+        """Adds a call to `check_eligible(address,uint64,uint64,byte[])bool` ABI method
         
         :param str addr: The `addr` ABI parameter
         :param int amount: The `amount` ABI parameter
         :param int campaign_id: The `campaign_id` ABI parameter
+        :param bytes | bytearray proof: The `proof` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns Composer: This Composer instance"""
 
@@ -519,6 +612,7 @@ class Composer:
             addr=addr,
             amount=amount,
             campaign_id=campaign_id,
+            proof=proof,
         )
         self.app_client.compose_call(
             self.atc,
@@ -787,7 +881,10 @@ class CampaignClient:
         duration: int,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> algokit_utils.ABITransactionResponse[int]:
-        """Calls `add_campaign(byte[],byte[],uint64)uint64` ABI method
+        """Opens a campaign with Merkle root `root` for `duration` seconds.
+        `proof` is only stored and emitted, for compatibility with existing callers; each claim passes its own proof to `mint_token`, so it may be empty.
+        
+        Calls `add_campaign(byte[],byte[],uint64)uint64` ABI method
         
         :param bytes | bytearray proof: The `proof` ABI parameter
         :param bytes | bytearray root: The `root` ABI parameter
@@ -807,6 +904,34 @@ class CampaignClient:
         )
         return result
 
+    def rotate_root(
+        self,
+        *,
+        campaign_id: int,
+        root: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Replaces the Merkle root of a live campaign after leaves were appended.
+        Proofs are passed with each claim, so only the root is stored. Claim records are keyed by campaign and address, so recipients who already claimed stay claimed under the new root.
+        
+        Calls `rotate_root(uint64,byte[])void` ABI method
+        
+        :param int campaign_id: The `campaign_id` ABI parameter
+        :param bytes | bytearray root: The `root` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = RotateRootArgs(
+            campaign_id=campaign_id,
+            root=root,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def mint_token(
         self,
         *,
@@ -814,14 +939,19 @@ class CampaignClient:
         addr: str,
         amount: int,
         campaign_id: int,
+        proof: bytes | bytearray,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> algokit_utils.ABITransactionResponse[None]:
-        """Calls `mint_token(byte[],address,uint64,uint64)void` ABI method
+        """Sends `amount` to `addr` once per campaign, given the Merkle proof of the
+        (addr, amount) leaf.
+        
+        Calls `mint_token(byte[],address,uint64,uint64,byte[])void` ABI method
         
         :param bytes | bytearray leaf_data: The `leaf_data` ABI parameter
         :param str addr: The `addr` ABI parameter
         :param int amount: The `amount` ABI parameter
         :param int campaign_id: The `campaign_id` ABI parameter
+        :param bytes | bytearray proof: The `proof` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
 
@@ -830,6 +960,7 @@ class CampaignClient:
             addr=addr,
             amount=amount,
             campaign_id=campaign_id,
+            proof=proof,
         )
         result = self.app_client.call(
             call_abi_method=args.method(),
@@ -844,13 +975,15 @@ class CampaignClient:
         addr: str,
         amount: int,
         campaign_id: int,
+        proof: bytes | bytearray,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> algokit_utils.ABITransactionResponse[bool]:
-        """Calls `check_eligible(address,uint64,uint64)bool` ABI method
+        """Calls `check_eligible(address,uint64,uint64,byte[])bool` ABI method
         
         :param str addr: The `addr` ABI parameter
         :param int amount: The `amount` ABI parameter
         :param int campaign_id: The `campaign_id` ABI parameter
+        :param bytes | bytearray proof: The `proof` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns algokit_utils.ABITransactionResponse[bool]: The result of the transaction"""
 
@@ -858,6 +991,7 @@ class CampaignClient:
             addr=addr,
             amount=amount,
             campaign_id=campaign_id,
+            proof=proof,
         )
         result = self.app_client.call(
             call_abi_method=args.method(),
@@ -120,7 +120,7 @@ _APP_SPEC_JSON = r"""{
         }
     },
     "source": {
-        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLl9fcHV5YV9hcmM0X3JvdXRlcl9fKCkgLT4gdWludDY0OgpfX3B1eWFfYXJjNF9yb3V0ZXJfXzoKICAgIHByb3RvIDAgMQogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2JhcmVfcm91dGluZ0AxNgogICAgbWV0aG9kICJpbml0aWFsaXplKGFzc2V0KXZvaWQiCiAgICBtZXRob2QgImxvY2tfdG9rZW4oYWRkcmVzcyx1aW50NjQsdWludDY0LGF4ZmVyKXZvaWQiCiAgICBtZXRob2QgImNsYWltX3Rva2VuKCl2b2lkIgogICAgbWV0aG9kICJleHRlbmRfbG9jayh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZXh0ZW5kX2Ftb3VudCh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAidXBkYXRlX3ZldG9rZW5fZGF0YSgpdm9pZCIKICAgIG1ldGhvZCAib3B0X2ludG9fYXNzZXQoYXNzZXQpdm9pZCIKICAgIG1ldGhvZCAiYWRkX3NjaG9sYXJzaGlwKGFzc2V0LHVpbnQ2NCx1aW50NjQsYXhmZXIpdWludDY0IgogICAgbWV0aG9kICJwYXlfc2Nob2xhcnNoaXAodWludDY0KXZvaWQiCiAgICBtZXRob2QgImlzX2xvY2tlZF9ldmVyKGFkZHJlc3MpYm9vbCIKICAgIG1ldGhvZCAicHJvZmlsZV9sb2NrX3VzZXIoYWRkcmVzcykoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBtZXRob2QgImJhbGFuY2Vfb2YoYWRkcmVzcyl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19pbml0aWFsaXplX3JvdXRlQDIgX19wdXlhX2FyYzRfcm91dGVyX19fbG9ja190b2tlbl9yb3V0ZUAzIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2NsYWltX3Rva2VuX3JvdXRlQDQgX19wdXlhX2FyYzRfcm91dGVyX19fZXh0ZW5kX2xvY2tfcm91dGVANSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19leHRlbmRfYW1vdW50X3JvdXRlQDYgX19wdXlhX2FyYzRfcm91dGVyX19fdXBkYXRlX3ZldG9rZW5fZGF0YV9yb3V0ZUA3IF9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9pbnRvX2Fzc2V0X3JvdXRlQDggX19wdXlhX2FyYzRfcm91dGVyX19fYWRkX3NjaG9sYXJzaGlwX3JvdXRlQDkgX19wdXlhX2FyYzRfcm91dGVyX19fcGF5X3NjaG9sYXJzaGlwX3JvdXRlQDEwIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2lzX2xvY2tlZF9ldmVyX3JvdXRlQDExIF9fcHV5YV9hcmM0X3JvdXRlcl9fX3Byb2ZpbGVfbG9ja191c2VyX3JvdXRlQDEyIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2JhbGFuY2Vfb2Zfcm91dGVAMTMKICAgIGludCAwCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2luaXRpYWxpemVfcm91dGVAMjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgY2FsbHN1YiBpbml0aWFsaXplCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19sb2NrX3Rva2VuX3JvdXRlQDM6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICBjYWxsc3ViIGxvY2tfdG9rZW4KICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2NsYWltX3Rva2VuX3JvdXRlQDQ6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNsYWltX3Rva2VuCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19leHRlbmRfbG9ja19yb3V0ZUA1OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgY2FsbHN1YiBleHRlbmRfbG9jawogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZXh0ZW5kX2Ftb3VudF9yb3V0ZUA2OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgY2FsbHN1YiBleHRlbmRfYW1vdW50CiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX191cGRhdGVfdmV0b2tlbl9kYXRhX3JvdXRlQDc6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZV92ZXRva2VuX2RhdGEKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9pbnRvX2Fzc2V0X3JvdXRlQDg6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIGNhbGxzdWIgb3B0X2ludG9fYXNzZXQKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FkZF9zY2hvbGFyc2hpcF9yb3V0ZUA5OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICBjYWxsc3ViIGFkZF9zY2hvbGFyc2hpcAogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcGF5X3NjaG9sYXJzaGlwX3JvdXRlQDEwOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgY2FsbHN1YiBwYXlfc2Nob2xhcnNoaXAKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2lzX2xvY2tlZF9ldmVyX3JvdXRlQDExOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgY2FsbHN1YiBpc19sb2NrZWRfZXZlcgogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3Byb2ZpbGVfbG9ja191c2VyX3JvdXRlQDEyOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgY2FsbHN1YiBwcm9maWxlX2xvY2tfdXNlcgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYmFsYW5jZV9vZl9yb3V0ZUAxMzoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGNhbGxzdWIgYmFsYW5jZV9vZgogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYmFyZV9yb3V0aW5nQDE2OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMjAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMjA6CiAgICBpbnQgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmluaXRpYWxpemUoYXNzZXQ6IHVpbnQ2NCkgLT4gdm9pZDoKaW5pdGlhbGl6ZToKICAgIHByb3RvIDEgMAogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICBpbnQgMAogICAgYnl0ZSAiYXNhIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzYSBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgYnl0ZSAiYXNhIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgaXR4bl9iZWdpbgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUubG9ja190b2tlbihhZGRyOiBieXRlcywgbG9ja19hbW91bnQ6IHVpbnQ2NCwgbG9ja19kdXJhdGlvbjogdWludDY0LCBwYXltZW50OiB1aW50NjQpIC0+IHZvaWQ6CmxvY2tfdG9rZW46CiAgICBwcm90byA0IDAKICAgIGludCAwCiAgICBkdXBuIDIKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgZnJhbWVfZGlnIC00CiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgX2NhbGN1bGF0ZV92ZXRva2VuX2Ftb3VudAogICAgc3dhcAogICAgYnl0ZSAidm90aW5nX2VzY3Jvd191c2VyIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogbG9ja190b2tlbl9ib29sX3RydWVAMgogICAgZnJhbWVfZGlnIDYKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPT0KICAgIGJ6IGxvY2tfdG9rZW5fYm9vbF9mYWxzZUAzCgpsb2NrX3Rva2VuX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgbG9ja190b2tlbl9ib29sX21lcmdlQDQKCmxvY2tfdG9rZW5fYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCmxvY2tfdG9rZW5fYm9vbF9tZXJnZUA0OgogICAgYXNzZXJ0IC8vIEFscmVhZHkgbG9ja2VkCiAgICBpbnQgMAogICAgYnl0ZSAiYXNhIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzYSBleGlzdHMKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID09CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQXNzZXRTZW5kZXIKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFhmZXJBc3NldAogICAgaW50IDAKICAgIGJ5dGUgImFzYSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc2EgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICBmcmFtZV9kaWcgLTMKICAgID09CiAgICBhc3NlcnQKICAgIGludCAwCiAgICBieXRlICJNQVhfTE9DS19USU1FX1NFQ09ORFMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuTUFYX0xPQ0tfVElNRV9TRUNPTkRTIGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICA+PQogICAgYXNzZXJ0IC8vIE5vdCB1cHBlciBtYXggbG9jayB0aW1lCiAgICBpbnQgMAogICAgYnl0ZSAiTUlOX0xPQ0tfVElNRV9TRUNPTkRTIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLk1JTl9MT0NLX1RJTUVfU0VDT05EUyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgPD0KICAgIGFzc2VydCAvLyBOb3QgbG93ZXIgbWluIGxvY2sgdGltZQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgY292ZXIgMgogICAgYnl0ZSAweAogICAgYj4KICAgIGFzc2VydAogICAgZHVwCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMiAzMgogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGZyYW1lX2RpZyA0CiAgICBpdG9iCiAgICBzd2FwCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGRpZyAyCiAgICByZXBsYWNlMiA0MAogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDIKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMiA0OAogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGRpZyAzCiAgICBsZW4KICAgIGludCA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBpbnQgOAogICAgYnplcm8KICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDUKICAgIHVuY292ZXIgMgogICAgYnwKICAgIHJlcGxhY2UyIDU2CiAgICBkaWcgMQogICAgc3dhcAogICAgYm94X3B1dAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIHJlcGxhY2UyIDY0CiAgICBib3hfcHV0CiAgICBieXRlICJsb2NrZWRfdXNlciIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGxvY2tfdG9rZW5fYWZ0ZXJfaWZfZWxzZUA2CiAgICBpbnQgMAogICAgYnl0ZSAidG90YWxfdXNlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF91c2VyIGV4aXN0cwogICAgaW50IDEKICAgICsKICAgIGJ5dGUgInRvdGFsX3VzZXIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgaW50IDEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBib3hfcHV0Cgpsb2NrX3Rva2VuX2FmdGVyX2lmX2Vsc2VANjoKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMgogICAgY29uY2F0CiAgICBtZXRob2QgIkxvY2tFdmVudChhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5fY2FsY3VsYXRlX3ZldG9rZW5fYW1vdW50KGFtb3VudF9sb2NrZWQ6IHVpbnQ2NCwgdGltZV9yZW1haW5pbmc6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9jYWxjdWxhdGVfdmV0b2tlbl9hbW91bnQ6CiAgICBwcm90byAyIDEKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBiKgogICAgZHVwCiAgICBieXRlIDB4CiAgICBiPT0KICAgIGJ6IF9jYWxjdWxhdGVfdmV0b2tlbl9hbW91bnRfYWZ0ZXJfaWZfZWxzZUAyCiAgICBieXRlIDB4CiAgICBzd2FwCiAgICByZXRzdWIKCl9jYWxjdWxhdGVfdmV0b2tlbl9hbW91bnRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgaW50IDAKICAgIGJ5dGUgIlNFQ09ORFNfUEVSX1lFQVIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuU0VDT05EU19QRVJfWUVBUiBleGlzdHMKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBiLwogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmNsYWltX3Rva2VuKCkgLT4gdm9pZDoKY2xhaW1fdG9rZW46CiAgICBwcm90byAwIDAKICAgIHR4biBTZW5kZXIKICAgIGJ5dGUgInZvdGluZ19lc2Nyb3dfdXNlciIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90IGxvY2tlZCB5ZXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgc3dhcAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDQ4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNhbGxzdWIgZ2V0X2xvY2tfZW5kX3RpbWUKICAgIHN3YXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIHN3YXAKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGFzc2VydCAvLyBOb3QgZm91bmQgYW55IGxvY2tlZAogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgID4KICAgIGFzc2VydCAvLyBOb3QgZXhwaXJlZAogICAgZGlnIDEKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYXNzZXJ0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICByZXBsYWNlMiAzMgogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIHJlcGxhY2UyIDQwCiAgICBkaWcgMQogICAgc3dhcAogICAgYm94X3B1dAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgcmVwbGFjZTIgNDgKICAgIGRpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICByZXBsYWNlMiA2NAogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIHJlcGxhY2UyIDU2CiAgICBib3hfcHV0CiAgICBieXRlICJsb2NrZWRfdXNlciIKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGludCAwCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICBpdHhuX2JlZ2luCiAgICBpbnQgMAogICAgYnl0ZSAiYXNhIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzYSBleGlzdHMKICAgIGRpZyAxCiAgICBidG9pCiAgICBkaWcgMwogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBjb25jYXQKICAgIG1ldGhvZCAiQ2xhaW1FdmVudChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmdldF9sb2NrX2VuZF90aW1lKGxvY2tfc3RhcnRfdGltZTogdWludDY0LCBsb2NrX2R1cmF0aW9uOiB1aW50NjQpIC0+IHVpbnQ2NDoKZ2V0X2xvY2tfZW5kX3RpbWU6CiAgICBwcm90byAyIDEKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuZXh0ZW5kX2xvY2soZXh0ZW5kX2xvY2tfZHVyYXRpb246IHVpbnQ2NCkgLT4gdm9pZDoKZXh0ZW5kX2xvY2s6CiAgICBwcm90byAxIDAKICAgIHR4biBTZW5kZXIKICAgIGJ5dGUgInZvdGluZ19lc2Nyb3dfdXNlciIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90IGxvY2tlZCB5ZXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgc3dhcAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDQ4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNhbGxzdWIgZ2V0X2xvY2tfZW5kX3RpbWUKICAgIHN3YXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGFzc2VydCAvLyBOb3QgZm91bmQgYW55IGxvY2tlZAogICAgdW5jb3ZlciAyCiAgICA8CiAgICBhc3NlcnQgLy8gRXhwaXJlZAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDQ4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMgogICAgYjwKICAgIGFzc2VydCAvLyBFeHRlbmQgZHVyYXRpb24gbXVzdCBiZSBoaWdoZXIgdGhhbiBjdXJyZW50IGR1cmF0aW9uCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZGlnIDEKICAgIHJlcGxhY2UyIDQ4CiAgICBkaWcgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgc3dhcAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgY2FsbHN1YiBfdXBkYXRlX3ZldG9rZW5fZGF0YQogICAgcG9wCiAgICBjb25jYXQKICAgIG1ldGhvZCAiRXh0ZW5kTG9ja0V2ZW50KGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuX3VwZGF0ZV92ZXRva2VuX2RhdGEodXNlcjogYnl0ZXMpIC0+IGJ5dGVzOgpfdXBkYXRlX3ZldG9rZW5fZGF0YToKICAgIHByb3RvIDEgMQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgNjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGRpZyAxCiAgICBzd2FwCiAgICAtCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA0OCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgY2FsbHN1YiBnZXRfbG9ja19lbmRfdGltZQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBzd2FwCiAgICAtCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGJ6IF91cGRhdGVfdmV0b2tlbl9kYXRhX2FmdGVyX2lmX2Vsc2VANQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICA+CiAgICBieiBfdXBkYXRlX3ZldG9rZW5fZGF0YV9lbHNlX2JvZHlAMwogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgcmVwbGFjZTIgNTYKICAgIGZyYW1lX2J1cnkgLTEKICAgIGIgX3VwZGF0ZV92ZXRva2VuX2RhdGFfYWZ0ZXJfaWZfZWxzZUA0CgpfdXBkYXRlX3ZldG9rZW5fZGF0YV9lbHNlX2JvZHlAMzoKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZnJhbWVfZGlnIDIKICAgIGNhbGxzdWIgX2NhbGN1bGF0ZV92ZXRva2VuX2Ftb3VudAogICAgZHVwCiAgICBsZW4KICAgIGludCA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBpbnQgOAogICAgYnplcm8KICAgIGJ8CiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIHJlcGxhY2UyIDU2CiAgICBmcmFtZV9idXJ5IC0xCgpfdXBkYXRlX3ZldG9rZW5fZGF0YV9hZnRlcl9pZl9lbHNlQDQ6CiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICByZXBsYWNlMiA2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IC0xCiAgICBmcmFtZV9idXJ5IDMKCl91cGRhdGVfdmV0b2tlbl9kYXRhX2FmdGVyX2lmX2Vsc2VANToKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgLTEKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZGF0ZURhdGFFdmVudChhZGRyZXNzLChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5leHRlbmRfYW1vdW50KGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpleHRlbmRfYW1vdW50OgogICAgcHJvdG8gMSAwCiAgICB0eG4gU2VuZGVyCiAgICBieXRlICJ2b3RpbmdfZXNjcm93X3VzZXIiCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vdCBsb2NrZWQgeWV0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIHN3YXAKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA0OCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjYWxsc3ViIGdldF9sb2NrX2VuZF90aW1lCiAgICBzd2FwCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBFeHRlbmRlZCBhbW91bnQgbXVzdCBiZSBsYXJnZXIgdGhhbiAwCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBhc3NlcnQgLy8gTm90IGZvdW5kIGFueSBsb2NrZWQKICAgIHVuY292ZXIgMgogICAgPAogICAgYXNzZXJ0IC8vIEV4cGlyZWQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBpdG9iCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgc3dhcAogICAgcmVwbGFjZTIgMzIKICAgIGRpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBjYWxsc3ViIF91cGRhdGVfdmV0b2tlbl9kYXRhCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgY29uY2F0CiAgICBtZXRob2QgIkV4dGVuZEFtb3VudEV2ZW50KGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUudXBkYXRlX3ZldG9rZW5fZGF0YSgpIC0+IHZvaWQ6CnVwZGF0ZV92ZXRva2VuX2RhdGE6CiAgICBwcm90byAwIDAKICAgIGJ5dGUgInZvdGluZ19lc2Nyb3dfdXNlciIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3QgbG9ja2VkIHlldAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgY2FsbHN1YiBfdXBkYXRlX3ZldG9rZW5fZGF0YQogICAgcG9wCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUub3B0X2ludG9fYXNzZXQoYXNzZXQ6IHVpbnQ2NCkgLT4gdm9pZDoKb3B0X2ludG9fYXNzZXQ6CiAgICBwcm90byAxIDAKICAgIGl0eG5fYmVnaW4KICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGludCBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmFkZF9zY2hvbGFyc2hpcChhc3NldDogdWludDY0LCBhbW91bnQ6IHVpbnQ2NCwgdmFsdWU6IHVpbnQ2NCwgYXhmZXI6IHVpbnQ2NCkgLT4gdWludDY0OgphZGRfc2Nob2xhcnNoaXA6CiAgICBwcm90byA0IDEKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICBieXRlICJ0b3RhbF9zY2hvbGFyc2hpcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zY2hvbGFyc2hpcCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMwogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTIKICAgIGFzc2VydAogICAgZHVwCiAgICBpdG9iCiAgICBieXRlICJzY2hvbGFyc2hpcCIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBmcmFtZV9kaWcgLTQKICAgID09CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMwogICAgPT0KICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFNlbmRlcgogICAgZGlnIDQKICAgID09CiAgICBhc3NlcnQKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICA9PQogICAgYXNzZXJ0CiAgICBpbnQgMAogICAgYnl0ZSAidG90YWxfc2Nob2xhcnNoaXAiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfc2Nob2xhcnNoaXAgZXhpc3RzCiAgICBpbnQgMQogICAgKwogICAgYnl0ZSAidG90YWxfc2Nob2xhcnNoaXAiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtNAogICAgaXRvYgogICAgY292ZXIgMgogICAgdW5jb3ZlciA0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLnBheV9zY2hvbGFyc2hpcChzY2hvbGFyc2hpcF9pZDogdWludDY0KSAtPiB2b2lkOgpwYXlfc2Nob2xhcnNoaXA6CiAgICBwcm90byAxIDAKICAgIGludCAwCiAgICBkdXBuIDMKICAgIGJ5dGUgIiIKICAgIGR1cAogICAgdHhuIFNlbmRlcgogICAgZHVwCiAgICBpbnQgMAogICAgYnl0ZSAidG90YWxfc2Nob2xhcnNoaXAiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfc2Nob2xhcnNoaXAgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgID4KICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ5dGUgInNjaG9sYXJzaGlwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0CiAgICBieXRlICJ2b3RpbmdfZXNjcm93X3VzZXIiCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGNhbGxzdWIgZ2V0X3BhaWRfa2V5CiAgICBieXRlICJwYWlkX3NjaG9sYXJzaGlwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogcGF5X3NjaG9sYXJzaGlwX2Jvb2xfdHJ1ZUAyCiAgICBmcmFtZV9kaWcgMTAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhaWRfc2Nob2xhcnNoaXAgZW50cnkgZXhpc3RzCiAgICBibnogcGF5X3NjaG9sYXJzaGlwX2Jvb2xfZmFsc2VAMwoKcGF5X3NjaG9sYXJzaGlwX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgcGF5X3NjaG9sYXJzaGlwX2Jvb2xfbWVyZ2VANAoKcGF5X3NjaG9sYXJzaGlwX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgpwYXlfc2Nob2xhcnNoaXBfYm9vbF9tZXJnZUA0OgogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgOAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNjaG9sYXJzaGlwIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgY2FsbHN1YiBfdXBkYXRlX3ZldG9rZW5fZGF0YQogICAgcG9wCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGZyYW1lX2J1cnkgMwogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfZGlnIDYKICAgIGNhbGxzdWIgYmFsYW5jZV9vZgogICAgZGlnIDEKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICBpdG9iCiAgICBiPD0KICAgIGFzc2VydAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDEKICAgIGI+PQogICAgYXNzZXJ0CiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGJ6IHBheV9zY2hvbGFyc2hpcF9ib29sX2ZhbHNlQDcKICAgIGZyYW1lX2RpZyAzCiAgICBleHRyYWN0IDU2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGJ6IHBheV9zY2hvbGFyc2hpcF9ib29sX2ZhbHNlQDcKICAgIGludCAxCiAgICBiIHBheV9zY2hvbGFyc2hpcF9ib29sX21lcmdlQDgKCnBheV9zY2hvbGFyc2hpcF9ib29sX2ZhbHNlQDc6CiAgICBpbnQgMAoKcGF5X3NjaG9sYXJzaGlwX2Jvb2xfbWVyZ2VAODoKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIDIKICAgIGV4dHJhY3QgMjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgc3dhcAogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgNQogICAgYXNzZXJ0IC8vIGFjY291bnQgb3B0ZWQgaW50byBhc3NldAogICAgaW50IDEKICAgID49CiAgICBieiBwYXlfc2Nob2xhcnNoaXBfYm9vbF9mYWxzZUAxMQogICAgZnJhbWVfZGlnIDUKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBiPT0KICAgIGJ6IHBheV9zY2hvbGFyc2hpcF9ib29sX2ZhbHNlQDExCiAgICBpbnQgMQogICAgYiBwYXlfc2Nob2xhcnNoaXBfYm9vbF9tZXJnZUAxMgoKcGF5X3NjaG9sYXJzaGlwX2Jvb2xfZmFsc2VAMTE6CiAgICBpbnQgMAoKcGF5X3NjaG9sYXJzaGlwX2Jvb2xfbWVyZ2VAMTI6CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAxCiAgICBidG9pCiAgICBpbnQgMQogICAgLQogICAgaXRvYgogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgY292ZXIgMgogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2Nob2xhcnNoaXAgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICByZXBsYWNlMiA4CiAgICBib3hfcHV0CiAgICBmcmFtZV9kaWcgMwogICAgZXh0cmFjdCA3MiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZnJhbWVfZGlnIDAKICAgIGJ0b2kKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIHN3YXAKICAgIHJlcGxhY2UyIDcyCiAgICBib3hfcHV0CiAgICBpbnQgMQogICAgaXRvYgogICAgZnJhbWVfZGlnIDEwCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBpdHhuX2JlZ2luCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgaXR4bl9maWVsZCBBc3NldFNlbmRlcgogICAgaW50IDEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyA2CiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXNzZXRDbG9zZVRvCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIDQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGZyYW1lX2RpZyA3CiAgICBzd2FwCiAgICBjb25jYXQKICAgIG1ldGhvZCAiUGF5U2Nob2xhcnNoaXAodWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5nZXRfcGFpZF9rZXkoc2Nob2xhcnNoaXBfaWQ6IHVpbnQ2NCwgYWRkcjogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfcGFpZF9rZXk6CiAgICBwcm90byAyIDEKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmJhbGFuY2Vfb2YodXNlcjogYnl0ZXMpIC0+IHVpbnQ2NDoKYmFsYW5jZV9vZjoKICAgIHByb3RvIDEgMQogICAgaW50IDAKICAgIGJ5dGUgIiIKICAgIGR1cAogICAgYnl0ZSAidm90aW5nX2VzY3Jvd191c2VyIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogYmFsYW5jZV9vZl9hZnRlcl9pZl9lbHNlQDIKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKYmFsYW5jZV9vZl9hZnRlcl9pZl9lbHNlQDI6CiAgICBmcmFtZV9kaWcgMwogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAxCiAgICBkdXAKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIHN3YXAKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGNhbGxzdWIgZ2V0X2xvY2tfZW5kX3RpbWUKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICA+CiAgICBieiBiYWxhbmNlX29mX2FmdGVyX2lmX2Vsc2VANAogICAgaW50IDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpiYWxhbmNlX29mX2FmdGVyX2lmX2Vsc2VANDoKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgLQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgc3dhcAogICAgY2FsbHN1YiBfY2FsY3VsYXRlX3ZldG9rZW5fYW1vdW50CiAgICBzd2FwCiAgICBleHRyYWN0IDcyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpdG9iCiAgICBiLQogICAgYnRvaQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuaXNfbG9ja2VkX2V2ZXIoYWRkcjogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfbG9ja2VkX2V2ZXI6CiAgICBwcm90byAxIDEKICAgIGJ5dGUgImxvY2tlZF91c2VyIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogaXNfbG9ja2VkX2V2ZXJfYWZ0ZXJfaWZfZWxzZUAyCiAgICBpbnQgMAogICAgc3dhcAogICAgcmV0c3ViCgppc19sb2NrZWRfZXZlcl9hZnRlcl9pZl9lbHNlQDI6CiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubG9ja2VkX3VzZXIgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUucHJvZmlsZV9sb2NrX3VzZXIoYWRkcjogYnl0ZXMpIC0+IGJ5dGVzOgpwcm9maWxlX2xvY2tfdXNlcjoKICAgIHByb3RvIDEgMQogICAgYnl0ZSAidm90aW5nX2VzY3Jvd191c2VyIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgcHJvdG8gMCAwCiAgICBieXRlICJ0b3RhbF91c2VyIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBieXRlICJhc2EiCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGJ5dGUgIlNFQ09ORFNfUEVSX1lFQVIiCiAgICBpbnQgMzE1MzYwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBieXRlICJNSU5fTE9DS19USU1FX1NFQ09ORFMiCiAgICBpbnQgNjA0ODAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYnl0ZSAiTUFYX0xPQ0tfVElNRV9TRUNPTkRTIgogICAgaW50IDEyNjE0NDAwMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGJ5dGUgInRvdGFsX3NjaG9sYXJzaGlwIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLl9fcHV5YV9hcmM0X3JvdXRlcl9fKCkgLT4gdWludDY0OgpfX3B1eWFfYXJjNF9yb3V0ZXJfXzoKICAgIHByb3RvIDAgMQogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2JhcmVfcm91dGluZ0AxNgogICAgbWV0aG9kICJpbml0aWFsaXplKGFzc2V0KXZvaWQiCiAgICBtZXRob2QgImxvY2tfdG9rZW4oYWRkcmVzcyx1aW50NjQsdWludDY0LGF4ZmVyKXZvaWQiCiAgICBtZXRob2QgImNsYWltX3Rva2VuKCl2b2lkIgogICAgbWV0aG9kICJleHRlbmRfbG9jayh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZXh0ZW5kX2Ftb3VudCh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAidXBkYXRlX3ZldG9rZW5fZGF0YSgpdm9pZCIKICAgIG1ldGhvZCAib3B0X2ludG9fYXNzZXQoYXNzZXQpdm9pZCIKICAgIG1ldGhvZCAiYWRkX3NjaG9sYXJzaGlwKGFzc2V0LHVpbnQ2NCx1aW50NjQsYXhmZXIpdWludDY0IgogICAgbWV0aG9kICJwYXlfc2Nob2xhcnNoaXAodWludDY0KXZvaWQiCiAgICBtZXRob2QgImlzX2xvY2tlZF9ldmVyKGFkZHJlc3MpYm9vbCIKICAgIG1ldGhvZCAicHJvZmlsZV9sb2NrX3VzZXIoYWRkcmVzcykoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBtZXRob2QgImJhbGFuY2Vfb2YoYWRkcmVzcyl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19pbml0aWFsaXplX3JvdXRlQDIgX19wdXlhX2FyYzRfcm91dGVyX19fbG9ja190b2tlbl9yb3V0ZUAzIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2NsYWltX3Rva2VuX3JvdXRlQDQgX19wdXlhX2FyYzRfcm91dGVyX19fZXh0ZW5kX2xvY2tfcm91dGVANSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19leHRlbmRfYW1vdW50X3JvdXRlQDYgX19wdXlhX2FyYzRfcm91dGVyX19fdXBkYXRlX3ZldG9rZW5fZGF0YV9yb3V0ZUA3IF9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9pbnRvX2Fzc2V0X3JvdXRlQDggX19wdXlhX2FyYzRfcm91dGVyX19fYWRkX3NjaG9sYXJzaGlwX3JvdXRlQDkgX19wdXlhX2FyYzRfcm91dGVyX19fcGF5X3NjaG9sYXJzaGlwX3JvdXRlQDEwIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2lzX2xvY2tlZF9ldmVyX3JvdXRlQDExIF9fcHV5YV9hcmM0X3JvdXRlcl9fX3Byb2ZpbGVfbG9ja191c2VyX3JvdXRlQDEyIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2JhbGFuY2Vfb2Zfcm91dGVAMTMKICAgIGludCAwCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2luaXRpYWxpemVfcm91dGVAMjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgY2FsbHN1YiBpbml0aWFsaXplCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19sb2NrX3Rva2VuX3JvdXRlQDM6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICBjYWxsc3ViIGxvY2tfdG9rZW4KICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2NsYWltX3Rva2VuX3JvdXRlQDQ6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNsYWltX3Rva2VuCiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19leHRlbmRfbG9ja19yb3V0ZUA1OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgY2FsbHN1YiBleHRlbmRfbG9jawogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZXh0ZW5kX2Ftb3VudF9yb3V0ZUA2OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgY2FsbHN1YiBleHRlbmRfYW1vdW50CiAgICBpbnQgMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX191cGRhdGVfdmV0b2tlbl9kYXRhX3JvdXRlQDc6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZV92ZXRva2VuX2RhdGEKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9pbnRvX2Fzc2V0X3JvdXRlQDg6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIGNhbGxzdWIgb3B0X2ludG9fYXNzZXQKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FkZF9zY2hvbGFyc2hpcF9yb3V0ZUA5OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICBjYWxsc3ViIGFkZF9zY2hvbGFyc2hpcAogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcGF5X3NjaG9sYXJzaGlwX3JvdXRlQDEwOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgY2FsbHN1YiBwYXlfc2Nob2xhcnNoaXAKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2lzX2xvY2tlZF9ldmVyX3JvdXRlQDExOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgY2FsbHN1YiBpc19sb2NrZWRfZXZlcgogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3Byb2ZpbGVfbG9ja191c2VyX3JvdXRlQDEyOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgY2FsbHN1YiBwcm9maWxlX2xvY2tfdXNlcgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYmFsYW5jZV9vZl9yb3V0ZUAxMzoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGNhbGxzdWIgYmFsYW5jZV9vZgogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYmFyZV9yb3V0aW5nQDE2OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMjAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMjA6CiAgICBpbnQgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmluaXRpYWxpemUoYXNzZXQ6IHVpbnQ2NCkgLT4gdm9pZDoKaW5pdGlhbGl6ZToKICAgIHByb3RvIDEgMAogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICBpbnQgMAogICAgYnl0ZSAiYXNhIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzYSBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgYnl0ZSAiYXNhIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgaXR4bl9iZWdpbgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUubG9ja190b2tlbihhZGRyOiBieXRlcywgbG9ja19hbW91bnQ6IHVpbnQ2NCwgbG9ja19kdXJhdGlvbjogdWludDY0LCBwYXltZW50OiB1aW50NjQpIC0+IHZvaWQ6CmxvY2tfdG9rZW46CiAgICBwcm90byA0IDAKICAgIGludCAwCiAgICBkdXBuIDIKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgZnJhbWVfZGlnIC00CiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgX2NhbGN1bGF0ZV92ZXRva2VuX2Ftb3VudAogICAgc3dhcAogICAgYnl0ZSAidm90aW5nX2VzY3Jvd191c2VyIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogbG9ja190b2tlbl9ib29sX3RydWVAMgogICAgZnJhbWVfZGlnIDYKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPT0KICAgIGJ6IGxvY2tfdG9rZW5fYm9vbF9mYWxzZUAzCgpsb2NrX3Rva2VuX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgbG9ja190b2tlbl9ib29sX21lcmdlQDQKCmxvY2tfdG9rZW5fYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCmxvY2tfdG9rZW5fYm9vbF9tZXJnZUA0OgogICAgYXNzZXJ0IC8vIEFscmVhZHkgbG9ja2VkCiAgICBpbnQgMAogICAgYnl0ZSAiYXNhIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzYSBleGlzdHMKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID09CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQXNzZXRTZW5kZXIKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFhmZXJBc3NldAogICAgaW50IDAKICAgIGJ5dGUgImFzYSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc2EgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICBmcmFtZV9kaWcgLTMKICAgID09CiAgICBhc3NlcnQKICAgIGludCAwCiAgICBieXRlICJNQVhfTE9DS19USU1FX1NFQ09ORFMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuTUFYX0xPQ0tfVElNRV9TRUNPTkRTIGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICA+PQogICAgYXNzZXJ0IC8vIE5vdCB1cHBlciBtYXggbG9jayB0aW1lCiAgICBpbnQgMAogICAgYnl0ZSAiTUlOX0xPQ0tfVElNRV9TRUNPTkRTIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLk1JTl9MT0NLX1RJTUVfU0VDT05EUyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgPD0KICAgIGFzc2VydCAvLyBOb3QgbG93ZXIgbWluIGxvY2sgdGltZQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIHN3YXAKICAgIGZyYW1lX2RpZyA0CiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgNAogICAgZnJhbWVfYnVyeSAyCiAgICBpdG9iCiAgICBjb3ZlciAzCiAgICBkaWcgNAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyA2CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBieXRlICJsb2NrZWRfdXNlciIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGxvY2tfdG9rZW5fYWZ0ZXJfaWZfZWxzZUA2CiAgICBpbnQgMAogICAgYnl0ZSAidG90YWxfdXNlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF91c2VyIGV4aXN0cwogICAgaW50IDEKICAgICsKICAgIGJ5dGUgInRvdGFsX3VzZXIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgaW50IDEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0Cgpsb2NrX3Rva2VuX2FmdGVyX2lmX2Vsc2VANjoKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMgogICAgY29uY2F0CiAgICBtZXRob2QgIkxvY2tFdmVudChhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5fY2FsY3VsYXRlX3ZldG9rZW5fYW1vdW50KGFtb3VudF9sb2NrZWQ6IHVpbnQ2NCwgdGltZV9yZW1haW5pbmc6IHVpbnQ2NCkgLT4gdWludDY0OgpfY2FsY3VsYXRlX3ZldG9rZW5fYW1vdW50OgogICAgcHJvdG8gMiAxCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgbXVsdwogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBibnogX2NhbGN1bGF0ZV92ZXRva2VuX2Ftb3VudF9hZnRlcl9pZl9lbHNlQDIKICAgIGludCAwCiAgICBieXRlICJTRUNPTkRTX1BFUl9ZRUFSIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLlNFQ09ORFNfUEVSX1lFQVIgZXhpc3RzCiAgICAvCiAgICBzd2FwCiAgICByZXRzdWIKCl9jYWxjdWxhdGVfdmV0b2tlbl9hbW91bnRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgaW50IDAKICAgIGJ5dGUgIlNFQ09ORFNfUEVSX1lFQVIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuU0VDT05EU19QRVJfWUVBUiBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICB1bmNvdmVyIDIKICAgIGludCAwCiAgICB1bmNvdmVyIDMKICAgIGRpdm1vZHcKICAgIHBvcG4gMgogICAgc3dhcAogICAgIQogICAgYXNzZXJ0IC8vIHZlVE9LRU4gYW1vdW50IG92ZXJmbG93CiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuY2xhaW1fdG9rZW4oKSAtPiB2b2lkOgpjbGFpbV90b2tlbjoKICAgIHByb3RvIDAgMAogICAgdHhuIFNlbmRlcgogICAgYnl0ZSAidm90aW5nX2VzY3Jvd191c2VyIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3QgbG9ja2VkIHlldAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBjYWxsc3ViIF91c2VyX2xvY2tfZW5kX3RpbWUKICAgIHBvcAogICAgc3dhcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYXNzZXJ0IC8vIE5vdCBmb3VuZCBhbnkgbG9ja2VkCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgPgogICAgYXNzZXJ0IC8vIE5vdCBleHBpcmVkCiAgICBkaWcgMQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBhc3NlcnQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIHJlcGxhY2UyIDMyCiAgICBkaWcgMQogICAgc3dhcAogICAgYm94X3B1dAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgcmVwbGFjZTIgNDAKICAgIGRpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICByZXBsYWNlMiA0OAogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIHJlcGxhY2UyIDY0CiAgICBkaWcgMQogICAgc3dhcAogICAgYm94X3B1dAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgcmVwbGFjZTIgNTYKICAgIGJveF9wdXQKICAgIGJ5dGUgImxvY2tlZF91c2VyIgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgaW50IDAKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIGl0eG5fYmVnaW4KICAgIGludCAwCiAgICBieXRlICJhc2EiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNhIGV4aXN0cwogICAgZGlnIDEKICAgIGJ0b2kKICAgIGRpZyAzCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGNvbmNhdAogICAgbWV0aG9kICJDbGFpbUV2ZW50KGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuX3VzZXJfbG9ja19lbmRfdGltZSh1c2VyOiBieXRlcykgLT4gdWludDY0LCBieXRlczoKX3VzZXJfbG9ja19lbmRfdGltZToKICAgIHByb3RvIDEgMgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDQwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGNhbGxzdWIgZ2V0X2xvY2tfZW5kX3RpbWUKICAgIGZyYW1lX2RpZyAtMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmdldF9sb2NrX2VuZF90aW1lKGxvY2tfc3RhcnRfdGltZTogdWludDY0LCBsb2NrX2R1cmF0aW9uOiB1aW50NjQpIC0+IHVpbnQ2NDoKZ2V0X2xvY2tfZW5kX3RpbWU6CiAgICBwcm90byAyIDEKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuZXh0ZW5kX2xvY2soZXh0ZW5kX2xvY2tfZHVyYXRpb246IHVpbnQ2NCkgLT4gdm9pZDoKZXh0ZW5kX2xvY2s6CiAgICBwcm90byAxIDAKICAgIHR4biBTZW5kZXIKICAgIGJ5dGUgInZvdGluZ19lc2Nyb3dfdXNlciIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90IGxvY2tlZCB5ZXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgY2FsbHN1YiBfdXNlcl9sb2NrX2VuZF90aW1lCiAgICBwb3AKICAgIHN3YXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIHN3YXAKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBhc3NlcnQgLy8gTm90IGZvdW5kIGFueSBsb2NrZWQKICAgIGNvdmVyIDIKICAgID4KICAgIGFzc2VydCAvLyBFeHBpcmVkCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBiPAogICAgYXNzZXJ0IC8vIEV4dGVuZCBkdXJhdGlvbiBtdXN0IGJlIGhpZ2hlciB0aGFuIGN1cnJlbnQgZHVyYXRpb24KICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBkaWcgMQogICAgcmVwbGFjZTIgNDgKICAgIGRpZyAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBzd2FwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBjYWxsc3ViIF91cGRhdGVfdmV0b2tlbl9kYXRhCiAgICBwb3AKICAgIGNvbmNhdAogICAgbWV0aG9kICJFeHRlbmRMb2NrRXZlbnQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5fdXBkYXRlX3ZldG9rZW5fZGF0YSh1c2VyOiBieXRlcykgLT4gYnl0ZXM6Cl91cGRhdGVfdmV0b2tlbl9kYXRhOgogICAgcHJvdG8gMSAxCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA2NCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZGlnIDEKICAgIHN3YXAKICAgIC0KICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfdXNlcl9sb2NrX2VuZF90aW1lCiAgICBmcmFtZV9idXJ5IC0xCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIC0KICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgYnogX3VwZGF0ZV92ZXRva2VuX2RhdGFfYWZ0ZXJfaWZfZWxzZUA1CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgID4KICAgIGJ6IF91cGRhdGVfdmV0b2tlbl9kYXRhX2Vsc2VfYm9keUAzCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICByZXBsYWNlMiA1NgogICAgZnJhbWVfYnVyeSAtMQogICAgYiBfdXBkYXRlX3ZldG9rZW5fZGF0YV9hZnRlcl9pZl9lbHNlQDQKCl91cGRhdGVfdmV0b2tlbl9kYXRhX2Vsc2VfYm9keUAzOgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgMgogICAgY2FsbHN1YiBfY2FsY3VsYXRlX3ZldG9rZW5fYW1vdW50CiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIHJlcGxhY2UyIDU2CiAgICBmcmFtZV9idXJ5IC0xCgpfdXBkYXRlX3ZldG9rZW5fZGF0YV9hZnRlcl9pZl9lbHNlQDQ6CiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICByZXBsYWNlMiA2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IC0xCiAgICBmcmFtZV9idXJ5IDMKCl91cGRhdGVfdmV0b2tlbl9kYXRhX2FmdGVyX2lmX2Vsc2VANToKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgLTEKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZGF0ZURhdGFFdmVudChhZGRyZXNzLChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5leHRlbmRfYW1vdW50KGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpleHRlbmRfYW1vdW50OgogICAgcHJvdG8gMSAwCiAgICB0eG4gU2VuZGVyCiAgICBieXRlICJ2b3RpbmdfZXNjcm93X3VzZXIiCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vdCBsb2NrZWQgeWV0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGNhbGxzdWIgX3VzZXJfbG9ja19lbmRfdGltZQogICAgcG9wCiAgICBzd2FwCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBFeHRlbmRlZCBhbW91bnQgbXVzdCBiZSBsYXJnZXIgdGhhbiAwCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYXNzZXJ0IC8vIE5vdCBmb3VuZCBhbnkgbG9ja2VkCiAgICBjb3ZlciAyCiAgICA+CiAgICBhc3NlcnQgLy8gRXhwaXJlZAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGl0b2IKICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICByZXBsYWNlMiAzMgogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19lc2Nyb3dfdXNlciBlbnRyeSBleGlzdHMKICAgIGNhbGxzdWIgX3VwZGF0ZV92ZXRva2VuX2RhdGEKICAgIHBvcAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBjb25jYXQKICAgIG1ldGhvZCAiRXh0ZW5kQW1vdW50RXZlbnQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS51cGRhdGVfdmV0b2tlbl9kYXRhKCkgLT4gdm9pZDoKdXBkYXRlX3ZldG9rZW5fZGF0YToKICAgIHByb3RvIDAgMAogICAgYnl0ZSAidm90aW5nX2VzY3Jvd191c2VyIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vdCBsb2NrZWQgeWV0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBjYWxsc3ViIF91cGRhdGVfdmV0b2tlbl9kYXRhCiAgICBwb3AKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5vcHRfaW50b19hc3NldChhc3NldDogdWludDY0KSAtPiB2b2lkOgpvcHRfaW50b19hc3NldDoKICAgIHByb3RvIDEgMAogICAgaXR4bl9iZWdpbgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuYWRkX3NjaG9sYXJzaGlwKGFzc2V0OiB1aW50NjQsIGFtb3VudDogdWludDY0LCB2YWx1ZTogdWludDY0LCBheGZlcjogdWludDY0KSAtPiB1aW50NjQ6CmFkZF9zY2hvbGFyc2hpcDoKICAgIHByb3RvIDQgMQogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIGJ5dGUgInRvdGFsX3NjaG9sYXJzaGlwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3NjaG9sYXJzaGlwIGV4aXN0cwogICAgZnJhbWVfZGlnIC0zCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMgogICAgYXNzZXJ0CiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGUgInNjaG9sYXJzaGlwIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGZyYW1lX2RpZyAtNAogICAgPT0KICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0U2VuZGVyCiAgICBkaWcgNAogICAgPT0KICAgIGFzc2VydAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgID09CiAgICBhc3NlcnQKICAgIGludCAwCiAgICBieXRlICJ0b3RhbF9zY2hvbGFyc2hpcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zY2hvbGFyc2hpcCBleGlzdHMKICAgIGludCAxCiAgICArCiAgICBieXRlICJ0b3RhbF9zY2hvbGFyc2hpcCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgc3dhcAogICAgZnJhbWVfZGlnIC00CiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICB1bmNvdmVyIDQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUucGF5X3NjaG9sYXJzaGlwKHNjaG9sYXJzaGlwX2lkOiB1aW50NjQpIC0+IHZvaWQ6CnBheV9zY2hvbGFyc2hpcDoKICAgIHByb3RvIDEgMAogICAgaW50IDAKICAgIGR1cG4gMwogICAgYnl0ZSAiIgogICAgZHVwCiAgICB0eG4gU2VuZGVyCiAgICBkdXAKICAgIGludCAwCiAgICBieXRlICJ0b3RhbF9zY2hvbGFyc2hpcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zY2hvbGFyc2hpcCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPgogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMgogICAgYnl0ZSAic2Nob2xhcnNoaXAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQKICAgIGJ5dGUgInZvdGluZ19lc2Nyb3dfdXNlciIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiBnZXRfcGFpZF9rZXkKICAgIGJ5dGUgInBhaWRfc2Nob2xhcnNoaXAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBwYXlfc2Nob2xhcnNoaXBfYm9vbF90cnVlQDIKICAgIGZyYW1lX2RpZyAxMAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFpZF9zY2hvbGFyc2hpcCBlbnRyeSBleGlzdHMKICAgIGJueiBwYXlfc2Nob2xhcnNoaXBfYm9vbF9mYWxzZUAzCgpwYXlfc2Nob2xhcnNoaXBfYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBwYXlfc2Nob2xhcnNoaXBfYm9vbF9tZXJnZUA0CgpwYXlfc2Nob2xhcnNoaXBfYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCnBheV9zY2hvbGFyc2hpcF9ib29sX21lcmdlQDQ6CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyA4CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2Nob2xhcnNoaXAgZW50cnkgZXhpc3RzCiAgICBmcmFtZV9kaWcgOQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBjYWxsc3ViIF91cGRhdGVfdmV0b2tlbl9kYXRhCiAgICBwb3AKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMwogICAgZnJhbWVfYnVyeSAzCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBmcmFtZV9kaWcgNgogICAgY2FsbHN1YiBiYWxhbmNlX29mCiAgICBkaWcgMQogICAgZXh0cmFjdCAxNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIGl0b2IKICAgIGI8PQogICAgYXNzZXJ0CiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYj49CiAgICBhc3NlcnQKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYnogcGF5X3NjaG9sYXJzaGlwX2Jvb2xfZmFsc2VANwogICAgZnJhbWVfZGlnIDMKICAgIGV4dHJhY3QgNTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYnogcGF5X3NjaG9sYXJzaGlwX2Jvb2xfZmFsc2VANwogICAgaW50IDEKICAgIGIgcGF5X3NjaG9sYXJzaGlwX2Jvb2xfbWVyZ2VAOAoKcGF5X3NjaG9sYXJzaGlwX2Jvb2xfZmFsc2VANzoKICAgIGludCAwCgpwYXlfc2Nob2xhcnNoaXBfYm9vbF9tZXJnZUA4OgogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgMgogICAgZXh0cmFjdCAyNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBzd2FwCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSA1CiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICBpbnQgMQogICAgPj0KICAgIGJ6IHBheV9zY2hvbGFyc2hpcF9ib29sX2ZhbHNlQDExCiAgICBmcmFtZV9kaWcgNQogICAgaXRvYgogICAgZnJhbWVfZGlnIDEKICAgIGI9PQogICAgYnogcGF5X3NjaG9sYXJzaGlwX2Jvb2xfZmFsc2VAMTEKICAgIGludCAxCiAgICBiIHBheV9zY2hvbGFyc2hpcF9ib29sX21lcmdlQDEyCgpwYXlfc2Nob2xhcnNoaXBfYm9vbF9mYWxzZUAxMToKICAgIGludCAwCgpwYXlfc2Nob2xhcnNoaXBfYm9vbF9tZXJnZUAxMjoKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIDEKICAgIGJ0b2kKICAgIGludCAxCiAgICAtCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zY2hvbGFyc2hpcCBlbnRyeSBleGlzdHMKICAgIHN3YXAKICAgIHJlcGxhY2UyIDgKICAgIGJveF9wdXQKICAgIGZyYW1lX2RpZyAzCiAgICBleHRyYWN0IDcyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgMAogICAgYnRvaQogICAgKwogICAgaXRvYgogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgY292ZXIgMgogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgc3dhcAogICAgcmVwbGFjZTIgNzIKICAgIGJveF9wdXQKICAgIGludCAxCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMTAKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGl0eG5fYmVnaW4KICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICBpbnQgMQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldENsb3NlVG8KICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgNAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIGludCBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgZnJhbWVfZGlnIDcKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbWV0aG9kICJQYXlTY2hvbGFyc2hpcCh1aW50NjQsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLmdldF9wYWlkX2tleShzY2hvbGFyc2hpcF9pZDogdWludDY0LCBhZGRyOiBieXRlcykgLT4gYnl0ZXM6CmdldF9wYWlkX2tleToKICAgIHByb3RvIDIgMQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuYmFsYW5jZV9vZih1c2VyOiBieXRlcykgLT4gdWludDY0OgpiYWxhbmNlX29mOgogICAgcHJvdG8gMSAxCiAgICBpbnQgMAogICAgYnl0ZSAiIgogICAgZHVwCiAgICBieXRlICJ2b3RpbmdfZXNjcm93X3VzZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBiYWxhbmNlX29mX2FmdGVyX2lmX2Vsc2VAMgogICAgaW50IDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpiYWxhbmNlX29mX2FmdGVyX2lmX2Vsc2VAMjoKICAgIGZyYW1lX2RpZyAzCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZXNjcm93X3VzZXIgZW50cnkgZXhpc3RzCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMQogICAgY2FsbHN1YiBfdXNlcl9sb2NrX2VuZF90aW1lCiAgICBmcmFtZV9idXJ5IDAKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICA+CiAgICBieiBiYWxhbmNlX29mX2FmdGVyX2lmX2Vsc2VANAogICAgaW50IDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpiYWxhbmNlX29mX2FmdGVyX2lmX2Vsc2VANDoKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgLQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgc3dhcAogICAgY2FsbHN1YiBfY2FsY3VsYXRlX3ZldG9rZW5fYW1vdW50CiAgICBzd2FwCiAgICBleHRyYWN0IDcyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAtCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5pc19sb2NrZWRfZXZlcihhZGRyOiBieXRlcykgLT4gdWludDY0Ogppc19sb2NrZWRfZXZlcjoKICAgIHByb3RvIDEgMQogICAgYnl0ZSAibG9ja2VkX3VzZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBpc19sb2NrZWRfZXZlcl9hZnRlcl9pZl9lbHNlQDIKICAgIGludCAwCiAgICBzd2FwCiAgICByZXRzdWIKCmlzX2xvY2tlZF9ldmVyX2FmdGVyX2lmX2Vsc2VAMjoKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sb2NrZWRfdXNlciBlbnRyeSBleGlzdHMKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zY2hvbGFyc2hpcC5jb250cmFjdC5DZXJ0aWZpY2F0ZS5wcm9maWxlX2xvY2tfdXNlcihhZGRyOiBieXRlcykgLT4gYnl0ZXM6CnByb2ZpbGVfbG9ja191c2VyOgogICAgcHJvdG8gMSAxCiAgICBieXRlICJ2b3RpbmdfZXNjcm93X3VzZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2VzY3Jvd191c2VyIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNjaG9sYXJzaGlwLmNvbnRyYWN0LkNlcnRpZmljYXRlLl9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICBwcm90byAwIDAKICAgIGJ5dGUgInRvdGFsX3VzZXIiCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGJ5dGUgImFzYSIKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYnl0ZSAiU0VDT05EU19QRVJfWUVBUiIKICAgIGludCAzMTUzNjAwMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGJ5dGUgIk1JTl9MT0NLX1RJTUVfU0VDT05EUyIKICAgIGludCA2MDQ4MDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBieXRlICJNQVhfTE9DS19USU1FX1NFQ09ORFMiCiAgICBpbnQgMTI2MTQ0MDAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYnl0ZSAidG90YWxfc2Nob2xhcnNoaXAiCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
         "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuc2Nob2xhcnNoaXAuY29udHJhY3QuQ2VydGlmaWNhdGUuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIGludCAxCiAgICByZXR1cm4K"
     },
     "state": {
@@ -0,0 +1,336 @@
+from pathlib import Path
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+)
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.async_client import (
+    DEFAULT_WAIT_ROUNDS,
+    AsyncApplicationClient,
+    AsyncComposer,
+    SimulateOptions,
+    method_args,
+)
+from smart_contracts._helpers.batch import box_name
+from smart_contracts._helpers.snapshot import (
+    DEFAULT_WORKERS,
+    BoxMapSnapshot,
+    load_snapshot,
+    take_snapshot,
+)
+from smart_contracts.campaign import boxes, codec
+from smart_contracts.campaign import client as campaign_client
+
+
+class AsyncCampaignComposer:
+    """Typed counterpart of the generated `Composer` for `AsyncCampaignClient`."""
+
+    def __init__(self, composer: AsyncComposer):
+        self.composer = composer
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.composer.build()
+
+    async def simulate(
+        self, options: SimulateOptions | None = None
+    ) -> SimulateAtomicTransactionResponse:
+        return await self.composer.simulate(options)
+
+    async def execute(
+        self, wait_rounds: int = DEFAULT_WAIT_ROUNDS
+    ) -> AtomicTransactionResponse:
+        return await self.composer.execute(wait_rounds)
+
+    def opt_into_asset(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.OptIntoAssetArgs(asset=asset)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def allow_owner_campaign(
+        self,
+        *,
+        owner_campaign: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.AllowOwnerCampaignArgs(owner_campaign=owner_campaign)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def add_campaign(
+        self,
+        *,
+        proof: bytes | bytearray,
+        root: bytes | bytearray,
+        duration: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.AddCampaignArgs(
+            proof=proof, root=root, duration=duration
+        )
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def rotate_root(
+        self,
+        *,
+        campaign_id: int,
+        root: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.RotateRootArgs(campaign_id=campaign_id, root=root)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def mint_token(
+        self,
+        *,
+        leaf_data: bytes | bytearray,
+        addr: str,
+        amount: int,
+        campaign_id: int,
+        proof: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.MintTokenArgs(
+            leaf_data=leaf_data,
+            addr=addr,
+            amount=amount,
+            campaign_id=campaign_id,
+            proof=proof,
+        )
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def check_eligible(
+        self,
+        *,
+        addr: str,
+        amount: int,
+        campaign_id: int,
+        proof: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.CheckEligibleArgs(
+            addr=addr, amount=amount, campaign_id=campaign_id, proof=proof
+        )
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def owner_campaign(
+        self,
+        *,
+        campaign_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.OwnerCampaignArgs(campaign_id=campaign_id)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def creator(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCampaignComposer":
+        args = campaign_client.CreatorArgs()
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+
+class AsyncCampaignClient:
+    """Asyncio variant of `CampaignClient` for a deployed Campaign app.
+
+    Every method that talks to algod is a coroutine over the pooled session of
+    `algod_client`. Methods that only read state are simulated instead of submitted,
+    unsigned and batched with concurrent reads, so they cost no fee and need no
+    confirmation. Deploy with `CampaignClient`, then
+    point this client at its app id.
+    """
+
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        *,
+        app_id: int,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: transaction.SuggestedParams | None = None,
+    ):
+        self.app_spec = campaign_client.APP_SPEC
+        self.app_client = AsyncApplicationClient(
+            algod_client,
+            self.app_spec,
+            app_id=app_id,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+        )
+
+    @property
+    def algod_client(self) -> AsyncAlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    async def get_global_state(self) -> "campaign_client.GlobalState":
+        return campaign_client.GlobalState(await self.app_client.get_global_state())
+
+    async def get_campaign(self, campaign_id: int) -> codec.EligibleData:
+        """Reads a campaign's root, proof, owner and expiry straight from its box."""
+        return await self.app_client.get_box(
+            box_name(b"campaign", campaign_id), codec.decode_eligible_data
+        )
+
+    async def snapshot(
+        self, directory: Path, *, workers: int = DEFAULT_WORKERS
+    ) -> dict[bytes, BoxMapSnapshot]:
+        """Reads every box of the app into `directory`, resuming an interrupted
+        snapshot there, and returns the columns of each map by prefix."""
+        await take_snapshot(
+            self.app_client.algod_client, self.app_id, directory, workers=workers
+        )
+        return load_snapshot(directory, boxes.BOX_MAPS)
+
+    async def compose(
+        self, atc: AtomicTransactionComposer | None = None
+    ) -> AsyncCampaignComposer:
+        return AsyncCampaignComposer(await self.app_client.compose(atc))
+
+    async def opt_into_asset(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = campaign_client.OptIntoAssetArgs(asset=asset)
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def allow_owner_campaign(
+        self,
+        *,
+        owner_campaign: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = campaign_client.AllowOwnerCampaignArgs(owner_campaign=owner_campaign)
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def add_campaign(
+        self,
+        *,
+        proof: bytes | bytearray,
+        root: bytes | bytearray,
+        duration: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        args = campaign_client.AddCampaignArgs(
+            proof=proof, root=root, duration=duration
+        )
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def rotate_root(
+        self,
+        *,
+        campaign_id: int,
+        root: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = campaign_client.RotateRootArgs(campaign_id=campaign_id, root=root)
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def mint_token(
+        self,
+        *,
+        leaf_data: bytes | bytearray,
+        addr: str,
+        amount: int,
+        campaign_id: int,
+        proof: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = campaign_client.MintTokenArgs(
+            leaf_data=leaf_data,
+            addr=addr,
+            amount=amount,
+            campaign_id=campaign_id,
+            proof=proof,
+        )
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def check_eligible(
+        self,
+        *,
+        addr: str,
+        amount: int,
+        campaign_id: int,
+        proof: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[bool]:
+        args = campaign_client.CheckEligibleArgs(
+            addr=addr, amount=amount, campaign_id=campaign_id, proof=proof
+        )
+        return await self.app_client.read(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def owner_campaign(
+        self,
+        *,
+        campaign_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[str]:
+        args = campaign_client.OwnerCampaignArgs(campaign_id=campaign_id)
+        return await self.app_client.read(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def creator(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[str]:
+        args = campaign_client.CreatorArgs()
+        return await self.app_client.read(
+            args.method(), method_args(args), transaction_parameters
+        )
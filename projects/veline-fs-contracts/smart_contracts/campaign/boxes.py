@@ -0,0 +1,81 @@
+"""Boxes of the Campaign contract: which ones each ABI method touches, for
+`BatchComposer` to reference, and how each `BoxMap` is laid out, for snapshots.
+
+ARC-32 specs do not describe box storage, so the rules mirror the `BoxMap`s in
+`contract.py`: each box name is the map's attribute name followed by the key.
+"""
+
+import hashlib
+from collections.abc import Sequence
+
+from algosdk import encoding
+
+from smart_contracts._helpers.batch import BoxName, arg_box, box_name, sender_box
+from smart_contracts._helpers.snapshot import (
+    BoxMapLayout,
+    Columns,
+    bool_columns,
+    uint64_column,
+)
+from smart_contracts.campaign.codec import EligibleData
+
+
+def claim_key(campaign_id: int, addr: str) -> bytes:
+    """Key of the `claimed` box, as `Campaign.get_claim_key` derives it."""
+    return hashlib.sha256(
+        campaign_id.to_bytes(8, "big") + encoding.decode_address(addr)
+    ).digest()
+
+
+BOX_REFERENCES: dict[str, list[BoxName]] = {
+    "allow_owner_campaign": [arg_box(b"valid_owner_campaign", "owner_campaign")],
+    # The new `campaign` box is keyed by the next campaign id, which depends on app
+    # state; pass it in `TransactionParameters.boxes`
+    "add_campaign": [
+        sender_box(b"valid_owner_campaign"),
+        sender_box(b"campaign_id"),
+    ],
+    "rotate_root": [
+        arg_box(b"campaign", "campaign_id"),
+        sender_box(b"valid_owner_campaign"),
+    ],
+    "mint_token": [
+        arg_box(b"campaign", "campaign_id"),
+        lambda args, sender: box_name(
+            b"claimed", claim_key(args["campaign_id"], args["addr"])
+        ),
+    ],
+    "check_eligible": [arg_box(b"campaign", "campaign_id")],
+    "owner_campaign": [arg_box(b"campaign", "campaign_id")],
+}
+
+
+def eligible_data_columns(values: Sequence[bytes]) -> Columns:
+    campaigns = [EligibleData(value) for value in values]
+    return {
+        "proof": [bytes(campaign.proof) for campaign in campaigns],
+        "root": [bytes(campaign.root) for campaign in campaigns],
+        "owner": [campaign.owner for campaign in campaigns],
+        "expired_at": uint64_column(campaign.expired_at for campaign in campaigns),
+    }
+
+
+def campaign_ids_columns(values: Sequence[bytes]) -> Columns:
+    """Decodes `DynamicArray[arc4.UInt64]` values, a length and then the items."""
+    return {
+        "campaign_ids": [
+            uint64_column(
+                int.from_bytes(value[offset : offset + 8], "big")
+                for offset in range(2, len(value), 8)
+            )
+            for value in values
+        ]
+    }
+
+
+BOX_MAPS = [
+    BoxMapLayout(b"campaign", 8, eligible_data_columns),
+    BoxMapLayout(b"valid_owner_campaign", 32, bool_columns),
+    BoxMapLayout(b"campaign_id", 32, campaign_ids_columns),
+    BoxMapLayout(b"claimed", 32, bool_columns),
+]
@@ -0,0 +1,16 @@
+"""The generated typed client of Campaign, imported on first use.
+
+Importing `smart_contracts.artifacts.campaign.campaign_client` loads
+algokit_utils and algosdk and parses the app spec; importing this module does
+not. Each name, such as `CampaignClient` or `APP_SPEC`, is read from the
+generated module when first used.
+"""
+
+from typing import TYPE_CHECKING
+
+from smart_contracts._helpers.lazy_client import lazy_getattr
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.campaign.campaign_client import *  # noqa: F403
+
+__getattr__ = lazy_getattr("smart_contracts.artifacts.campaign.campaign_client")
@@ -0,0 +1,78 @@
+"""Fast decoder for the `EligibleData` ARC-4 struct the Campaign contract stores.
+
+`EligibleData` has two dynamic byte arrays, so instead of decoding every field up
+front it is wrapped in a view that reads the ARC-4 head offsets and slices the
+buffer only when a field is accessed. Slices are `memoryview`s of the original
+buffer, so nothing is copied until the caller asks for `bytes`.
+"""
+
+import struct
+from collections.abc import Iterator
+
+from algosdk import encoding
+
+Buffer = bytes | bytearray | memoryview
+
+# The head is the proof offset, the root offset, owner and expired_at
+_UINT16 = struct.Struct(">H")
+_UINT64 = struct.Struct(">Q")
+_OWNER = slice(4, 36)
+
+
+class EligibleData:
+    __slots__ = ("data",)
+
+    def __init__(self, data: Buffer):
+        self.data = memoryview(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"EligibleData(proof={bytes(self.proof).hex()}, "
+            f"root={bytes(self.root).hex()}, owner={self.owner_address}, "
+            f"expired_at={self.expired_at})"
+        )
+
+    def _bytes_at(self, head_offset: int) -> memoryview:
+        (offset,) = _UINT16.unpack_from(self.data, head_offset)
+        (length,) = _UINT16.unpack_from(self.data, offset)
+        return self.data[offset + 2 : offset + 2 + length]
+
+    @property
+    def proof(self) -> memoryview:
+        return self._bytes_at(0)
+
+    @property
+    def root(self) -> memoryview:
+        return self._bytes_at(2)
+
+    @property
+    def owner(self) -> bytes:
+        return bytes(self.data[_OWNER])
+
+    @property
+    def owner_address(self) -> str:
+        return encoding.encode_address(self.owner)  # type: ignore[no-any-return]
+
+    @property
+    def expired_at(self) -> int:
+        return _UINT64.unpack_from(self.data, _OWNER.stop)[0]  # type: ignore[no-any-return]
+
+
+def decode_eligible_data(data: Buffer) -> EligibleData:
+    return EligibleData(data)
+
+
+def iter_eligible_data(data: Buffer) -> Iterator[EligibleData]:
+    """Splits a buffer of `campaign` box values laid end to end into views.
+
+    The root is the last part of each value, so its offset and length give where
+    the next value starts.
+    """
+    data = memoryview(data)
+    start = 0
+    while start < len(data):
+        (root_offset,) = _UINT16.unpack_from(data, start + 2)
+        (root_length,) = _UINT16.unpack_from(data, start + root_offset)
+        end = start + root_offset + 2 + root_length
+        yield EligibleData(data[start:end])
+        start = end
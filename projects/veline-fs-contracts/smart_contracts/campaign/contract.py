@@ -3,6 +3,7 @@
 from algopy import (
     ARC4Contract,
     Asset,
+    BigUInt,
     BoxMap,
     Bytes,
     Global,
@@ -18,6 +19,8 @@ from algopy.arc4 import Address, DynamicArray, Struct, abimethod, emit
 
 
 class EligibleData(Struct):
+    # Not read by claims, which pass their own proof; kept so the box layout and
+    # the `add_campaign` ABI stay the same for existing callers
     proof: arc4.DynamicBytes
     root: arc4.DynamicBytes
     owner: arc4.Address
@@ -37,6 +40,11 @@ class AddCampaignEvent(Struct):
     owner: arc4.Address
 
 
+class RotateRootEvent(Struct):
+    campaign_id: arc4.UInt64
+    root: arc4.DynamicBytes
+
+
 class Campaign(ARC4Contract):
 
     def __init__(self) -> None:
@@ -77,6 +85,8 @@ class Campaign(ARC4Contract):
         Returns:
             Bytes: The hash of the sorted pair.
         """
+        if BigUInt.from_bytes(a) > BigUInt.from_bytes(b):
+            return op.sha256(b + a)
         return op.sha256(a + b)
 
     @subroutine
@@ -143,6 +153,11 @@ class Campaign(ARC4Contract):
 
     @abimethod
     def add_campaign(self, proof: Bytes, root: Bytes, duration: UInt64) -> UInt64:
+        """Opens a campaign with Merkle root `root` for `duration` seconds.
+
+        `proof` is only stored and emitted, for compatibility with existing callers;
+        each claim passes its own proof to `mint_token`, so it may be empty.
+        """
         self.only_valid_owner_campaign()
         sender = Txn.sender
         sender_address = Address(sender)
@@ -175,6 +190,27 @@ class Campaign(ARC4Contract):
         )
         return campaign_id
 
+    @abimethod
+    def rotate_root(self, campaign_id: UInt64, root: Bytes) -> None:
+        """Replaces the Merkle root of a live campaign after leaves were appended.
+
+        Proofs are passed with each claim, so only the root is stored. Claim records
+        are keyed by campaign and address, so recipients who already claimed stay
+        claimed under the new root.
+        """
+        assert campaign_id in self.campaign, "Campaign is not found"
+        self.only_owner_campaign(campaign_id)
+        eligible_data = self.campaign[campaign_id].copy()
+        assert eligible_data.expired_at >= Global.latest_timestamp, "Expired"
+        assert root, "Root is empty"
+        self.campaign[campaign_id].root = arc4.DynamicBytes(root)
+        emit(
+            RotateRootEvent(
+                campaign_id=arc4.UInt64(campaign_id),
+                root=arc4.DynamicBytes(root),
+            )
+        )
+
     @abimethod
     def mint_token(
         self,
@@ -182,22 +218,25 @@ class Campaign(ARC4Contract):
         addr: Address,
         amount: UInt64,
         campaign_id: UInt64,
+        proof: Bytes,
     ) -> None:
-        sender = Txn.sender
-        sender_address = Address(sender)
+        """Sends `amount` to `addr` once per campaign, given the Merkle proof of the
+        (addr, amount) leaf."""
+        assert campaign_id in self.campaign, "Campaign is not found"
         eligible_data = self.campaign[campaign_id].copy()
         current_time = Global.latest_timestamp
         claim_key = self.get_claim_key(campaign_id, addr)
-        assert campaign_id in self.campaign
         assert claim_key not in self.claimed or not self.claimed[claim_key]
         assert eligible_data.expired_at >= current_time, "Expired"
-        assert eligible_data.proof and eligible_data.root, "Campaign is not found"
+        assert eligible_data.root, "Campaign is not found"
+        assert leaf_data == addr.bytes + op.itob(amount), "Invalid data"
 
         leaf = op.sha256(leaf_data)
+        # the stored root without its ARC-4 length prefix
         is_valid = self.verify_asset(
             leaf=leaf,
-            proof=eligible_data.proof.bytes,
-            root=eligible_data.root.bytes,
+            proof=proof,
+            root=eligible_data.root.bytes[2:],
         )
         assert is_valid, "Invalid data"
         # Mint token for eligible users
@@ -206,12 +245,12 @@ class Campaign(ARC4Contract):
         itxn.AssetTransfer(
             xfer_asset=self.asa,
             asset_amount=amount,
-            asset_receiver=sender,
+            asset_receiver=addr.native,
             fee=0,
         ).submit()
         emit(
             MintEvent(
-                addr=sender_address,
+                addr=addr,
                 amount=arc4.UInt64(amount),
                 campaign_id=arc4.UInt64(campaign_id),
             )
@@ -219,14 +258,14 @@ class Campaign(ARC4Contract):
 
     @abimethod
     def check_eligible(
-        self, addr: Address, amount: UInt64, campaign_id: UInt64
+        self, addr: Address, amount: UInt64, campaign_id: UInt64, proof: Bytes
     ) -> bool:
         merkle_tree = self.campaign[campaign_id].copy()
-        if not merkle_tree.proof and not merkle_tree.root:
+        if not merkle_tree.root:
             return False
-        leaf = self.hash_pair(a=addr.bytes, b=op.itob(amount))
+        leaf = op.sha256(addr.bytes + op.itob(amount))
         return self.verify_asset(
-            leaf=leaf, proof=merkle_tree.proof.bytes, root=merkle_tree.root.bytes
+            leaf=leaf, proof=proof, root=merkle_tree.root.bytes[2:]
         )
 
     @abimethod
@@ -0,0 +1,37 @@
+from smart_contracts.campaign.merkle.builder import (
+    MerkleTree,
+    build_levels,
+    build_tree,
+    build_tree_from_file,
+    hash_level,
+)
+from smart_contracts.campaign.merkle.frontier import IncrementalTree
+from smart_contracts.campaign.merkle.incremental import append_leaves
+from smart_contracts.campaign.merkle.leaf import (
+    decode_address,
+    encode_leaf_data,
+    hash_leaf,
+    hash_pair,
+    verify_proof,
+)
+from smart_contracts.campaign.merkle.source import iter_rows
+from smart_contracts.campaign.merkle.store import Claim, ProofStore, write_index
+
+__all__ = [
+    "Claim",
+    "IncrementalTree",
+    "MerkleTree",
+    "ProofStore",
+    "append_leaves",
+    "build_levels",
+    "build_tree",
+    "build_tree_from_file",
+    "decode_address",
+    "encode_leaf_data",
+    "hash_leaf",
+    "hash_level",
+    "hash_pair",
+    "iter_rows",
+    "verify_proof",
+    "write_index",
+]
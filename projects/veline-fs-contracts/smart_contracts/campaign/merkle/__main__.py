@@ -0,0 +1,91 @@
+import argparse
+import logging
+import os
+from pathlib import Path
+
+from smart_contracts.campaign.merkle.builder import MerkleTree, build_tree_from_file
+from smart_contracts.campaign.merkle.incremental import append_leaves
+from smart_contracts.campaign.merkle.source import iter_rows
+from smart_contracts.campaign.merkle.store import ProofStore
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m smart_contracts.campaign.merkle",
+        description="Build Merkle trees for Campaign airdrop lists",
+    )
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build", help="Build a tree from a CSV or Parquet list"
+    )
+    build_parser.add_argument("input", type=Path)
+    build_parser.add_argument("output_dir", type=Path)
+    build_parser.add_argument("--address-column", default="address")
+    build_parser.add_argument("--amount-column", default="amount")
+    build_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes hashing subtrees in parallel",
+    )
+
+    proof_parser = subparsers.add_parser("proof", help="Print the proof for a leaf")
+    proof_parser.add_argument("tree_dir", type=Path)
+    proof_parser.add_argument("leaf_index", type=int)
+
+    append_parser = subparsers.add_parser(
+        "append", help="Append a CSV or Parquet list to an existing tree"
+    )
+    append_parser.add_argument("input", type=Path)
+    append_parser.add_argument("tree_dir", type=Path)
+    append_parser.add_argument("--address-column", default="address")
+    append_parser.add_argument("--amount-column", default="amount")
+
+    lookup_parser = subparsers.add_parser(
+        "lookup", help="Print the claim arguments for an address"
+    )
+    lookup_parser.add_argument("tree_dir", type=Path)
+    lookup_parser.add_argument("address")
+
+    args = parser.parse_args()
+    match args.action:
+        case "build":
+            tree = build_tree_from_file(
+                args.input,
+                args.output_dir,
+                args.address_column,
+                args.amount_column,
+                args.workers,
+            )
+            print(tree.root.hex())
+        case "append":
+            tree = append_leaves(
+                args.tree_dir,
+                iter_rows(args.input, args.address_column, args.amount_column),
+            )
+            print(tree.root.hex())
+        case "proof":
+            tree = MerkleTree(args.tree_dir)
+            print(f"root={tree.root.hex()}")
+            print(f"leaf_data={tree.leaf_data(args.leaf_index).hex()}")
+            print(f"proof={tree.proof(args.leaf_index).hex()}")
+        case "lookup":
+            with ProofStore(args.tree_dir) as store:
+                claim = store.lookup(args.address)
+                if claim is None:
+                    raise SystemExit(f"{args.address} is not in the tree")
+                print(f"root={store.root.hex()}")
+                print(f"leaf_index={claim.leaf_index}")
+                print(f"amount={claim.amount}")
+                print(f"leaf_data={claim.leaf_data.hex()}")
+                print(f"proof={claim.proof.hex()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Reports Merkle tree build throughput against worker count.
+
+Usage: python -m smart_contracts.campaign.merkle.benchmark --leaves 16777216 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from smart_contracts.campaign.merkle.builder import CHUNK_NODES, build_levels
+from smart_contracts.campaign.merkle.layout import LEAVES_FILE_NAME
+from smart_contracts.campaign.merkle.leaf import LEAF_DATA_LENGTH
+
+
+def _write_random_leaves(output_dir: Path, leaf_count: int) -> None:
+    with (output_dir / LEAVES_FILE_NAME).open("wb") as leaves_file:
+        for start in range(0, leaf_count, CHUNK_NODES):
+            count = min(CHUNK_NODES, leaf_count - start)
+            leaves_file.write(os.urandom(count * LEAF_DATA_LENGTH))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--leaves", type=int, default=1 << 20)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    parser.add_argument("--dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        output_dir = Path(tmp)
+        _write_random_leaves(output_dir, args.leaves)
+        print(f"{'workers':>8} {'seconds':>10} {'leaves/sec':>14} {'speedup':>8}")
+        baseline = None
+        for workers in sorted(set(args.workers)):
+            started = time.perf_counter()
+            build_levels(output_dir, args.leaves, workers)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>8} {elapsed:>10.2f} {args.leaves / elapsed:>14,.0f} "
+                f"{baseline / elapsed:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
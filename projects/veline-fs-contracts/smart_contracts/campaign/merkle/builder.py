@@ -0,0 +1,260 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from smart_contracts.campaign.merkle import layout
+from smart_contracts.campaign.merkle.frontier import write_frontier
+from smart_contracts.campaign.merkle.layout import (
+    HASH_SCHEME,
+    LEAVES_FILE_NAME,
+    MANIFEST_FILE_NAME,
+    TREE_FILE_NAME,
+    level_offsets,
+)
+from smart_contracts.campaign.merkle.leaf import (
+    HASH_LENGTH,
+    LEAF_DATA_LENGTH,
+    encode_leaf_data,
+)
+from smart_contracts.campaign.merkle.source import iter_rows
+from smart_contracts.campaign.merkle.store import write_index
+
+logger = logging.getLogger(__name__)
+
+# Number of nodes read per chunk when hashing a level, must be even
+CHUNK_NODES = 1 << 16
+# Parallel builds aim for this many subtrees per worker to even out the load
+SUBTREES_PER_WORKER = 4
+MIN_SUBTREE_HEIGHT = 10
+
+
+def hash_level(nodes: bytes) -> bytes:
+    """Hashes a run of contiguous 32-byte nodes into their parent nodes.
+
+    Pairs are sorted before hashing and a trailing odd node is promoted unchanged.
+    """
+    sha256 = hashlib.sha256
+    parents = bytearray()
+    pair_length = 2 * HASH_LENGTH
+    for offset in range(0, len(nodes) - HASH_LENGTH, pair_length):
+        a = nodes[offset : offset + HASH_LENGTH]
+        b = nodes[offset + HASH_LENGTH : offset + pair_length]
+        parents += sha256(a + b if a <= b else b + a).digest()
+    if (len(nodes) // HASH_LENGTH) % 2:
+        parents += nodes[-HASH_LENGTH:]
+    return bytes(parents)
+
+
+def hash_leaves(leaves: mmap.mmap, tree: mmap.mmap, start: int, count: int) -> None:
+    """Hashes `leaf_data` records [start, start + count) into level 0 of the tree."""
+    sha256 = hashlib.sha256
+    for chunk_start in range(start, start + count, CHUNK_NODES):
+        chunk_end = min(chunk_start + CHUNK_NODES, start + count)
+        records = leaves[chunk_start * LEAF_DATA_LENGTH : chunk_end * LEAF_DATA_LENGTH]
+        tree[chunk_start * HASH_LENGTH : chunk_end * HASH_LENGTH] = b"".join(
+            sha256(records[offset : offset + LEAF_DATA_LENGTH]).digest()
+            for offset in range(0, len(records), LEAF_DATA_LENGTH)
+        )
+
+
+def hash_levels(
+    tree: mmap.mmap,
+    level_counts: list[int],
+    start: int,
+    count: int,
+    first_level: int,
+    last_level: int,
+) -> None:
+    """Hashes nodes [start, start + count) of `first_level` up to `last_level`.
+
+    `start` must be aligned to `2 ** (last_level - first_level)` so that every pair
+    inside the range is a pair of the full tree.
+    """
+    offsets = level_offsets(level_counts)
+    for level in range(first_level, last_level):
+        level_offset = offsets[level]
+        parent_offset = offsets[level + 1] + start // 2
+        for chunk_start in range(start, start + count, CHUNK_NODES):
+            chunk_end = min(chunk_start + CHUNK_NODES, start + count)
+            read_start = (level_offset + chunk_start) * HASH_LENGTH
+            read_end = (level_offset + chunk_end) * HASH_LENGTH
+            parents = hash_level(tree[read_start:read_end])
+            write_offset = (parent_offset + (chunk_start - start) // 2) * HASH_LENGTH
+            tree[write_offset : write_offset + len(parents)] = parents
+        start //= 2
+        count = (count + 1) // 2
+
+
+def _hash_subtree(
+    output_dir: Path, level_counts: list[int], start: int, count: int, height: int
+) -> None:
+    """Builds the subtree of `count` leaves at `start` up to `height`, in place.
+
+    Runs in pool workers: every worker maps the same leaves and tree files, and the
+    kernel shares those pages between processes, so nodes are never pickled.
+    """
+    with (
+        (output_dir / LEAVES_FILE_NAME).open("rb") as leaves_file,
+        (output_dir / TREE_FILE_NAME).open("r+b") as tree_file,
+        mmap.mmap(leaves_file.fileno(), 0, access=mmap.ACCESS_READ) as leaves,
+        mmap.mmap(tree_file.fileno(), 0) as tree,
+    ):
+        hash_leaves(leaves, tree, start, count)
+        hash_levels(tree, level_counts, start, count, 0, height)
+
+
+def _subtree_height(leaf_count: int, workers: int) -> int:
+    """Picks the largest power-of-two subtree that still gives every worker a few."""
+    height = 0
+    while (leaf_count >> (height + 1)) >= workers * SUBTREES_PER_WORKER:
+        height += 1
+    return max(height, MIN_SUBTREE_HEIGHT)
+
+
+def build_levels(output_dir: Path, leaf_count: int, workers: int = 1) -> bytes:
+    """Builds `tree.bin` from the `leaf_data` records in `leaves.bin` and returns the root.
+
+    With `workers > 1` the leaves are split into aligned power-of-two subtrees that are
+    hashed in a process pool, then the subtree roots are combined in this process.
+    """
+    level_counts = layout.level_counts(leaf_count)
+    tree_path = output_dir / TREE_FILE_NAME
+    with tree_path.open("wb") as tree_file:
+        tree_file.truncate(sum(level_counts) * HASH_LENGTH)
+
+    top_level = len(level_counts) - 1
+    height = min(_subtree_height(leaf_count, workers), top_level)
+    if workers > 1 and height < top_level:
+        subtree_size = 1 << height
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _hash_subtree,
+                    output_dir,
+                    level_counts,
+                    start,
+                    min(subtree_size, leaf_count - start),
+                    height,
+                )
+                for start in range(0, leaf_count, subtree_size)
+            ]
+            for future in futures:
+                future.result()
+        logger.info(
+            f"Hashed {len(futures)} subtrees of {subtree_size} leaves "
+            f"with {workers} workers"
+        )
+    else:
+        height = top_level
+        _hash_subtree(output_dir, level_counts, 0, leaf_count, height)
+
+    with (
+        tree_path.open("r+b") as tree_file,
+        mmap.mmap(tree_file.fileno(), 0) as tree,
+    ):
+        hash_levels(tree, level_counts, 0, level_counts[height], height, top_level)
+        root = tree[-HASH_LENGTH:]
+    write_manifest(output_dir, level_counts, root)
+    return root
+
+
+def write_manifest(output_dir: Path, level_counts: list[int], root: bytes) -> None:
+    """Writes `manifest.json` for a tree with these level sizes and root."""
+    manifest = {
+        "hash_scheme": HASH_SCHEME,
+        "leaf_count": level_counts[0],
+        "level_counts": level_counts,
+        "root": root.hex(),
+    }
+    (output_dir / MANIFEST_FILE_NAME).write_text(json.dumps(manifest, indent=2))
+
+
+def build_tree(
+    rows: Iterable[tuple[str, int]], output_dir: Path, workers: int = 1
+) -> "MerkleTree":
+    """Builds a campaign Merkle tree from (address, amount) rows into `output_dir`.
+
+    Writes `leaves.bin` (the `leaf_data` of each leaf, in leaf index order),
+    `tree.bin` (every level concatenated, leaves first, root last),
+    `index.bin` (addresses sorted for lookup), `frontier.bin` (state for appending
+    leaves later) and `manifest.json` (root and level sizes).
+    """
+    output_dir.mkdir(exist_ok=True, parents=True)
+    leaf_count = 0
+    with (output_dir / LEAVES_FILE_NAME).open("wb") as leaves_file:
+        buffer = bytearray()
+        for address, amount in rows:
+            buffer += encode_leaf_data(address, amount)
+            leaf_count += 1
+            if leaf_count % CHUNK_NODES == 0:
+                leaves_file.write(buffer)
+                buffer.clear()
+        leaves_file.write(buffer)
+    if leaf_count == 0:
+        raise Exception("Could not build Merkle tree, the airdrop list is empty")
+    logger.info(f"Encoded {leaf_count} leaves, building tree levels")
+    root = build_levels(output_dir, leaf_count, workers)
+    write_index(output_dir)
+    write_frontier(output_dir)
+    logger.info(f"Built Merkle tree with root {root.hex()} in {output_dir}")
+    return MerkleTree(output_dir)
+
+
+def build_tree_from_file(
+    input_path: Path,
+    output_dir: Path,
+    address_column: str = "address",
+    amount_column: str = "amount",
+    workers: int = 1,
+) -> "MerkleTree":
+    """Streams a CSV or Parquet airdrop list into a campaign Merkle tree."""
+    return build_tree(
+        iter_rows(input_path, address_column, amount_column), output_dir, workers
+    )
+
+
+class MerkleTree:
+    """Read access to a tree written by `build_tree`, without loading it into memory."""
+
+    def __init__(self, tree_dir: Path):
+        self.tree_dir = tree_dir
+        manifest = json.loads((tree_dir / MANIFEST_FILE_NAME).read_text())
+        if manifest["hash_scheme"] != HASH_SCHEME:
+            raise Exception(f"Unsupported hash scheme {manifest['hash_scheme']}")
+        self.leaf_count: int = manifest["leaf_count"]
+        self.level_counts: list[int] = manifest["level_counts"]
+        self.root = bytes.fromhex(manifest["root"])
+        self.level_offsets = level_offsets(self.level_counts)
+
+    def leaf_data(self, leaf_index: int) -> bytes:
+        """Returns the `leaf_data` argument for `mint_token` for a leaf."""
+        self._check_index(leaf_index)
+        with (self.tree_dir / LEAVES_FILE_NAME).open("rb") as leaves_file:
+            return os.pread(
+                leaves_file.fileno(), LEAF_DATA_LENGTH, leaf_index * LEAF_DATA_LENGTH
+            )
+
+    def proof(self, leaf_index: int) -> bytes:
+        """Returns the sibling hashes from leaf to root, concatenated as `verify_asset` expects."""
+        self._check_index(leaf_index)
+        proof = bytearray()
+        with (self.tree_dir / TREE_FILE_NAME).open("rb") as tree_file:
+            fd = tree_file.fileno()
+            index = leaf_index
+            for offset, count in zip(self.level_offsets, self.level_counts[:-1]):
+                sibling = index ^ 1
+                if sibling < count:
+                    proof += os.pread(fd, HASH_LENGTH, (offset + sibling) * HASH_LENGTH)
+                index //= 2
+        return bytes(proof)
+
+    def _check_index(self, leaf_index: int) -> None:
+        if not 0 <= leaf_index < self.leaf_count:
+            raise Exception(
+                f"Leaf index {leaf_index} out of range for {self.leaf_count} leaves"
+            )
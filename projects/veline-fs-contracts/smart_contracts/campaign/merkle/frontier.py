@@ -0,0 +1,87 @@
+import json
+from pathlib import Path
+
+from smart_contracts.campaign.merkle.layout import (
+    FRONTIER_FILE_NAME,
+    MANIFEST_FILE_NAME,
+    TREE_FILE_NAME,
+    level_offsets,
+)
+from smart_contracts.campaign.merkle.leaf import HASH_LENGTH, hash_pair
+
+LEAF_COUNT_LENGTH = 8
+
+
+class IncrementalTree:
+    """Append-only Merkle tree that keeps only its frontier, as in deposit-contract trees.
+
+    The frontier holds the root of the complete subtree at each level whose bit is set
+    in the leaf count. Appending a leaf and computing the root both take O(log n),
+    and the root is the same as the one `build_tree` produces for the same leaves.
+    """
+
+    def __init__(self, leaf_count: int = 0, frontier: list[bytes] | None = None):
+        self.leaf_count = leaf_count
+        self.frontier = list(frontier or [])
+        if len(self.frontier) != leaf_count.bit_count():
+            raise Exception("Frontier must hold one node per set bit of the leaf count")
+
+    def append(self, leaf: bytes) -> None:
+        """Appends a leaf hash, merging the complete subtrees it closes."""
+        node = leaf
+        count = self.leaf_count
+        while count & 1:
+            node = hash_pair(self.frontier.pop(), node)
+            count >>= 1
+        self.frontier.append(node)
+        self.leaf_count += 1
+
+    @property
+    def root(self) -> bytes:
+        """Folds the frontier from the smallest subtree up, promoting odd nodes."""
+        if not self.leaf_count:
+            raise Exception("An empty tree has no root")
+        frontier = iter(reversed(self.frontier))
+        root = next(frontier)
+        for node in frontier:
+            root = hash_pair(node, root)
+        return root
+
+    def save(self, path: Path) -> None:
+        path.write_bytes(
+            self.leaf_count.to_bytes(LEAF_COUNT_LENGTH, "big") + b"".join(self.frontier)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "IncrementalTree":
+        data = path.read_bytes()
+        leaf_count = int.from_bytes(data[:LEAF_COUNT_LENGTH], "big")
+        frontier = [
+            data[offset : offset + HASH_LENGTH]
+            for offset in range(LEAF_COUNT_LENGTH, len(data), HASH_LENGTH)
+        ]
+        return cls(leaf_count, frontier)
+
+    @classmethod
+    def from_tree(cls, tree_dir: Path) -> "IncrementalTree":
+        """Reads the frontier out of a tree directory written by `build_tree`."""
+        manifest = json.loads((tree_dir / MANIFEST_FILE_NAME).read_text())
+        level_counts: list[int] = manifest["level_counts"]
+        leaf_count = level_counts[0]
+        offsets = level_offsets(level_counts)
+        frontier = []
+        with (tree_dir / TREE_FILE_NAME).open("rb") as tree_file:
+            # Largest subtree first: the frontier is ordered by descending level
+            for level in reversed(range(leaf_count.bit_length())):
+                if leaf_count >> level & 1:
+                    node_index = offsets[level] + (leaf_count >> level) - 1
+                    tree_file.seek(node_index * HASH_LENGTH)
+                    frontier.append(tree_file.read(HASH_LENGTH))
+        return cls(leaf_count, frontier)
+
+
+def write_frontier(tree_dir: Path) -> IncrementalTree:
+    """Persists the frontier of a built tree so later appends can start from it."""
+    incremental = IncrementalTree.from_tree(tree_dir)
+    incremental.save(tree_dir / FRONTIER_FILE_NAME)
+    return incremental
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from smart_contracts.campaign.merkle import layout
+from smart_contracts.campaign.merkle.builder import (
+    CHUNK_NODES,
+    MerkleTree,
+    hash_leaves,
+    hash_levels,
+    write_manifest,
+)
+from smart_contracts.campaign.merkle.frontier import IncrementalTree
+from smart_contracts.campaign.merkle.layout import (
+    FRONTIER_FILE_NAME,
+    INDEX_FILE_NAME,
+    LEAVES_FILE_NAME,
+    MANIFEST_FILE_NAME,
+    TREE_FILE_NAME,
+    level_offsets,
+)
+from smart_contracts.campaign.merkle.leaf import (
+    HASH_LENGTH,
+    LEAF_DATA_LENGTH,
+    encode_leaf_data,
+)
+from smart_contracts.campaign.merkle.store import ProofStore, write_index
+
+logger = logging.getLogger(__name__)
+
+
+def _rewrite_tree(
+    tree_dir: Path, old_counts: list[int], new_counts: list[int], new_tree_path: Path
+) -> bytes:
+    """Writes the tree for `new_counts` leaves to `new_tree_path`, rehashing only the
+    nodes that changed.
+
+    Nodes left of the first new leaf's path keep their hash and are copied over.
+    """
+    old_offsets = level_offsets(old_counts)
+    new_offsets = level_offsets(new_counts)
+    with new_tree_path.open("wb") as new_tree_file:
+        new_tree_file.truncate(sum(new_counts) * HASH_LENGTH)
+    with (
+        (tree_dir / TREE_FILE_NAME).open("rb") as old_tree_file,
+        (tree_dir / LEAVES_FILE_NAME).open("rb") as leaves_file,
+        new_tree_path.open("r+b") as new_tree_file,
+        mmap.mmap(old_tree_file.fileno(), 0, access=mmap.ACCESS_READ) as old_tree,
+        mmap.mmap(leaves_file.fileno(), 0, access=mmap.ACCESS_READ) as leaves,
+        mmap.mmap(new_tree_file.fileno(), 0) as new_tree,
+    ):
+        first_dirty = old_counts[0]
+        hash_leaves(leaves, new_tree, first_dirty, new_counts[0] - first_dirty)
+        for level in range(len(new_counts)):
+            if level > 0:
+                first_dirty //= 2
+                pair_start = 2 * first_dirty
+                hash_levels(
+                    new_tree,
+                    new_counts,
+                    pair_start,
+                    new_counts[level - 1] - pair_start,
+                    level - 1,
+                    level,
+                )
+            if level >= len(old_counts) or not first_dirty:
+                continue
+            clean = min(first_dirty, old_counts[level])
+            old_start = old_offsets[level] * HASH_LENGTH
+            new_start = new_offsets[level] * HASH_LENGTH
+            for start in range(0, clean * HASH_LENGTH, CHUNK_NODES * HASH_LENGTH):
+                end = min(start + CHUNK_NODES * HASH_LENGTH, clean * HASH_LENGTH)
+                new_tree[new_start + start : new_start + end] = old_tree[
+                    old_start + start : old_start + end
+                ]
+        root = new_tree[-HASH_LENGTH:]
+    return root
+
+
+def append_leaves(tree_dir: Path, rows: Iterable[tuple[str, int]]) -> MerkleTree:
+    """Appends (address, amount) rows to a built tree without rebuilding it.
+
+    The new root comes from the persisted frontier in O(log n) per leaf. `tree.bin`
+    and `index.bin` are then brought up to date for proof serving by rehashing only
+    the new leaves and the right edge of the tree, and merging the new addresses
+    into the existing index. An address already in the tree, or given twice, is
+    rejected before any file changes.
+
+    The new files are staged next to the old ones and the manifest is written last,
+    so an append that fails part way leaves the tree as it was. Leaves it wrote past
+    the manifest's leaf count are dropped by the next append.
+    """
+    frontier_path = tree_dir / FRONTIER_FILE_NAME
+    incremental = (
+        IncrementalTree.load(frontier_path)
+        if frontier_path.exists()
+        else IncrementalTree.from_tree(tree_dir)
+    )
+    manifest = json.loads((tree_dir / MANIFEST_FILE_NAME).read_text())
+    old_counts: list[int] = manifest["level_counts"]
+    if incremental.leaf_count != old_counts[0]:
+        raise Exception(
+            f"Frontier covers {incremental.leaf_count} leaves "
+            f"but the tree has {old_counts[0]}"
+        )
+
+    # Every row is checked before the tree directory is touched, so a rejected
+    # append leaves the tree as it was
+    sha256 = hashlib.sha256
+    new_leaves = bytearray()
+    new_keys: set[bytes] = set()
+    with ProofStore(tree_dir) as store:
+        for address, amount in rows:
+            leaf_data = encode_leaf_data(address, amount)
+            key = leaf_data[:HASH_LENGTH]
+            if key in new_keys or store.leaf_index(key) is not None:
+                raise Exception(
+                    f"Could not append to Merkle tree, duplicate address {address}"
+                )
+            new_keys.add(key)
+            new_leaves += leaf_data
+            incremental.append(sha256(leaf_data).digest())
+    added = incremental.leaf_count - old_counts[0]
+    if not added:
+        return MerkleTree(tree_dir)
+    with (tree_dir / LEAVES_FILE_NAME).open("r+b") as leaves_file:
+        leaves_file.truncate(old_counts[0] * LEAF_DATA_LENGTH)
+        leaves_file.seek(0, os.SEEK_END)
+        leaves_file.write(new_leaves)
+
+    new_counts = layout.level_counts(incremental.leaf_count)
+    staged = {
+        name: tree_dir / f"{name}.new"
+        for name in (TREE_FILE_NAME, INDEX_FILE_NAME, FRONTIER_FILE_NAME)
+    }
+    root = _rewrite_tree(tree_dir, old_counts, new_counts, staged[TREE_FILE_NAME])
+    if root != incremental.root:
+        raise Exception("Rewritten tree does not match the frontier root")
+    write_index(
+        tree_dir,
+        first_new_leaf=old_counts[0],
+        index_path=staged[INDEX_FILE_NAME],
+    )
+    incremental.save(staged[FRONTIER_FILE_NAME])
+    for name, staged_path in staged.items():
+        staged_path.replace(tree_dir / name)
+    write_manifest(tree_dir, new_counts, root)
+    logger.info(
+        f"Appended {added} leaves, tree now has {incremental.leaf_count} leaves "
+        f"and root {root.hex()}"
+    )
+    return MerkleTree(tree_dir)
@@ -0,0 +1,24 @@
+"""File names and level arithmetic shared by the tree builder and the proof store."""
+
+MANIFEST_FILE_NAME = "manifest.json"
+TREE_FILE_NAME = "tree.bin"
+LEAVES_FILE_NAME = "leaves.bin"
+INDEX_FILE_NAME = "index.bin"
+FRONTIER_FILE_NAME = "frontier.bin"
+HASH_SCHEME = "sha256-sorted-pairs"
+
+
+def level_counts(leaf_count: int) -> list[int]:
+    """Number of nodes on each level, leaves first and root last."""
+    counts = [leaf_count]
+    while counts[-1] > 1:
+        counts.append((counts[-1] + 1) // 2)
+    return counts
+
+
+def level_offsets(counts: list[int]) -> list[int]:
+    """Node offset of each level inside `tree.bin`."""
+    offsets = [0]
+    for count in counts[:-1]:
+        offsets.append(offsets[-1] + count)
+    return offsets
@@ -0,0 +1,73 @@
+import hashlib
+
+from algosdk import encoding
+
+HASH_LENGTH = 32
+AMOUNT_LENGTH = 8
+LEAF_DATA_LENGTH = HASH_LENGTH + AMOUNT_LENGTH
+ADDRESS_LENGTH = 58
+CHECKSUM_LENGTH = 4
+
+# Maps the base32 alphabet onto the digits int() accepts for base 32
+_BASE32_TO_DIGITS = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", "0123456789abcdefghijklmnopqrstuv"
+)
+try:
+    _SHA512_256 = hashlib.new("sha512_256")
+except ValueError:  # OpenSSL build without sha512_256
+    _SHA512_256 = None
+
+
+def decode_address(address: str) -> bytes:
+    """Decodes an Algorand address to its 32-byte public key, verifying the checksum.
+
+    Equivalent to `algosdk.encoding.decode_address`, several times faster for bulk lists.
+    """
+    if _SHA512_256 is None:
+        return encoding.decode_address(address)  # type: ignore[no-any-return]
+    if len(address) != ADDRESS_LENGTH:
+        raise Exception(f"Invalid address {address!r}")
+    try:
+        # 58 base32 characters carry 290 bits, the last 2 are padding
+        value = int(address.translate(_BASE32_TO_DIGITS), 32) >> 2
+    except ValueError:
+        raise Exception(f"Invalid address {address!r}") from None
+    decoded = value.to_bytes(HASH_LENGTH + CHECKSUM_LENGTH, "big")
+    public_key = decoded[:HASH_LENGTH]
+    checksum = _SHA512_256.copy()
+    checksum.update(public_key)
+    if checksum.digest()[-CHECKSUM_LENGTH:] != decoded[HASH_LENGTH:]:
+        raise Exception(f"Invalid address checksum {address!r}")
+    return public_key
+
+
+def encode_leaf_data(address: str, amount: int) -> bytes:
+    """Encodes an (address, amount) row as the `leaf_data` passed to `mint_token`.
+
+    This is `addr.bytes + op.itob(amount)`, the same bytes `check_eligible` hashes.
+    """
+    if not 0 <= amount < 2**64:
+        raise Exception(f"Amount out of uint64 range for {address}: {amount}")
+    return decode_address(address) + amount.to_bytes(AMOUNT_LENGTH, "big")
+
+
+def hash_leaf(leaf_data: bytes) -> bytes:
+    """Hashes encoded leaf data the way `mint_token` does."""
+    return hashlib.sha256(leaf_data).digest()
+
+
+def hash_pair(a: bytes, b: bytes) -> bytes:
+    """Sorts the pair (a, b) and hashes the result, mirroring `Campaign.hash_pair`."""
+    if b < a:
+        a, b = b, a
+    return hashlib.sha256(a + b).digest()
+
+
+def verify_proof(proof: bytes, root: bytes, leaf: bytes) -> bool:
+    """Off-chain equivalent of `Campaign.verify_asset`."""
+    if len(proof) % HASH_LENGTH:
+        raise Exception("Proof length must be a multiple of 32 bytes")
+    computed_hash = leaf
+    for offset in range(0, len(proof), HASH_LENGTH):
+        computed_hash = hash_pair(computed_hash, proof[offset : offset + HASH_LENGTH])
+    return computed_hash == root
@@ -0,0 +1,60 @@
+import csv
+from collections.abc import Iterator
+from pathlib import Path
+
+PARQUET_BATCH_SIZE = 65_536
+
+
+def iter_csv_rows(
+    path: Path, address_column: str = "address", amount_column: str = "amount"
+) -> Iterator[tuple[str, int]]:
+    """Streams (address, amount) rows from a CSV file with a header row."""
+    with path.open(newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        try:
+            address_index = header.index(address_column)
+            amount_index = header.index(amount_column)
+        except ValueError:
+            raise Exception(
+                f"{path} must have '{address_column}' and '{amount_column}' columns"
+            ) from None
+        for row in reader:
+            if row:
+                yield row[address_index], int(row[amount_index])
+
+
+def iter_parquet_rows(
+    path: Path, address_column: str = "address", amount_column: str = "amount"
+) -> Iterator[tuple[str, int]]:
+    """Streams (address, amount) rows from a Parquet file one record batch at a time."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise Exception(
+            "Reading Parquet airdrop lists requires pyarrow, "
+            "install it with `poetry run pip install pyarrow`"
+        ) from None
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(
+        batch_size=PARQUET_BATCH_SIZE, columns=[address_column, amount_column]
+    ):
+        addresses = batch.column(0).to_pylist()
+        amounts = batch.column(1).to_pylist()
+        yield from zip(addresses, (int(amount) for amount in amounts))
+
+
+def iter_rows(
+    path: Path, address_column: str = "address", amount_column: str = "amount"
+) -> Iterator[tuple[str, int]]:
+    """Streams (address, amount) rows, picking the reader from the file suffix."""
+    match path.suffix.lower():
+        case ".csv":
+            return iter_csv_rows(path, address_column, amount_column)
+        case ".parquet" | ".pq":
+            return iter_parquet_rows(path, address_column, amount_column)
+        case _:
+            raise Exception(f"Unsupported airdrop list format: {path}")
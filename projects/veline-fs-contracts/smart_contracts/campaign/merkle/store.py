@@ -0,0 +1,225 @@
+import dataclasses
+import heapq
+import json
+import logging
+import mmap
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+from smart_contracts.campaign.merkle.layout import (
+    INDEX_FILE_NAME,
+    LEAVES_FILE_NAME,
+    MANIFEST_FILE_NAME,
+    TREE_FILE_NAME,
+    level_offsets,
+)
+from smart_contracts.campaign.merkle.leaf import (
+    AMOUNT_LENGTH,
+    HASH_LENGTH,
+    LEAF_DATA_LENGTH,
+    decode_address,
+)
+
+logger = logging.getLogger(__name__)
+
+LEAF_INDEX_LENGTH = 8
+INDEX_RECORD_LENGTH = HASH_LENGTH + LEAF_INDEX_LENGTH
+# The index starts with a table of record offsets keyed by the first two bytes of
+# the public key. Keys are uniformly distributed, so each bucket holds about
+# leaf_count / 65536 records and a lookup is a short binary search inside it.
+BUCKET_PREFIX_LENGTH = 2
+BUCKET_COUNT = 1 << (8 * BUCKET_PREFIX_LENGTH)
+BUCKET_ENTRY_LENGTH = 8
+INDEX_HEADER_LENGTH = (BUCKET_COUNT + 1) * BUCKET_ENTRY_LENGTH
+# Number of index records sorted in memory at once before merging runs from disk
+SORT_RUN_RECORDS = 1 << 20
+WRITE_BUFFER_LENGTH = 1 << 22
+
+
+def _iter_sorted_run(run_path: Path, offset: int = 0) -> Iterator[bytes]:
+    with run_path.open("rb") as run_file:
+        run_file.seek(offset)
+        while record := run_file.read(INDEX_RECORD_LENGTH):
+            yield record
+
+
+def _write_sorted_runs(
+    leaves_path: Path, run_dir: Path, first_leaf: int = 0
+) -> list[Path]:
+    """Splits the leaves into sorted runs of (public key, leaf index) records."""
+    run_paths = []
+    leaf_index = first_leaf
+    with leaves_path.open("rb") as leaves_file:
+        leaves_file.seek(first_leaf * LEAF_DATA_LENGTH)
+        while chunk := leaves_file.read(SORT_RUN_RECORDS * LEAF_DATA_LENGTH):
+            records = []
+            for offset in range(0, len(chunk), LEAF_DATA_LENGTH):
+                records.append(
+                    chunk[offset : offset + HASH_LENGTH]
+                    + leaf_index.to_bytes(LEAF_INDEX_LENGTH, "big")
+                )
+                leaf_index += 1
+            records.sort()
+            run_path = run_dir / f"run_{len(run_paths)}.bin"
+            run_path.write_bytes(b"".join(records))
+            run_paths.append(run_path)
+    return run_paths
+
+
+def write_index(
+    tree_dir: Path, first_new_leaf: int = 0, index_path: Path | None = None
+) -> None:
+    """Writes `index.bin`, the address to leaf index map sorted by public key.
+
+    Uses an external merge sort so memory stays bounded for any campaign size. With
+    `first_new_leaf` set, the existing index is merged with the leaves appended since
+    instead of being sorted again. The index is written to `index_path` if given.
+    """
+    old_index_path = tree_dir / INDEX_FILE_NAME
+    index_path = index_path or old_index_path
+    bucket_ends = [0] * BUCKET_COUNT
+    with tempfile.TemporaryDirectory(dir=tree_dir) as run_dir:
+        runs = [
+            _iter_sorted_run(run_path)
+            for run_path in _write_sorted_runs(
+                tree_dir / LEAVES_FILE_NAME, Path(run_dir), first_new_leaf
+            )
+        ]
+        if first_new_leaf:
+            runs.append(_iter_sorted_run(old_index_path, INDEX_HEADER_LENGTH))
+        new_index_path = Path(run_dir) / INDEX_FILE_NAME
+        with new_index_path.open("wb") as index_file:
+            index_file.write(bytes(INDEX_HEADER_LENGTH))
+            previous_key = None
+            record_count = 0
+            buffer = bytearray()
+            for record in heapq.merge(*runs):
+                key = record[:HASH_LENGTH]
+                if key == previous_key:
+                    raise Exception(
+                        "Could not index Merkle tree, duplicate address at leaf "
+                        f"{int.from_bytes(record[HASH_LENGTH:], 'big')}"
+                    )
+                previous_key = key
+                record_count += 1
+                bucket_ends[int.from_bytes(key[:BUCKET_PREFIX_LENGTH], "big")] = (
+                    record_count
+                )
+                buffer += record
+                if len(buffer) >= WRITE_BUFFER_LENGTH:
+                    index_file.write(buffer)
+                    buffer.clear()
+            index_file.write(buffer)
+
+            # Empty buckets end where the previous bucket ended
+            bucket_offsets = [0]
+            for bucket_end in bucket_ends:
+                bucket_offsets.append(max(bucket_end, bucket_offsets[-1]))
+            index_file.seek(0)
+            index_file.write(
+                b"".join(
+                    offset.to_bytes(BUCKET_ENTRY_LENGTH, "big")
+                    for offset in bucket_offsets
+                )
+            )
+        new_index_path.replace(index_path)
+    logger.info(f"Indexed {record_count} addresses in {index_path}")
+
+
+@dataclasses.dataclass(frozen=True)
+class Claim:
+    """Arguments a recipient needs to claim from a campaign with `mint_token`."""
+
+    leaf_index: int
+    leaf_data: bytes
+    amount: int
+    proof: bytes
+
+
+class ProofStore:
+    """Serves proofs by address from a tree directory through read-only memory maps.
+
+    Nothing is loaded up front: the kernel pages in the index bucket and the one node
+    per level a lookup touches, so memory use does not grow with the campaign size.
+    """
+
+    def __init__(self, tree_dir: Path):
+        manifest = json.loads((tree_dir / MANIFEST_FILE_NAME).read_text())
+        self.root = bytes.fromhex(manifest["root"])
+        self.leaf_count: int = manifest["leaf_count"]
+        level_counts: list[int] = manifest["level_counts"]
+        self._levels = [
+            (offset * HASH_LENGTH, count)
+            for offset, count in zip(level_offsets(level_counts), level_counts[:-1])
+        ]
+        self._files = [
+            (tree_dir / name).open("rb")
+            for name in (TREE_FILE_NAME, LEAVES_FILE_NAME, INDEX_FILE_NAME)
+        ]
+        self._tree, self._leaves, self._index = (
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) for file in self._files
+        )
+
+    def close(self) -> None:
+        for mapped in (self._tree, self._leaves, self._index):
+            mapped.close()
+        for file in self._files:
+            file.close()
+
+    def __enter__(self) -> "ProofStore":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def leaf_index(self, public_key: bytes) -> int | None:
+        """Finds the leaf index of a 32-byte public key, or None if it is not in the tree."""
+        index = self._index
+        bucket = int.from_bytes(public_key[:BUCKET_PREFIX_LENGTH], "big")
+        bucket_offset = bucket * BUCKET_ENTRY_LENGTH
+        bucket_end = bucket_offset + BUCKET_ENTRY_LENGTH
+        low = int.from_bytes(index[bucket_offset:bucket_end], "big")
+        high = int.from_bytes(
+            index[bucket_end : bucket_end + BUCKET_ENTRY_LENGTH], "big"
+        )
+        while low < high:
+            middle = (low + high) // 2
+            offset = INDEX_HEADER_LENGTH + middle * INDEX_RECORD_LENGTH
+            key = index[offset : offset + HASH_LENGTH]
+            if key < public_key:
+                low = middle + 1
+            elif key > public_key:
+                high = middle
+            else:
+                return int.from_bytes(
+                    index[offset + HASH_LENGTH : offset + INDEX_RECORD_LENGTH], "big"
+                )
+        return None
+
+    def proof(self, leaf_index: int) -> bytes:
+        """Returns the sibling hashes from leaf to root, concatenated as `verify_asset` expects."""
+        tree = self._tree
+        siblings = []
+        index = leaf_index
+        for level_offset, count in self._levels:
+            sibling = index ^ 1
+            if sibling < count:
+                offset = level_offset + sibling * HASH_LENGTH
+                siblings.append(tree[offset : offset + HASH_LENGTH])
+            index >>= 1
+        return b"".join(siblings)
+
+    def lookup(self, address: str) -> Claim | None:
+        """Returns the claim for an address, or None if the address is not eligible."""
+        leaf_index = self.leaf_index(decode_address(address))
+        if leaf_index is None:
+            return None
+        offset = leaf_index * LEAF_DATA_LENGTH
+        leaf_data = self._leaves[offset : offset + LEAF_DATA_LENGTH]
+        return Claim(
+            leaf_index=leaf_index,
+            leaf_data=leaf_data,
+            amount=int.from_bytes(leaf_data[-AMOUNT_LENGTH:], "big"),
+            proof=self.proof(leaf_index),
+        )
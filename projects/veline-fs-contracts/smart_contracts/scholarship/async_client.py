@@ -0,0 +1,434 @@
+import dataclasses
+from pathlib import Path
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.async_client import (
+    DEFAULT_WAIT_ROUNDS,
+    AsyncApplicationClient,
+    AsyncComposer,
+    SimulateOptions,
+    method_args,
+)
+from smart_contracts._helpers.batch import box_name
+from smart_contracts._helpers.snapshot import (
+    DEFAULT_WORKERS,
+    BoxMapSnapshot,
+    load_snapshot,
+    take_snapshot,
+)
+from smart_contracts.scholarship import boxes, codec
+from smart_contracts.scholarship import client as certificate_client
+
+
+class AsyncCertificateComposer:
+    """Typed counterpart of the generated `Composer` for `AsyncCertificateClient`."""
+
+    def __init__(self, composer: AsyncComposer):
+        self.composer = composer
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.composer.build()
+
+    async def simulate(
+        self, options: SimulateOptions | None = None
+    ) -> SimulateAtomicTransactionResponse:
+        return await self.composer.simulate(options)
+
+    async def execute(
+        self, wait_rounds: int = DEFAULT_WAIT_ROUNDS
+    ) -> AtomicTransactionResponse:
+        return await self.composer.execute(wait_rounds)
+
+    def initialize(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.InitializeArgs(asset=asset)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def lock_token(
+        self,
+        *,
+        addr: str,
+        lock_amount: int,
+        lock_duration: int,
+        payment: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.LockTokenArgs(
+            addr=addr,
+            lock_amount=lock_amount,
+            lock_duration=lock_duration,
+            payment=payment,
+        )
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def claim_token(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.ClaimTokenArgs()
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def extend_lock(
+        self,
+        *,
+        extend_lock_duration: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.ExtendLockArgs(
+            extend_lock_duration=extend_lock_duration
+        )
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def extend_amount(
+        self,
+        *,
+        amount: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.ExtendAmountArgs(amount=amount)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def update_vetoken_data(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.UpdateVetokenDataArgs()
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def opt_into_asset(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.OptIntoAssetArgs(asset=asset)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def add_scholarship(
+        self,
+        *,
+        asset: int,
+        amount: int,
+        value: int,
+        axfer: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.AddScholarshipArgs(
+            asset=asset, amount=amount, value=value, axfer=axfer
+        )
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def pay_scholarship(
+        self,
+        *,
+        scholarship_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.PayScholarshipArgs(scholarship_id=scholarship_id)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def is_locked_ever(
+        self,
+        *,
+        addr: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.IsLockedEverArgs(addr=addr)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def profile_lock_user(
+        self,
+        *,
+        addr: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.ProfileLockUserArgs(addr=addr)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+    def balance_of(
+        self,
+        *,
+        user: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncCertificateComposer":
+        args = certificate_client.BalanceOfArgs(user=user)
+        self.composer.add_method_call(
+            args.method(), method_args(args), transaction_parameters
+        )
+        return self
+
+
+class AsyncCertificateClient:
+    """Asyncio variant of `CertificateClient` for a deployed Certificate app.
+
+    Every method that talks to algod is a coroutine over the pooled session of
+    `algod_client`. Methods that only read state are simulated instead of submitted,
+    unsigned and batched with concurrent reads, so balance reads cost no fee and
+    need no confirmation. Deploy with
+    `CertificateClient`, then point this client at its app id.
+    """
+
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        *,
+        app_id: int,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: transaction.SuggestedParams | None = None,
+    ):
+        self.app_spec = certificate_client.APP_SPEC
+        self.app_client = AsyncApplicationClient(
+            algod_client,
+            self.app_spec,
+            app_id=app_id,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+        )
+
+    @property
+    def algod_client(self) -> AsyncAlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    async def get_global_state(self) -> "certificate_client.GlobalState":
+        return certificate_client.GlobalState(await self.app_client.get_global_state())
+
+    async def get_voting_escrow_user(self, addr: str) -> codec.VotingEscrowUser:
+        """Reads the lock of `addr` straight from its box."""
+        return await self.app_client.get_box(
+            box_name(b"voting_escrow_user", addr), codec.decode_voting_escrow_user
+        )
+
+    async def get_scholarship(self, scholarship_id: int) -> codec.Scholarship:
+        return await self.app_client.get_box(
+            box_name(b"scholarship", scholarship_id), codec.decode_scholarship
+        )
+
+    async def snapshot(
+        self, directory: Path, *, workers: int = DEFAULT_WORKERS
+    ) -> dict[bytes, BoxMapSnapshot]:
+        """Reads every box of the app into `directory`, resuming an interrupted
+        snapshot there, and returns the columns of each map by prefix."""
+        await take_snapshot(
+            self.app_client.algod_client, self.app_id, directory, workers=workers
+        )
+        return load_snapshot(directory, boxes.BOX_MAPS)
+
+    async def compose(
+        self, atc: AtomicTransactionComposer | None = None
+    ) -> AsyncCertificateComposer:
+        return AsyncCertificateComposer(await self.app_client.compose(atc))
+
+    async def initialize(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.InitializeArgs(asset=asset)
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def lock_token(
+        self,
+        *,
+        addr: str,
+        lock_amount: int,
+        lock_duration: int,
+        payment: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.LockTokenArgs(
+            addr=addr,
+            lock_amount=lock_amount,
+            lock_duration=lock_duration,
+            payment=payment,
+        )
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def claim_token(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.ClaimTokenArgs()
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def extend_lock(
+        self,
+        *,
+        extend_lock_duration: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.ExtendLockArgs(
+            extend_lock_duration=extend_lock_duration
+        )
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def extend_amount(
+        self,
+        *,
+        amount: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.ExtendAmountArgs(amount=amount)
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def update_vetoken_data(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.UpdateVetokenDataArgs()
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def opt_into_asset(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.OptIntoAssetArgs(asset=asset)
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def add_scholarship(
+        self,
+        *,
+        asset: int,
+        amount: int,
+        value: int,
+        axfer: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        args = certificate_client.AddScholarshipArgs(
+            asset=asset, amount=amount, value=value, axfer=axfer
+        )
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def pay_scholarship(
+        self,
+        *,
+        scholarship_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        args = certificate_client.PayScholarshipArgs(scholarship_id=scholarship_id)
+        return await self.app_client.call(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def is_locked_ever(
+        self,
+        *,
+        addr: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[bool]:
+        args = certificate_client.IsLockedEverArgs(addr=addr)
+        return await self.app_client.read(
+            args.method(), method_args(args), transaction_parameters
+        )
+
+    async def profile_lock_user(
+        self,
+        *,
+        addr: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse["certificate_client.VotingEscrowUser"]:
+        args = certificate_client.ProfileLockUserArgs(addr=addr)
+        result = await self.app_client.read(
+            args.method(), method_args(args), transaction_parameters
+        )
+        elements = self.app_spec.hints[args.method()].structs["output"]["elements"]
+        # Results are memoized, so the converted value goes on a copy
+        return dataclasses.replace(
+            result,
+            return_value=certificate_client.VotingEscrowUser(
+                **{
+                    element[0]: value
+                    for element, value in zip(elements, result.return_value)
+                }
+            ),
+        )
+
+    async def balance_of(
+        self,
+        *,
+        user: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        args = certificate_client.BalanceOfArgs(user=user)
+        return await self.app_client.read(
+            args.method(), method_args(args), transaction_parameters
+        )
@@ -0,0 +1,72 @@
+"""Boxes of the Certificate contract: which ones each ABI method touches, for
+`BatchComposer` to reference, and how each `BoxMap` is laid out, for snapshots.
+
+ARC-32 specs do not describe box storage, so the rules mirror the `BoxMap`s in
+`contract.py`: each box name is the map's attribute name followed by the key.
+"""
+
+import hashlib
+
+from algosdk import encoding
+
+from smart_contracts._helpers.batch import BoxName, arg_box, box_name, sender_box
+from smart_contracts._helpers.snapshot import (
+    BoxMapLayout,
+    bool_columns,
+    struct_columns,
+)
+from smart_contracts.scholarship import codec
+
+
+def paid_key(scholarship_id: int, addr: str) -> bytes:
+    """Key of the `paid_scholarship` box, as `Certificate.get_paid_key` derives it."""
+    return hashlib.sha256(
+        scholarship_id.to_bytes(8, "big") + encoding.decode_address(addr)
+    ).digest()
+
+
+BOX_REFERENCES: dict[str, list[BoxName]] = {
+    "lock_token": [
+        sender_box(b"voting_escrow_user"),
+        sender_box(b"locked_user"),
+    ],
+    "claim_token": [
+        sender_box(b"voting_escrow_user"),
+        sender_box(b"locked_user"),
+    ],
+    "extend_lock": [sender_box(b"voting_escrow_user")],
+    "extend_amount": [sender_box(b"voting_escrow_user")],
+    "update_vetoken_data": [sender_box(b"voting_escrow_user")],
+    # The new `scholarship` box is keyed by total_scholarship, which depends on app
+    # state; pass it in `TransactionParameters.boxes`
+    "add_scholarship": [],
+    "pay_scholarship": [
+        sender_box(b"voting_escrow_user"),
+        arg_box(b"scholarship", "scholarship_id"),
+        lambda args, sender: box_name(
+            b"paid_scholarship", paid_key(args["scholarship_id"], sender)
+        ),
+    ],
+    "is_locked_ever": [arg_box(b"locked_user", "addr")],
+    "profile_lock_user": [arg_box(b"voting_escrow_user", "addr")],
+    "balance_of": [arg_box(b"voting_escrow_user", "user")],
+}
+
+BOX_MAPS = [
+    BoxMapLayout(
+        b"voting_escrow_user",
+        32,
+        lambda values: struct_columns(
+            codec.VotingEscrowUser._fields, codec.VOTING_ESCROW_USER, values
+        ),
+    ),
+    BoxMapLayout(b"locked_user", 32, bool_columns),
+    BoxMapLayout(
+        b"scholarship",
+        8,
+        lambda values: struct_columns(
+            codec.Scholarship._fields, codec.SCHOLARSHIP, values
+        ),
+    ),
+    BoxMapLayout(b"paid_scholarship", 32, bool_columns),
+]
@@ -0,0 +1,67 @@
+"""Fast decoders for the ARC-4 structs the Certificate contract stores in boxes.
+
+Both structs have a fixed layout, so each is read with one precompiled
+`struct.Struct` straight from the buffer, without going through the generic
+algosdk ABI types. Addresses are kept as their 32 raw bytes; encoding them is by
+far the most expensive part of decoding, so `address` does it only on access.
+"""
+
+import struct
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from algosdk import encoding
+
+Buffer = bytes | bytearray | memoryview
+
+VOTING_ESCROW_USER = struct.Struct(">32s6Q")
+SCHOLARSHIP = struct.Struct(">4Q32s")
+
+
+class VotingEscrowUser(NamedTuple):
+    user_address: bytes
+    amount_locked: int
+    lock_start_time: int
+    lock_duration: int
+    amount_vetoken: int
+    update_time: int
+    used_amount: int
+
+    @property
+    def address(self) -> str:
+        return encoding.encode_address(self.user_address)  # type: ignore[no-any-return]
+
+    @property
+    def lock_end_time(self) -> int:
+        """When the lock expires, as the contract derives it."""
+        return self.lock_start_time + self.lock_duration
+
+
+class Scholarship(NamedTuple):
+    scholarship_id: int
+    amount: int
+    value: int
+    asset_id: int
+    creator: bytes
+
+    @property
+    def creator_address(self) -> str:
+        return encoding.encode_address(self.creator)  # type: ignore[no-any-return]
+
+
+def decode_voting_escrow_user(data: Buffer, offset: int = 0) -> VotingEscrowUser:
+    return VotingEscrowUser._make(VOTING_ESCROW_USER.unpack_from(data, offset))
+
+
+def decode_scholarship(data: Buffer, offset: int = 0) -> Scholarship:
+    return Scholarship._make(SCHOLARSHIP.unpack_from(data, offset))
+
+
+def iter_voting_escrow_users(data: Buffer) -> Iterator[VotingEscrowUser]:
+    """Decodes a buffer of `voting_escrow_user` box values laid end to end."""
+    return map(VotingEscrowUser._make, VOTING_ESCROW_USER.iter_unpack(data))
+
+
+def iter_scholarships(data: Buffer) -> Iterator[Scholarship]:
+    """Decodes a buffer of `scholarship` box values laid end to end."""
+    return map(Scholarship._make, SCHOLARSHIP.iter_unpack(data))
@@ -4,7 +4,6 @@
 from algopy import (
     ARC4Contract,
     Asset,
-    BigUInt,
     BoxMap,
     Bytes,
     Global,
@@ -103,26 +102,36 @@ class Certificate(ARC4Contract):
         """Get the time at which the lock expires"""
         return lock_start_time + lock_duration
 
+    @subroutine
+    def _user_lock_end_time(self, user: VotingEscrowUser) -> UInt64:
+        """Get the time at which the user's lock expires, from the stored start
+        time and duration"""
+        return self.get_lock_end_time(
+            lock_start_time=op.btoi(user.lock_start_time.bytes),
+            lock_duration=op.btoi(user.lock_duration.bytes),
+        )
+
     @subroutine
     def _calculate_vetoken_amount(
         self, amount_locked: UInt64, time_remaining: UInt64
-    ) -> BigUInt:
+    ) -> UInt64:
         """Calculates the amount of veTOKEN a user has"""
-        multiple = BigUInt(amount_locked) * BigUInt(time_remaining)
-        if multiple == 0:
-            return BigUInt(0)
-        result = multiple // BigUInt(self.SECONDS_PER_YEAR)
-        return result
+        high, low = op.mulw(amount_locked, time_remaining)
+        if high == 0:
+            return low // self.SECONDS_PER_YEAR
+        # The product does not fit in 64 bits, divide the full 128-bit value
+        quotient_high, quotient_low, _remainder_high, _remainder_low = op.divmodw(
+            high, low, UInt64(0), self.SECONDS_PER_YEAR
+        )
+        assert quotient_high == 0, "veTOKEN amount overflow"
+        return quotient_low
 
     @subroutine
     def _update_vetoken_data(self, user: VotingEscrowUser) -> None:
         """Updates a user's veTOKEN data"""
         current_time = Global.latest_timestamp
         time_delta = current_time - op.btoi(user.update_time.bytes)
-        lock_end_time = self.get_lock_end_time(
-            lock_duration=op.btoi(user.lock_duration.bytes),
-            lock_start_time=op.btoi(user.lock_start_time.bytes),
-        )
+        lock_end_time = self._user_lock_end_time(user)
         lock_time_remaining = lock_end_time - current_time
 
         if time_delta > 0:
@@ -186,26 +195,13 @@ class Certificate(ARC4Contract):
 
         self.voting_escrow_user[sender_address] = VotingEscrowUser(
             user_address=sender_address,
-            amount_locked=arc4.UInt64(0),
-            amount_vetoken=arc4.UInt64(0),
-            lock_duration=arc4.UInt64(0),
-            lock_start_time=arc4.UInt64(0),
-            update_time=arc4.UInt64(0),
+            amount_locked=arc4.UInt64(lock_amount),
+            lock_start_time=arc4.UInt64(current_timestamp),
+            lock_duration=arc4.UInt64(lock_duration),
+            amount_vetoken=arc4.UInt64(vetoken_amount),
+            update_time=arc4.UInt64(current_timestamp),
             used_amount=arc4.UInt64(0),
         )
-        self.voting_escrow_user[sender_address].amount_locked = arc4.UInt64(lock_amount)
-        self.voting_escrow_user[sender_address].lock_start_time = arc4.UInt64(
-            current_timestamp
-        )
-        self.voting_escrow_user[sender_address].lock_duration = arc4.UInt64(
-            lock_duration
-        )
-        self.voting_escrow_user[sender_address].amount_vetoken = arc4.UInt64(
-            vetoken_amount
-        )
-        self.voting_escrow_user[sender_address].update_time = arc4.UInt64(
-            current_timestamp
-        )
 
         if sender_address not in self.locked_user:
             # self.user_locked.append(sender_address)
@@ -226,13 +222,8 @@ class Certificate(ARC4Contract):
         sender = Txn.sender
         sender_address = Address(sender)
         assert sender_address in self.voting_escrow_user, "Not locked yet"
-        lock_end_time = self.get_lock_end_time(
-            lock_duration=op.btoi(
-                self.voting_escrow_user[sender_address].lock_duration.bytes
-            ),
-            lock_start_time=op.btoi(
-                self.voting_escrow_user[sender_address].lock_start_time.bytes
-            ),
+        lock_end_time = self._user_lock_end_time(
+            self.voting_escrow_user[sender_address].copy()
         )
         current_time = Global.latest_timestamp
         locked_amount = self.voting_escrow_user[sender_address].amount_locked
@@ -259,13 +250,8 @@ class Certificate(ARC4Contract):
         sender = Txn.sender
         sender_address = Address(sender)
         assert sender_address in self.voting_escrow_user, "Not locked yet"
-        lock_end_time = self.get_lock_end_time(
-            lock_duration=op.btoi(
-                self.voting_escrow_user[sender_address].lock_duration.bytes
-            ),
-            lock_start_time=op.btoi(
-                self.voting_escrow_user[sender_address].lock_start_time.bytes
-            ),
+        lock_end_time = self._user_lock_end_time(
+            self.voting_escrow_user[sender_address].copy()
         )
         current_time = Global.latest_timestamp
         assert (
@@ -291,13 +277,8 @@ class Certificate(ARC4Contract):
         sender = Txn.sender
         sender_address = Address(sender)
         assert sender_address in self.voting_escrow_user, "Not locked yet"
-        lock_end_time = self.get_lock_end_time(
-            lock_duration=op.btoi(
-                self.voting_escrow_user[sender_address].lock_duration.bytes
-            ),
-            lock_start_time=op.btoi(
-                self.voting_escrow_user[sender_address].lock_start_time.bytes
-            ),
+        lock_end_time = self._user_lock_end_time(
+            self.voting_escrow_user[sender_address].copy()
         )
         current_time = Global.latest_timestamp
         assert amount > 0, "Extended amount must be larger than 0"
@@ -430,18 +411,11 @@ class Certificate(ARC4Contract):
             return UInt64(0)
         voting_escrow_user = self.voting_escrow_user[user].copy()
         current_time = Global.latest_timestamp
-        lock_end_time = self.get_lock_end_time(
-            lock_duration=op.btoi(voting_escrow_user.lock_duration.bytes),
-            lock_start_time=op.btoi(voting_escrow_user.lock_start_time.bytes),
-        )
+        lock_end_time = self._user_lock_end_time(voting_escrow_user)
         if lock_end_time < current_time:
             return UInt64(0)
         lock_time_remaining = lock_end_time - current_time
         calculate_vetoken_amount = self._calculate_vetoken_amount(
             op.btoi(voting_escrow_user.amount_locked.bytes), lock_time_remaining
         )
-        return op.btoi(
-            (
-                calculate_vetoken_amount - op.btoi(voting_escrow_user.used_amount.bytes)
-            ).bytes
-        )
+        return calculate_vetoken_amount - op.btoi(voting_escrow_user.used_amount.bytes)
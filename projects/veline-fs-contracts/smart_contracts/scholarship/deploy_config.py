@@ -4,6 +4,9 @@ import algokit_utils
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
+from smart_contracts._helpers.registry import find_deployment
+from smart_contracts.scholarship import client as certificate_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,17 +16,15 @@ def deploy(
     indexer_client: IndexerClient,
     app_spec: algokit_utils.ApplicationSpecification,
     deployer: algokit_utils.Account,
-) -> None:
-    from smart_contracts.artifacts.scholarship.certificate_client import (
-        CertificateClient,
-    )
-
-    app_client = CertificateClient(
+) -> algokit_utils.DeployResponse:
+    app_client = certificate_client.CertificateClient(
         algod_client,
         creator=deployer,
         indexer_client=indexer_client,
+        # the app recorded by the last deploy, instead of an indexer search
+        existing_deployments=find_deployment(algod_client, deployer.address, app_spec),
     )
-    app_client.deploy(
+    deploy_response = app_client.deploy(
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
         on_update=algokit_utils.OnUpdate.AppendApp,
     )
@@ -33,4 +34,4 @@ def deploy(
     #     f"Called hello on {app_spec.contract.name} ({app_client.app_id}) "
     #     f"with name={name}, received: {response.return_value}"
     # )
-    pass
+    return deploy_response
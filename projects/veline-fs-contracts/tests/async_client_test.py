@@ -0,0 +1,159 @@
+import asyncio
+import inspect
+import json
+from pathlib import Path
+
+import pytest
+from algokit_utils import Account
+from algosdk import abi, account, error
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts.campaign.async_client import (
+    AsyncCampaignClient,
+    AsyncCampaignComposer,
+)
+from smart_contracts.scholarship.async_client import (
+    AsyncCertificateClient,
+    AsyncCertificateComposer,
+)
+from tests.local_algod import LocalAlgod
+
+APP_ID = 1001
+
+
+@pytest.fixture()
+def local_algod() -> LocalAlgod:
+    return LocalAlgod()
+
+
+@pytest.fixture()
+def sender() -> Account:
+    private_key, address = account.generate_account()
+    return Account(private_key=private_key, address=address)
+
+
+def algod_client(local_algod: LocalAlgod) -> AsyncAlgodClient:
+    return AsyncAlgodClient(
+        "a" * 64, "http://localhost:4001", transport=local_algod.transport
+    )
+
+
+def test_concurrent_claims_from_one_event_loop(
+    local_algod: LocalAlgod, sender: Account
+) -> None:
+    local_algod.latency = 0.001
+    claims = 500
+
+    async def run() -> list[str]:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCampaignClient(algod, app_id=APP_ID, signer=sender)
+            responses = await asyncio.gather(
+                *(
+                    client.mint_token(
+                        leaf_data=bytes(40),
+                        addr=sender.address,
+                        amount=index,
+                        campaign_id=1,
+                        proof=bytes(32),
+                    )
+                    for index in range(claims)
+                )
+            )
+        return [response.tx_id for response in responses]
+
+    tx_ids = asyncio.run(run())
+
+    assert len(set(tx_ids)) == claims
+    assert set(tx_ids) <= set(local_algod.confirmed)
+    assert local_algod.max_in_flight > 1
+
+
+def test_composed_group_returns_every_result(
+    local_algod: LocalAlgod, sender: Account
+) -> None:
+    local_algod.on_method(
+        "add_campaign(byte[],byte[],uint64)uint64",
+        lambda txn: abi.UintType(64).encode(7),
+    )
+
+    async def run() -> list[object]:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCampaignClient(algod, app_id=APP_ID, signer=sender)
+            composer = await client.compose()
+            composer.add_campaign(proof=b"", root=bytes(32), duration=60)
+            composer.add_campaign(proof=b"", root=bytes(32), duration=60)
+            response = await composer.execute()
+        return [result.return_value for result in response.abi_results]
+
+    assert asyncio.run(run()) == [7, 7]
+
+
+def test_reads_are_simulated(local_algod: LocalAlgod, sender: Account) -> None:
+    local_algod.on_method(
+        "balance_of(address)uint64", lambda txn: abi.UintType(64).encode(42)
+    )
+    profile_type = abi.ABIType.from_string(
+        "(address,uint64,uint64,uint64,uint64,uint64,uint64)"
+    )
+    local_algod.on_method(
+        "profile_lock_user(address)(address,uint64,uint64,uint64,uint64,uint64,uint64)",
+        lambda txn: profile_type.encode([sender.address, 1, 2, 3, 4, 5, 6]),
+    )
+
+    async def run() -> tuple[int, object]:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCertificateClient(algod, app_id=APP_ID, signer=sender)
+            balance = await client.balance_of(user=sender.address)
+            profile = await client.profile_lock_user(addr=sender.address)
+        return balance.return_value, profile.return_value
+
+    balance, profile = asyncio.run(run())
+
+    assert balance == 42
+    assert profile.amount_locked == 1
+    assert profile.used_amount == 6
+    assert not local_algod.confirmed
+
+
+def test_global_state_and_http_errors(local_algod: LocalAlgod, sender: Account) -> None:
+    local_algod.global_state[APP_ID] = {b"total_campaign": 3, b"asa": 12}
+
+    async def run() -> int:
+        async with algod_client(local_algod) as algod:
+            state = await AsyncCampaignClient(algod, app_id=APP_ID).get_global_state()
+            with pytest.raises(error.AlgodHTTPError) as raised:
+                await AsyncCampaignClient(algod, app_id=1).get_global_state()
+            assert raised.value.code == 404
+        return state.total_campaign
+
+    assert asyncio.run(run()) == 3
+
+
+@pytest.mark.parametrize(
+    ("app_spec", "wrappers"),
+    [
+        (
+            "campaign/Campaign.arc32.json",
+            (AsyncCampaignClient, AsyncCampaignComposer),
+        ),
+        (
+            "scholarship/Certificate.arc32.json",
+            (AsyncCertificateClient, AsyncCertificateComposer),
+        ),
+    ],
+)
+def test_methods_match_the_app_spec(app_spec: str, wrappers: tuple[type, ...]) -> None:
+    spec = json.loads((Path("smart_contracts/artifacts") / app_spec).read_text())
+    methods = {
+        method["name"]: [arg["name"] for arg in method["args"]]
+        for method in spec["contract"]["methods"]
+    }
+
+    for wrapper in wrappers:
+        for name, args in methods.items():
+            parameters = inspect.signature(getattr(wrapper, name)).parameters
+            assert [
+                parameter
+                for parameter in parameters
+                if parameter not in ("self", "transaction_parameters")
+            ] == args, f"{wrapper.__name__}.{name}"
@@ -0,0 +1,179 @@
+import base64
+
+import pytest
+from algokit_utils import Account, TransactionParameters
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+
+from smart_contracts._helpers.batch import (
+    MAX_GROUP_SIZE,
+    MAX_TXN_REFERENCES,
+    BatchComposer,
+    box_name,
+)
+from smart_contracts.artifacts.campaign.campaign_client import (
+    APP_SPEC as CAMPAIGN_APP_SPEC,
+)
+from smart_contracts.artifacts.scholarship.certificate_client import (
+    APP_SPEC as CERTIFICATE_APP_SPEC,
+)
+from smart_contracts.campaign.boxes import BOX_REFERENCES as CAMPAIGN_BOXES
+from smart_contracts.campaign.boxes import claim_key
+from smart_contracts.scholarship.boxes import BOX_REFERENCES as CERTIFICATE_BOXES
+from smart_contracts.scholarship.boxes import paid_key
+
+APP_ID = 1001
+SUGGESTED_PARAMS = transaction.SuggestedParams(
+    0, 1, 1000, base64.b64encode(bytes(32)).decode(), "local", False, "future", 1000
+)
+
+
+def new_account() -> Account:
+    private_key, address = account.generate_account()
+    return Account(private_key=private_key, address=address)
+
+
+@pytest.fixture()
+def sender() -> Account:
+    return new_account()
+
+
+def group_boxes(atc: AtomicTransactionComposer) -> list[set[bytes]]:
+    """Box names referenced by each transaction of a built group."""
+    return [{box.name for box in txn.txn.boxes or []} for txn in atc.build_group()]
+
+
+def test_claims_are_split_into_groups_with_their_boxes(sender: Account) -> None:
+    claimers = [new_account().address for _ in range(40)]
+    composer = BatchComposer(CAMPAIGN_APP_SPEC, APP_ID, CAMPAIGN_BOXES, signer=sender)
+    for index, addr in enumerate(claimers):
+        composer.add_method_call(
+            "mint_token",
+            {
+                "leaf_data": bytes(40),
+                "addr": addr,
+                "amount": index,
+                "campaign_id": 3,
+                "proof": bytes(32),
+            },
+        )
+
+    atcs = composer.build(SUGGESTED_PARAMS)
+
+    assert len(composer) == 40
+    assert [atc.get_tx_count() for atc in atcs] == [16, 16, 8]
+    referenced = set()
+    for atc in atcs:
+        boxes = group_boxes(atc)
+        assert all(len(txn_boxes) <= MAX_TXN_REFERENCES for txn_boxes in boxes)
+        # The campaign box is shared by every call in the group and referenced once
+        assert sum(len(txn_boxes) for txn_boxes in boxes) == atc.get_tx_count() + 1
+        assert box_name(b"campaign", 3) in set().union(*boxes)
+        referenced |= set().union(*boxes)
+    assert referenced == {box_name(b"campaign", 3)} | {
+        box_name(b"claimed", claim_key(3, addr)) for addr in claimers
+    }
+
+
+def test_boxes_of_one_call_spill_onto_others_in_its_group(sender: Account) -> None:
+    composer = BatchComposer(CAMPAIGN_APP_SPEC, APP_ID, signer=sender)
+    composer.add_method_call("creator")
+    composer.add_method_call(
+        "owner_campaign",
+        {"campaign_id": 1},
+        TransactionParameters(boxes=[(APP_ID, bytes([index])) for index in range(12)]),
+    )
+
+    (atc,) = composer.build(SUGGESTED_PARAMS)
+
+    boxes = group_boxes(atc)
+    assert [len(txn_boxes) for txn_boxes in boxes] == [8, 4]
+    assert set().union(*boxes) == {bytes([index]) for index in range(12)}
+
+
+def test_full_groups_start_a_new_group(sender: Account) -> None:
+    composer = BatchComposer(CAMPAIGN_APP_SPEC, APP_ID, signer=sender)
+    for index in range(MAX_GROUP_SIZE):
+        composer.add_method_call(
+            "owner_campaign",
+            {"campaign_id": index},
+            TransactionParameters(
+                boxes=[(APP_ID, bytes([index, box])) for box in range(7)]
+            ),
+        )
+    # Needs more box references than the group has left
+    composer.add_method_call(
+        "creator",
+        transaction_parameters=TransactionParameters(
+            boxes=[(APP_ID, bytes([255, box])) for box in range(10)]
+        ),
+    )
+    composer.add_method_call("creator")
+
+    atcs = composer.build(SUGGESTED_PARAMS)
+
+    assert [atc.get_tx_count() for atc in atcs] == [MAX_GROUP_SIZE, 2]
+    assert [len(txn_boxes) for txn_boxes in group_boxes(atcs[1])] == [8, 2]
+
+
+def test_boxes_that_no_group_can_carry_are_rejected(sender: Account) -> None:
+    composer = BatchComposer(CAMPAIGN_APP_SPEC, APP_ID, signer=sender)
+    composer.add_method_call(
+        "creator",
+        transaction_parameters=TransactionParameters(
+            boxes=[(APP_ID, bytes([box])) for box in range(9)]
+        ),
+    )
+
+    with pytest.raises(Exception, match="needs 9 box references"):
+        composer.build(SUGGESTED_PARAMS)
+
+
+def test_reference_limits_of_one_call(sender: Account) -> None:
+    composer = BatchComposer(CERTIFICATE_APP_SPEC, APP_ID, signer=sender)
+
+    with pytest.raises(Exception, match="accounts"):
+        composer.add_method_call(
+            "balance_of",
+            {"user": new_account().address},
+            TransactionParameters(accounts=[new_account().address for _ in range(5)]),
+        )
+    with pytest.raises(Exception, match="references"):
+        composer.add_method_call(
+            "balance_of",
+            {"user": sender.address},
+            TransactionParameters(foreign_assets=list(range(1, 10))),
+        )
+    with pytest.raises(Exception, match="Missing arguments"):
+        composer.add_method_call("balance_of")
+
+
+def test_pay_scholarship_boxes(sender: Account) -> None:
+    composer = BatchComposer(
+        CERTIFICATE_APP_SPEC, APP_ID, CERTIFICATE_BOXES, signer=sender
+    )
+
+    assert composer.infer_boxes(
+        "pay_scholarship", {"scholarship_id": 5}, sender.address
+    ) == [
+        box_name(b"voting_escrow_user", sender.address),
+        box_name(b"scholarship", 5),
+        box_name(b"paid_scholarship", paid_key(5, sender.address)),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("app_spec", "box_references"),
+    [(CAMPAIGN_APP_SPEC, CAMPAIGN_BOXES), (CERTIFICATE_APP_SPEC, CERTIFICATE_BOXES)],
+)
+def test_box_rules_match_the_app_spec(app_spec, box_references) -> None:  # type: ignore[no-untyped-def]
+    composer = BatchComposer(app_spec, APP_ID, box_references)
+    sender = new_account().address
+    methods = {method.name: method for method in app_spec.contract.methods}
+    for name in box_references:
+        args = {
+            arg.name: sender if str(arg.type) in ("address", "account") else 1
+            for arg in methods[name].args
+        }
+        for box in composer.infer_boxes(name, args, sender):
+            assert isinstance(box, bytes)
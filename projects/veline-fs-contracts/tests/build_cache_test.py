@@ -0,0 +1,100 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import build as build_module
+from smart_contracts._helpers.build_cache import (
+    MANIFEST_FILE,
+    build_hash,
+    is_up_to_date,
+    read_manifest,
+    source_files,
+    write_manifest,
+)
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    package = tmp_path / "contracts" / "token"
+    package.mkdir(parents=True)
+    (tmp_path / "contracts" / "__init__.py").write_text("")
+    (tmp_path / "contracts" / "constants.py").write_text("FEE = 1000\n")
+    (package / "math.py").write_text("from ..constants import FEE\n")
+    (package / "unused.py").write_text("")
+    (package / "contract.py").write_text(
+        "from algopy import ARC4Contract\n"
+        "from contracts.token import math\n"
+        "\n\nclass Token(ARC4Contract):\n    pass\n"
+    )
+    return tmp_path
+
+
+def test_source_files_follow_project_imports(project: Path) -> None:
+    files = source_files(project / "contracts/token/contract.py", project)
+
+    assert [path.relative_to(project).as_posix() for path in files] == [
+        "contracts/constants.py",
+        "contracts/token/contract.py",
+        "contracts/token/math.py",
+    ]
+
+
+def test_hash_changes_with_any_input(project: Path) -> None:
+    contract_path = project / "contracts/token/contract.py"
+    inputs_hash = build_hash(contract_path, ["--debug-level=0"], root=project)
+
+    (project / "contracts/token/unused.py").write_text("X = 1\n")
+    assert build_hash(contract_path, ["--debug-level=0"], root=project) == inputs_hash
+
+    assert build_hash(contract_path, ["--debug-level=1"], root=project) != inputs_hash
+    (project / "contracts/constants.py").write_text("FEE = 2000\n")
+    assert build_hash(contract_path, ["--debug-level=0"], root=project) != inputs_hash
+
+
+def test_manifest_detects_changed_artifacts(tmp_path: Path) -> None:
+    (tmp_path / "Token.approval.teal").write_text("#pragma version 10\n")
+
+    manifest = write_manifest(tmp_path, "abc", flags=["--debug-level=0"])
+
+    assert read_manifest(tmp_path) == manifest
+    assert MANIFEST_FILE not in manifest["outputs"]
+    assert is_up_to_date(tmp_path, "abc")
+    assert not is_up_to_date(tmp_path, "def")
+    (tmp_path / "Token.approval.teal").write_text("#pragma version 11\n")
+    assert not is_up_to_date(tmp_path, "abc")
+
+
+def test_built_profile_is_read_from_the_manifest(tmp_path: Path) -> None:
+    # committed artifacts have no manifest and are built with the default
+    assert build_module.built_profile(tmp_path) == build_module.DEFAULT_PROFILE
+
+    write_manifest(tmp_path, "abc", profile="dev")
+
+    assert build_module.built_profile(tmp_path) == "dev"
+
+
+def test_unchanged_contract_is_not_rebuilt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    contract_path = Path("smart_contracts/campaign/contract.py")
+    (tmp_path / "Campaign.arc32.json").write_text("{}")
+    write_manifest(
+        tmp_path,
+        build_hash(
+            contract_path,
+            [*build_module.compile_flags, build_module.deployment_extension],
+        ),
+    )
+
+    def run(*args: object, **kwargs: object) -> None:
+        raise AssertionError("the compiler should not run")
+
+    monkeypatch.setattr(subprocess, "Popen", run)
+
+    assert build_module.build(tmp_path, contract_path) == (
+        tmp_path / "Campaign.arc32.json"
+    )
+    # the CLI backend runs the compiler as a subprocess, wherever puyapy is installed
+    with pytest.raises(AssertionError):
+        build_module.build(tmp_path, contract_path, force=True, backend="cli")
@@ -0,0 +1,274 @@
+import asyncio
+import base64
+import threading
+from typing import Any
+
+import pytest
+from algokit_utils import Account
+from algosdk import account
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.cache import CachingAlgodClient, RoundCache
+from smart_contracts._helpers.transport import PooledAlgodClient
+from smart_contracts.campaign.async_client import AsyncCampaignClient
+from tests.local_algod import GENESIS_HASH, LocalAlgod
+
+APP_ID = 1001
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def sender() -> Account:
+    private_key, address = account.generate_account()
+    return Account(private_key=private_key, address=address)
+
+
+def test_entries_expire_and_are_dropped_on_a_new_round() -> None:
+    clock = Clock()
+    cache = RoundCache(ttl=2.0, clock=clock)
+    fetches = []
+
+    def fetch() -> int:
+        fetches.append(cache.round)
+        return len(fetches)
+
+    assert cache.get_or_fetch(("global_state", 1), fetch) == 1
+    assert cache.get_or_fetch(("global_state", 1), fetch) == 1
+    clock.now = 2.5
+    assert cache.get_or_fetch(("global_state", 1), fetch) == 2
+    cache.observe_response({"last-round": 5})
+    assert cache.get_or_fetch(("global_state", 1), fetch) == 3
+    # Rounds older than the latest one seen do not invalidate
+    cache.observe_round(4)
+    assert cache.get_or_fetch(("global_state", 1), fetch) == 3
+
+    assert cache.stats["global_state"].hits == 2
+    assert cache.stats["global_state"].misses == 3
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_values_fetched_across_a_round_change_are_not_kept() -> None:
+    cache = RoundCache()
+
+    def fetch() -> str:
+        cache.observe_round(cache.round + 1)
+        return "stale"
+
+    cache.get_or_fetch(("application_info", 1), fetch)
+    # Unless the value itself is from the new round
+    cache.get_or_fetch(("suggested_params",), lambda: {"last-round": cache.round + 1})
+
+    assert cache.get_or_fetch(("application_info", 1), lambda: "fresh") == "fresh"
+    assert cache.get_or_fetch(("suggested_params",), dict) == {"last-round": 2}
+
+
+def test_a_cache_is_updated_by_one_thread_at_a_time() -> None:
+    cache = RoundCache(clock=Clock())
+    cache.get_or_fetch(("box", 1), lambda: {"round": 1})
+    blocked = []
+
+    def clock() -> float:
+        # Another thread observing a round waits for this lookup to finish
+        other = threading.Thread(target=cache.observe_round, args=(2,))
+        other.start()
+        other.join(timeout=0.1)
+        blocked.append(other.is_alive())
+        return 0.0
+
+    cache.clock = clock
+
+    assert cache.get_or_fetch(("box", 1), dict) == {"round": 1}
+    assert blocked == [True]
+
+
+def test_a_cache_is_not_locked_while_fetching() -> None:
+    cache = RoundCache()
+
+    def fetch() -> str:
+        other = threading.Thread(target=cache.observe_round, args=(2,))
+        other.start()
+        other.join(timeout=1)
+        assert not other.is_alive()
+        return "stale"
+
+    assert cache.get_or_fetch(("box", 1), fetch) == "stale"
+    assert cache.round == 2
+
+
+def test_concurrent_misses_share_one_fetch() -> None:
+    cache = RoundCache()
+    fetches = 0
+
+    async def fetch() -> int:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+        return 7
+
+    async def run() -> list[int]:
+        return await asyncio.gather(
+            *(cache.get_or_fetch_async(("box", 1, b"a"), fetch) for _ in range(50))
+        )
+
+    assert asyncio.run(run()) == [7] * 50
+    assert fetches == 1
+
+
+def test_a_cancelled_caller_does_not_cancel_a_shared_fetch() -> None:
+    cache = RoundCache()
+    fetches = 0
+
+    async def fetch() -> int:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.02)
+        return 7
+
+    async def run() -> tuple[int, bool]:
+        key = ("box", 1, b"a")
+        first = asyncio.ensure_future(cache.get_or_fetch_async(key, fetch))
+        second = asyncio.ensure_future(cache.get_or_fetch_async(key, fetch))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        value = await second
+        await asyncio.gather(first, return_exceptions=True)
+        return value, first.cancelled()
+
+    assert asyncio.run(run()) == (7, True)
+    assert fetches == 1
+
+
+def test_a_fetch_nobody_waits_for_is_cancelled() -> None:
+    cache = RoundCache()
+    cancelled = asyncio.Event()
+
+    async def fetch() -> int:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 7
+
+    async def quick() -> int:
+        return 8
+
+    async def run() -> int:
+        key = ("box", 1, b"a")
+        callers = [
+            asyncio.ensure_future(cache.get_or_fetch_async(key, fetch))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.005)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), 1)
+        # the next caller starts a fetch of its own
+        return await cache.get_or_fetch_async(key, quick)
+
+    assert asyncio.run(run()) == 8
+
+
+def test_async_client_fetches_params_once_per_round(sender: Account) -> None:
+    local_algod = LocalAlgod(latency=0.001)
+    cache = RoundCache()
+
+    async def run() -> None:
+        async with AsyncAlgodClient(
+            "a" * 64,
+            "http://localhost:4001",
+            transport=local_algod.transport,
+            cache=cache,
+        ) as algod:
+            client = AsyncCampaignClient(algod, app_id=APP_ID, signer=sender)
+            await asyncio.gather(
+                *(
+                    client.mint_token(
+                        leaf_data=bytes(40),
+                        addr=sender.address,
+                        amount=index,
+                        campaign_id=1,
+                        proof=bytes(32),
+                    )
+                    for index in range(200)
+                )
+            )
+
+    asyncio.run(run())
+
+    assert len(local_algod.confirmed) == 200
+    assert local_algod.requests_by_path["/v2/transactions/params"] == 1
+    assert cache.stats["suggested_params"].hits == 199
+
+
+def test_global_state_is_read_again_after_a_round(sender: Account) -> None:
+    local_algod = LocalAlgod()
+    local_algod.global_state[APP_ID] = {b"total_campaign": 3}
+
+    async def run() -> list[int]:
+        async with AsyncAlgodClient(
+            "a" * 64,
+            "http://localhost:4001",
+            transport=local_algod.transport,
+            cache=RoundCache(),
+        ) as algod:
+            client = AsyncCampaignClient(algod, app_id=APP_ID, signer=sender)
+            totals = [(await client.get_global_state()).total_campaign]
+            local_algod.global_state[APP_ID][b"total_campaign"] = 4
+            totals.append((await client.get_global_state()).total_campaign)
+            await client.add_campaign(proof=b"", root=bytes(32), duration=60)
+            totals.append((await client.get_global_state()).total_campaign)
+        return totals
+
+    assert asyncio.run(run()) == [3, 3, 4]
+    assert local_algod.requests_by_path[f"/v2/applications/{APP_ID}"] == 2
+
+
+def test_caching_algod_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[str] = []
+    last_round = 10
+
+    def algod_request(self: AlgodClient, method: str, path: str, **kwargs: Any) -> Any:
+        requests.append(path)
+        if path == "/transactions/params":
+            return {
+                "consensus-version": "future",
+                "fee": 0,
+                "genesis-hash": GENESIS_HASH,
+                "genesis-id": "local-algod",
+                "last-round": last_round,
+                "min-fee": 1000,
+            }
+        if path == "/status":
+            return {"last-round": last_round}
+        return {"round": last_round, "name": "", "value": base64.b64encode(b"x")}
+
+    monkeypatch.setattr(PooledAlgodClient, "algod_request", algod_request)
+    algod_client = CachingAlgodClient.wrap(AlgodClient("a" * 64, "http://localhost"))
+
+    params = algod_client.suggested_params()
+    params.fee = 5000
+    assert algod_client.suggested_params().fee == 0
+    algod_client.application_box_by_name(APP_ID, b"box")
+    algod_client.application_box_by_name(APP_ID, b"box")
+    last_round = 11
+    algod_client.status()
+    algod_client.suggested_params()
+
+    assert requests == [
+        "/transactions/params",
+        "/applications/1001/box",
+        "/status",
+        "/transactions/params",
+    ]
+    assert algod_client.cache.stats["suggested_params"].hits == 1
+    assert algod_client.cache.stats["box"].hits == 1
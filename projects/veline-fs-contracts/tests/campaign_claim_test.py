@@ -0,0 +1,133 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from algopy import Account, Bytes, UInt64
+from algopy.arc4 import Address
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.campaign.contract import Campaign
+from smart_contracts.campaign.merkle import ProofStore, append_leaves, build_tree
+
+START = 1_000_000
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.ledger.patch_global_fields(latest_timestamp=START)
+        yield ctx
+
+
+def add_campaign(context: AlgopyTestContext, contract: Campaign, root: bytes) -> UInt64:
+    contract.asa = context.any.asset()
+    contract.allow_owner_campaign(Address(context.default_sender))
+    return contract.add_campaign(Bytes(b""), Bytes(root), UInt64(60))
+
+
+def test_each_address_claims_with_its_own_proof(
+    context: AlgopyTestContext, tmp_path: Path
+) -> None:
+    recipients = [context.any.account() for _ in range(5)]
+    build_tree(
+        ((account.public_key, index + 1) for index, account in enumerate(recipients)),
+        tmp_path,
+    )
+    contract = Campaign()
+
+    with ProofStore(tmp_path) as store:
+        campaign_id = add_campaign(context, contract, store.root)
+        for account in recipients:
+            claim = store.lookup(account.public_key)
+            assert claim is not None
+            assert contract.check_eligible(
+                Address(account), UInt64(claim.amount), campaign_id, Bytes(claim.proof)
+            )
+            contract.mint_token(
+                Bytes(claim.leaf_data),
+                Address(account),
+                UInt64(claim.amount),
+                campaign_id,
+                Bytes(claim.proof),
+            )
+
+            transfer = context.txn.last_group.last_itxn.asset_transfer
+            assert transfer.asset_receiver == account
+            assert transfer.asset_amount == claim.amount
+
+
+def test_leaf_data_must_encode_the_claimed_address_and_amount(
+    context: AlgopyTestContext, tmp_path: Path
+) -> None:
+    recipients = [context.any.account() for _ in range(2)]
+    build_tree(((account.public_key, 5) for account in recipients), tmp_path)
+    contract = Campaign()
+
+    with ProofStore(tmp_path) as store:
+        campaign_id = add_campaign(context, contract, store.root)
+        claim = store.lookup(recipients[0].public_key)
+        assert claim is not None
+
+        def mint(addr: Account, amount: int) -> None:
+            contract.mint_token(
+                Bytes(claim.leaf_data),
+                Address(addr),
+                UInt64(amount),
+                campaign_id,
+                Bytes(claim.proof),
+            )
+
+        # a valid leaf and proof cannot be replayed for another address or amount
+        with pytest.raises(AssertionError, match="Invalid data"):
+            mint(recipients[1], 5)
+        with pytest.raises(AssertionError, match="Invalid data"):
+            mint(recipients[0], 6)
+        assert not contract.check_eligible(
+            Address(recipients[0]), UInt64(6), campaign_id, Bytes(claim.proof)
+        )
+
+        mint(recipients[0], 5)
+        with pytest.raises(AssertionError):
+            mint(recipients[0], 5)
+
+
+def test_rotated_root_admits_appended_recipients(
+    context: AlgopyTestContext, tmp_path: Path
+) -> None:
+    recipients = [context.any.account() for _ in range(4)]
+    build_tree(((account.public_key, 5) for account in recipients[:3]), tmp_path)
+    contract = Campaign()
+
+    def mint(account: Account) -> None:
+        with ProofStore(tmp_path) as store:
+            claim = store.lookup(account.public_key)
+            assert claim is not None
+            contract.mint_token(
+                Bytes(claim.leaf_data),
+                Address(account),
+                UInt64(claim.amount),
+                campaign_id,
+                Bytes(claim.proof),
+            )
+
+    with ProofStore(tmp_path) as store:
+        campaign_id = add_campaign(context, contract, store.root)
+    mint(recipients[0])
+    tree = append_leaves(tmp_path, [(recipients[3].public_key, 5)])
+    with pytest.raises(AssertionError, match="Invalid data"):
+        mint(recipients[3])
+
+    with pytest.raises(AssertionError, match="No accessible"):
+        with context.txn.create_group(active_txn_overrides={"sender": recipients[3]}):
+            contract.rotate_root(campaign_id, Bytes(tree.root))
+    contract.rotate_root(campaign_id, Bytes(tree.root))
+
+    assert contract.campaign[campaign_id].root.bytes[2:] == tree.root
+    mint(recipients[3])
+    mint(recipients[1])
+    with pytest.raises(AssertionError):
+        mint(recipients[0])
+
+    context.ledger.patch_global_fields(latest_timestamp=START + 61)
+    with pytest.raises(AssertionError, match="Expired"):
+        contract.rotate_root(campaign_id, Bytes(tree.root))
@@ -0,0 +1,63 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, UInt64
+from algopy.arc4 import Address
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.scholarship.contract import Certificate
+
+START = 1_000_000
+WEEK = 7 * 24 * 60 * 60
+YEAR = 365 * 24 * 60 * 60
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.ledger.patch_global_fields(latest_timestamp=START)
+        yield ctx
+
+
+def lock(
+    context: AlgopyTestContext, contract: Certificate, amount: int, duration: int
+) -> Account:
+    contract.asa = context.any.asset(total=2**64 - 1)
+    user = context.default_sender
+    payment = context.any.txn.asset_transfer(
+        sender=user,
+        asset_sender=user,
+        asset_receiver=context.ledger.get_app(contract).address,
+        xfer_asset=contract.asa,
+        asset_amount=amount,
+    )
+    contract.lock_token(Address(user), UInt64(amount), UInt64(duration), payment)
+    return user
+
+
+def test_balance_decays_until_the_lock_ends(context: AlgopyTestContext) -> None:
+    contract = Certificate()
+    user = lock(context, contract, 10**6, 2 * WEEK)
+
+    assert contract.balance_of(Address(user)) == 10**6 * 2 * WEEK // YEAR
+    context.ledger.patch_global_fields(latest_timestamp=START + WEEK)
+    assert contract.balance_of(Address(user)) == 10**6 * WEEK // YEAR
+
+    # the end of the lock follows from the stored start time and duration
+    contract.extend_lock(UInt64(3 * WEEK))
+    assert contract.balance_of(Address(user)) == 10**6 * 2 * WEEK // YEAR
+    context.ledger.patch_global_fields(latest_timestamp=START + 3 * WEEK + 1)
+    assert contract.balance_of(Address(user)) == 0
+
+
+def test_amounts_beyond_64_bits_are_divided_as_128_bits(
+    context: AlgopyTestContext,
+) -> None:
+    contract = Certificate()
+    # the amount times the duration does not fit in 64 bits
+    amount = 2**62
+    user = lock(context, contract, amount, YEAR)
+
+    assert contract.balance_of(Address(user)) == amount
+    context.ledger.patch_global_fields(latest_timestamp=START + YEAR // 2)
+    assert contract.balance_of(Address(user)) == amount * (YEAR - YEAR // 2) // YEAR
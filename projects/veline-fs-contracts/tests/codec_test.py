@@ -0,0 +1,152 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from algosdk import abi, account
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.batch import box_name
+from smart_contracts.campaign import codec as campaign_codec
+from smart_contracts.campaign.async_client import AsyncCampaignClient
+from smart_contracts.scholarship import codec as scholarship_codec
+from smart_contracts.scholarship.async_client import AsyncCertificateClient
+from tests.local_algod import LocalAlgod
+
+APP_ID = 1001
+CERTIFICATE_SPEC = json.loads(
+    Path("smart_contracts/artifacts/scholarship/Certificate.arc32.json").read_text()
+)
+PROFILE_LOCK_USER = (
+    "profile_lock_user(address)(address,uint64,uint64,uint64,uint64,uint64,uint64)"
+)
+# as the contract returns it, so the test fails if the contract's layout changes
+VOTING_ESCROW_USER = abi.ABIType.from_string(
+    next(
+        method["returns"]["type"]
+        for method in CERTIFICATE_SPEC["contract"]["methods"]
+        if method["name"] == "profile_lock_user"
+    )
+)
+SCHOLARSHIP = abi.ABIType.from_string("(uint64,uint64,uint64,uint64,address)")
+ELIGIBLE_DATA = abi.ABIType.from_string("(byte[],byte[],address,uint64)")
+
+
+def new_address() -> str:
+    return account.generate_account()[1]
+
+
+def test_fields_match_the_app_spec() -> None:
+    struct_hint = CERTIFICATE_SPEC["hints"][PROFILE_LOCK_USER]["structs"]["output"]
+
+    assert struct_hint["name"] == "VotingEscrowUser"
+    assert [name for name, _ in struct_hint["elements"]] == list(
+        scholarship_codec.VotingEscrowUser._fields
+    )
+    assert scholarship_codec.VOTING_ESCROW_USER.size == VOTING_ESCROW_USER.byte_len()
+
+
+def test_voting_escrow_user() -> None:
+    address = new_address()
+    fields = [address, 100, 2, 3, 4, 5, 2**64 - 1]
+
+    user = scholarship_codec.decode_voting_escrow_user(
+        VOTING_ESCROW_USER.encode(fields)
+    )
+
+    assert user.address == address
+    assert list(user[1:]) == fields[1:]
+    assert user.lock_end_time == 5
+
+
+def test_scholarship() -> None:
+    creator = new_address()
+
+    scholarship = scholarship_codec.decode_scholarship(
+        SCHOLARSHIP.encode([1, 2, 3, 4, creator])
+    )
+
+    assert scholarship[:4] == (1, 2, 3, 4)
+    assert scholarship.creator_address == creator
+
+
+def test_concatenated_voting_escrow_users() -> None:
+    addresses = [new_address() for _ in range(3)]
+    values = [
+        VOTING_ESCROW_USER.encode([address, index, index, 10, 0, 0, 0])
+        for index, address in enumerate(addresses)
+    ]
+
+    users = list(scholarship_codec.iter_voting_escrow_users(b"".join(values)))
+
+    assert [user.address for user in users] == addresses
+    assert [user.lock_end_time for user in users] == [10, 11, 12]
+
+
+def test_snapshot_of_many_users_decodes() -> None:
+    value = VOTING_ESCROW_USER.encode([new_address(), 1, 2, 3, 4, 5, 6])
+
+    users = scholarship_codec.iter_voting_escrow_users(memoryview(value * 200_000))
+
+    assert sum(user.amount_locked for user in users) == 200_000
+
+
+@pytest.mark.parametrize("depth", [0, 1, 20])
+def test_eligible_data(depth: int) -> None:
+    owner = new_address()
+    proof = bytes(range(32)) * depth
+    root = bytes(range(100, 132))
+
+    data = campaign_codec.decode_eligible_data(
+        ELIGIBLE_DATA.encode([proof, root, owner, 99])
+    )
+
+    assert data.proof == proof
+    assert data.root == root
+    assert data.owner_address == owner
+    assert data.expired_at == 99
+
+
+def test_concatenated_eligible_data() -> None:
+    owners = [new_address() for _ in range(4)]
+    values = [
+        ELIGIBLE_DATA.encode([bytes([index]) * 32 * index, bytes(32), owner, index])
+        for index, owner in enumerate(owners)
+    ]
+
+    campaigns = list(campaign_codec.iter_eligible_data(b"".join(values)))
+
+    assert [bytes(campaign.data) for campaign in campaigns] == values
+    assert [campaign.owner_address for campaign in campaigns] == owners
+    assert [len(campaign.proof) for campaign in campaigns] == [0, 32, 64, 96]
+
+
+def test_boxes_are_read_by_the_async_clients() -> None:
+    local_algod = LocalAlgod()
+    user, owner = new_address(), new_address()
+    local_algod.boxes[(APP_ID, box_name(b"voting_escrow_user", user))] = (
+        VOTING_ESCROW_USER.encode([user, 5, 4, 5, 0, 0, 0])
+    )
+    local_algod.boxes[(APP_ID, box_name(b"campaign", 2))] = ELIGIBLE_DATA.encode(
+        [b"", bytes(32), owner, 60]
+    )
+
+    async def run() -> (
+        tuple[scholarship_codec.VotingEscrowUser, campaign_codec.EligibleData]
+    ):
+        async with AsyncAlgodClient(
+            "a" * 64, "http://localhost:4001", transport=local_algod.transport
+        ) as algod:
+            return (
+                await AsyncCertificateClient(
+                    algod, app_id=APP_ID
+                ).get_voting_escrow_user(user),
+                await AsyncCampaignClient(algod, app_id=APP_ID).get_campaign(2),
+            )
+
+    lock, campaign = asyncio.run(run())
+
+    assert lock.address == user
+    assert lock.lock_end_time == 9
+    assert campaign.owner_address == owner
+    assert campaign.expired_at == 60
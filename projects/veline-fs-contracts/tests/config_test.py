@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.config import discover_contracts
+
+DEPLOY_MODULE = "smart_contracts.campaign.deploy_config"
+
+
+def test_contracts_are_listed_without_imports(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delitem(sys.modules, DEPLOY_MODULE, raising=False)
+
+    contracts = discover_contracts()
+
+    assert [contract.name for contract in contracts] == ["campaign", "scholarship"]
+    assert DEPLOY_MODULE not in sys.modules
+    assert contracts[0].deploy is sys.modules[DEPLOY_MODULE].deploy
+
+
+def test_named_contracts_only(tmp_path: Path) -> None:
+    (tmp_path / "token").mkdir()
+    (tmp_path / "token" / "contract.py").write_text("")
+    # an unrelated folder that would fail discovery is never looked at
+    (tmp_path / "broken").mkdir()
+
+    assert [contract.path for contract in discover_contracts(["token"], tmp_path)] == [
+        tmp_path / "token" / "contract.py"
+    ]
+    with pytest.raises(Exception, match="Contract not found"):
+        discover_contracts(["broken"], tmp_path)
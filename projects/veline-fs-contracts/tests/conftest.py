@@ -1,12 +1,13 @@
 import pytest
-from algokit_utils import (
-    get_algod_client,
-    get_default_localnet_config,
-    get_indexer_client,
-)
+from algokit_utils import get_default_localnet_config
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
+from smart_contracts._helpers.transport import (
+    get_pooled_algod_client,
+    get_pooled_indexer_client,
+)
+
 # Uncomment if you want to load network specific or generic .env file
 # @pytest.fixture(autouse=True, scope="session")
 # def environment_fixture() -> None:
@@ -17,10 +18,10 @@ from algosdk.v2client.indexer import IndexerClient
 @pytest.fixture(scope="session")
 def algod_client() -> AlgodClient:
     # by default we are using localnet algod
-    client = get_algod_client(get_default_localnet_config("algod"))
+    client = get_pooled_algod_client(get_default_localnet_config("algod"))
     return client
 
 
 @pytest.fixture(scope="session")
 def indexer_client() -> IndexerClient:
-    return get_indexer_client(get_default_localnet_config("indexer"))
+    return get_pooled_indexer_client(get_default_localnet_config("indexer"))
@@ -0,0 +1,92 @@
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from algokit_utils import Account
+from algosdk import account
+
+from smart_contracts._helpers import deploy as deploy_module
+from smart_contracts._helpers.deploy import deploy_all
+
+
+def new_account() -> Account:
+    private_key, address = account.generate_account()  # type: ignore[no-untyped-call]
+    return Account(private_key=private_key, address=address)
+
+
+def test_contracts_are_deployed_concurrently_by_one_deployer(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    deployer = new_account()
+    accounts: list[str] = []
+    funding: list[int] = []
+    recorded: list[int] = []
+
+    monkeypatch.setattr(deploy_module, "get_pooled_algod_client", lambda session: None)
+    monkeypatch.setattr(
+        deploy_module, "get_pooled_indexer_client", lambda session: None
+    )
+    monkeypatch.setattr(deploy_module.CachingAlgodClient, "wrap", lambda client: None)
+    monkeypatch.setattr(
+        deploy_module,
+        "is_unchanged",
+        lambda algod_client, app_spec: app_spec.contract.name == "Unchanged",
+    )
+
+    def get_account(algod_client: None, name: str, fund_with_algos: int) -> Account:
+        accounts.append(name)
+        return deployer
+
+    def ensure_funded(algod_client: None, parameters: Any) -> None:
+        funding.append(parameters.min_spending_balance_micro_algos)
+
+    monkeypatch.setattr(deploy_module, "get_account", get_account)
+    monkeypatch.setattr(deploy_module, "ensure_funded", ensure_funded)
+    monkeypatch.setattr(
+        deploy_module,
+        "record_deployment",
+        lambda algod_client, app_spec, app: recorded.append(app.app_id),
+    )
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class Response:
+        def __init__(self, app_id: int):
+            self.app = type("App", (), {"app_id": app_id})
+
+    def deploy_callback(app_id: int) -> Any:
+        def deploy(
+            algod_client: None, indexer_client: None, app_spec: Any, deployer: Account
+        ) -> Response:
+            # only returns once both contracts are being deployed
+            barrier.wait()
+            return Response(app_id)
+
+        return deploy
+
+    app_spec_paths = {}
+    for name in ("Campaign", "Certificate", "Unchanged"):
+        app_spec_paths[name] = tmp_path / f"{name}.arc32.json"
+        app_spec_paths[name].write_text(name)
+    # app specs named after the content of their file
+    monkeypatch.setattr(
+        deploy_module.ApplicationSpecification,
+        "from_json",
+        lambda text: type(
+            "AppSpec", (), {"contract": type("Contract", (), {"name": text})}
+        ),
+    )
+
+    deploy_all(
+        {
+            "campaign": (app_spec_paths["Campaign"], deploy_callback(1)),
+            "scholarship": (app_spec_paths["Certificate"], deploy_callback(2)),
+            "unchanged": (app_spec_paths["Unchanged"], deploy_callback(3)),
+        },
+        jobs=3,
+    )
+
+    assert accounts == ["DEPLOYER"]
+    assert funding == [2 * 2_000_000]
+    assert sorted(recorded) == [1, 2]
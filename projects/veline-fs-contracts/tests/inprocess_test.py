@@ -0,0 +1,153 @@
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smart_contracts._helpers import build as build_module
+from smart_contracts._helpers import inprocess
+from smart_contracts.artifacts.campaign import campaign_client
+
+CONTRACT_PATH = Path("smart_contracts/campaign/contract.py")
+APPROVAL_TEAL = Path("smart_contracts/artifacts/campaign/Campaign.approval.teal")
+ROUTER_CALL = "    callsub __puya_arc4_router__\n"
+
+
+class Options:
+    def __init__(self, paths: list[Path], out_dir: Path, **options: Any):
+        self.paths = paths
+        self.out_dir = out_dir
+        self.options = options
+
+
+@pytest.fixture()
+def compiled(monkeypatch: pytest.MonkeyPatch) -> list[Options]:
+    """Replaces puyapy and the client generator with fakes that write artifacts."""
+    compiled = []
+
+    def compile_to_teal(options: Options) -> None:
+        compiled.append(options)
+        (options.out_dir / "Campaign.arc32.json").write_text(
+            campaign_client._APP_SPEC_JSON
+        )
+        teal = APPROVAL_TEAL.read_text()
+        if options.options.get("optimization_level") == 0:
+            # two more opcodes on every call
+            teal = teal.replace(ROUTER_CALL, "    int 0\n    pop\n" + ROUTER_CALL)
+        (options.out_dir / "Campaign.approval.teal").write_text(teal)
+
+    def generate_client(app_spec_path: Path, output_path: Path) -> None:
+        output_path.write_text(
+            "import algokit_utils\n\n"
+            f'_APP_SPEC_JSON = r"""{app_spec_path.read_text()}"""\n'
+            "APP_SPEC = algokit_utils.ApplicationSpecification.from_json("
+            "_APP_SPEC_JSON)\n"
+        )
+
+    def run(*args: object, **kwargs: object) -> None:
+        raise AssertionError("the CLI should not run")
+
+    monkeypatch.setattr(
+        inprocess,
+        "_load",
+        lambda: inprocess._Backend(compile_to_teal, Options, generate_client),
+    )
+    monkeypatch.setattr(subprocess, "Popen", run)
+    return compiled
+
+
+def test_flags_are_translated_to_options() -> None:
+    assert inprocess.compiler_options(
+        ["--output-arc32", "--debug-level=0", "--optimization-level=2"]
+    ) == {"output_arc32": True, "debug_level": 0, "optimization_level": 2}
+    with pytest.raises(inprocess.UnsupportedFlag):
+        inprocess.compiler_options(["--target-avm-version=10"])
+
+
+def test_client_names_match_algokit() -> None:
+    assert inprocess.snake_case("Campaign") == "campaign"
+    assert inprocess.snake_case("VotingEscrow") == "voting_escrow"
+
+
+def test_contract_is_built_in_process(tmp_path: Path, compiled: list[Options]) -> None:
+    app_spec_path = build_module.build(tmp_path, CONTRACT_PATH, backend="in-process")
+
+    assert app_spec_path == tmp_path / "Campaign.arc32.json"
+    assert compiled[0].options == {
+        "output_arc32": True,
+        "optimization_level": 1,
+        "debug_level": 0,
+    }
+    client_source = (tmp_path / "campaign_client.py").read_text()
+    # written as generated
+    assert client_source.endswith(
+        "APP_SPEC = algokit_utils.ApplicationSpecification.from_json(_APP_SPEC_JSON)\n"
+    )
+    assert json.loads((tmp_path / "build_manifest.json").read_text())["outputs"]
+
+
+def test_each_profile_is_measured(tmp_path: Path, compiled: list[Options]) -> None:
+    build_module.build(tmp_path, CONTRACT_PATH, profile="dev")
+    build_module.build(tmp_path, CONTRACT_PATH)
+
+    manifest = json.loads((tmp_path / "build_manifest.json").read_text())
+    assert manifest["profile"] == "release"
+    dev = manifest["profiles"]["dev"]["Campaign"]
+    release = manifest["profiles"]["release"]["Campaign"]
+    assert dev["program_size"] > release["program_size"]
+    assert all(
+        cost == release["method_costs"][signature] + 2
+        for signature, cost in dev["method_costs"].items()
+    )
+    assert compiled[0].options["debug_level"] == 1
+    with pytest.raises(Exception, match="Unknown build profile"):
+        build_module.build(tmp_path, CONTRACT_PATH, profile="fast")
+
+
+def test_cli_is_used_when_the_api_differs(
+    tmp_path: Path, compiled: list[Options], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cli_builds = []
+
+    def incompatible_compile(options: Any) -> None:
+        raise TypeError("unexpected keyword argument 'out_dir'")
+
+    def compile_with_cli(
+        contract_path: Path, output_dir: Path, flags: list[str]
+    ) -> None:
+        cli_builds.append(contract_path)
+        raise Exception("stop here")
+
+    backend = inprocess._load()
+    monkeypatch.setattr(
+        inprocess,
+        "_load",
+        lambda: backend._replace(compile_to_teal=incompatible_compile),  # type: ignore[union-attr]
+    )
+    monkeypatch.setattr(build_module, "_compile_with_cli", compile_with_cli)
+
+    with pytest.raises(Exception, match="stop here"):
+        build_module.build(tmp_path, CONTRACT_PATH)
+    assert cli_builds == [CONTRACT_PATH]
+    with pytest.raises(TypeError):
+        build_module.build(tmp_path, CONTRACT_PATH, backend="in-process")
+
+
+def test_compile_errors_are_raised(
+    tmp_path: Path, compiled: list[Options], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_compile(options: Any) -> None:
+        # as puyapy does once it has logged the errors
+        raise SystemExit(1)
+
+    backend = inprocess._load()
+    monkeypatch.setattr(
+        inprocess,
+        "_load",
+        lambda: backend._replace(compile_to_teal=failing_compile),  # type: ignore[union-attr]
+    )
+
+    # an error in the contract, so not retried with the CLI
+    with pytest.raises(Exception, match="Could not build contract"):
+        build_module.build(tmp_path, CONTRACT_PATH)
@@ -0,0 +1,76 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.artifacts.campaign import campaign_client
+from smart_contracts.artifacts.scholarship import certificate_client
+from smart_contracts.campaign import client as campaign
+from smart_contracts.scholarship import client as scholarship
+
+
+@pytest.mark.parametrize("module", ["campaign.client", "scholarship.client"])
+def test_importing_a_client_does_not_import_algokit_utils(module: str) -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, smart_contracts.{module}; "
+            "print(sorted({name.split('.')[0] for name in sys.modules}))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+    )
+
+    assert "algokit_utils" not in result.stdout
+    assert "algosdk" not in result.stdout
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "campaign.async_client",
+        "campaign.deploy_config",
+        "scholarship.async_client",
+        "scholarship.deploy_config",
+    ],
+)
+def test_importing_a_user_of_a_client_does_not_parse_the_app_spec(module: str) -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, smart_contracts.{module}; "
+            "print(sorted(name for name in sys.modules if '.artifacts.' in name))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+    )
+
+    assert "_client" not in result.stdout
+
+
+def test_names_are_read_from_the_generated_client() -> None:
+    assert campaign.APP_SPEC is campaign_client.APP_SPEC
+    assert campaign.CampaignClient is campaign_client.CampaignClient
+    assert scholarship.CertificateClient is certificate_client.CertificateClient
+    with pytest.raises(AttributeError):
+        campaign.OTHER  # noqa: B018
+
+
+def test_generated_clients_are_not_modified() -> None:
+    for module in (campaign_client, certificate_client):
+        source = Path(module.__file__).read_text()  # type: ignore[arg-type]
+
+        assert (
+            "APP_SPEC = algokit_utils.ApplicationSpecification.from_json("
+            "_APP_SPEC_JSON)" in source
+        )
+        assert "on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.Fail" in (
+            source
+        )
@@ -0,0 +1,254 @@
+"""In-process algod stand-in for exercising the async clients without a LocalNet.
+
+It serves the algod REST endpoints the clients use through an `httpx.MockTransport`:
+transactions are accepted into a pending pool and confirmed when a block is produced,
+which happens whenever a client waits for the next round. App calls are not
+evaluated; a test registers the ABI return value of each method it calls.
+"""
+
+import asyncio
+import base64
+import re
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import msgpack
+from algosdk import abi, encoding, transaction
+from algosdk.atomic_transaction_composer import ABI_RETURN_HASH
+
+GENESIS_HASH = base64.b64encode(bytes(32)).decode()
+MethodHandler = Callable[[transaction.ApplicationCallTxn], bytes | None]
+
+
+class LocalAlgod:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        block_time: float = 0.0,
+        pool_size: int | None = None,
+    ):
+        self.latency = latency
+        self.block_time = block_time
+        self.pool_size = pool_size
+        self.round = 1
+        self.blocks: dict[int, list[str]] = {}
+        self.simulated: list[dict[str, Any]] = []
+        self.pending: dict[str, transaction.SignedTransaction] = {}
+        self.confirmed: dict[str, dict[str, Any]] = {}
+        self.global_state: dict[int, dict[bytes, bytes | int]] = {}
+        self.boxes: dict[tuple[int, bytes], bytes] = {}
+        self.requests = 0
+        self.requests_by_path: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._method_handlers: dict[bytes, MethodHandler] = {}
+        self._block_lock = asyncio.Lock()
+        self._routes: list[tuple[str, re.Pattern[str], Callable[..., Any]]] = [
+            ("GET", re.compile(r"/v2/status"), self._status),
+            (
+                "GET",
+                re.compile(r"/v2/status/wait-for-block-after/(\d+)"),
+                self._status_after_block,
+            ),
+            ("GET", re.compile(r"/v2/blocks/(\d+)/txids"), self._block_txids),
+            ("GET", re.compile(r"/v2/transactions/params"), self._params),
+            ("POST", re.compile(r"/v2/transactions"), self._send),
+            ("GET", re.compile(r"/v2/transactions/pending/(\w+)"), self._pending),
+            ("POST", re.compile(r"/v2/transactions/simulate"), self._simulate),
+            ("GET", re.compile(r"/v2/applications/(\d+)"), self._application),
+            ("GET", re.compile(r"/v2/applications/(\d+)/box"), self._box),
+            ("GET", re.compile(r"/v2/applications/(\d+)/boxes"), self._boxes),
+        ]
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle)
+
+    def on_method(self, signature: str, handler: MethodHandler) -> None:
+        """Makes calls to `signature` log `handler(txn)` as their ABI return value."""
+        self._method_handlers[abi.Method.from_signature(signature).get_selector()] = (
+            handler
+        )
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.requests_by_path[request.url.path] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            for method, pattern, route in self._routes:
+                match = pattern.fullmatch(request.url.path)
+                if request.method == method and match:
+                    return await route(request, *match.groups())
+            return _error(404, f"{request.method} {request.url.path} not found")
+        finally:
+            self.in_flight -= 1
+
+    async def _status(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"last-round": self.round})
+
+    async def _status_after_block(
+        self, request: httpx.Request, round_num: str
+    ) -> httpx.Response:
+        while self.round <= int(round_num):
+            async with self._block_lock:
+                if self.round <= int(round_num):
+                    await asyncio.sleep(self.block_time)
+                    self._produce_block()
+        return httpx.Response(200, json={"last-round": self.round})
+
+    def _produce_block(self) -> None:
+        self.round += 1
+        self.blocks[self.round] = list(self.pending)
+        for txid, signed_txn in self.pending.items():
+            self.confirmed[txid] = {
+                "confirmed-round": self.round,
+                "pool-error": "",
+                **self._eval(signed_txn.transaction),
+            }
+        self.pending.clear()
+
+    def _eval(self, txn: transaction.Transaction) -> dict[str, Any]:
+        if not isinstance(txn, transaction.ApplicationCallTxn) or not txn.app_args:
+            return {}
+        handler = self._method_handlers.get(txn.app_args[0])
+        value = handler(txn) if handler else None
+        if value is None:
+            return {}
+        return {"logs": [base64.b64encode(ABI_RETURN_HASH + value).decode()]}
+
+    async def _block_txids(
+        self, request: httpx.Request, round_num: str
+    ) -> httpx.Response:
+        if int(round_num) not in self.blocks:
+            return _error(404, "block not found")
+        return httpx.Response(200, json={"blockTxids": self.blocks[int(round_num)]})
+
+    async def _params(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "consensus-version": "future",
+                "fee": 0,
+                "genesis-hash": GENESIS_HASH,
+                "genesis-id": "local-algod",
+                "last-round": self.round,
+                "min-fee": 1000,
+            },
+        )
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        signed_txns = _decode_signed_txns(request.content)
+        if self.pool_size is not None and (
+            len(self.pending) + len(signed_txns) > self.pool_size
+        ):
+            return _error(400, "TransactionPool.Remember: transaction pool is full")
+        for signed_txn in signed_txns:
+            txn = signed_txn.transaction
+            if txn.last_valid_round <= self.round:
+                return _error(
+                    400,
+                    f"TransactionPool.Remember: txn dead: round {self.round + 1} "
+                    f"outside of {txn.first_valid_round}--{txn.last_valid_round}",
+                )
+        for signed_txn in signed_txns:
+            self.pending[signed_txn.get_txid()] = signed_txn
+        return httpx.Response(200, json={"txId": signed_txns[0].get_txid()})
+
+    async def _pending(self, request: httpx.Request, txid: str) -> httpx.Response:
+        if txid in self.confirmed:
+            return httpx.Response(200, json=self.confirmed[txid])
+        if txid in self.pending:
+            return httpx.Response(200, json={"pool-error": ""})
+        return _error(404, "txn does not exist")
+
+    async def _simulate(self, request: httpx.Request) -> httpx.Response:
+        body = msgpack.unpackb(request.content, raw=False, strict_map_key=False)
+        self.simulated.append(body)
+        txn_groups = []
+        for group in body["txn-groups"]:
+            txns = [encoding.msgpack_decode(_b64_pack(txn)) for txn in group["txns"]]
+            txn_group: dict[str, Any] = {"txn-results": []}
+            for index, txn in enumerate(txns):
+                try:
+                    # Unsigned transactions decode without their signed wrapper
+                    result = self._eval(getattr(txn, "transaction", txn))
+                except Exception as ex:
+                    # Like algod, report where the group failed and stop evaluating
+                    txn_group["failure-message"] = f"logic eval error: {ex}"
+                    txn_group["failed-at"] = [index]
+                    break
+                txn_group["txn-results"].append({"txn-result": result})
+            txn_groups.append(txn_group)
+        return httpx.Response(
+            200, json={"version": 2, "last-round": self.round, "txn-groups": txn_groups}
+        )
+
+    async def _application(self, request: httpx.Request, app_id: str) -> httpx.Response:
+        if int(app_id) not in self.global_state:
+            return _error(404, "application does not exist")
+        global_state = [
+            {
+                "key": base64.b64encode(key).decode(),
+                "value": (
+                    {"type": 1, "bytes": base64.b64encode(value).decode(), "uint": 0}
+                    if isinstance(value, bytes)
+                    else {"type": 2, "bytes": "", "uint": value}
+                ),
+            }
+            for key, value in self.global_state[int(app_id)].items()
+        ]
+        return httpx.Response(
+            200, json={"id": int(app_id), "params": {"global-state": global_state}}
+        )
+
+    async def _box(self, request: httpx.Request, app_id: str) -> httpx.Response:
+        name = base64.b64decode(request.url.params["name"].removeprefix("b64:"))
+        if (int(app_id), name) not in self.boxes:
+            return _error(404, "box not found")
+        return httpx.Response(
+            200,
+            json={
+                "round": self.round,
+                "name": base64.b64encode(name).decode(),
+                "value": base64.b64encode(self.boxes[(int(app_id), name)]).decode(),
+            },
+        )
+
+    async def _boxes(self, request: httpx.Request, app_id: str) -> httpx.Response:
+        # Pages through the names in order as algod does, from the `next` name
+        names = sorted(
+            name for box_app_id, name in self.boxes if box_app_id == int(app_id)
+        )
+        if "next" in request.url.params:
+            start = base64.b64decode(request.url.params["next"].removeprefix("b64:"))
+            names = [name for name in names if name >= start]
+        page_size = int(request.url.params.get("max", 0)) or len(names)
+        page = {
+            "round": self.round,
+            "boxes": [
+                {"name": base64.b64encode(name).decode()} for name in names[:page_size]
+            ],
+        }
+        if len(names) > page_size:
+            page["next-token"] = "b64:" + base64.b64encode(names[page_size]).decode()
+        return httpx.Response(200, json=page)
+
+
+def _b64_pack(value: Any) -> str:
+    return base64.b64encode(msgpack.packb(value, use_bin_type=True)).decode()
+
+
+def _decode_signed_txns(content: bytes) -> list[transaction.SignedTransaction]:
+    """Splits a body of concatenated msgpack signed transactions, as algod accepts."""
+    unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    unpacker.feed(content)
+    return [encoding.msgpack_decode(_b64_pack(txn)) for txn in unpacker]
+
+
+def _error(status_code: int, message: str) -> httpx.Response:
+    return httpx.Response(status_code, json={"message": message})
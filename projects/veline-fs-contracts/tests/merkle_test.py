@@ -0,0 +1,207 @@
+import hashlib
+import random
+from pathlib import Path
+
+import pytest
+from algosdk.encoding import decode_address as algosdk_decode_address
+from algosdk.encoding import encode_address
+
+from smart_contracts.campaign.merkle import builder, incremental
+from smart_contracts.campaign.merkle import (
+    IncrementalTree,
+    MerkleTree,
+    ProofStore,
+    append_leaves,
+    build_tree,
+    build_tree_from_file,
+    decode_address,
+    encode_leaf_data,
+    hash_leaf,
+    hash_level,
+    verify_proof,
+)
+
+# Tree used by tests/campaign_test.py, built over sha256(address) leaves
+fixture_addresses = [
+    "OPY7XNB5LVMECF3PHJGQV2U33LZPM5FBUXA3JJPHANAG5B7GEYUPZJVYRE",
+    "ABQHZLNGGPWWZVA5SOQO3HBEECVJSE3OHYLKACOTC7TC4BS52ZHREPF7QY",
+    "WJUXYO3WMOB4F33MFUT34Y6SYMO6OZTXGSS4TPDNXK6ZRUIZXLIUWHR7GQ",
+    "5IACOPMTVP4GYBXUKFV5VXHSK4GH23FC5LG3TP5MQWFH2XGEXNEPHCYTSQ",
+    "WARN666I6ITOTBIFMYOOYDAT2JA63QQO2Y6MJCNER5YAF4L6MQO7W6SCAM",
+    "YEA5FH27HDXE4BKXRSXFRWU44KSQO5OAGKSS2RX27W3OTS3D3FIITODX5M",
+]
+fixture_proof = (
+    "579144fcf900fdab77e9e8eadda0ce337d2f0c401f00188590c14936e91c0798"
+    "60dc27adf601053048b663cc7740145e287652ff455721e0af9e488c7320b438"
+    "db4764cb9399b89d8818f94ae757f6f233b4b32f74db25290c640cdf38dda10c"
+)
+fixture_root = "578743d82a932e42278a5a166fd0d20c9bff0e15ef38232b2cc503a7856e8fec"
+
+
+def random_rows(count: int, seed: int = 0) -> list[tuple[str, int]]:
+    rng = random.Random(seed)
+    return [
+        (encode_address(rng.randbytes(32)), rng.randrange(1, 10**9))
+        for _ in range(count)
+    ]
+
+
+def test_hash_level_matches_fixture_tree() -> None:
+    level = b"".join(hashlib.sha256(a.encode()).digest() for a in fixture_addresses)
+    while len(level) > 32:
+        level = hash_level(level)
+    assert level.hex() == fixture_root
+    leaf = hashlib.sha256(fixture_addresses[0].encode()).digest()
+    assert verify_proof(bytes.fromhex(fixture_proof), level, leaf)
+
+
+def test_leaf_data_matches_check_eligible_encoding() -> None:
+    address, amount = random_rows(1)[0]
+    leaf_data = encode_leaf_data(address, amount)
+    assert len(leaf_data) == 40
+    assert leaf_data[32:] == amount.to_bytes(8, "big")
+    assert encode_address(leaf_data[:32]) == address
+
+
+@pytest.mark.parametrize("count", [1, 2, 7, 64, 1000])
+def test_build_tree_proofs_verify(tmp_path: Path, count: int) -> None:
+    rows = random_rows(count)
+    tree = build_tree(iter(rows), tmp_path)
+
+    assert tree.leaf_count == count
+    assert MerkleTree(tmp_path).root == tree.root
+    for index, (address, amount) in enumerate(rows):
+        leaf_data = tree.leaf_data(index)
+        assert leaf_data == encode_leaf_data(address, amount)
+        assert verify_proof(tree.proof(index), tree.root, hash_leaf(leaf_data))
+
+
+def test_build_tree_from_csv(tmp_path: Path) -> None:
+    rows = random_rows(10)
+    csv_path = tmp_path / "airdrop.csv"
+    csv_path.write_text(
+        "amount,address\n" + "".join(f"{amount},{addr}\n" for addr, amount in rows)
+    )
+
+    tree = build_tree_from_file(csv_path, tmp_path / "tree")
+
+    assert tree.root == build_tree(iter(rows), tmp_path / "expected").root
+
+
+def test_build_tree_rejects_empty_list(tmp_path: Path) -> None:
+    with pytest.raises(Exception, match="empty"):
+        build_tree(iter([]), tmp_path)
+
+
+def test_decode_address_matches_algosdk() -> None:
+    for address, _ in random_rows(100):
+        assert decode_address(address) == algosdk_decode_address(address)
+    with pytest.raises(Exception, match="checksum"):
+        decode_address(fixture_addresses[0][:-1] + "A")
+
+
+def test_parallel_build_matches_sequential(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(builder, "MIN_SUBTREE_HEIGHT", 2)
+    monkeypatch.setattr(builder, "CHUNK_NODES", 4)
+    rows = random_rows(203)
+    sequential = build_tree(iter(rows), tmp_path / "sequential")
+
+    parallel = build_tree(iter(rows), tmp_path / "parallel", workers=2)
+
+    assert parallel.root == sequential.root
+    assert (tmp_path / "parallel" / "tree.bin").read_bytes() == (
+        tmp_path / "sequential" / "tree.bin"
+    ).read_bytes()
+
+
+def test_proof_store_lookup(tmp_path: Path) -> None:
+    rows = random_rows(500)
+    tree = build_tree(iter(rows), tmp_path)
+
+    with ProofStore(tmp_path) as store:
+        for index, (address, amount) in enumerate(rows):
+            claim = store.lookup(address)
+            assert claim is not None
+            assert claim.leaf_index == index
+            assert claim.amount == amount
+            assert claim.leaf_data == encode_leaf_data(address, amount)
+            assert claim.proof == tree.proof(index)
+            assert verify_proof(claim.proof, store.root, hash_leaf(claim.leaf_data))
+        assert store.lookup(random_rows(1, seed=1)[0][0]) is None
+
+
+def test_build_tree_rejects_duplicate_addresses(tmp_path: Path) -> None:
+    rows = random_rows(10)
+    with pytest.raises(Exception, match="duplicate address"):
+        build_tree(iter(rows + [(rows[3][0], 1)]), tmp_path)
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 8, 33])
+def test_incremental_tree_matches_full_build(tmp_path: Path, count: int) -> None:
+    rows = random_rows(count)
+    incremental = IncrementalTree()
+    for address, amount in rows:
+        incremental.append(hash_leaf(encode_leaf_data(address, amount)))
+
+    assert incremental.root == build_tree(iter(rows), tmp_path).root
+    assert IncrementalTree.from_tree(tmp_path).frontier == incremental.frontier
+
+
+@pytest.mark.parametrize(("initial", "added"), [(1, 1), (6, 10), (64, 1), (100, 157)])
+def test_append_leaves_matches_full_build(
+    tmp_path: Path, initial: int, added: int
+) -> None:
+    rows = random_rows(initial + added)
+    build_tree(iter(rows[:initial]), tmp_path / "appended")
+
+    appended = append_leaves(tmp_path / "appended", iter(rows[initial:]))
+
+    expected = build_tree(iter(rows), tmp_path / "expected")
+    assert appended.root == expected.root
+    for name in ("tree.bin", "leaves.bin", "index.bin", "frontier.bin"):
+        assert (tmp_path / "appended" / name).read_bytes() == (
+            tmp_path / "expected" / name
+        ).read_bytes()
+
+
+def test_append_leaves_rejects_duplicates_without_changing_the_tree(
+    tmp_path: Path,
+) -> None:
+    rows = random_rows(7)
+    build_tree(iter(rows[:5]), tmp_path)
+    files = {path.name: path.read_bytes() for path in tmp_path.iterdir()}
+
+    for duplicate in ([rows[5], rows[2]], [rows[5], rows[6], rows[5]]):
+        with pytest.raises(Exception, match="duplicate address"):
+            append_leaves(tmp_path, iter(duplicate))
+
+        assert {path.name: path.read_bytes() for path in tmp_path.iterdir()} == files
+    assert append_leaves(tmp_path, iter(rows[5:])).leaf_count == 7
+
+
+def test_append_leaves_after_a_failed_append(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rows = random_rows(12)
+    build_tree(iter(rows[:5]), tmp_path / "appended")
+    write_index = incremental.write_index
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise Exception("Disk full")
+
+    # the leaves are already written when indexing fails
+    monkeypatch.setattr(incremental, "write_index", fail)
+    with pytest.raises(Exception, match="Disk full"):
+        append_leaves(tmp_path / "appended", iter(rows[5:9]))
+    monkeypatch.setattr(incremental, "write_index", write_index)
+
+    appended = append_leaves(tmp_path / "appended", iter(rows[5:]))
+
+    expected = build_tree(iter(rows), tmp_path / "expected")
+    assert appended.root == expected.root
+    for name in ("tree.bin", "leaves.bin", "index.bin", "frontier.bin"):
+        assert (tmp_path / "appended" / name).read_bytes() == (
+            tmp_path / "expected" / name
+        ).read_bytes()
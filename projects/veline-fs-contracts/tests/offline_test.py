@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from algokit_utils import Account
+from algosdk import account
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.offline import (
+    ReplayResult,
+    iter_signed_groups,
+    offline_params,
+    presign,
+    replay,
+)
+from smart_contracts.artifacts.campaign.campaign_client import APP_SPEC
+from smart_contracts.campaign.boxes import BOX_REFERENCES
+from tests.local_algod import GENESIS_HASH, LocalAlgod
+
+APP_ID = 1001
+
+
+@pytest.fixture()
+def sender() -> Account:
+    private_key, address = account.generate_account()
+    return Account(private_key=private_key, address=address)
+
+
+def claims(sender: Account, count: int) -> Iterator[tuple[str, dict[str, Any]]]:
+    for index in range(count):
+        yield "mint_token", {
+            "leaf_data": bytes(40),
+            "addr": sender.address,
+            "amount": index,
+            "campaign_id": 1,
+            "proof": bytes(32),
+        }
+
+
+def run_replay(
+    local_algod: LocalAlgod, path: Path, max_in_flight: int = 4
+) -> ReplayResult:
+    async def run() -> ReplayResult:
+        async with AsyncAlgodClient(
+            "a" * 64, "http://localhost:4001", transport=local_algod.transport
+        ) as algod:
+            return await replay(algod, path, max_in_flight=max_in_flight)
+
+    return asyncio.run(run())
+
+
+def test_presigned_groups_are_replayed(sender: Account, tmp_path: Path) -> None:
+    path = tmp_path / "claims.msgpack"
+    params = offline_params(1, 1000, GENESIS_HASH, fee=2000)
+
+    groups = presign(
+        path,
+        APP_SPEC,
+        APP_ID,
+        claims(sender, 100),
+        params,
+        signer=sender,
+        box_references=BOX_REFERENCES,
+        chunk_size=40,
+    )
+
+    signed_groups = list(iter_signed_groups(path))
+    assert groups == len(signed_groups) == 8
+    assert {group.last_valid for group in signed_groups} == {1000}
+
+    local_algod = LocalAlgod()
+    result = run_replay(local_algod, path)
+
+    assert result == ReplayResult(confirmed=8)
+    assert len(local_algod.confirmed) == 100
+    assert local_algod.requests_by_path["/v2/transactions/params"] == 0
+
+
+def test_expired_groups_are_not_sent(sender: Account, tmp_path: Path) -> None:
+    path = tmp_path / "claims.msgpack"
+    presign(
+        path,
+        APP_SPEC,
+        APP_ID,
+        claims(sender, 20),
+        offline_params(1, 5, GENESIS_HASH),
+        signer=sender,
+        box_references=BOX_REFERENCES,
+    )
+    local_algod = LocalAlgod()
+    local_algod.round = 5
+
+    result = run_replay(local_algod, path)
+
+    assert result == ReplayResult(expired=2)
+    assert local_algod.requests_by_path["/v2/transactions"] == 0
+
+
+def test_groups_that_expire_during_the_replay_are_not_sent(
+    sender: Account, tmp_path: Path
+) -> None:
+    path = tmp_path / "claims.msgpack"
+    presign(
+        path,
+        APP_SPEC,
+        APP_ID,
+        claims(sender, 6),
+        offline_params(1, 4, GENESIS_HASH),
+        signer=sender,
+        box_references=BOX_REFERENCES,
+        chunk_size=1,
+    )
+    local_algod = LocalAlgod()
+
+    # One group at a time, so rounds pass before the later groups are read
+    result = run_replay(local_algod, path, max_in_flight=1)
+
+    assert result.failed == 0
+    assert result.expired > 0
+    assert result.confirmed + result.expired == 6
+    assert local_algod.requests_by_path["/v2/transactions"] == result.confirmed
+
+
+def test_validity_window_is_checked() -> None:
+    with pytest.raises(Exception, match="not a valid window"):
+        offline_params(1, 1002, GENESIS_HASH)
@@ -0,0 +1,74 @@
+import logging
+import threading
+
+import pytest
+
+from smart_contracts._helpers.parallel import ContractLogFilter, run_parallel
+
+
+def test_tasks_run_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    def task(value: int) -> int:
+        # Only returns once all three tasks are running
+        barrier.wait()
+        return value
+
+    results = run_parallel(
+        {name: lambda value=value: task(value) for value, name in enumerate("abc")},
+        jobs=3,
+    )
+
+    assert results == {"a": 0, "b": 1, "c": 2}
+
+
+def test_failures_stop_the_rest_and_are_aggregated() -> None:
+    started = []
+    stopped = threading.Event()
+
+    def fail(name: str) -> None:
+        started.append(name)
+        raise Exception(f"{name} does not compile")
+
+    def wait_until_stopped() -> None:
+        started.append("slow")
+        assert stopped.wait(5)
+        raise Exception("terminated")
+
+    with pytest.raises(Exception) as ex:
+        run_parallel(
+            {
+                "slow": wait_until_stopped,
+                "broken": lambda: fail("broken"),
+                "later": lambda: fail("later"),
+            },
+            jobs=2,
+            on_failure=stopped.set,
+        )
+
+    assert sorted(started) == ["broken", "slow"]
+    assert str(ex.value) == (
+        "2 of 3 contracts failed:\n"
+        "- slow: terminated\n"
+        "- broken: broken does not compile\n"
+        "Not started: later"
+    )
+
+
+def test_log_records_are_prefixed_with_the_contract() -> None:
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append  # type: ignore[method-assign]
+    handler.addFilter(ContractLogFilter())
+    logger = logging.getLogger("parallel_test")
+    logger.addHandler(handler)
+    try:
+        logger.warning("outside")
+        run_parallel({"campaign": lambda: logger.warning("inside")})
+    finally:
+        logger.removeHandler(handler)
+
+    assert [record.contract_prefix for record in records] == [  # type: ignore[attr-defined]
+        "",
+        "[campaign] ",
+    ]
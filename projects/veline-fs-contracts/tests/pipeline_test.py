@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from algokit_utils import Account
+from algosdk import abi, account, error, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+)
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.batch import BatchComposer
+from smart_contracts._helpers.pipeline import SubmissionPipeline, is_pool_full
+from smart_contracts.artifacts.campaign.campaign_client import APP_SPEC
+from smart_contracts.campaign.boxes import BOX_REFERENCES
+from tests.local_algod import GENESIS_HASH, LocalAlgod
+
+APP_ID = 1001
+SUGGESTED_PARAMS = transaction.SuggestedParams(
+    0, 1, 1000, GENESIS_HASH, "local-algod", False, "future", 1000
+)
+
+
+@pytest.fixture()
+def sender() -> Account:
+    private_key, address = account.generate_account()
+    return Account(private_key=private_key, address=address)
+
+
+def claim_groups(sender: Account, claims: int) -> list[AtomicTransactionComposer]:
+    composer = BatchComposer(APP_SPEC, APP_ID, BOX_REFERENCES, signer=sender)
+    for index in range(claims):
+        composer.add_method_call(
+            "mint_token",
+            {
+                "leaf_data": bytes(40),
+                "addr": sender.address,
+                "amount": index,
+                "campaign_id": 1,
+                "proof": bytes(32),
+            },
+        )
+    return composer.build(SUGGESTED_PARAMS)
+
+
+def run_pipeline(
+    local_algod: LocalAlgod,
+    atcs: list[AtomicTransactionComposer],
+    **kwargs: float,
+) -> tuple[list[AtomicTransactionResponse | BaseException], SubmissionPipeline]:
+    async def run() -> (
+        tuple[list[AtomicTransactionResponse | BaseException], SubmissionPipeline]
+    ):
+        async with AsyncAlgodClient(
+            "a" * 64, "http://localhost:4001", transport=local_algod.transport
+        ) as algod:
+            async with SubmissionPipeline(algod, **kwargs) as pipeline:  # type: ignore[arg-type]
+                return await pipeline.run(atcs), pipeline
+
+    return asyncio.run(run())
+
+
+def test_groups_are_confirmed_by_following_blocks(sender: Account) -> None:
+    local_algod = LocalAlgod(latency=0.001)
+    atcs = claim_groups(sender, 2000)
+
+    responses, pipeline = run_pipeline(local_algod, atcs, max_in_flight=32)
+
+    assert all(
+        isinstance(response, AtomicTransactionResponse) for response in responses
+    )
+    assert len(local_algod.confirmed) == 2000
+    assert pipeline.confirmed == len(atcs) == 125
+    # No transaction was polled, every block was read once
+    assert not any(
+        path.startswith("/v2/transactions/pending")
+        for path in local_algod.requests_by_path
+    )
+    assert sum(
+        count
+        for path, count in local_algod.requests_by_path.items()
+        if path.startswith("/v2/blocks/")
+    ) == len(local_algod.blocks)
+    assert max(len(txids) for txids in local_algod.blocks.values()) <= 32 * 16
+
+
+def test_pool_full_submissions_are_retried(sender: Account) -> None:
+    local_algod = LocalAlgod(pool_size=48)
+    atcs = claim_groups(sender, 320)
+
+    responses, pipeline = run_pipeline(local_algod, atcs, backoff=0.001)
+
+    assert all(
+        isinstance(response, AtomicTransactionResponse) for response in responses
+    )
+    assert len(local_algod.confirmed) == 320
+    assert pipeline.retries > 0
+
+
+def test_only_a_full_pool_is_retried() -> None:
+    assert is_pool_full(
+        error.AlgodHTTPError("TransactionPool.Remember: transaction pool is full", 400)
+    )
+    # resending the same signed group would not raise its fee
+    assert not is_pool_full(
+        error.AlgodHTTPError(
+            "TransactionPool.checkSufficientFee: txn fee per byte below threshold",
+            400,
+        )
+    )
+
+
+def test_return_values_and_errors(sender: Account) -> None:
+    local_algod = LocalAlgod(pool_size=0)
+    local_algod.on_method(
+        "add_campaign(byte[],byte[],uint64)uint64",
+        lambda txn: abi.UintType(64).encode(7),
+    )
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=APP_ID,
+        method=APP_SPEC.contract.get_method_by_name("add_campaign"),
+        sender=sender.address,
+        sp=SUGGESTED_PARAMS,
+        signer=sender.signer,
+        method_args=[b"", bytes(32), 60],
+    )
+
+    (rejected,), _ = run_pipeline(local_algod, [atc], max_retries=2, backoff=0.001)
+    assert "pool is full" in str(rejected)
+
+    local_algod.pool_size = None
+    atc = atc.clone()
+    (response,), _ = run_pipeline(local_algod, [atc])
+    assert isinstance(response, AtomicTransactionResponse)
+    assert response.abi_results[0].return_value == 7
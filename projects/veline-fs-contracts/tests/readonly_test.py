@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from algosdk import abi, account, encoding, transaction
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.cache import RoundCache
+from smart_contracts.scholarship.async_client import AsyncCertificateClient
+from tests.local_algod import LocalAlgod
+
+APP_ID = 1001
+UINT64 = abi.UintType(64)
+
+
+def balance(txn: transaction.ApplicationCallTxn) -> bytes:
+    """Reports the first byte of the user's public key as their balance."""
+    user = txn.app_args[1]
+    if user == bytes(32):
+        raise Exception("assert failed")
+    return UINT64.encode(user[0])
+
+
+@pytest.fixture()
+def local_algod() -> LocalAlgod:
+    local_algod = LocalAlgod()
+    local_algod.on_method("balance_of(address)uint64", balance)
+    return local_algod
+
+
+def algod_client(local_algod: LocalAlgod) -> AsyncAlgodClient:
+    return AsyncAlgodClient(
+        "a" * 64,
+        "http://localhost:4001",
+        transport=local_algod.transport,
+        cache=RoundCache(),
+    )
+
+
+def test_concurrent_reads_share_simulate_requests(local_algod: LocalAlgod) -> None:
+    users = [account.generate_account()[1] for _ in range(100)]
+
+    async def run() -> list[int]:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCertificateClient(algod, app_id=APP_ID)
+            responses = await asyncio.gather(
+                *(client.balance_of(user=user) for user in users)
+            )
+        return [response.return_value for response in responses]
+
+    balances = asyncio.run(run())
+
+    assert balances == [encoding.decode_address(user)[0] for user in users]
+    assert len(local_algod.simulated) == 7
+    assert all(
+        request["allow-empty-signatures"] and request["allow-unnamed-resources"]
+        for request in local_algod.simulated
+    )
+    assert not local_algod.pending and not local_algod.confirmed
+
+
+def test_reads_are_memoized_until_the_next_round(local_algod: LocalAlgod) -> None:
+    user = account.generate_account()[1]
+
+    async def run() -> None:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCertificateClient(algod, app_id=APP_ID)
+            await client.balance_of(user=user)
+            await client.balance_of(user=user)
+            assert len(local_algod.simulated) == 1
+            local_algod.round += 1
+            await algod.status()
+            await client.balance_of(user=user)
+            assert len(local_algod.simulated) == 2
+
+    asyncio.run(run())
+
+
+def test_a_failing_read_does_not_fail_the_others(local_algod: LocalAlgod) -> None:
+    users = [account.generate_account()[1] for _ in range(4)]
+    users.insert(2, encoding.encode_address(bytes(32)))
+
+    async def run() -> list[object]:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCertificateClient(algod, app_id=APP_ID)
+            return await asyncio.gather(
+                *(client.balance_of(user=user) for user in users),
+                return_exceptions=True,
+            )
+
+    responses = asyncio.run(run())
+
+    assert "assert failed" in str(responses[2])
+    assert [response.return_value for response in responses[:2] + responses[3:]] == [  # type: ignore[union-attr]
+        encoding.decode_address(user)[0] for user in users[:2] + users[3:]
+    ]
+    assert len(local_algod.simulated) == 2
+
+
+def test_a_cancelled_read_does_not_fail_the_others(local_algod: LocalAlgod) -> None:
+    local_algod.latency = 0.05
+    users = [account.generate_account()[1] for _ in range(3)]
+
+    async def run() -> list[object]:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCertificateClient(algod, app_id=APP_ID)
+            reads = [
+                asyncio.ensure_future(client.balance_of(user=user)) for user in users
+            ]
+            # the reads are queued and their simulate request is in flight
+            await asyncio.sleep(0.01)
+            reads[1].cancel()
+            return await asyncio.gather(*reads, return_exceptions=True)
+
+    first, cancelled, last = asyncio.run(run())
+
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert [first.return_value, last.return_value] == [  # type: ignore[attr-defined]
+        encoding.decode_address(user)[0] for user in (users[0], users[2])
+    ]
+
+
+def test_cancelling_one_caller_of_a_read_does_not_fail_the_other(
+    local_algod: LocalAlgod,
+) -> None:
+    local_algod.latency = 0.05
+    user = account.generate_account()[1]
+
+    async def run() -> object:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCertificateClient(algod, app_id=APP_ID)
+            # the same read, so both callers share one cached fetch
+            first, second = (
+                asyncio.ensure_future(client.balance_of(user=user)) for _ in range(2)
+            )
+            await asyncio.sleep(0.01)
+            first.cancel()
+            response = await second
+            assert first.cancelled()
+            return response.return_value
+
+    assert asyncio.run(run()) == encoding.decode_address(user)[0]
+    assert len(local_algod.simulated) == 1
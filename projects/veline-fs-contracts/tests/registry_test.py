@@ -0,0 +1,117 @@
+import base64
+import dataclasses
+from pathlib import Path
+from typing import Any
+
+import pytest
+from algokit_utils import AppMetaData, ApplicationSpecification
+from algokit_utils.deploy import AppDeployMetaData
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts._helpers.registry import (
+    find_deployment,
+    is_unchanged,
+    read_registry,
+    record_deployment,
+    registry_path,
+)
+
+APP_SPEC_PATH = Path("smart_contracts/artifacts/campaign/Campaign.arc32.json")
+CREATOR = "CREATOR"
+
+
+class FakeAlgod:
+    algod_address = "http://localhost:4001"
+
+    def __init__(self) -> None:
+        self.apps: dict[int, dict[str, Any]] = {}
+        self.calls = 0
+
+    def application_info(self, app_id: int) -> dict[str, Any]:
+        self.calls += 1
+        if app_id not in self.apps:
+            raise AlgodHTTPError("application does not exist", 404)
+        return self.apps[app_id]
+
+    def create(self, app_id: int, approval: bytes, creator: str = CREATOR) -> None:
+        self.apps[app_id] = {
+            "id": app_id,
+            "params": {
+                "creator": creator,
+                "approval-program": base64.b64encode(approval).decode(),
+                "clear-state-program": base64.b64encode(b"\x0a\x81\x01").decode(),
+            },
+        }
+
+
+def deployed_app(app_id: int) -> AppMetaData:
+    metadata = AppDeployMetaData("Campaign", "v1.0", deletable=False, updatable=False)
+    return AppMetaData(
+        **dataclasses.asdict(metadata),
+        app_id=app_id,
+        app_address="",
+        created_round=5,
+        updated_round=5,
+        created_metadata=metadata,
+        deleted=False,
+    )
+
+
+@pytest.fixture()
+def app_spec() -> ApplicationSpecification:
+    return ApplicationSpecification.from_json(APP_SPEC_PATH.read_text())
+
+
+def test_unchanged_app_is_verified_with_one_call(
+    tmp_path: Path, app_spec: ApplicationSpecification
+) -> None:
+    algod = FakeAlgod()
+    assert not is_unchanged(algod, app_spec, tmp_path)  # type: ignore[arg-type]
+    assert algod.calls == 0
+
+    algod.create(1001, b"\x0a\x81\x01")
+    record_deployment(algod, app_spec, deployed_app(1001), tmp_path)  # type: ignore[arg-type]
+    assert registry_path(algod, tmp_path).name == "localhost_4001.json"  # type: ignore[arg-type]
+
+    algod.calls = 0
+    assert is_unchanged(algod, app_spec, tmp_path)  # type: ignore[arg-type]
+    assert algod.calls == 1
+
+
+def test_changes_are_detected(
+    tmp_path: Path, app_spec: ApplicationSpecification
+) -> None:
+    algod = FakeAlgod()
+    algod.create(1001, b"\x0a\x81\x01")
+    record_deployment(algod, app_spec, deployed_app(1001), tmp_path)  # type: ignore[arg-type]
+
+    changed_spec = ApplicationSpecification.from_json(APP_SPEC_PATH.read_text())
+    changed_spec.approval_program += "\n// changed"
+    algod.calls = 0
+    assert not is_unchanged(algod, changed_spec, tmp_path)  # type: ignore[arg-type]
+    assert algod.calls == 0
+
+    # updated by someone else
+    algod.create(1001, b"\x0a\x81\x02")
+    assert not is_unchanged(algod, app_spec, tmp_path)  # type: ignore[arg-type]
+
+    # the network was reset
+    del algod.apps[1001]
+    assert not is_unchanged(algod, app_spec, tmp_path)  # type: ignore[arg-type]
+    assert find_deployment(algod, CREATOR, app_spec, tmp_path) is None  # type: ignore[arg-type]
+
+
+def test_recorded_app_is_used_instead_of_the_indexer(
+    tmp_path: Path, app_spec: ApplicationSpecification
+) -> None:
+    algod = FakeAlgod()
+    algod.create(1001, b"\x0a\x81\x01")
+    record_deployment(algod, app_spec, deployed_app(1001), tmp_path)  # type: ignore[arg-type]
+
+    lookup = find_deployment(algod, CREATOR, app_spec, tmp_path)  # type: ignore[arg-type]
+
+    assert lookup is not None
+    assert lookup.apps["Campaign"].app_id == 1001
+    assert lookup.apps["Campaign"].version == "v1.0"
+    assert find_deployment(algod, "SOMEONE ELSE", app_spec, tmp_path) is None  # type: ignore[arg-type]
+    assert list(read_registry(registry_path(algod, tmp_path))) == ["Campaign"]  # type: ignore[arg-type]
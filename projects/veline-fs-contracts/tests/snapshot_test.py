@@ -0,0 +1,158 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from algosdk import abi, account, encoding
+
+from smart_contracts._helpers import snapshot
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.batch import box_name
+from smart_contracts.campaign import boxes as campaign_boxes
+from smart_contracts.campaign.async_client import AsyncCampaignClient
+from smart_contracts.scholarship import boxes as scholarship_boxes
+from smart_contracts.scholarship.async_client import AsyncCertificateClient
+from tests.local_algod import LocalAlgod
+
+APP_ID = 1001
+VOTING_ESCROW_USER = abi.ABIType.from_string(
+    "(address,uint64,uint64,uint64,uint64,uint64,uint64)"
+)
+ELIGIBLE_DATA = abi.ABIType.from_string("(byte[],byte[],address,uint64)")
+CAMPAIGN_IDS = abi.ABIType.from_string("uint64[]")
+TRUE = b"\x80"
+
+
+def algod_client(local_algod: LocalAlgod) -> AsyncAlgodClient:
+    return AsyncAlgodClient(
+        "a" * 64, "http://localhost:4001", transport=local_algod.transport
+    )
+
+
+def test_certificate_snapshot_is_decoded_into_columns(tmp_path: Path) -> None:
+    local_algod = LocalAlgod()
+    users = [account.generate_account()[1] for _ in range(300)]
+    for index, user in enumerate(users):
+        local_algod.boxes[(APP_ID, box_name(b"voting_escrow_user", user))] = (
+            VOTING_ESCROW_USER.encode([user, index, 0, index * 2, 0, 0, 0])
+        )
+        local_algod.boxes[(APP_ID, box_name(b"locked_user", user))] = TRUE
+
+    async def run() -> dict[bytes, snapshot.BoxMapSnapshot]:
+        async with algod_client(local_algod) as algod:
+            client = AsyncCertificateClient(algod, app_id=APP_ID)
+            return await client.snapshot(tmp_path, workers=8)
+
+    maps = asyncio.run(run())
+
+    locks = maps[b"voting_escrow_user"]
+    assert len(locks) == 300
+    by_user = dict(zip(locks.keys, locks.columns["amount_locked"]))
+    assert by_user == {
+        encoding.decode_address(user): index for index, user in enumerate(users)
+    }
+    assert sum(locks.columns["lock_duration"]) == sum(range(0, 600, 2))
+    assert maps[b"locked_user"].columns["value"] == [True] * 300
+    assert len(maps[b"scholarship"]) == 0
+    assert local_algod.max_in_flight <= 8
+
+
+def test_box_names_are_listed_a_page_at_a_time() -> None:
+    local_algod = LocalAlgod()
+    names = {box_name(b"claimed", index) for index in range(25)}
+    for name in names:
+        local_algod.boxes[(APP_ID, name)] = TRUE
+    local_algod.boxes[(APP_ID + 1, b"other")] = TRUE
+
+    async def run() -> list[bytes]:
+        async with algod_client(local_algod) as algod:
+            return await snapshot.list_box_names(algod, APP_ID, page_size=10)
+
+    listed = asyncio.run(run())
+
+    assert sorted(listed) == sorted(names)
+    assert local_algod.requests_by_path[f"/v2/applications/{APP_ID}/boxes"] == 3
+
+
+def test_campaign_maps_sharing_a_prefix_are_told_apart(tmp_path: Path) -> None:
+    local_algod = LocalAlgod()
+    owner = account.generate_account()[1]
+    local_algod.boxes[(APP_ID, box_name(b"campaign", 7))] = ELIGIBLE_DATA.encode(
+        [bytes(64), bytes(range(32)), owner, 100]
+    )
+    local_algod.boxes[(APP_ID, box_name(b"campaign_id", owner))] = CAMPAIGN_IDS.encode(
+        [3, 7]
+    )
+    local_algod.boxes[(APP_ID, box_name(b"valid_owner_campaign", owner))] = TRUE
+
+    async def run() -> dict[bytes, snapshot.BoxMapSnapshot]:
+        async with algod_client(local_algod) as algod:
+            return await AsyncCampaignClient(algod, app_id=APP_ID).snapshot(tmp_path)
+
+    maps = asyncio.run(run())
+
+    campaigns = maps[b"campaign"]
+    assert list(campaigns.keys) == [7]
+    assert campaigns.columns["proof"] == [bytes(64)]
+    assert campaigns.columns["root"] == [bytes(range(32))]
+    assert campaigns.columns["owner"] == [encoding.decode_address(owner)]
+    assert list(campaigns.columns["expired_at"]) == [100]
+    assert [list(ids) for ids in maps[b"campaign_id"].columns["campaign_ids"]] == [
+        [3, 7]
+    ]
+    assert maps[b"valid_owner_campaign"].columns["value"] == [True]
+
+
+def test_interrupted_snapshot_resumes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    local_algod = LocalAlgod()
+    names = [
+        box_name(b"locked_user", bytes(31) + bytes([index])) for index in range(100)
+    ]
+    for name in names:
+        local_algod.boxes[(APP_ID, name)] = TRUE
+    fetch_box = snapshot._fetch_box
+    fetched = 0
+
+    async def interrupted_fetch_box(*args: object) -> bytes | None:
+        nonlocal fetched
+        fetched += 1
+        if fetched > 40:
+            raise ConnectionError("connection reset")
+        return await fetch_box(*args)  # type: ignore[arg-type]
+
+    async def run() -> None:
+        async with algod_client(local_algod) as algod:
+            await snapshot.take_snapshot(algod, APP_ID, tmp_path, workers=4)
+
+    monkeypatch.setattr(snapshot, "_fetch_box", interrupted_fetch_box)
+    with pytest.raises(ConnectionError):
+        asyncio.run(run())
+    # A record cut short while being written
+    with (tmp_path / snapshot.VALUES_FILE).open("ab") as values_file:
+        values_file.write(b"\x00\x2b\x00")
+    with pytest.raises(Exception, match="incomplete"):
+        snapshot.load_snapshot(tmp_path, scholarship_boxes.BOX_MAPS)
+
+    monkeypatch.setattr(snapshot, "_fetch_box", fetch_box)
+    del local_algod.boxes[(APP_ID, names[-1])]
+    asyncio.run(run())
+
+    maps = snapshot.load_snapshot(tmp_path, scholarship_boxes.BOX_MAPS)
+    assert sorted(maps[b"locked_user"].keys) == [name[11:] for name in names[:-1]]
+    assert local_algod.requests_by_path[f"/v2/applications/{APP_ID}/boxes"] == 1
+    assert local_algod.requests_by_path[f"/v2/applications/{APP_ID}/box"] == 100
+
+
+def test_boxes_of_no_known_map_are_skipped(tmp_path: Path) -> None:
+    local_algod = LocalAlgod()
+    local_algod.boxes[(APP_ID, b"campaign" + bytes(3))] = b"\x00"
+
+    async def run() -> None:
+        async with algod_client(local_algod) as algod:
+            await snapshot.take_snapshot(algod, APP_ID, tmp_path)
+
+    asyncio.run(run())
+
+    maps = snapshot.load_snapshot(tmp_path, campaign_boxes.BOX_MAPS)
+    assert all(len(box_map) == 0 for box_map in maps.values())
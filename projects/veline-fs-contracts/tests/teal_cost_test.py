@@ -0,0 +1,154 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smart_contracts._helpers.teal_cost import (
+    REPORT_FILE,
+    analyse_artifacts,
+    check_report,
+    estimate_size,
+    find_regressions,
+    parse_teal,
+    routes,
+)
+
+ARTIFACTS = Path("smart_contracts/artifacts")
+
+TEAL = """#pragma version 10
+
+main:
+    txn ApplicationID
+    bnz main_entrypoint@2
+    callsub __init__
+
+main_entrypoint@2:
+    callsub router
+    return
+
+router:
+    proto 0 1
+    txn NumAppArgs
+    bz bare_routing
+    method "hash(byte[])byte[32]"
+    method "store(uint64)void"
+    txna ApplicationArgs 0
+    match hash_route store_route
+    int 0
+    retsub
+
+hash_route:
+    txna ApplicationArgs 1
+    extract 2 0
+    callsub hash
+    byte 0x151f7c75
+    swap
+    concat
+    log
+    int 1
+    retsub
+
+store_route:
+    txna ApplicationArgs 1
+    dup
+    btoi
+    bz store_failed
+    byte "values"
+    swap
+    box_put
+    int 1
+    retsub
+
+store_failed:
+    err // zero is not allowed
+
+bare_routing:
+    int 1
+    retsub
+
+hash:
+    proto 1 1
+    frame_dig -1
+
+hash_loop:
+    sha256 // a loop, counted once
+    dup
+    len
+    int 64
+    <
+    bnz hash_loop
+    retsub
+
+__init__:
+    byte "values"
+    box_del
+    pop
+    sha256
+    retsub
+"""
+
+
+def analyse(teal: str, tmp_path: Path) -> dict[str, Any]:
+    path = tmp_path / "Hasher.approval.teal"
+    path.write_text(teal)
+    return analyse_artifacts([path])["Hasher"]  # type: ignore[no-any-return]
+
+
+def test_worst_case_of_each_method(tmp_path: Path) -> None:
+    program = parse_teal(TEAL)
+
+    assert list(routes(program)) == ["hash(byte[])byte[32]", "store(uint64)void"]
+    report = analyse(TEAL, tmp_path)
+
+    assert report["methods"] == {
+        # 11 to get to the route, 9 in it and 43 in the hash, as sha256 costs 35
+        "hash(byte[])byte[32]": {
+            "cost": 63,
+            "box_accesses": 0,
+            "log_bytes": 36,
+            "loops": 1,
+        },
+        # the path through err fails, so does not count
+        "store(uint64)void": {
+            "cost": 20,
+            "box_accesses": 1,
+            "log_bytes": 0,
+            "loops": 0,
+        },
+    }
+    assert report["program_size_estimated"]
+    assert report["program_size"] == estimate_size(program)
+
+
+def test_cost_growth_beyond_the_threshold_is_a_regression() -> None:
+    baseline = {"Token": {"methods": {"mint()void": {"cost": 100}}}}
+
+    def report(cost: int) -> dict[str, Any]:
+        return {
+            "Token": {
+                "methods": {"mint()void": {"cost": cost}, "new()void": {"cost": 999}}
+            }
+        }
+
+    assert find_regressions(baseline, report(110), threshold=0.1) == []
+    assert find_regressions(baseline, report(111), threshold=0.1) == [
+        "Token.mint()void costs 111, up from 100"
+    ]
+
+
+def test_committed_report_is_up_to_date() -> None:
+    report = analyse_artifacts(ARTIFACTS.glob("*/*.approval.teal"))
+
+    check_report(ARTIFACTS / REPORT_FILE, report, threshold=0)
+    assert report["Campaign"]["methods"][
+        "mint_token(byte[],address,uint64,uint64,byte[])void"
+    ]
+    assert report["Certificate"]["methods"][
+        "lock_token(address,uint64,uint64,axfer)void"
+    ]
+
+    report["Campaign"]["methods"][
+        "mint_token(byte[],address,uint64,uint64,byte[])void"
+    ]["cost"] *= 2
+    with pytest.raises(Exception, match="mint_token"):
+        check_report(ARTIFACTS / REPORT_FILE, report)
@@ -0,0 +1,108 @@
+import json
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from smart_contracts._helpers import timing
+from smart_contracts._helpers.parallel import run_parallel
+from smart_contracts._helpers.timing import Timeline
+from smart_contracts._helpers.transport import PooledAlgodClient, PooledSession
+
+TXID = "A" * 52
+
+
+@pytest.fixture()
+def timeline(monkeypatch: pytest.MonkeyPatch) -> Timeline:
+    timeline = Timeline()
+    monkeypatch.setattr(timing, "timeline", timeline)
+    return timeline
+
+
+@pytest.fixture()
+def algod_client() -> PooledAlgodClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v2/transactions/pending/"):
+            return httpx.Response(200, json={"confirmed-round": 1})
+        return httpx.Response(200, json={"last-round": 1})
+
+    session = PooledSession(transport=httpx.MockTransport(handler))
+    return PooledAlgodClient("a" * 64, "http://algod", session=session)
+
+
+def test_requests_are_counted_in_the_open_stages(
+    timeline: Timeline, algod_client: PooledAlgodClient
+) -> None:
+    algod_client.status()
+    with timing.stage("create/update", "token") as create:
+        with timing.stage("app lookup"):
+            algod_client.status()
+        algod_client.pending_transaction_info(TXID)
+        algod_client.status_after_block(1)
+    with pytest.raises(Exception, match="no funds"):
+        with timing.stage("funding"):
+            raise Exception("no funds")
+
+    assert create.requests == 3
+    assert [
+        (span.stage, span.contract, span.requests, span.failed)
+        for span in sorted(timeline.spans, key=lambda span: span.start)
+    ] == [
+        ("create/update", "token", 3, False),
+        ("app lookup", "token", 1, False),
+        ("confirmation", "token", 1, False),
+        ("confirmation", "token", 1, False),
+        ("funding", None, 0, True),
+    ]
+    summary = timeline.summary()
+    assert list(summary) == ["funding", "app lookup", "create/update", "confirmation"]
+    assert summary["confirmation"]["spans"] == 2
+    assert summary["confirmation"]["requests"] == 2
+    with pytest.raises(Exception, match="Unknown stage"):
+        with timing.stage("deploy"):
+            pass
+
+
+def test_spans_are_written_as_json_lines_and_a_chrome_trace(
+    timeline: Timeline, tmp_path: Path
+) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def deploy() -> None:
+        with timing.stage("create/update"):
+            # both at once, on two threads
+            barrier.wait()
+
+    with timing.stage("discovery"):
+        pass
+    run_parallel({"token": deploy, "vault": deploy}, jobs=2)
+
+    timeline.write_json_lines(tmp_path / "timings.jsonl")
+    lines = [
+        json.loads(line)
+        for line in (tmp_path / "timings.jsonl").read_text().splitlines()
+    ]
+    assert [(line["stage"], line.get("contract")) for line in lines[:3]] in (
+        [("discovery", None), ("create/update", "token"), ("create/update", "vault")],
+        [("discovery", None), ("create/update", "vault"), ("create/update", "token")],
+    )
+    assert lines[3:] == [
+        {"stage": stage, "total": True, **total}
+        for stage, total in timeline.summary().items()
+    ]
+
+    timeline.write_chrome_trace(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    threads = {
+        event["tid"]: event["args"]["name"] for event in events if event["ph"] == "M"
+    }
+    spans = [event for event in events if event["ph"] == "X"]
+    assert sorted(event["name"] for event in spans) == [
+        "create/update token",
+        "create/update vault",
+        "discovery",
+    ]
+    assert all(event["dur"] >= 0 and event["tid"] in threads for event in spans)
+    # the contracts are deployed on worker threads
+    assert len(threads) == 3
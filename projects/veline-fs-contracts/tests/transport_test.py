@@ -0,0 +1,112 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from algosdk import error
+
+from smart_contracts._helpers.cache import CachingAlgodClient
+from smart_contracts._helpers.transport import (
+    PooledAlgodClient,
+    PooledIndexerClient,
+    PooledSession,
+)
+
+TOKEN = "a" * 64
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[tuple[str, int]] = set()
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.connections.add(self.client_address)
+        if self.path.startswith("/v2/applications/"):
+            self._reply(404, {"message": "application does not exist"})
+        else:
+            self._reply(
+                200, {"last-round": 5, "token": self.headers["X-Algo-API-Token"]}
+            )
+
+    def _reply(self, status: int, body: dict[str, object]) -> None:
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def server_address() -> Iterator[str]:
+    Handler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_kept_alive(server_address: str) -> None:
+    algod_client = PooledAlgodClient(TOKEN, server_address)
+
+    for _ in range(20):
+        assert algod_client.status() == {"last-round": 5, "token": TOKEN}
+
+    assert len(Handler.connections) == 1
+    assert algod_client.metrics.summary()["GET /v2/status"]["requests"] == 20
+
+
+def test_threads_share_the_pool(server_address: str) -> None:
+    algod_client = PooledAlgodClient(
+        TOKEN, server_address, session=PooledSession(pool_size=4)
+    )
+
+    threads = [
+        threading.Thread(target=lambda: [algod_client.status() for _ in range(10)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(Handler.connections) <= 4
+    assert algod_client.metrics.requests == 80
+
+
+def test_errors_are_raised_as_by_algosdk(server_address: str) -> None:
+    algod_client = PooledAlgodClient(TOKEN, server_address)
+
+    with pytest.raises(error.AlgodHTTPError, match="does not exist") as ex:
+        algod_client.application_info(1001)
+    assert ex.value.code == 404
+    assert algod_client.metrics.summary()["GET /v2/applications/{id}"]["errors"] == 1
+
+
+def test_indexer_and_caching_clients_share_a_session() -> None:
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        assert request.headers["X-Indexer-API-Token"] == "token"
+        return httpx.Response(200, json={"b": {"d": 1, "c": 2}, "a": []})
+
+    session = PooledSession(transport=httpx.MockTransport(handler))
+    indexer_client = PooledIndexerClient("token", "http://indexer", session=session)
+    algod_client = CachingAlgodClient.wrap(
+        PooledAlgodClient(TOKEN, "http://algod", session=session)
+    )
+
+    response = indexer_client.search_applications(creator="A" * 58)
+
+    assert list(response) == ["a", "b"] and list(response["b"]) == ["c", "d"]
+    assert algod_client.session is session
+    assert paths == ["/v2/applications"]
+    assert session.metrics.summary()["GET /v2/applications"]["requests"] == 1
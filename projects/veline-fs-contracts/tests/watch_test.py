@@ -0,0 +1,92 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.config import SmartContract
+from smart_contracts._helpers.watch import ContractWatcher, matching_tests, watch
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "__init__.py").write_text("")
+    (tmp_path / "contracts" / "constants.py").write_text("FEE = 1000\n")
+    for name in ("token", "vault"):
+        (tmp_path / "contracts" / name).mkdir()
+        (tmp_path / "contracts" / name / "contract.py").write_text(
+            "from algopy import ARC4Contract\n"
+        )
+    (tmp_path / "contracts" / "token" / "contract.py").write_text(
+        "from contracts.constants import FEE\n"
+    )
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "token_test.py").write_text(
+        "from contracts.token.contract import Token\n"
+    )
+    (tmp_path / "tests" / "vault_test.py").write_text(
+        "from contracts.vault.contract import Vault\n"
+    )
+    return tmp_path
+
+
+def contracts(project: Path) -> list[SmartContract]:
+    return [
+        SmartContract(path=project / "contracts" / name / "contract.py", name=name)
+        for name in ("token", "vault")
+    ]
+
+
+def touch(path: Path) -> None:
+    modified = path.stat().st_mtime_ns + 1_000_000
+    os.utime(path, ns=(modified, modified))
+
+
+def test_only_contracts_with_changed_sources_are_reported(project: Path) -> None:
+    token, vault = contracts(project)
+    watcher = ContractWatcher([token, vault], project)
+
+    assert watcher.poll() == []
+    touch(project / "contracts" / "constants.py")
+    assert watcher.poll() == [token]
+    assert watcher.poll() == []
+
+    # a newly imported file is watched from then on
+    (project / "contracts" / "limits.py").write_text("MAX = 1\n")
+    (vault.path).write_text("from contracts.limits import MAX\n")
+    touch(vault.path)
+    assert watcher.poll() == [vault]
+    touch(project / "contracts" / "limits.py")
+    assert watcher.poll() == [vault]
+
+
+def test_tests_importing_the_contract_are_matched(project: Path) -> None:
+    token, _ = contracts(project)
+    watcher = ContractWatcher([token], project)
+
+    assert matching_tests(watcher.sources(token), project / "tests", project) == [
+        project / "tests" / "token_test.py"
+    ]
+
+
+def test_changed_contract_is_rebuilt_until_stopped(project: Path) -> None:
+    token, vault = contracts(project)
+    rebuilt: list[str] = []
+    stop = threading.Event()
+
+    def rebuild(contract: SmartContract) -> None:
+        rebuilt.append(contract.name)
+        if len(rebuilt) == 1:
+            raise Exception("does not compile")
+        stop.set()
+
+    def edit() -> None:
+        touch(vault.path)
+        # fixed by the next save
+        threading.Timer(0.1, touch, [vault.path]).start()
+
+    threading.Timer(0.05, edit).start()
+    watch([token, vault], rebuild, interval=0.02, stop=stop, root=project)
+
+    assert rebuilt == ["vault", "vault"]